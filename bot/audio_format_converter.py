@@ -343,6 +343,85 @@ def detect_audio_format(file_path: str) -> Optional[str]:
         return None
 
 
+def _sniff_audio_format(head: bytes) -> Optional[str]:
+    """Identify an audio container from its leading magic bytes.
+
+    Args:
+        head: First bytes of the file (16 are enough)
+
+    Returns:
+        Detected format extension or None if the header is not recognized
+    """
+    if head.startswith(b"ID3"):
+        return "mp3"
+    if head.startswith(b"OggS"):
+        return "ogg"
+    if head.startswith(b"fLaC"):
+        return "flac"
+    if head.startswith(b"RIFF") and head[8:12] == b"WAVE":
+        return "wav"
+    if len(head) >= 2 and head[0] == 0xFF:
+        # MPEG frame sync; layer bits 00 mean ADTS AAC, layer III is MP3
+        if head[1] & 0xF6 == 0xF0:
+            return "aac"
+        if head[1] & 0xE6 == 0xE2:
+            return "mp3"
+    return None
+
+
+def detect_audio_format_fast(file_path: str) -> Optional[str]:
+    """Detect audio file format from its header, falling back to ffprobe.
+
+    Args:
+        file_path: Path to the audio file
+
+    Returns:
+        Detected format extension (mp3, wav, ogg, aac, flac) or None if cannot detect
+    """
+    try:
+        with open(file_path, "rb") as f:
+            head = f.read(16)
+    except OSError as e:
+        logger.warning(f"Could not read header for format detection: {e}")
+        return None
+
+    detected = _sniff_audio_format(head)
+    if detected:
+        logger.debug(f"Detected format from header: {detected}")
+        return detected
+    return detect_audio_format(file_path)
+
+
+# MIME types Telegram reports for audio, mapped to our format names
+_MIME_TYPE_FORMATS = {
+    "audio/mpeg": "mp3",
+    "audio/mp3": "mp3",
+    "audio/ogg": "ogg",
+    "audio/opus": "ogg",
+    "audio/wav": "wav",
+    "audio/x-wav": "wav",
+    "audio/wave": "wav",
+    "audio/flac": "flac",
+    "audio/x-flac": "flac",
+    "audio/aac": "aac",
+    "audio/x-aac": "aac",
+}
+
+
+def audio_format_from_mime_type(mime_type: Optional[str]) -> Optional[str]:
+    """Map a MIME type reported by Telegram to a supported format.
+
+    Args:
+        mime_type: MIME type from the Telegram audio object, if any
+
+    Returns:
+        Format extension (mp3, wav, ogg, aac, flac) or None if unknown
+    """
+    if not mime_type:
+        return None
+    return _MIME_TYPE_FORMATS.get(mime_type.lower())
+
+
 def get_supported_audio_formats() -> list[str]:
     """Return list of supported audio formats for conversion.
 
@@ -354,7 +433,9 @@ def get_supported_audio_formats() -> list[str]:
 
 __all__ = [
     "AudioFormatConverter",
+    "audio_format_from_mime_type",
     "detect_audio_format",
+    "detect_audio_format_fast",
     "extract_metadata",
     "get_supported_audio_formats",
     "has_metadata_support",
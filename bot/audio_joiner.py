@@ -2,12 +2,14 @@
 
 Provides functionality to merge multiple audio files into a single continuous audio file.
 """
+import json
 import shutil
 import subprocess
 import logging
 import os
+import tempfile
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, List, Optional, Tuple
 
 from bot.error_handler import AudioJoinError
 
@@ -18,7 +20,8 @@ class AudioJoiner:
     """Join multiple audio files into a single continuous audio file.
 
     Uses ffmpeg concat demuxer for quality preservation when possible,
-    or re-encodes to a common format when audio files have incompatible codecs.
+    or re-encodes to MP3 in a single concat-filter pass when audio files have
+    incompatible codecs.
     """
 
     def __init__(self, output_path: str):
@@ -29,6 +32,8 @@ class AudioJoiner:
         """
         self.output_path = Path(output_path)
         self._input_audios: List[str] = []
+        # Input durations in seconds, filled in by the ffprobe format check
+        self._durations: dict[str, float] = {}
 
     @staticmethod
     def _check_ffmpeg() -> bool:
@@ -65,14 +70,14 @@ class AudioJoiner:
         self._input_audios.append(str(path.absolute()))
         logger.debug(f"Added audio to join list: {audio_path}")
 
-    def _get_audio_info(self, audio_path: str) -> Tuple[str, str]:
-        """Get audio codec and container format using ffprobe.
+    def _get_audio_info(self, audio_path: str) -> Tuple[str, str, int, str]:
+        """Get audio stream parameters and container format using ffprobe.
 
         Args:
             audio_path: Path to the audio file
 
         Returns:
-            Tuple of (audio_codec, container_format)
+            Tuple of (audio_codec, sample_rate, channels, container_format)
 
         Raises:
             AudioJoinError: If ffprobe fails
@@ -81,44 +86,50 @@ class AudioJoiner:
             logger.error("ffprobe is not installed or not in PATH")
             raise AudioJoinError("ffprobe no está disponible")
 
-        # Get audio codec
-        codec_cmd = [
+        # Read the first audio stream and the container in one ffprobe run
+        cmd = [
             "ffprobe",
             "-v", "error",
             "-select_streams", "a:0",
-            "-show_entries", "stream=codec_name",
-            "-of", "csv=p=0",
-            audio_path,
-        ]
-
-        # Get container format
-        format_cmd = [
-            "ffprobe",
-            "-v", "error",
-            "-show_entries", "format=format_name",
-            "-of", "csv=p=0",
+            "-show_entries", "stream=codec_name,sample_rate,channels:format=format_name,duration",
+            "-of", "json",
             audio_path,
         ]
 
         try:
-            codec_result = subprocess.run(
-                codec_cmd, capture_output=True, text=True, check=False
-            )
-            audio_codec = codec_result.stdout.strip() or "unknown"
-
-            format_result = subprocess.run(
-                format_cmd, capture_output=True, text=True, check=True
+            result = subprocess.run(
+                cmd, capture_output=True, text=True, check=True
             )
-            container_format = format_result.stdout.strip() or "unknown"
-
-            return audio_codec, container_format
-
+            info = json.loads(result.stdout or "{}")
         except subprocess.CalledProcessError as e:
             logger.error(f"ffprobe failed: {e.stderr}")
             raise AudioJoinError("No pude analizar el formato del audio") from e
+        except json.JSONDecodeError as e:
+            logger.error(f"Could not parse ffprobe output for {audio_path}: {e}")
+            raise AudioJoinError("No pude analizar el formato del audio") from e
+
+        streams = info.get("streams") or [{}]
+        stream = streams[0]
+        audio_codec = stream.get("codec_name") or "unknown"
+        sample_rate = stream.get("sample_rate") or "unknown"
+        channels = stream.get("channels") or 0
+        container_format = info.get("format", {}).get("format_name") or "unknown"
+        try:
+            self._durations[audio_path] = float(info.get("format", {})["duration"])
+        except (KeyError, TypeError, ValueError):
+            pass
+
+        return audio_codec, sample_rate, channels, container_format
+
+    def _need_normalization(self, probe_all: bool = False) -> bool:
+        """Check if audio files need re-encoding before concatenation.
 
-    def _need_normalization(self) -> bool:
-        """Check if audio files need format normalization before concatenation.
+        Stream copy is only safe when every input has the same codec,
+        sample rate and channel count.
+
+        Args:
+            probe_all: Keep probing after the first mismatch so every
+                input's duration is known
 
         Returns:
             True if audio files have incompatible formats and need re-encoding
@@ -127,79 +138,56 @@ class AudioJoiner:
             return False
 
         # Get info for first audio as reference
-        ref_audio_codec, ref_container = self._get_audio_info(self._input_audios[0])
+        ref_codec, ref_rate, ref_channels, ref_container = self._get_audio_info(self._input_audios[0])
 
         logger.debug(
-            f"Reference audio - codec: {ref_audio_codec}, container: {ref_container}"
+            f"Reference audio - codec: {ref_codec}, sample rate: {ref_rate}, "
+            f"channels: {ref_channels}, container: {ref_container}"
         )
 
+        mismatch = False
         for audio_path in self._input_audios[1:]:
-            audio_codec, container = self._get_audio_info(audio_path)
+            codec, rate, channels, container = self._get_audio_info(audio_path)
             logger.debug(
-                f"Checking {audio_path} - codec: {audio_codec}, container: {container}"
+                f"Checking {audio_path} - codec: {codec}, sample rate: {rate}, "
+                f"channels: {channels}, container: {container}"
             )
 
-            # Check if codecs match
-            if audio_codec != ref_audio_codec:
+            if (codec, rate, channels) != (ref_codec, ref_rate, ref_channels):
                 logger.info(
-                    f"Audio codec mismatch: {ref_audio_codec} vs {audio_codec}"
+                    f"Audio format mismatch: {ref_codec}/{ref_rate}Hz/{ref_channels}ch "
+                    f"vs {codec}/{rate}Hz/{channels}ch"
                 )
-                return True
+                if not probe_all:
+                    return True
+                mismatch = True
 
-        return False
+        return mismatch
 
-    def _normalize_audios(self, temp_dir: str) -> List[str]:
-        """Convert audio files to a common compatible format for concatenation.
+    def _build_reencode_command(self) -> List[str]:
+        """Build a single ffmpeg command that decodes, concatenates and encodes.
 
-        Re-encodes all audio files to MP3 format with libmp3lame encoder,
-        which is widely compatible.
-
-        Args:
-            temp_dir: Directory for temporary normalized files
+        The concat filter reads every input directly and resamples them to
+        a common format, so no normalized copy of each input is written to
+        disk before joining.
 
         Returns:
-            List of paths to normalized audio files
-
-        Raises:
-            AudioJoinError: If normalization fails
+            ffmpeg command line producing the joined MP3
         """
-        normalized_paths = []
-        temp_path = Path(temp_dir)
-        temp_path.mkdir(parents=True, exist_ok=True)
-
-        logger.info("Normalizing audio files to common format (MP3)")
-
-        for i, audio_path in enumerate(self._input_audios):
-            output_path = temp_path / f"normalized_{i:03d}.mp3"
-
-            cmd = [
-                "ffmpeg",
-                "-y",  # Overwrite output if exists
-                "-i", audio_path,  # Input file
-                "-c:a", "libmp3lame",  # MP3 audio codec
-                "-b:a", "192k",  # Audio bitrate
-                "-id3v2_version", "3",  # Metadata compatibility
-                str(output_path),
-            ]
-
-            try:
-                logger.debug(f"Normalizing audio {i+1}/{len(self._input_audios)}: {audio_path}")
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                normalized_paths.append(str(output_path))
-                logger.debug(f"Normalized: {output_path}")
-
-            except subprocess.CalledProcessError as e:
-                logger.error(f"ffmpeg failed with code {e.returncode}")
-                logger.error(f"ffmpeg stderr: {e.stderr}")
-                raise AudioJoinError(f"Error normalizando audio {i+1}") from e
-
-        logger.info(f"All {len(normalized_paths)} audio files normalized successfully")
-        return normalized_paths
+        cmd = ["ffmpeg", "-y"]
+        for audio_path in self._input_audios:
+            cmd.extend(["-i", audio_path])
+
+        inputs = "".join(f"[{i}:a:0]" for i in range(len(self._input_audios)))
+        cmd.extend([
+            "-filter_complex", f"{inputs}concat=n={len(self._input_audios)}:v=0:a=1[out]",
+            "-map", "[out]",
+            "-c:a", "libmp3lame",  # MP3 audio codec
+            "-b:a", "192k",  # Audio bitrate
+            "-id3v2_version", "3",  # Metadata compatibility
+            str(self.output_path),
+        ])
+        return cmd
 
     def _create_concat_file(self, audio_paths: List[str], concat_file_path: str) -> str:
         """Create ffmpeg concat demuxer file list.
@@ -224,11 +212,52 @@ class AudioJoiner:
         logger.debug(f"Created concat file: {concat_file_path}")
         return concat_file_path
 
-    def join_audios(self) -> bool:
+    def _run_with_progress(self, cmd: List[str], progress_callback: Callable[[float], None]) -> None:
+        """Run ffmpeg and report the fraction of the output written so far.
+
+        ffmpeg's -progress key=value lines are read from stdout; each
+        out_time_us is turned into a fraction of the inputs' total duration.
+
+        Args:
+            cmd: ffmpeg command line; its last element is the output path
+            progress_callback: Called from this thread with a value in [0, 1]
+
+        Raises:
+            subprocess.CalledProcessError: If ffmpeg exits with an error
+        """
+        total_us = sum(self._durations.get(path, 0.0) for path in self._input_audios) * 1_000_000
+        cmd = [*cmd[:-1], "-progress", "pipe:1", "-nostats", cmd[-1]]
+
+        # stderr goes to a temp file so a chatty ffmpeg can't fill the pipe
+        # while we are blocked reading stdout
+        with tempfile.TemporaryFile(mode="w+") as stderr_file:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True)
+            try:
+                for line in process.stdout:
+                    key, _, value = line.strip().partition("=")
+                    if key == "out_time_us" and total_us and value.isdigit():
+                        progress_callback(min(1.0, int(value) / total_us))
+                returncode = process.wait()
+            finally:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                process.stdout.close()
+
+            if returncode != 0:
+                stderr_file.seek(0)
+                raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr_file.read())
+
+    def join_audios(self, progress_callback: Optional[Callable[[float], None]] = None) -> bool:
         """Concatenate all added audio files into a single output file.
 
         Uses ffmpeg concat demuxer for lossless concatenation when audio files
-        have compatible formats, or re-encodes to a common format when needed.
+        have compatible formats, or the concat filter to re-encode them to MP3
+        in a single pass when they don't.
+
+        Args:
+            progress_callback: Optional callable receiving the fraction of
+                the join completed, called from the worker thread
 
         Returns:
             True if join succeeded, False otherwise
@@ -248,54 +277,46 @@ class AudioJoiner:
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Check if normalization is needed
-        needs_normalization = self._need_normalization()
-
-        # Create temporary directory for intermediate files
-        temp_dir = self.output_path.parent / "join_audio_temp"
-        temp_dir.mkdir(parents=True, exist_ok=True)
+        needs_normalization = self._need_normalization(probe_all=progress_callback is not None)
 
         try:
             if needs_normalization:
-                logger.info("Audio files have incompatible formats, normalizing first")
-                audios_to_join = self._normalize_audios(str(temp_dir))
+                # Re-encode in one pass instead of normalizing each input first
+                logger.info("Audio files have incompatible formats, re-encoding while joining")
+                cmd = self._build_reencode_command()
             else:
                 logger.info("Audio files have compatible formats, using direct concat")
-                audios_to_join = self._input_audios.copy()
-
-            # Create concat file list
-            concat_file = temp_dir / "concat_list.txt"
-            self._create_concat_file(audios_to_join, str(concat_file))
+                temp_dir = self.output_path.parent / "join_audio_temp"
+                temp_dir.mkdir(parents=True, exist_ok=True)
 
-            # Build ffmpeg concat command
-            cmd = [
-                "ffmpeg",
-                "-y",  # Overwrite output if exists
-                "-f", "concat",  # Use concat demuxer
-                "-safe", "0",  # Allow unsafe file paths
-                "-i", str(concat_file),  # Input concat file
-            ]
+                # Create concat file list
+                concat_file = temp_dir / "concat_list.txt"
+                self._create_concat_file(self._input_audios, str(concat_file))
 
-            if needs_normalization:
-                # Already normalized to MP3, just copy
-                cmd.extend(["-c", "copy"])
-            else:
                 # Direct concat with copy (lossless)
-                cmd.extend(["-c", "copy"])
-
-            cmd.extend([
-                "-id3v2_version", "3",  # Metadata compatibility
-                str(self.output_path),
-            ])
-
-            logger.info(f"Joining {len(audios_to_join)} audio files")
+                cmd = [
+                    "ffmpeg",
+                    "-y",  # Overwrite output if exists
+                    "-f", "concat",  # Use concat demuxer
+                    "-safe", "0",  # Allow unsafe file paths
+                    "-i", str(concat_file),  # Input concat file
+                    "-c", "copy",
+                    "-id3v2_version", "3",  # Metadata compatibility
+                    str(self.output_path),
+                ]
+
+            logger.info(f"Joining {len(self._input_audios)} audio files")
             logger.debug(f"Running ffmpeg: {' '.join(cmd)}")
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            if progress_callback is not None:
+                self._run_with_progress(cmd, progress_callback)
+            else:
+                subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
 
             logger.info(f"Audio files joined successfully: {self.output_path}")
             return True
@@ -5,10 +5,11 @@ Supports common audio formats: MP3, OGG, WAV, AAC, FLAC.
 """
 import shutil
 import subprocess
+import tempfile
 import logging
 import os
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional, Tuple
 
 from bot.error_handler import AudioSplitError
 
@@ -29,18 +30,31 @@ class AudioSplitter:
     # Supported audio formats
     SUPPORTED_FORMATS = {'.mp3', '.ogg', '.oga', '.wav', '.aac', '.flac', '.m4a', '.wma'}
 
-    def __init__(self, input_path: str, output_dir: str):
+    # Muxers that can write to a non-seekable pipe, by file extension
+    PIPE_MUXERS = {'.mp3': 'mp3', '.ogg': 'ogg', '.oga': 'ogg', '.aac': 'adts', '.flac': 'flac'}
+
+    def __init__(
+        self,
+        input_path: str,
+        output_dir: str,
+        duration: Optional[float] = None,
+        threads: int = 0,
+    ):
         """Initialize audio splitter.
 
         Args:
             input_path: Path to input audio file
             output_dir: Directory for output segments
+            duration: Known audio duration in seconds, skips the ffprobe call
+            threads: ffmpeg -threads value per process (0 lets ffmpeg decide)
 
         Raises:
             AudioSplitError: If input file format is not supported
         """
         self.input_path = Path(input_path)
         self.output_dir = Path(output_dir)
+        self.duration = duration
+        self.threads = threads
         self._basename = self.input_path.stem
         self._ext = self.input_path.suffix.lower()
 
@@ -67,15 +81,25 @@ class AudioSplitter:
         """
         return shutil.which("ffprobe") is not None
 
+    def _threads_args(self) -> List[str]:
+        """Return the ffmpeg thread-limit arguments, if a limit is set."""
+        return ["-threads", str(self.threads)] if self.threads > 0 else []
+
     def get_audio_duration(self) -> float:
         """Get total audio duration using ffprobe.
 
+        The result is kept on the instance, so repeated calls (and the split
+        methods that need the duration) only probe once.
+
         Returns:
             Duration in seconds
 
         Raises:
             AudioSplitError: If ffprobe is not available or fails
         """
+        if self.duration is not None:
+            return self.duration
+
         if not self._check_ffprobe():
             logger.error("ffprobe is not installed or not in PATH")
             raise AudioSplitError("ffprobe no está disponible")
@@ -102,6 +126,7 @@ class AudioSplitter:
             )
             duration = float(result.stdout.strip())
             logger.debug(f"Audio duration: {duration} seconds")
+            self.duration = duration
             return duration
 
         except subprocess.CalledProcessError as e:
@@ -155,6 +180,7 @@ class AudioSplitter:
             "-segment_time", str(segment_duration),  # Segment duration
             "-f", "segment",  # Use segment muxer
             "-reset_timestamps", "1",  # Reset timestamps at each segment
+            *self._threads_args(),  # Bound per-process CPU usage
             str(output_pattern),  # Output pattern
         ]
 
@@ -183,6 +209,102 @@ class AudioSplitter:
             logger.error(f"Unexpected error during audio splitting: {e}")
             raise AudioSplitError("Error inesperado al dividir el audio") from e
 
+    def iter_split_by_duration(self, segment_duration: int) -> Iterator[str]:
+        """Split audio by duration, yielding each segment as ffmpeg finishes it.
+
+        The segment muxer reports every completed file on stdout, so callers
+        can start uploading early segments while later ones are still being
+        written. Closing the iterator early stops ffmpeg.
+
+        Args:
+            segment_duration: Duration of each segment in seconds (must be >= 5)
+
+        Yields:
+            Path of each completed segment file, in order
+
+        Raises:
+            AudioSplitError: If splitting fails
+        """
+        if segment_duration < 5:
+            raise AudioSplitError("La duración mínima por segmento es 5 segundos")
+
+        if not self._check_ffmpeg():
+            logger.error("ffmpeg is not installed or not in PATH")
+            raise AudioSplitError("ffmpeg no está disponible")
+
+        if not self.input_path.exists():
+            logger.error(f"Input file not found: {self.input_path}")
+            raise AudioSplitError(f"Archivo no encontrado: {self.input_path}")
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        output_pattern = self.output_dir / f"{self._basename}_part%03d{self._ext}"
+
+        cmd = [
+            "ffmpeg",
+            "-y",  # Overwrite output if exists
+            "-i", str(self.input_path),  # Input file
+            "-c", "copy",  # Copy streams without re-encoding
+            "-map", "0",  # Map all streams from input
+            "-segment_time", str(segment_duration),  # Segment duration
+            "-f", "segment",  # Use segment muxer
+            "-reset_timestamps", "1",  # Reset timestamps at each segment
+            "-segment_list", "pipe:1",  # Announce each finished segment on stdout
+            "-segment_list_type", "flat",  # One bare filename per line
+            *self._threads_args(),  # Bound per-process CPU usage
+            str(output_pattern),  # Output pattern
+        ]
+
+        logger.debug(f"Running ffmpeg: {' '.join(cmd)}")
+        # stderr goes to a temp file so a chatty ffmpeg can't fill the pipe
+        # while we are blocked reading stdout
+        with tempfile.TemporaryFile(mode="w+") as stderr_file:
+            try:
+                process = subprocess.Popen(
+                    cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True
+                )
+            except OSError as e:
+                logger.error(f"Could not start ffmpeg: {e}")
+                raise AudioSplitError("Error inesperado al dividir el audio") from e
+
+            count = 0
+            try:
+                for line in process.stdout:
+                    name = line.strip()
+                    if name:
+                        count += 1
+                        yield str(self.output_dir / name)
+                returncode = process.wait()
+            finally:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                process.stdout.close()
+
+            if returncode != 0:
+                stderr_file.seek(0)
+                logger.error(f"ffmpeg failed with code {returncode}")
+                logger.error(f"ffmpeg stderr: {stderr_file.read()}")
+                raise AudioSplitError("Error dividiendo el audio por duración")
+
+        logger.info(f"Audio split into {count} segments by duration")
+
+    def expected_segment_count(self, segment_duration: int) -> int:
+        """Probe the duration and compute how many segments a split would produce.
+
+        Args:
+            segment_duration: Duration of each segment in seconds
+
+        Returns:
+            Expected number of segments
+
+        Raises:
+            AudioSplitError: If the duration probe fails
+        """
+        duration = self.get_audio_duration()
+        return int(duration // segment_duration) + (
+            1 if duration % segment_duration > 0 else 0
+        )
+
     def split_by_parts(self, num_parts: int) -> List[str]:
         """Split audio into specified number of equal parts.
 
@@ -243,6 +365,7 @@ class AudioSplitter:
             "-segment_time", str(segment_duration),  # Calculated segment duration
             "-f", "segment",  # Use segment muxer
             "-reset_timestamps", "1",  # Reset timestamps at each segment
+            *self._threads_args(),  # Bound per-process CPU usage
             str(output_pattern),  # Output pattern
         ]
 
@@ -271,18 +394,18 @@ class AudioSplitter:
             logger.error(f"Unexpected error during audio splitting: {e}")
             raise AudioSplitError("Error inesperado al dividir el audio") from e
 
-    def split_by_time_range(self, start_time: float, end_time: float) -> str:
-        """Extract a segment from the audio between start and end times.
+    def _prepare_time_range(self, start_time: float, end_time: float) -> Tuple[float, float]:
+        """Validate a time range and clamp its end to the audio duration.
 
         Args:
-            start_time: Start time in seconds (e.g., 30.5 for 30 seconds and 500ms)
-            end_time: End time in seconds (must be greater than start_time)
+            start_time: Start time in seconds
+            end_time: End time in seconds
 
         Returns:
-            Path to the extracted segment file
+            Tuple of (clamped end_time, requested duration)
 
         Raises:
-            AudioSplitError: If splitting fails or times are invalid
+            AudioSplitError: If the times are invalid or ffmpeg is unavailable
         """
         if start_time < 0:
             raise AudioSplitError("El tiempo de inicio no puede ser negativo")
@@ -308,15 +431,20 @@ class AudioSplitter:
             logger.warning(f"End time ({end_time}s) exceeds audio duration ({audio_duration}s), adjusting")
             end_time = audio_duration
 
-        # Ensure output directory exists
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        return end_time, duration
 
-        # Build output filename
-        output_filename = f"{self._basename}_{int(start_time)}s_to_{int(end_time)}s{self._ext}"
-        output_path = self.output_dir / output_filename
+    def _time_range_command(self, start_time: float, duration: float, output: List[str]) -> List[str]:
+        """Build the stream-copy ffmpeg command for a time range.
 
-        # Build ffmpeg command for extracting time range
-        cmd = [
+        Args:
+            start_time: Start time in seconds
+            duration: Length of the segment in seconds
+            output: Trailing output arguments (path, or format and pipe)
+
+        Returns:
+            ffmpeg command line
+        """
+        return [
             "ffmpeg",
             "-y",  # Overwrite output if exists
             "-i", str(self.input_path),  # Input file
@@ -324,9 +452,35 @@ class AudioSplitter:
             "-t", str(duration),  # Duration (end - start)
             "-c", "copy",  # Copy streams without re-encoding
             "-copyts",  # Copy timestamps
-            str(output_path),
+            *self._threads_args(),  # Bound per-process CPU usage
+            *output,
         ]
 
+    def split_by_time_range(self, start_time: float, end_time: float) -> str:
+        """Extract a segment from the audio between start and end times.
+
+        Args:
+            start_time: Start time in seconds (e.g., 30.5 for 30 seconds and 500ms)
+            end_time: End time in seconds (must be greater than start_time)
+
+        Returns:
+            Path to the extracted segment file
+
+        Raises:
+            AudioSplitError: If splitting fails or times are invalid
+        """
+        end_time, duration = self._prepare_time_range(start_time, end_time)
+
+        # Ensure output directory exists
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Build output filename
+        output_filename = f"{self._basename}_{int(start_time)}s_to_{int(end_time)}s{self._ext}"
+        output_path = self.output_dir / output_filename
+
+        # Build ffmpeg command for extracting time range
+        cmd = self._time_range_command(start_time, duration, [str(output_path)])
+
         try:
             logger.debug(f"Running ffmpeg: {' '.join(cmd)}")
             result = subprocess.run(
@@ -346,3 +500,45 @@ class AudioSplitter:
         except Exception as e:
             logger.error(f"Unexpected error during audio segment extraction: {e}")
             raise AudioSplitError("Error inesperado al extraer segmento") from e
+
+    def extract_time_range(self, start_time: float, end_time: float) -> Tuple[Optional[bytes], str]:
+        """Extract a segment for upload, in memory when the format allows it.
+
+        For formats in PIPE_MUXERS, ffmpeg writes the stream-copied segment
+        to stdout, so the cut is never written to disk and read back. Formats
+        whose muxer needs a seekable output (m4a, wav, wma) are written with
+        split_by_time_range and returned by path, so callers can upload them
+        by path instead of loading them.
+
+        Args:
+            start_time: Start time in seconds
+            end_time: End time in seconds (must be greater than start_time)
+
+        Returns:
+            Tuple of (segment bytes, filename for the upload) for piped
+            formats, or (None, segment file path) for the others
+
+        Raises:
+            AudioSplitError: If splitting fails or times are invalid
+        """
+        muxer = self.PIPE_MUXERS.get(self._ext)
+        if muxer is None:
+            return None, self.split_by_time_range(start_time, end_time)
+
+        end_time, duration = self._prepare_time_range(start_time, end_time)
+        filename = f"{self._basename}_{int(start_time)}s_to_{int(end_time)}s{self._ext}"
+        cmd = self._time_range_command(start_time, duration, ["-f", muxer, "pipe:1"])
+
+        logger.debug(f"Running ffmpeg: {' '.join(cmd)}")
+        try:
+            result = subprocess.run(cmd, capture_output=True, check=True)
+        except subprocess.CalledProcessError as e:
+            logger.error(f"ffmpeg failed with code {e.returncode}")
+            logger.error(f"ffmpeg stderr: {e.stderr.decode(errors='replace')}")
+            raise AudioSplitError("Error extrayendo segmento del audio") from e
+        except OSError as e:
+            logger.error(f"Unexpected error during audio segment extraction: {e}")
+            raise AudioSplitError("Error inesperado al extraer segmento") from e
+
+        logger.info(f"Audio segment extracted in memory: {filename} ({len(result.stdout)} bytes)")
+        return result.stdout, filename
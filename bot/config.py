@@ -31,6 +31,9 @@ class BotConfig:
     TELEGRAM_LOCAL_MODE: bool = False
     TELEGRAM_API_BASE_URL: Optional[str] = None
     TELEGRAM_API_FILE_BASE_URL: Optional[str] = None
+    # Bot API server can read the bot's temp files (same host/container), so
+    # uploads are sent as file:// paths instead of streamed bytes.
+    TELEGRAM_LOCAL_SHARED_FS: bool = False
     TELEGRAM_API_TIMEOUT: float = 30.0
     TELEGRAM_MAX_UPLOAD_SIZE_MB: int = TELEGRAM_CLOUD_MAX_UPLOAD_MB
 
@@ -47,6 +50,22 @@ class BotConfig:
     JOIN_MIN_VIDEOS: int = 2
     MAX_IMAGE_BATCH_SIZE: int = 10
 
+    # Concurrent segment uploads per chat (kept low to respect Telegram flood limits)
+    UPLOAD_CONCURRENCY: int = 3
+
+    # ffmpeg resource limits: concurrent media jobs and -threads per ffmpeg
+    # process (0 lets ffmpeg use every core)
+    MAX_CONCURRENT_JOBS: int = 2
+    FFMPEG_THREADS: int = 0
+
+    # Telegram file downloads in flight at once across all users; bursts of
+    # get_file/downloads otherwise trigger flood waits
+    MAX_CONCURRENT_DOWNLOADS: int = 8
+
+    # Seconds a downloaded Telegram file is kept for reuse when the same file
+    # is processed again (e.g. trying another boost intensity); 0 disables
+    DOWNLOAD_CACHE_TTL: int = 300
+
     # Audio configuration
     MAX_VOICE_DURATION_MINUTES: int = 20
     MAX_AUDIO_FILE_SIZE_MB: int = 20
@@ -61,6 +80,8 @@ class BotConfig:
     JOIN_MAX_AUDIO_FILES: int = 20
     JOIN_MIN_AUDIO_FILES: int = 2
     JOIN_AUDIO_TIMEOUT: int = 120
+    # Queued join audios downloaded in parallel at /done
+    JOIN_AUDIO_DOWNLOAD_CONCURRENCY: int = 4
 
     # Download configuration (per QF-01, QF-02, QF-03, QF-05, DM-01, EH-03)
     # Cloud API: 50MB. Local Bot API: up to 2000MB.
@@ -83,6 +104,9 @@ class BotConfig:
     # Concurrent download settings (DM-01)
     DOWNLOAD_MAX_CONCURRENT: int = 5
 
+    # Parallel HTTP range connections used to fetch large Telegram files
+    TELEGRAM_DOWNLOAD_CONNECTIONS: int = 4
+
     # Retry settings (EH-03)
     DOWNLOAD_MAX_RETRIES: int = 3
     DOWNLOAD_RETRY_DELAY: int = 2  # seconds between retries
@@ -131,6 +155,8 @@ class BotConfig:
                     "TELEGRAM_API_BASE_URL must start with http:// or https:// "
                     f"(got: {self.TELEGRAM_API_BASE_URL!r})"
                 )
+        elif self.TELEGRAM_LOCAL_SHARED_FS:
+            errors.append("TELEGRAM_LOCAL_SHARED_FS requires TELEGRAM_LOCAL_MODE to be enabled")
 
         if not isinstance(self.TELEGRAM_API_TIMEOUT, (int, float)) or self.TELEGRAM_API_TIMEOUT <= 0:
             errors.append(
@@ -176,6 +202,9 @@ class BotConfig:
             ("JOIN_MAX_VIDEOS", self.JOIN_MAX_VIDEOS),
             ("JOIN_MIN_VIDEOS", self.JOIN_MIN_VIDEOS),
             ("MAX_IMAGE_BATCH_SIZE", self.MAX_IMAGE_BATCH_SIZE),
+            ("UPLOAD_CONCURRENCY", self.UPLOAD_CONCURRENCY),
+            ("MAX_CONCURRENT_JOBS", self.MAX_CONCURRENT_JOBS),
+            ("MAX_CONCURRENT_DOWNLOADS", self.MAX_CONCURRENT_DOWNLOADS),
             ("MAX_VOICE_DURATION_MINUTES", self.MAX_VOICE_DURATION_MINUTES),
             ("MAX_AUDIO_FILE_SIZE_MB", self.MAX_AUDIO_FILE_SIZE_MB),
         ]
@@ -183,6 +212,16 @@ class BotConfig:
             if not isinstance(value, int) or value <= 0:
                 errors.append(f"{name} must be a positive integer (got: {value})")
 
+        if not isinstance(self.DOWNLOAD_CACHE_TTL, int) or self.DOWNLOAD_CACHE_TTL < 0:
+            errors.append(
+                f"DOWNLOAD_CACHE_TTL must be a non-negative integer (got: {self.DOWNLOAD_CACHE_TTL})"
+            )
+
+        if not isinstance(self.FFMPEG_THREADS, int) or self.FFMPEG_THREADS < 0:
+            errors.append(
+                f"FFMPEG_THREADS must be a non-negative integer (got: {self.FFMPEG_THREADS})"
+            )
+
         # Validate audio duration limit (max 20 minutes for Telegram)
         if self.MAX_VOICE_DURATION_MINUTES > 20:
             errors.append(
@@ -203,6 +242,7 @@ class BotConfig:
             ("JOIN_MAX_AUDIO_FILES", self.JOIN_MAX_AUDIO_FILES),
             ("JOIN_MIN_AUDIO_FILES", self.JOIN_MIN_AUDIO_FILES),
             ("JOIN_AUDIO_TIMEOUT", self.JOIN_AUDIO_TIMEOUT),
+            ("JOIN_AUDIO_DOWNLOAD_CONCURRENCY", self.JOIN_AUDIO_DOWNLOAD_CONCURRENCY),
         ]
         for name, value in audio_join_fields:
             if not isinstance(value, int) or value <= 0:
@@ -263,6 +303,15 @@ class BotConfig:
                 f"DOWNLOAD_MAX_CONCURRENT must be at least 1 (got: {self.DOWNLOAD_MAX_CONCURRENT})"
             )
 
+        if (
+            not isinstance(self.TELEGRAM_DOWNLOAD_CONNECTIONS, int)
+            or self.TELEGRAM_DOWNLOAD_CONNECTIONS < 1
+        ):
+            errors.append(
+                "TELEGRAM_DOWNLOAD_CONNECTIONS must be at least 1 "
+                f"(got: {self.TELEGRAM_DOWNLOAD_CONNECTIONS})"
+            )
+
         # Validate retry settings
         if not isinstance(self.DOWNLOAD_MAX_RETRIES, int) or self.DOWNLOAD_MAX_RETRIES < 0:
             errors.append(
@@ -401,6 +450,10 @@ def load_config() -> BotConfig:
         TELEGRAM_LOCAL_MAX_UPLOAD_MB if telegram_local_mode else 500
     )
 
+    # Split the cores between concurrent ffmpeg jobs so they don't oversubscribe the host
+    max_concurrent_jobs = _int_env("MAX_CONCURRENT_JOBS", 2)
+    default_ffmpeg_threads = max(1, (os.cpu_count() or 1) // max(1, max_concurrent_jobs))
+
     telegram_api_timeout = os.getenv("TELEGRAM_API_TIMEOUT")
     if telegram_api_timeout is None:
         parsed_timeout = 30.0
@@ -417,6 +470,7 @@ def load_config() -> BotConfig:
         TELEGRAM_LOCAL_MODE=telegram_local_mode,
         TELEGRAM_API_BASE_URL=os.getenv("TELEGRAM_API_BASE_URL") or None,
         TELEGRAM_API_FILE_BASE_URL=os.getenv("TELEGRAM_API_FILE_BASE_URL") or None,
+        TELEGRAM_LOCAL_SHARED_FS=_bool_env("TELEGRAM_LOCAL_SHARED_FS", False),
         TELEGRAM_API_TIMEOUT=parsed_timeout,
         TELEGRAM_MAX_UPLOAD_SIZE_MB=_int_env(
             "TELEGRAM_MAX_UPLOAD_SIZE_MB", default_upload_mb
@@ -433,6 +487,11 @@ def load_config() -> BotConfig:
         JOIN_MAX_VIDEOS=_int_env("JOIN_MAX_VIDEOS", 10),
         JOIN_MIN_VIDEOS=_int_env("JOIN_MIN_VIDEOS", 2),
         MAX_IMAGE_BATCH_SIZE=_int_env("MAX_IMAGE_BATCH_SIZE", 10),
+        UPLOAD_CONCURRENCY=_int_env("UPLOAD_CONCURRENCY", 3),
+        MAX_CONCURRENT_JOBS=max_concurrent_jobs,
+        MAX_CONCURRENT_DOWNLOADS=_int_env("MAX_CONCURRENT_DOWNLOADS", 8),
+        DOWNLOAD_CACHE_TTL=_int_env("DOWNLOAD_CACHE_TTL", 300),
+        FFMPEG_THREADS=_int_env("FFMPEG_THREADS", default_ffmpeg_threads),
         MAX_VOICE_DURATION_MINUTES=_int_env("MAX_VOICE_DURATION_MINUTES", 20),
         MAX_AUDIO_FILE_SIZE_MB=_int_env(
             "MAX_AUDIO_FILE_SIZE_MB",
@@ -445,6 +504,7 @@ def load_config() -> BotConfig:
         JOIN_MAX_AUDIO_FILES=_int_env("JOIN_MAX_AUDIO_FILES", 20),
         JOIN_MIN_AUDIO_FILES=_int_env("JOIN_MIN_AUDIO_FILES", 2),
         JOIN_AUDIO_TIMEOUT=_int_env("JOIN_AUDIO_TIMEOUT", 120),
+        JOIN_AUDIO_DOWNLOAD_CONCURRENCY=_int_env("JOIN_AUDIO_DOWNLOAD_CONCURRENCY", 4),
         # Download configuration
         DOWNLOAD_MAX_SIZE_MB=_int_env("DOWNLOAD_MAX_SIZE_MB", default_download_mb),
         DOWNLOAD_MAX_SIZE_GENERIC_MB=_int_env(
@@ -457,6 +517,7 @@ def load_config() -> BotConfig:
         DOWNLOAD_AUDIO_QUALITY=os.getenv("DOWNLOAD_AUDIO_QUALITY", "320"),
         DOWNLOAD_VIDEO_PREFERENCE=os.getenv("DOWNLOAD_VIDEO_PREFERENCE", "mp4"),
         DOWNLOAD_MAX_CONCURRENT=_int_env("DOWNLOAD_MAX_CONCURRENT", 5),
+        TELEGRAM_DOWNLOAD_CONNECTIONS=_int_env("TELEGRAM_DOWNLOAD_CONNECTIONS", 4),
         DOWNLOAD_MAX_RETRIES=_int_env("DOWNLOAD_MAX_RETRIES", 3),
         DOWNLOAD_RETRY_DELAY=_int_env("DOWNLOAD_RETRY_DELAY", 2),
         COOKIES_FILE=os.getenv("COOKIES_FILE") or None,
@@ -12,9 +12,9 @@ The architecture ensures:
 import abc
 import logging
 import re
-import uuid
 from dataclasses import dataclass
 from pathlib import Path
+from secrets import token_hex
 from typing import Any, Callable, Optional, TYPE_CHECKING
 
 # Avoid circular imports
@@ -487,7 +487,7 @@ class BaseDownloader(abc.ABC):
         Returns:
             Unique 8-character identifier string.
         """
-        return str(uuid.uuid4())[:8]
+        return token_hex(4)
 
     @staticmethod
     def _sanitize_filename(title: str) -> str:
@@ -14,7 +14,7 @@ Exception Hierarchy:
         NetworkError
 """
 import logging
-import uuid
+from secrets import token_hex
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -43,7 +43,7 @@ class DownloadError(Exception):
     @staticmethod
     def _generate_correlation_id() -> str:
         """Generate a unique correlation ID for request tracing."""
-        return str(uuid.uuid4())[:8]
+        return token_hex(4)
 
     def to_user_message(self) -> str:
         """Return a user-friendly error message.
@@ -35,6 +35,9 @@ class FormatConverter:
         "webm": "libopus",
     }
 
+    # Supported output formats, built once for O(1) membership checks
+    SUPPORTED_FORMATS: frozenset[str] = frozenset(VIDEO_CODECS)
+
     def __init__(self, input_path: str, output_path: str):
         """Initialize format converter.
 
@@ -61,7 +64,7 @@ class FormatConverter:
         Returns:
             List of supported format extensions
         """
-        return ["mp4", "avi", "mov", "mkv", "webm"]
+        return list(FormatConverter.VIDEO_CODECS)
 
     def convert(self, output_format: str) -> bool:
         """Convert video to specified format.
@@ -82,7 +85,7 @@ class FormatConverter:
 
         # Validate output format
         output_format = output_format.lower().lstrip(".")
-        if output_format not in self.get_supported_formats():
+        if output_format not in self.SUPPORTED_FORMATS:
             logger.error(f"Unsupported output format: {output_format}")
             return False
 
@@ -144,6 +147,9 @@ class AudioExtractor:
         "ogg": {"codec": "libvorbis", "bitrate": "128k"},
     }
 
+    # Supported output formats, built once for O(1) membership checks
+    SUPPORTED_FORMATS: frozenset[str] = frozenset(AUDIO_CONFIG)
+
     def __init__(self, input_path: str, output_path: str):
         """Initialize audio extractor.
 
@@ -170,7 +176,7 @@ class AudioExtractor:
         Returns:
             List of supported audio format extensions
         """
-        return ["mp3", "aac", "wav", "ogg"]
+        return list(AudioExtractor.AUDIO_CONFIG)
 
     def extract(self, output_format: str = "mp3") -> bool:
         """Extract audio track from video.
@@ -191,7 +197,7 @@ class AudioExtractor:
 
         # Validate output format
         output_format = output_format.lower().lstrip(".")
-        if output_format not in self.get_supported_formats():
+        if output_format not in self.SUPPORTED_FORMATS:
             logger.error(f"Unsupported audio format: {output_format}")
             return False
 
@@ -1,16 +1,26 @@
 """Telegram bot handlers for video processing."""
 import asyncio
 import logging
+import math
 import os
+import shutil
+import tempfile
+import threading
 import time
-import uuid
-from contextlib import contextmanager
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Iterator
-from telegram import Update, InlineKeyboardMarkup, InlineKeyboardButton
+from secrets import token_hex
+from typing import Any, AsyncIterator, Callable, Iterator
+
+import aiofiles
+import aiohttp
+from telegram import Update, InlineKeyboardMarkup, InlineKeyboardButton, InputFile
 from telegram.constants import ChatType
 from telegram.ext import ContextTypes, CallbackQueryHandler, MessageHandler, filters
-from telegram.error import NetworkError, TimedOut
+from telegram.error import BadRequest, NetworkError, RetryAfter, TimedOut
 
 from bot.temp_manager import TempManager
 from bot.video_processor import VideoProcessor
@@ -51,12 +61,18 @@ from bot.validators import (
     validate_audio_file,
     check_disk_space,
     estimate_required_space,
+    preflight_audio,
     ValidationError,
 )
 from bot.audio_processor import VoiceNoteConverter, VoiceToMp3Converter, get_audio_duration
 from bot.audio_splitter import AudioSplitter
 from bot.audio_joiner import AudioJoiner
-from bot.audio_format_converter import AudioFormatConverter, detect_audio_format, get_supported_audio_formats
+from bot.audio_format_converter import (
+    AudioFormatConverter,
+    audio_format_from_mime_type,
+    detect_audio_format_fast,
+    get_supported_audio_formats,
+)
 from bot.audio_enhancer import AudioEnhancer
 from bot.audio_effects import AudioEffects
 from bot.screenshot_processor import ScreenshotProcessor
@@ -95,6 +111,54 @@ logger = logging.getLogger(__name__)
 # URL detector instance for detecting URLs in messages
 url_detector = URLDetector()
 
+# Dedicated pool for ffmpeg/ffprobe jobs so they don't compete with the
+# default executor used for Telegram and file I/O
+MEDIA_EXECUTOR = ThreadPoolExecutor(
+    max_workers=max(2, os.cpu_count() or 1),
+    thread_name_prefix="media",
+)
+
+# Caps how many ffmpeg-heavy jobs run at once across all users
+MEDIA_JOB_SEMAPHORE = asyncio.Semaphore(config.MAX_CONCURRENT_JOBS)
+
+# Caps Telegram file downloads in flight across all users
+DOWNLOAD_SEMAPHORE = asyncio.Semaphore(config.MAX_CONCURRENT_DOWNLOADS)
+
+
+@asynccontextmanager
+async def _media_job_slot(
+    status_message=None, restore_text: str | None = None, reply_markup=None
+) -> AsyncIterator[None]:
+    """Hold one of the MAX_CONCURRENT_JOBS media processing slots.
+
+    If every slot is busy, the status message tells the user the job is
+    queued and is restored once the slot is acquired.
+
+    Args:
+        status_message: Optional processing message shown to the user
+        restore_text: Text to show again once the slot is acquired; defaults
+            to the status message's text when it was sent
+        reply_markup: Keyboard to keep on the status message, e.g. a cancel button
+    """
+    queued = False
+    if MEDIA_JOB_SEMAPHORE.locked() and status_message:
+        try:
+            await status_message.edit_text(
+                "⏳ En cola, tu archivo se procesará en breve...", reply_markup=reply_markup
+            )
+            queued = True
+        except Exception as e:
+            logger.warning(f"Could not update queue status message: {e}")
+
+    async with MEDIA_JOB_SEMAPHORE:
+        restore_text = restore_text or (status_message.text if queued else None)
+        if queued and restore_text:
+            try:
+                await status_message.edit_text(restore_text, reply_markup=reply_markup)
+            except Exception as e:
+                logger.warning(f"Could not restore status message: {e}")
+        yield
+
 # Audio file extensions accepted when sent as Telegram documents
 AUDIO_DOCUMENT_EXTENSIONS = {".mp3", ".wav", ".ogg", ".flac", ".m4a", ".aac"}
 
@@ -124,17 +188,226 @@ def _get_message_audio_source(message) -> tuple[str | None, int | None, str | No
     return None, None, None
 
 
-async def _download_with_retry(file, destination_path: str, max_retries: int = 3, correlation_id: str = None) -> bool:
+# Large Telegram files are fetched as parallel HTTP range requests of this size
+PARALLEL_DOWNLOAD_CHUNK_BYTES = 4 * 1024 * 1024
+PARALLEL_DOWNLOAD_MIN_BYTES = 2 * PARALLEL_DOWNLOAD_CHUNK_BYTES
+
+
+class _RangeNotSupportedError(Exception):
+    """Raised when the file server ignores HTTP Range requests."""
+
+
+# Shared by every range download so connections (and TLS sessions) to the
+# file server are kept alive between files instead of being set up per file
+_download_session: aiohttp.ClientSession | None = None
+_download_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_download_session() -> aiohttp.ClientSession:
+    """Return the shared range-download session, creating it on first use.
+
+    A new session is created if the previous one was closed or belongs to
+    another event loop.
+    """
+    global _download_session, _download_session_loop
+    loop = asyncio.get_running_loop()
+    if _download_session is None or _download_session.closed or _download_session_loop is not loop:
+        _download_session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=config.DOWNLOAD_TIMEOUT)
+        )
+        _download_session_loop = loop
+    return _download_session
+
+
+async def close_download_session(application=None) -> None:
+    """Close the shared range-download session.
+
+    Registered as the application's post_shutdown hook.
+
+    Args:
+        application: The running Application (unused)
+    """
+    global _download_session
+    if _download_session is not None and not _download_session.closed:
+        await _download_session.close()
+    _download_session = None
+
+
+def _can_download_in_ranges(file) -> bool:
+    """Return True if a Telegram file is worth downloading in parallel ranges."""
+    file_path = file.file_path or ""
+    return (
+        config.TELEGRAM_DOWNLOAD_CONNECTIONS > 1
+        and (file.file_size or 0) >= PARALLEL_DOWNLOAD_MIN_BYTES
+        and file_path.startswith(("http://", "https://"))
+    )
+
+
+async def _download_in_ranges(
+    url: str,
+    destination_path: str,
+    file_size: int,
+    max_retries: int = 3,
+) -> bool:
+    """Download a file with concurrent HTTP range requests.
+
+    The destination is sized up front and every chunk is written at its own
+    offset, so chunks can complete in any order.
+
+    Args:
+        url: Direct file URL (Bot API file endpoint)
+        destination_path: Path to save the file
+        file_size: Expected size of the file in bytes
+        max_retries: Attempts per chunk for transient network errors
+
+    Returns:
+        True if the file was downloaded, False if the server ignores Range
+        requests and the caller should fall back to a single stream
+
+    Raises:
+        aiohttp.ClientError, asyncio.TimeoutError: If a chunk keeps failing
+    """
+    ranges = [
+        (start, min(start + PARALLEL_DOWNLOAD_CHUNK_BYTES, file_size) - 1)
+        for start in range(0, file_size, PARALLEL_DOWNLOAD_CHUNK_BYTES)
+    ]
+    semaphore = asyncio.Semaphore(config.TELEGRAM_DOWNLOAD_CONNECTIONS)
+    loop = asyncio.get_running_loop()
+    session = _get_download_session()
+
+    fd = os.open(destination_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.ftruncate(fd, file_size)
+
+        async def _fetch(start: int, end: int) -> None:
+            async with semaphore:
+                for attempt in range(max_retries):
+                    try:
+                        async with session.get(
+                            url, headers={"Range": f"bytes={start}-{end}"}
+                        ) as response:
+                            if response.status != 206:
+                                raise _RangeNotSupportedError(f"HTTP {response.status}")
+                            data = await response.read()
+                        break
+                    except (aiohttp.ClientError, asyncio.TimeoutError):
+                        if attempt == max_retries - 1:
+                            raise
+                        await asyncio.sleep(1 * (attempt + 1))
+            if len(data) != end - start + 1:
+                raise aiohttp.ClientPayloadError(
+                    f"Short range read at offset {start}: {len(data)} bytes"
+                )
+            await loop.run_in_executor(None, os.pwrite, fd, data, start)
+
+        # Wait for every chunk before closing the fd, then surface the first error
+        results = await asyncio.gather(
+            *(_fetch(start, end) for start, end in ranges),
+            return_exceptions=True,
+        )
+    finally:
+        os.close(fd)
+
+    for result in results:
+        if isinstance(result, _RangeNotSupportedError):
+            return False
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return True
+
+
+# Recently downloaded files kept for reuse, keyed like the duration cache.
+# Entries are hard links into a private directory, so a cached file survives
+# the job's TempManager cleanup without being copied. Files that cannot be
+# linked (e.g. across filesystems) are simply not cached.
+DOWNLOAD_CACHE_SIZE = 16
+_download_cache: OrderedDict[tuple[str, int], tuple[str, float]] = OrderedDict()
+_download_cache_dir: str | None = None
+
+
+def _ensure_download_cache_dir(cache_dir: str | None) -> str:
+    """Return the cache directory, creating a new one if it is missing."""
+    if cache_dir is None or not os.path.isdir(cache_dir):
+        cache_dir = tempfile.mkdtemp(prefix="videonote_cache_")
+    return cache_dir
+
+
+def _unlink_quietly(paths: list[str]) -> None:
+    """Remove files, ignoring ones that are already gone."""
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+async def _restore_cached_download(key: tuple[str, int], destination_path: str) -> bool:
+    """Hard-link a fresh cached download to destination_path.
+
+    Returns:
+        True if the file was restored from the cache
+    """
+    entry = _download_cache.get(key)
+    if entry is None:
+        return False
+    path, expires_at = entry
+    if expires_at >= time.monotonic():
+        try:
+            os.link(path, destination_path)
+        except OSError:
+            pass
+        else:
+            _download_cache.move_to_end(key)
+            return True
+    del _download_cache[key]
+    await asyncio.to_thread(_unlink_quietly, [path])
+    return False
+
+
+async def _cache_download(key: tuple[str, int], source_path: str) -> None:
+    """Keep a finished download for DOWNLOAD_CACHE_TTL seconds."""
+    global _download_cache_dir
+    _download_cache_dir = await asyncio.to_thread(_ensure_download_cache_dir, _download_cache_dir)
+    cached_path = os.path.join(_download_cache_dir, f"{key[0]}_{key[1]}")
+    if key in _download_cache:
+        # The old entry has the same path, so it must go before linking
+        await asyncio.to_thread(_unlink_quietly, [_download_cache.pop(key)[0]])
+    try:
+        os.link(source_path, cached_path)
+    except OSError as e:
+        logger.debug(f"Not caching {source_path}: {e}")
+        return
+    now = time.monotonic()
+    stale_paths = []
+    _download_cache[key] = (cached_path, now + config.DOWNLOAD_CACHE_TTL)
+    for stale_key in [k for k, (_, expires_at) in _download_cache.items() if expires_at < now]:
+        stale_paths.append(_download_cache.pop(stale_key)[0])
+    while len(_download_cache) > DOWNLOAD_CACHE_SIZE:
+        stale_paths.append(_download_cache.popitem(last=False)[1][0])
+    if stale_paths:
+        await asyncio.to_thread(_unlink_quietly, stale_paths)
+
+
+async def _download_with_retry(
+    file, destination_path: str, max_retries: int = 3, correlation_id: str = None, cache: bool = False
+) -> bool:
     """Download file with retry logic for transient failures.
 
     With local Bot API, copies from a shared filesystem when available and
-    otherwise downloads via the configured local file endpoint.
+    otherwise downloads via the configured local file endpoint. Large files
+    are fetched with parallel range requests when the server supports them.
+    Network downloads hold a DOWNLOAD_SEMAPHORE slot, and a flood wait is
+    slept out with the slot released before the attempt is retried.
 
     Args:
         file: Telegram file object to download
         destination_path: Path to save the file
         max_retries: Maximum number of retry attempts
         correlation_id: Optional correlation ID for request tracing
+        cache: Reuse a recent download of the same file and keep this one
+            for DOWNLOAD_CACHE_TTL seconds. Only for callers that never
+            modify the downloaded file, since cached copies are hard links.
 
     Returns:
         True if download succeeded
@@ -142,8 +415,6 @@ async def _download_with_retry(file, destination_path: str, max_retries: int = 3
     Raises:
         NetworkError, TimedOut: If all retries exhausted
     """
-    import shutil
-
     cid = correlation_id or "no-cid"
 
     if file.file_path and os.path.isfile(file.file_path):
@@ -151,11 +422,52 @@ async def _download_with_retry(file, destination_path: str, max_retries: int = 3
         logger.info(f"[{cid}] File copied from shared path to {destination_path}")
         return True
 
+    cache_key = None
+    if cache and config.DOWNLOAD_CACHE_TTL and isinstance(file.file_unique_id, str):
+        cache_key = (file.file_unique_id, file.file_size or 0)
+        if await _restore_cached_download(cache_key, destination_path):
+            logger.info(f"[{cid}] Reused cached download for {destination_path}")
+            return True
+        if not await _download_uncached(file, destination_path, max_retries, cid):
+            return False
+        await _cache_download(cache_key, destination_path)
+        return True
+
+    return await _download_uncached(file, destination_path, max_retries, cid)
+
+
+async def _download_uncached(file, destination_path: str, max_retries: int, cid: str) -> bool:
+    """Fetch a Telegram file over the network for _download_with_retry."""
+    if _can_download_in_ranges(file):
+        try:
+            async with DOWNLOAD_SEMAPHORE:
+                downloaded = await _download_in_ranges(
+                    file.file_path, destination_path, file.file_size, max_retries
+                )
+            if downloaded:
+                logger.info(
+                    f"[{cid}] File downloaded in parallel ranges to {destination_path} "
+                    f"({file.file_size} bytes)"
+                )
+                return True
+            logger.info(f"[{cid}] Range requests not supported, using single-stream download")
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            logger.warning(f"[{cid}] Parallel download failed ({type(e).__name__}), using single stream")
+
     for attempt in range(max_retries):
         try:
-            await file.download_to_drive(destination_path)
+            async with DOWNLOAD_SEMAPHORE:
+                await file.download_to_drive(destination_path)
             logger.info(f"[{cid}] File downloaded to {destination_path}")
             return True
+        except RetryAfter as e:
+            if attempt < max_retries - 1:
+                delay = _retry_after_seconds(e)
+                logger.warning(f"[{cid}] Download rate limited, retrying in {delay}s")
+                await asyncio.sleep(delay)
+            else:
+                logger.error(f"[{cid}] Download rate limited after {max_retries} attempts")
+                raise
         except (NetworkError, TimedOut) as e:
             if attempt < max_retries - 1:
                 logger.warning(f"[{cid}] Download attempt {attempt + 1} failed, retrying...")
@@ -166,6 +478,34 @@ async def _download_with_retry(file, destination_path: str, max_retries: int = 3
     return False
 
 
+# Read buffer for upload files; multi-MB segments are read in few large syscalls
+UPLOAD_READ_BUFFER_BYTES = 1 << 20
+
+
+async def _read_upload_file(file_path: str, filename: str | None = None) -> InputFile | Path:
+    """Read a local file for upload without blocking the event loop.
+
+    PTB reads file handles synchronously when building the multipart body,
+    so the bytes are loaded through aiofiles first and handed over as an
+    InputFile that keeps the original filename. When the local Bot API
+    server shares the bot's filesystem, the absolute path is returned
+    instead; PTB sends it as a file:// URI and the server reads the file
+    from disk, so the bytes never pass through the bot process.
+
+    Args:
+        file_path: Path of the file to upload
+        filename: Name shown to the user; defaults to the file's own name.
+            A custom name needs the bytes, so it disables the path shortcut.
+
+    Returns:
+        InputFile or Path ready to pass to reply_video/reply_audio
+    """
+    if config.TELEGRAM_LOCAL_SHARED_FS and filename is None:
+        return Path(file_path).resolve()
+    async with aiofiles.open(file_path, "rb", buffering=UPLOAD_READ_BUFFER_BYTES) as f:
+        data = await f.read()
+    return InputFile(data, filename=filename or os.path.basename(file_path))
+
 
 async def _process_video_with_timeout(
     update: Update,
@@ -228,10 +568,10 @@ async def _process_video_with_timeout(
     logger.debug(f"[{cid}] Processing with timeout: {config.PROCESSING_TIMEOUT}s")
     try:
         # Use asyncio.wait_for to enforce timeout
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         success = await asyncio.wait_for(
             loop.run_in_executor(
-                None,
+                MEDIA_EXECUTOR,
                 VideoProcessor.process_video,
                 str(input_path),
                 str(output_path)
@@ -250,8 +590,7 @@ async def _process_video_with_timeout(
     # Send as video note
     logger.info(f"[{cid}] Sending video note to user {user_id}")
     try:
-        with open(output_path, "rb") as video_file:
-            await update.message.reply_video_note(video_note=video_file)
+        await update.message.reply_video_note(video_note=await _read_upload_file(output_path))
         logger.info(f"[{cid}] Video note sent successfully to user {user_id}")
     except Exception as e:
         logger.error(f"[{cid}] Failed to send video note to user {user_id}: {e}")
@@ -274,7 +613,7 @@ async def handle_video(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         context: Telegram context object
     """
     user_id = update.effective_user.id
-    correlation_id = str(uuid.uuid4())[:8]
+    correlation_id = token_hex(4)
     logger.info(f"[{correlation_id}] Video received from user {user_id}")
 
     # Check if there's an active video join session
@@ -424,12 +763,10 @@ async def handle_convert_command(update: Update, context: ContextTypes.DEFAULT_T
         return
 
     output_format = args[0].lower().lstrip(".")
-    supported_formats = FormatConverter.get_supported_formats()
-
-    if output_format not in supported_formats:
+    if output_format not in FormatConverter.SUPPORTED_FORMATS:
         await update.message.reply_text(
             f"Formato no soportado: {output_format}\n"
-            f"Formatos soportados: {', '.join(supported_formats)}"
+            f"Formatos soportados: {', '.join(FormatConverter.get_supported_formats())}"
         )
         return
 
@@ -443,7 +780,7 @@ async def handle_convert_command(update: Update, context: ContextTypes.DEFAULT_T
         logger.warning(f"Could not send processing message to user {user_id}: {e}")
 
     # Process with TempManager for automatic cleanup
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             # Generate safe filenames
             input_filename = f"input_{user_id}_{video.file_unique_id}.mp4"
@@ -479,10 +816,10 @@ async def handle_convert_command(update: Update, context: ContextTypes.DEFAULT_T
             # Convert video with timeout
             logger.info(f"Converting video to {output_format} for user {user_id}")
             try:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 converter = FormatConverter(str(input_path), str(output_path))
                 success = await asyncio.wait_for(
-                    loop.run_in_executor(None, converter.convert, output_format),
+                    loop.run_in_executor(MEDIA_EXECUTOR, converter.convert, output_format),
                     timeout=config.PROCESSING_TIMEOUT
                 )
 
@@ -497,8 +834,7 @@ async def handle_convert_command(update: Update, context: ContextTypes.DEFAULT_T
             # Send converted video
             logger.info(f"Sending converted video to user {user_id}")
             try:
-                with open(output_path, "rb") as video_file:
-                    await update.message.reply_video(video=video_file)
+                await update.message.reply_video(video=await _read_upload_file(output_path))
                 logger.info(f"Converted video sent successfully to user {user_id}")
             except Exception as e:
                 logger.error(f"Failed to send converted video to user {user_id}: {e}")
@@ -562,12 +898,10 @@ async def handle_extract_audio_command(update: Update, context: ContextTypes.DEF
     # Parse format from command arguments (default to mp3)
     args = context.args
     output_format = args[0].lower().lstrip(".") if args else "mp3"
-    supported_formats = AudioExtractor.get_supported_formats()
-
-    if output_format not in supported_formats:
+    if output_format not in AudioExtractor.SUPPORTED_FORMATS:
         await update.message.reply_text(
             f"Formato no soportado: {output_format}\n"
-            f"Formatos soportados: {', '.join(supported_formats)}"
+            f"Formatos soportados: {', '.join(AudioExtractor.get_supported_formats())}"
         )
         return
 
@@ -581,7 +915,7 @@ async def handle_extract_audio_command(update: Update, context: ContextTypes.DEF
         logger.warning(f"Could not send processing message to user {user_id}: {e}")
 
     # Process with TempManager for automatic cleanup
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             # Generate safe filenames
             input_filename = f"input_{user_id}_{video.file_unique_id}.mp4"
@@ -617,10 +951,10 @@ async def handle_extract_audio_command(update: Update, context: ContextTypes.DEF
             # Extract audio with timeout
             logger.info(f"Extracting audio as {output_format} for user {user_id}")
             try:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 extractor = AudioExtractor(str(input_path), str(output_path))
                 success = await asyncio.wait_for(
-                    loop.run_in_executor(None, extractor.extract, output_format),
+                    loop.run_in_executor(MEDIA_EXECUTOR, extractor.extract, output_format),
                     timeout=config.PROCESSING_TIMEOUT
                 )
 
@@ -635,8 +969,7 @@ async def handle_extract_audio_command(update: Update, context: ContextTypes.DEF
             # Send extracted audio
             logger.info(f"Sending extracted audio to user {user_id}")
             try:
-                with open(output_path, "rb") as audio_file:
-                    await update.message.reply_audio(audio=audio_file)
+                await update.message.reply_audio(audio=await _read_upload_file(output_path))
                 logger.info(f"Audio sent successfully to user {user_id}")
             except Exception as e:
                 logger.error(f"Failed to send audio to user {user_id}: {e}")
@@ -676,6 +1009,415 @@ SPLIT_WAITING_START_TIME = "waiting_start_time"
 SPLIT_WAITING_END_TIME = "waiting_end_time"
 SPLIT_CONFIRMING = "confirming"
 
+# ffprobe durations keyed by (file_unique_id, file_size). The unique id
+# identifies the content itself, so entries never need invalidation.
+MEDIA_DURATION_CACHE_SIZE = 512
+_media_duration_cache: OrderedDict[tuple[str, int], float] = OrderedDict()
+
+
+def _get_cached_duration(file_unique_id: str, file_size: int | None) -> float | None:
+    """Return a previously probed duration for a Telegram file, if known."""
+    key = (file_unique_id, file_size or 0)
+    duration = _media_duration_cache.get(key)
+    if duration is not None:
+        _media_duration_cache.move_to_end(key)
+    return duration
+
+
+def _cache_duration(file_unique_id: str, file_size: int | None, duration: float | None) -> None:
+    """Remember a probed duration, evicting the least recently used entry."""
+    if duration is None:
+        return
+    key = (file_unique_id, file_size or 0)
+    _media_duration_cache[key] = duration
+    _media_duration_cache.move_to_end(key)
+    while len(_media_duration_cache) > MEDIA_DURATION_CACHE_SIZE:
+        _media_duration_cache.popitem(last=False)
+
+
+# Minimum seconds between progress message edits during multi-part sends
+PROGRESS_EDIT_INTERVAL_SECONDS = 1.0
+
+
+async def _throttled_progress(message, text: str, state: dict) -> None:
+    """Edit a progress message at most once per PROGRESS_EDIT_INTERVAL_SECONDS.
+
+    Args:
+        message: Telegram message to edit
+        text: New progress text
+        state: Mutable dict shared across calls for the same message
+    """
+    now = time.monotonic()
+    last_edit = state.get("last_edit")
+    if last_edit is not None and now - last_edit < PROGRESS_EDIT_INTERVAL_SECONDS:
+        return
+    state["last_edit"] = now
+    try:
+        await message.edit_text(text)
+    except Exception as e:
+        logger.warning(f"Could not update progress message: {e}")
+
+
+def _threaded_progress(message, label: str) -> Callable[[float], None] | None:
+    """Build a progress callback for ffmpeg work running in MEDIA_EXECUTOR.
+
+    The callback runs in the worker thread and hands each new percentage to
+    _throttled_progress on the event loop, so the status message shows
+    "<label> NN%" while ffmpeg runs.
+
+    Args:
+        message: Status message to edit, or None to skip progress reporting
+        label: Text shown before the percentage
+
+    Returns:
+        Callable taking the completed fraction, or None without a message
+    """
+    if message is None:
+        return None
+    loop = asyncio.get_running_loop()
+    state: dict = {}
+
+    def report(fraction: float) -> None:
+        text = f"{label} {fraction:.0%}"
+        if text == state.get("text"):
+            return
+        state["text"] = text
+        asyncio.run_coroutine_threadsafe(_throttled_progress(message, text, state), loop)
+
+    return report
+
+
+def _retry_after_seconds(error: RetryAfter) -> float:
+    """Return the flood-wait delay of a RetryAfter error in seconds."""
+    retry_after = error.retry_after
+    if hasattr(retry_after, "total_seconds"):
+        return retry_after.total_seconds()
+    return float(retry_after)
+
+
+# Backoff bounds for retried Telegram sends
+SEND_RETRY_BASE_DELAY_SECONDS = 1.0
+SEND_RETRY_MAX_DELAY_SECONDS = 60.0
+
+
+async def _safe_reply(message, text: str, *, attempts: int = 3, **kwargs):
+    """Reply to a message, retrying transient Telegram failures.
+
+    Flood waits sleep for the delay Telegram asks for; timeouts and network
+    errors back off exponentially up to SEND_RETRY_MAX_DELAY_SECONDS.
+
+    Args:
+        message: Telegram message to reply to
+        text: Reply text
+        attempts: Maximum number of send attempts
+        **kwargs: Extra arguments for reply_text (parse_mode, reply_markup...)
+
+    Returns:
+        The sent message, or None if every attempt failed
+    """
+    delay = SEND_RETRY_BASE_DELAY_SECONDS
+    for attempt in range(1, attempts + 1):
+        try:
+            return await message.reply_text(text, **kwargs)
+        except RetryAfter as e:
+            wait = _retry_after_seconds(e)
+        except BadRequest:
+            # Subclass of NetworkError, but a malformed request won't recover
+            raise
+        except (TimedOut, NetworkError) as e:
+            wait = delay
+            delay = min(delay * 2, SEND_RETRY_MAX_DELAY_SECONDS)
+            logger.warning(f"Reply failed (attempt {attempt}/{attempts}): {e}")
+        if attempt < attempts:
+            await asyncio.sleep(wait)
+    logger.error(f"Giving up on reply after {attempts} attempts")
+    return None
+
+
+# Strong references so fire-and-forget tasks aren't garbage-collected mid-flight
+_background_tasks: set[asyncio.Task] = set()
+
+
+async def _safe_delete(message) -> None:
+    """Delete a message, logging instead of raising on failure.
+
+    Args:
+        message: Telegram message to delete
+    """
+    try:
+        await message.delete()
+    except BadRequest as e:
+        # Already deleted or too old to delete; expected, not worth a warning
+        logger.debug(f"Processing message not deleted: {e}")
+    except Exception as e:
+        logger.warning(f"Could not delete processing message: {e}")
+
+
+def _fire_and_forget_delete(message) -> None:
+    """Schedule deletion of a status message without waiting for Telegram.
+
+    Args:
+        message: Optional Telegram message to delete; None is ignored
+    """
+    if message:
+        task = asyncio.create_task(_safe_delete(message))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+async def _replace_status(status_message, message, text: str, **kwargs):
+    """Turn a status message into the final reply, or send a new one.
+
+    Editing the status in place costs one API call instead of a delete
+    followed by a new message.
+
+    Args:
+        status_message: Optional status message to edit
+        message: Message to reply to if there is nothing to edit
+        text: Final text
+        **kwargs: Extra arguments for edit_text/reply_text (parse_mode, reply_markup)
+
+    Returns:
+        The edited or newly sent message
+    """
+    if status_message:
+        try:
+            return await status_message.edit_text(text, **kwargs)
+        except BadRequest as e:
+            logger.debug(f"Could not edit status message, replying instead: {e}")
+    return await message.reply_text(text, **kwargs)
+
+
+def _fire_and_forget_cleanup(temp_mgr: TempManager) -> None:
+    """Remove a session's temp directory in a worker thread without waiting.
+
+    Args:
+        temp_mgr: TempManager whose directory should be removed
+    """
+    task = asyncio.create_task(temp_mgr.cleanup_async())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+@asynccontextmanager
+async def _job_cleanup(
+    processing_message, user_data: dict, *session_keys: str, temp_mgr: TempManager | None = None
+) -> AsyncIterator[None]:
+    """Tear down a media job however it ends, including cancellation.
+
+    Deletes the status message, drops the job's session keys from
+    ``user_data`` and removes the temp directory once the block exits.
+
+    Args:
+        processing_message: Status message to delete, or None
+        user_data: The user's context.user_data
+        *session_keys: Keys to remove from user_data
+        temp_mgr: TempManager to clean up, if the job owns one
+    """
+    try:
+        yield
+    finally:
+        _fire_and_forget_delete(processing_message)
+        for key in session_keys:
+            user_data.pop(key, None)
+        if temp_mgr is not None:
+            await temp_mgr.cleanup_async()
+
+
+async def _iter_segments_in_executor(
+    segment_iter: Iterator[str], processing_message=None
+) -> AsyncIterator[str]:
+    """Drain a blocking splitter iterator on MEDIA_EXECUTOR, yielding as it goes.
+
+    The iterator runs in a worker thread while holding a media job slot and
+    hands each finished segment back to the event loop through a queue, so
+    uploads can start before ffmpeg has written the last segment. If the
+    consumer stops early (timeout, error or closing the stream), the worker
+    closes the iterator at the next segment, which stops ffmpeg, and the
+    slot is held until it has done so.
+
+    Args:
+        segment_iter: Blocking iterator of segment paths (e.g. iter_split_by_duration)
+        processing_message: Optional status message for the queued notice
+
+    Yields:
+        Segment file paths in production order
+
+    Raises:
+        asyncio.TimeoutError: If splitting exceeds config.PROCESSING_TIMEOUT
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    finished = object()
+    stop = threading.Event()
+
+    def _produce() -> None:
+        try:
+            for segment_path in segment_iter:
+                if stop.is_set():
+                    break
+                loop.call_soon_threadsafe(queue.put_nowait, segment_path)
+        finally:
+            # Closing a splitter generator kills its ffmpeg process
+            close = getattr(segment_iter, "close", None)
+            if close is not None:
+                close()
+            loop.call_soon_threadsafe(queue.put_nowait, finished)
+
+    async with _media_job_slot(processing_message):
+        # The timeout covers ffmpeg only, not the wait for a free slot
+        deadline = loop.time() + config.PROCESSING_TIMEOUT
+        producer = loop.run_in_executor(MEDIA_EXECUTOR, _produce)
+        try:
+            while True:
+                item = await asyncio.wait_for(queue.get(), max(0.0, deadline - loop.time()))
+                if item is finished:
+                    break
+                yield item
+            # Surface splitter errors raised in the worker thread
+            await producer
+        finally:
+            stop.set()
+            if not producer.done():
+                # Keep the job slot until ffmpeg has actually stopped
+                await asyncio.gather(producer, return_exceptions=True)
+
+
+async def _expected_segment_count(splitter, segment_duration: int) -> int:
+    """Count the parts a duration split will produce, probing only if needed.
+
+    With the duration already known (e.g. from the duration cache) the count
+    is plain arithmetic, so the executor round-trip for ffprobe is skipped.
+
+    Args:
+        splitter: VideoSplitter or AudioSplitter for the input file
+        segment_duration: Duration of each segment in seconds
+
+    Returns:
+        Expected number of segments
+    """
+    if splitter.duration is not None:
+        return splitter.expected_segment_count(segment_duration)
+    return await asyncio.wait_for(
+        asyncio.get_running_loop().run_in_executor(
+            MEDIA_EXECUTOR, splitter.expected_segment_count, segment_duration
+        ),
+        timeout=config.PROCESSING_TIMEOUT
+    )
+
+
+async def _send_split_segments(
+    update: Update,
+    segments: list[str] | AsyncIterator[str],
+    media_kind: str,
+    processing_message,
+    user_id: int,
+    total_segments: int | None = None,
+) -> int:
+    """Upload split segments to the user with bounded concurrency.
+
+    Uploads overlap up to config.UPLOAD_CONCURRENCY at a time. Each part is
+    captioned with its index so the order stays clear even when uploads
+    complete out of order. When a stream produces a different number of
+    parts than total_segments predicted, the sent captions are corrected
+    to the real count afterwards. A failed part is reported to the user
+    without aborting the remaining uploads.
+
+    Args:
+        update: Telegram update object
+        segments: Ordered segment file paths, or an async stream of them
+            when uploads should start while the split is still running
+        media_kind: "video" or "audio", selects reply_video/reply_audio
+        processing_message: Optional progress message to update
+        user_id: ID of the user receiving the segments
+        total_segments: Part count for captions; required for streams
+
+    Returns:
+        Number of segments dispatched
+    """
+    if total_segments is None:
+        total_segments = len(segments)
+    semaphore = asyncio.Semaphore(config.UPLOAD_CONCURRENCY)
+    # Lets the next segment be read while the current ones upload, keeping
+    # disk I/O out of the upload critical section. Each slot holds a whole
+    # segment in memory, so a split job holds at most UPLOAD_CONCURRENCY + 1
+    # segments (nothing with TELEGRAM_LOCAL_SHARED_FS, which uploads by path).
+    buffer_slots = asyncio.Semaphore(config.UPLOAD_CONCURRENCY + 1)
+    reply = update.message.reply_video if media_kind == "video" else update.message.reply_audio
+    completed = 0
+    progress_state: dict = {}
+    # Formatted once per batch; a stream that overshoots the probed count
+    # falls back to an unnumbered total
+    captions = [f"Parte {i} de {total_segments}" for i in range(1, total_segments + 1)]
+
+    sent_messages: dict[int, Any] = {}
+
+    async def _upload(i: int, input_file: InputFile | Path) -> None:
+        sent_messages[i] = await reply(
+            **{media_kind: input_file},
+            caption=captions[i - 1] if i <= total_segments else f"Parte {i}"
+        )
+
+    async def _send_one(i: int, segment_path: str) -> None:
+        nonlocal completed
+        async with buffer_slots:
+            try:
+                input_file = await _read_upload_file(segment_path)
+                async with semaphore:
+                    try:
+                        await _upload(i, input_file)
+                    except RetryAfter as e:
+                        delay = _retry_after_seconds(e)
+                        logger.warning(f"Rate limited sending segment {i} to user {user_id}, retrying in {delay}s")
+                        await asyncio.sleep(delay)
+                        await _upload(i, input_file)
+                logger.info(f"Sent {media_kind} segment {i}/{total_segments} to user {user_id}")
+            except Exception as e:
+                logger.error(f"Failed to send {media_kind} segment {i} to user {user_id}: {e}")
+                await update.message.reply_text(
+                    f"Error enviando la parte {i} de {total_segments}."
+                )
+
+        completed += 1
+        # The progress message is deleted once all parts are sent, so the
+        # final count is never shown; intermediate edits are time-throttled
+        if processing_message and completed < total_segments:
+            await _throttled_progress(
+                processing_message,
+                f"Enviadas {completed} de {total_segments} partes...",
+                progress_state,
+            )
+
+    if isinstance(segments, list):
+        sends = [_send_one(i, segment_path) for i, segment_path in enumerate(segments, 1)]
+    else:
+        sends = []
+        try:
+            async for segment_path in segments:
+                sends.append(asyncio.create_task(_send_one(len(sends) + 1, segment_path)))
+        except BaseException:
+            for task in sends:
+                task.cancel()
+            await asyncio.gather(*sends, return_exceptions=True)
+            raise
+
+    await asyncio.gather(*sends, return_exceptions=True)
+
+    if len(sends) != total_segments:
+        logger.warning(
+            f"Expected {total_segments} {media_kind} segments for user {user_id}, "
+            f"produced {len(sends)}"
+        )
+        # Stream copy cuts on keyframes, so the probed count can be off
+        await asyncio.gather(
+            *(
+                message.edit_caption(caption=f"Parte {i} de {len(sends)}")
+                for i, message in sent_messages.items()
+            ),
+            return_exceptions=True,
+        )
+    return len(sends)
+
 
 async def handle_split_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /split command to split video into segments.
@@ -794,7 +1536,7 @@ async def handle_split_command(update: Update, context: ContextTypes.DEFAULT_TYP
         logger.warning(f"Could not send processing message to user {user_id}: {e}")
 
     # Process with TempManager for automatic cleanup
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             # Generate safe filenames
             input_filename = f"input_{user_id}_{video.file_unique_id}.mp4"
@@ -818,49 +1560,50 @@ async def handle_split_command(update: Update, context: ContextTypes.DEFAULT_TYP
                 logger.warning(f"Video validation failed for user {user_id}: {error_msg}")
                 raise ValidationError(error_msg)
 
-            # Check disk space before processing
-            video_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
-            required_space = estimate_required_space(int(video_size_mb))
+            # Check disk space before processing; Telegram already reported the size
+            video_size_mb = (video.file_size or os.path.getsize(input_path)) >> 20
+            required_space = estimate_required_space(video_size_mb)
             has_space, space_error = check_disk_space(required_space)
             if not has_space:
                 logger.warning(f"Disk space check failed for user {user_id}: {space_error}")
                 raise ValidationError(space_error)
 
-            # Create output directory for segments
-            Path(output_dir).mkdir(parents=True, exist_ok=True)
-
             # Split video with timeout
             logger.info(f"Splitting video for user {user_id} (mode={split_mode}, value={split_value})")
             try:
-                loop = asyncio.get_event_loop()
-                splitter = VideoSplitter(str(input_path), str(output_dir))
+                loop = asyncio.get_running_loop()
+                splitter = VideoSplitter(
+                    str(input_path),
+                    str(output_dir),
+                    duration=_get_cached_duration(video.file_unique_id, video.file_size),
+                    threads=config.FFMPEG_THREADS,
+                )
 
                 if split_mode == "duration":
-                    # Check how many segments would be created
-                    duration = await loop.run_in_executor(None, splitter.get_video_duration)
-                    expected_segments = int(duration // split_value) + (1 if duration % split_value > 0 else 0)
+                    # Count first so the segment cap is enforced before ffmpeg runs
+                    expected_segments = await _expected_segment_count(splitter, split_value)
+                    _cache_duration(video.file_unique_id, video.file_size, splitter.duration)
 
                     if expected_segments > config.MAX_SEGMENTS:
                         await update.message.reply_text(
                             f"El video generaría demasiadas partes ({expected_segments}). "
                             f"Intenta con una duración mayor (máximo {config.MAX_SEGMENTS} partes)."
                         )
-                        if processing_message:
-                            try:
-                                await processing_message.delete()
-                            except Exception:
-                                pass
+                        _fire_and_forget_delete(processing_message)
                         return
 
-                    segments = await asyncio.wait_for(
-                        loop.run_in_executor(None, splitter.split_by_duration, split_value),
-                        timeout=config.PROCESSING_TIMEOUT
+                    # Segments are uploaded as ffmpeg finishes each one
+                    segments = _iter_segments_in_executor(
+                        splitter.iter_split_by_duration(split_value), processing_message
                     )
+                    total_segments = expected_segments
                 else:  # split_mode == "parts"
-                    segments = await asyncio.wait_for(
-                        loop.run_in_executor(None, splitter.split_by_parts, split_value),
-                        timeout=config.PROCESSING_TIMEOUT
-                    )
+                    async with _media_job_slot(processing_message):
+                        segments = await asyncio.wait_for(
+                            loop.run_in_executor(MEDIA_EXECUTOR, splitter.split_by_parts, split_value),
+                            timeout=config.PROCESSING_TIMEOUT
+                        )
+                    _cache_duration(video.file_unique_id, video.file_size, splitter.duration)
 
                     # Check if we got too many segments (shouldn't happen due to validation in split_by_parts)
                     if len(segments) > config.MAX_SEGMENTS:
@@ -868,14 +1611,18 @@ async def handle_split_command(update: Update, context: ContextTypes.DEFAULT_TYP
                             f"El video generaría demasiadas partes ({len(segments)}). "
                             f"Intenta con menos partes (máximo {config.MAX_SEGMENTS})."
                         )
-                        if processing_message:
-                            try:
-                                await processing_message.delete()
-                            except Exception:
-                                pass
+                        _fire_and_forget_delete(processing_message)
                         return
 
-                if not segments:
+                    total_segments = len(segments)
+
+                # Send segments to user
+                logger.info(f"Sending {total_segments} segments to user {user_id}")
+                total_segments = await _send_split_segments(
+                    update, segments, "video", processing_message, user_id, total_segments
+                )
+
+                if not total_segments:
                     logger.error(f"Video splitting produced no segments for user {user_id}")
                     raise VideoSplitError("No se generaron segmentos del video")
 
@@ -883,64 +1630,23 @@ async def handle_split_command(update: Update, context: ContextTypes.DEFAULT_TYP
                 logger.error(f"Video splitting timed out for user {user_id}")
                 raise ProcessingTimeoutError("La división del video tardó demasiado") from e
 
-            # Send segments to user
-            logger.info(f"Sending {len(segments)} segments to user {user_id}")
-            total_segments = len(segments)
-
-            for i, segment_path in enumerate(segments, 1):
-                try:
-                    # Update progress message
-                    if processing_message:
-                        try:
-                            await processing_message.edit_text(
-                                f"Enviando parte {i} de {total_segments}..."
-                            )
-                        except Exception as e:
-                            logger.warning(f"Could not update progress message: {e}")
-
-                    # Send segment
-                    with open(segment_path, "rb") as video_file:
-                        await update.message.reply_video(
-                            video=video_file,
-                            caption=f"Parte {i} de {total_segments}"
-                        )
-                    logger.info(f"Sent segment {i}/{total_segments} to user {user_id}")
-
-                except Exception as e:
-                    logger.error(f"Failed to send segment {i} to user {user_id}: {e}")
-                    await update.message.reply_text(
-                        f"Error enviando la parte {i} de {total_segments}."
-                    )
-
-            # Send completion message
-            await update.message.reply_text(
-                f"¡Listo! El video se dividió en {total_segments} partes."
-            )
-            logger.info(f"All segments sent successfully to user {user_id}")
+            # Send completion message
+            await update.message.reply_text(
+                f"¡Listo! El video se dividió en {total_segments} partes."
+            )
+            logger.info(f"All segments sent successfully to user {user_id}")
 
             # Delete processing message on success
-            if processing_message:
-                try:
-                    await processing_message.delete()
-                except Exception as e:
-                    logger.warning(f"Could not delete processing message: {e}")
+            _fire_and_forget_delete(processing_message)
 
         except (DownloadError, VideoSplitError, ProcessingTimeoutError, ValidationError) as e:
             await handle_processing_error(update, e, user_id)
-            if processing_message:
-                try:
-                    await processing_message.delete()
-                except Exception as e:
-                    logger.warning(f"Could not delete processing message: {e}")
+            _fire_and_forget_delete(processing_message)
 
         except Exception as e:
             logger.exception(f"Unexpected error splitting video for user {user_id}: {e}")
             await handle_processing_error(update, e, user_id)
-            if processing_message:
-                try:
-                    await processing_message.delete()
-                except Exception as e:
-                    logger.warning(f"Could not delete processing message: {e}")
+            _fire_and_forget_delete(processing_message)
 
 
 # Default audio segment duration for split_audio command
@@ -1064,7 +1770,7 @@ async def handle_split_audio_command(update: Update, context: ContextTypes.DEFAU
         logger.warning(f"Could not send processing message to user {user_id}: {e}")
 
     # Process with TempManager for automatic cleanup
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             # Generate safe filenames
             input_filename = f"input_audio_{user_id}_{audio.file_unique_id}.mp3"
@@ -1088,49 +1794,50 @@ async def handle_split_audio_command(update: Update, context: ContextTypes.DEFAU
                 logger.warning(f"Audio validation failed for user {user_id}: {error_msg}")
                 raise ValidationError(error_msg)
 
-            # Check disk space before processing
-            audio_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
-            required_space = estimate_required_space(int(audio_size_mb))
+            # Check disk space before processing; Telegram already reported the size
+            audio_size_mb = (audio.file_size or os.path.getsize(input_path)) >> 20
+            required_space = estimate_required_space(audio_size_mb)
             has_space, space_error = check_disk_space(required_space)
             if not has_space:
                 logger.warning(f"Disk space check failed for user {user_id}: {space_error}")
                 raise ValidationError(space_error)
 
-            # Create output directory for segments
-            Path(output_dir).mkdir(parents=True, exist_ok=True)
-
             # Split audio with timeout
             logger.info(f"Splitting audio for user {user_id} (mode={split_mode}, value={split_value})")
             try:
-                loop = asyncio.get_event_loop()
-                splitter = AudioSplitter(str(input_path), str(output_dir))
+                loop = asyncio.get_running_loop()
+                splitter = AudioSplitter(
+                    str(input_path),
+                    str(output_dir),
+                    duration=_get_cached_duration(audio.file_unique_id, audio.file_size),
+                    threads=config.FFMPEG_THREADS,
+                )
 
                 if split_mode == "duration":
-                    # Check how many segments would be created
-                    duration = await loop.run_in_executor(None, splitter.get_audio_duration)
-                    expected_segments = int(duration // split_value) + (1 if duration % split_value > 0 else 0)
+                    # Count first so the segment cap is enforced before ffmpeg runs
+                    expected_segments = await _expected_segment_count(splitter, split_value)
+                    _cache_duration(audio.file_unique_id, audio.file_size, splitter.duration)
 
                     if expected_segments > config.MAX_AUDIO_SEGMENTS:
                         await update.message.reply_text(
                             f"El audio generaría demasiadas partes ({expected_segments}). "
                             f"Intenta con una duración mayor (máximo {config.MAX_AUDIO_SEGMENTS} partes)."
                         )
-                        if processing_message:
-                            try:
-                                await processing_message.delete()
-                            except Exception:
-                                pass
+                        _fire_and_forget_delete(processing_message)
                         return
 
-                    segments = await asyncio.wait_for(
-                        loop.run_in_executor(None, splitter.split_by_duration, split_value),
-                        timeout=config.PROCESSING_TIMEOUT
+                    # Segments are uploaded as ffmpeg finishes each one
+                    segments = _iter_segments_in_executor(
+                        splitter.iter_split_by_duration(split_value), processing_message
                     )
+                    total_segments = expected_segments
                 else:  # split_mode == "parts"
-                    segments = await asyncio.wait_for(
-                        loop.run_in_executor(None, splitter.split_by_parts, split_value),
-                        timeout=config.PROCESSING_TIMEOUT
-                    )
+                    async with _media_job_slot(processing_message):
+                        segments = await asyncio.wait_for(
+                            loop.run_in_executor(MEDIA_EXECUTOR, splitter.split_by_parts, split_value),
+                            timeout=config.PROCESSING_TIMEOUT
+                        )
+                    _cache_duration(audio.file_unique_id, audio.file_size, splitter.duration)
 
                     # Check if we got too many segments
                     if len(segments) > config.MAX_AUDIO_SEGMENTS:
@@ -1138,14 +1845,18 @@ async def handle_split_audio_command(update: Update, context: ContextTypes.DEFAU
                             f"El audio generaría demasiadas partes ({len(segments)}). "
                             f"Intenta con menos partes (máximo {config.MAX_AUDIO_SEGMENTS})."
                         )
-                        if processing_message:
-                            try:
-                                await processing_message.delete()
-                            except Exception:
-                                pass
+                        _fire_and_forget_delete(processing_message)
                         return
 
-                if not segments:
+                    total_segments = len(segments)
+
+                # Send segments to user
+                logger.info(f"Sending {total_segments} audio segments to user {user_id}")
+                total_segments = await _send_split_segments(
+                    update, segments, "audio", processing_message, user_id, total_segments
+                )
+
+                if not total_segments:
                     logger.error(f"Audio splitting produced no segments for user {user_id}")
                     raise AudioSplitError("No se generaron segmentos del audio")
 
@@ -1153,35 +1864,6 @@ async def handle_split_audio_command(update: Update, context: ContextTypes.DEFAU
                 logger.error(f"Audio splitting timed out for user {user_id}")
                 raise ProcessingTimeoutError("La división del audio tardó demasiado") from e
 
-            # Send segments to user
-            logger.info(f"Sending {len(segments)} audio segments to user {user_id}")
-            total_segments = len(segments)
-
-            for i, segment_path in enumerate(segments, 1):
-                try:
-                    # Update progress message
-                    if processing_message:
-                        try:
-                            await processing_message.edit_text(
-                                f"Enviando parte {i} de {total_segments}..."
-                            )
-                        except Exception as e:
-                            logger.warning(f"Could not update progress message: {e}")
-
-                    # Send segment
-                    with open(segment_path, "rb") as audio_file:
-                        await update.message.reply_audio(
-                            audio=audio_file,
-                            caption=f"Parte {i} de {total_segments}"
-                        )
-                    logger.info(f"Sent audio segment {i}/{total_segments} to user {user_id}")
-
-                except Exception as e:
-                    logger.error(f"Failed to send audio segment {i} to user {user_id}: {e}")
-                    await update.message.reply_text(
-                        f"Error enviando la parte {i} de {total_segments}."
-                    )
-
             # Send completion message
             await update.message.reply_text(
                 f"¡Listo! El audio se dividió en {total_segments} partes."
@@ -1189,32 +1871,142 @@ async def handle_split_audio_command(update: Update, context: ContextTypes.DEFAU
             logger.info(f"All audio segments sent successfully to user {user_id}")
 
             # Delete processing message on success
-            if processing_message:
-                try:
-                    await processing_message.delete()
-                except Exception as e:
-                    logger.warning(f"Could not delete processing message: {e}")
+            _fire_and_forget_delete(processing_message)
 
         except (DownloadError, AudioSplitError, ProcessingTimeoutError, ValidationError) as e:
             await handle_processing_error(update, e, user_id)
-            if processing_message:
-                try:
-                    await processing_message.delete()
-                except Exception as e:
-                    logger.warning(f"Could not delete processing message: {e}")
+            _fire_and_forget_delete(processing_message)
 
         except Exception as e:
             logger.exception(f"Unexpected error splitting audio for user {user_id}: {e}")
             await handle_processing_error(update, e, user_id)
-            if processing_message:
-                try:
-                    await processing_message.delete()
-                except Exception as e:
-                    logger.warning(f"Could not delete processing message: {e}")
+            _fire_and_forget_delete(processing_message)
 
 
 # Note: Join command configuration now uses bot.config values
 
+# How often idle join sessions are swept from user_data
+SESSION_SWEEP_INTERVAL_SECONDS = 300
+
+# user_data keys holding join sessions with a temp_mgr and monotonic last_activity,
+# in the priority order /done and /cancel resolve them
+_JOIN_SESSION_KINDS = (("video", "join_session"), ("audio", "join_audio_session"))
+_JOIN_SESSION_KEYS = tuple(key for _, key in _JOIN_SESSION_KINDS)
+
+# Replies shared by the join /done, /cancel and add handlers
+JOIN_NO_SESSION_MESSAGE = "No hay una sesión de unión activa."
+JOIN_AUDIO_NO_SESSION_MESSAGE = "No hay una sesión de unión de audio activa."
+JOIN_AUDIO_BUSY_MESSAGE = "Ya estoy uniendo tus audios, espera un momento."
+JOIN_VIDEO_BUSY_MESSAGE = "Ya estoy uniendo tus videos, espera un momento."
+
+# Repeated /cancel without a session within this window gets no new reply
+NO_SESSION_REPLY_COOLDOWN_SECONDS = 1.0
+
+
+@dataclass(slots=True)
+class JoinSession:
+    """Videos collected by a /join session, stored in user_data["join_session"].
+
+    Per-video data lives in parallel lists indexed like ``paths``, so /done
+    needs no stat() pass. A validation is None once the video is known to
+    be valid, otherwise the pending validate_video_file future.
+    """
+
+    temp_mgr: TempManager
+    paths: list[str] = field(default_factory=list)
+    sizes: list[int] = field(default_factory=list)
+    durations: list[float] = field(default_factory=list)
+    validations: list[asyncio.Future | None] = field(default_factory=list)
+    last_activity: float = field(default_factory=time.monotonic)
+    correlation_id: str | None = None
+    # The /done task joining this session, so /cancel can stop it
+    task: asyncio.Task | None = None
+
+
+def _active_join_session(user_data: dict) -> tuple[str | None, JoinSession | dict | None]:
+    """Find the user's active join session and what it joins.
+
+    Video sessions take priority over audio ones, so /done and /cancel
+    resolve a user with both the same way as before.
+
+    Args:
+        user_data: The user's context.user_data
+
+    Returns:
+        Tuple of (kind, session) where kind is "video" or "audio", or
+        (None, None) when no join session is active
+    """
+    for kind, key in _JOIN_SESSION_KINDS:
+        session = user_data.get(key)
+        if session:
+            return kind, session
+    return None, None
+
+
+async def sweep_expired_sessions(user_data_by_user: dict, now: float | None = None) -> int:
+    """Drop join sessions idle for longer than config.JOIN_SESSION_TIMEOUT.
+
+    Expired sessions are otherwise only noticed when the user interacts
+    again, so abandoned ones would keep their temp files forever. Sessions
+    whose join is still queued or running are left alone; the join removes
+    them when it finishes.
+
+    Args:
+        user_data_by_user: Mapping of user ID to that user's user_data
+        now: Current time.monotonic() value, for testing
+
+    Returns:
+        Number of sessions removed
+    """
+    if now is None:
+        now = time.monotonic()
+
+    removed = 0
+    for user_id, user_data in list(user_data_by_user.items()):
+        for key in _JOIN_SESSION_KEYS:
+            session = user_data.get(key)
+            if not session:
+                continue
+            # Audio join sessions are still plain dicts
+            if isinstance(session, JoinSession):
+                last_activity, temp_mgr = session.last_activity, session.temp_mgr
+                running = session.task is not None and not session.task.done()
+            else:
+                last_activity, temp_mgr = session.get("last_activity", now), session["temp_mgr"]
+                running = _join_audio_running(session)
+            if running or now - last_activity <= config.JOIN_SESSION_TIMEOUT:
+                continue
+            user_data.pop(key, None)
+            try:
+                await temp_mgr.cleanup_async()
+            except Exception as e:
+                logger.warning(f"Could not clean up expired {key} for user {user_id}: {e}")
+            removed += 1
+            logger.info(f"Swept expired {key} for user {user_id}")
+    return removed
+
+
+async def _run_session_sweeper(application) -> None:
+    """Periodically sweep expired join sessions until cancelled."""
+    while True:
+        await asyncio.sleep(SESSION_SWEEP_INTERVAL_SECONDS)
+        try:
+            await sweep_expired_sessions(application.user_data)
+        except Exception as e:
+            logger.error(f"Session sweep failed: {e}")
+
+
+async def start_session_sweeper(application) -> None:
+    """Application post_init hook that starts the idle-session sweeper.
+
+    Args:
+        application: The running telegram Application
+    """
+    task = asyncio.create_task(_run_session_sweeper(application))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    logger.info(f"Session sweeper started (every {SESSION_SWEEP_INTERVAL_SECONDS}s)")
+
 
 async def handle_join_start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /join command to start a video join session.
@@ -1232,17 +2024,13 @@ async def handle_join_start(update: Update, context: ContextTypes.DEFAULT_TYPE)
     if context.user_data.get("join_session"):
         await update.message.reply_text(
             "Ya tienes una sesión de unión activa. "
-            f"Tienes {len(context.user_data['join_session']['videos'])} video(s) agregados.\n\n"
+            f"Tienes {len(context.user_data['join_session'].paths)} video(s) agregados.\n\n"
             "Envía más videos o usa /done para unir, /cancel para cancelar."
         )
         return
 
     # Initialize join session
-    context.user_data["join_session"] = {
-        "videos": [],
-        "temp_mgr": TempManager(),
-        "last_activity": asyncio.get_event_loop().time(),
-    }
+    context.user_data["join_session"] = JoinSession(temp_mgr=TempManager())
 
     await update.message.reply_text(
         "🎬 *Modo unión de videos activado*\n\n"
@@ -1273,12 +2061,19 @@ async def handle_join_video(update: Update, context: ContextTypes.DEFAULT_TYPE)
         await handle_video(update, context)
         return
 
+    # /done runs concurrently with this handler; videos added while it is
+    # joining would never be joined, and an idle-looking session must not
+    # expire under a running join
+    if session.task is not None and not session.task.done():
+        await update.message.reply_text(JOIN_VIDEO_BUSY_MESSAGE)
+        return
+
     # Check session timeout
-    current_time = asyncio.get_event_loop().time()
-    if current_time - session["last_activity"] > config.JOIN_SESSION_TIMEOUT:
+    current_time = time.monotonic()
+    if current_time - session.last_activity > config.JOIN_SESSION_TIMEOUT:
         logger.info(f"Join session expired for user {user_id}")
         # Clean up expired session
-        session["temp_mgr"].cleanup()
+        _fire_and_forget_cleanup(session.temp_mgr)
         context.user_data.pop("join_session", None)
         await update.message.reply_text(
             "La sesión expiró. Usa /join para comenzar de nuevo."
@@ -1286,10 +2081,10 @@ async def handle_join_video(update: Update, context: ContextTypes.DEFAULT_TYPE)
         return
 
     # Update last activity
-    session["last_activity"] = current_time
+    session.last_activity = current_time
 
     # Check if we've reached the maximum
-    if len(session["videos"]) >= config.JOIN_MAX_VIDEOS:
+    if len(session.paths) >= config.JOIN_MAX_VIDEOS:
         await update.message.reply_text(
             f"Máximo {config.JOIN_MAX_VIDEOS} videos permitidos.\n"
             "Usa /done para unir o /cancel para cancelar."
@@ -1316,16 +2111,16 @@ async def handle_join_video(update: Update, context: ContextTypes.DEFAULT_TYPE)
     processing_message = None
     try:
         processing_message = await update.message.reply_text(
-            f"Descargando video {len(session['videos']) + 1}..."
+            f"Descargando video {len(session.paths) + 1}..."
         )
     except Exception as e:
         logger.warning(f"Could not send processing message to user {user_id}: {e}")
 
     try:
-        temp_mgr = session["temp_mgr"]
+        temp_mgr = session.temp_mgr
 
         # Generate safe filename
-        video_index = len(session["videos"]) + 1
+        video_index = len(session.paths) + 1
         input_filename = f"join_{user_id}_video{video_index:02d}_{video.file_unique_id}.mp4"
         input_path = temp_mgr.get_temp_path(input_filename)
 
@@ -1337,81 +2132,99 @@ async def handle_join_video(update: Update, context: ContextTypes.DEFAULT_TYPE)
             logger.info(f"Video downloaded to {input_path}")
         except Exception as e:
             logger.error(f"Failed to download video for user {user_id}: {e}")
-            if processing_message:
-                try:
-                    await processing_message.delete()
-                except Exception:
-                    pass
+            _fire_and_forget_delete(processing_message)
             await update.message.reply_text(
                 "No pude descargar el video. Intenta con otro archivo."
             )
             return
 
-        # Validate video integrity after download
-        is_valid, error_msg = validate_video_file(str(input_path))
-        if not is_valid:
-            logger.warning(f"Video validation failed for user {user_id}: {error_msg}")
-            if processing_message:
-                try:
-                    await processing_message.delete()
-                except Exception:
-                    pass
-            await update.message.reply_text(error_msg)
-            return
+        # Validate in the background so the ffprobe run overlaps with the
+        # user's next upload; /done awaits the result before joining
+        loop = asyncio.get_running_loop()
+        validation = loop.run_in_executor(MEDIA_EXECUTOR, validate_video_file, str(input_path))
 
-        # Track the video
-        session["videos"].append(str(input_path))
+        # Per-video fields live in parallel lists so /done needs no stat() pass
+        session.paths.append(str(input_path))
+        session.validations.append(validation)
+        session.sizes.append(video.file_size or os.path.getsize(input_path))
+        duration = video.duration or 0
+        session.durations.append(
+            duration.total_seconds() if hasattr(duration, "total_seconds") else duration
+        )
         temp_mgr.track_file(str(input_path))
 
-        video_count = len(session["videos"])
-
-        # Delete processing message
-        if processing_message:
-            try:
-                await processing_message.delete()
-            except Exception:
-                pass
+        video_count = len(session.paths)
 
-        # Send confirmation with keyboard
+        # Turn the download status into the confirmation with keyboard
         if video_count == 1:
-            await update.message.reply_text(
+            confirmation = (
                 f"✓ Video {video_count} agregado.\n\n"
                 f"Actualmente tienes: *{video_count} video*\n"
-                f"Envía más videos o presiona el botón para unir:",
-                parse_mode="Markdown",
-                reply_markup=_get_join_video_keyboard(video_count)
+                f"Envía más videos o presiona el botón para unir:"
             )
         elif video_count < config.JOIN_MIN_VIDEOS:
             remaining = config.JOIN_MIN_VIDEOS - video_count
-            await update.message.reply_text(
+            confirmation = (
                 f"✓ Video {video_count} agregado.\n\n"
                 f"Necesitas *{remaining}* video(s) más para poder unir.\n"
-                f"Actualmente tienes: *{video_count} videos*",
-                parse_mode="Markdown",
-                reply_markup=_get_join_video_keyboard(video_count)
+                f"Actualmente tienes: *{video_count} videos*"
             )
         else:
-            await update.message.reply_text(
+            confirmation = (
                 f"✓ Video {video_count} agregado.\n\n"
                 f"Actualmente tienes: *{video_count} videos*\n"
                 f"Máximo: {config.JOIN_MAX_VIDEOS}\n\n"
-                f"Envía más videos o presiona el botón para unir:",
-                parse_mode="Markdown",
-                reply_markup=_get_join_video_keyboard(video_count)
+                f"Envía más videos o presiona el botón para unir:"
             )
+        await _replace_status(
+            processing_message,
+            update.message,
+            confirmation,
+            parse_mode="Markdown",
+            reply_markup=_get_join_video_keyboard(video_count),
+        )
 
     except Exception as e:
         logger.exception(f"Unexpected error handling join video for user {user_id}: {e}")
-        if processing_message:
-            try:
-                await processing_message.delete()
-            except Exception:
-                pass
+        _fire_and_forget_delete(processing_message)
         await update.message.reply_text(
             "Ocurrió un error procesando el video. Intenta de nuevo."
         )
 
 
+async def _drop_invalid_join_videos(session: JoinSession, user_id: int) -> list[tuple[int, str]]:
+    """Await pending join validations and remove videos that failed them.
+
+    Entries whose validation is None were checked before being added.
+
+    Args:
+        session: Active video join session
+        user_id: ID of the session owner, for logging
+
+    Returns:
+        List of (1-based position, error message) for each dropped video
+    """
+    rejected = []
+    for position, validation in enumerate(session.validations, 1):
+        if validation is None:
+            continue
+        try:
+            is_valid, error_msg = await validation
+        except Exception as e:
+            logger.error(f"Validation of join video {position} failed for user {user_id}: {e}")
+            is_valid, error_msg = False, "No pude validar el video"
+        if not is_valid:
+            logger.warning(f"Join video {position} invalid for user {user_id}: {error_msg}")
+            rejected.append((position, error_msg))
+
+    for position, _ in reversed(rejected):
+        for per_video in (session.paths, session.sizes, session.durations, session.validations):
+            del per_video[position - 1]
+    # Every remaining entry is now known to be valid
+    session.validations = [None] * len(session.paths)
+    return rejected
+
+
 async def handle_join_done(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /done command or button to complete video or audio joining.
 
@@ -1430,25 +2243,33 @@ async def handle_join_done(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     if not effective_message and update.callback_query:
         effective_message = update.callback_query.message
 
-    # Check if there's an active video join session
-    session = context.user_data.get("join_session")
+    # Resolve the active join session; audio sessions have their own handler
+    kind, session = _active_join_session(context.user_data)
+    if kind == "audio":
+        await handle_join_audio_done(update, context)
+        return
     if not session:
-        # No video session - check for audio join session
-        if context.user_data.get("join_audio_session"):
-            # Delegate to audio join handler
-            await handle_join_audio_done(update, context)
-            return
         if effective_message:
             await effective_message.reply_text(
                 "No hay una sesión de unión activa. Usa /join o /join_audio para comenzar."
             )
         return
 
+    # Updates run concurrently here, so a double-tapped /done must not start
+    # a second join of the same session. Claim it before the first await;
+    # /cancel uses the same task to stop the join while it is queued or running.
+    if session.task is not None and not session.task.done():
+        logger.info(f"Join already in progress for user {user_id}")
+        if effective_message:
+            await effective_message.reply_text(JOIN_VIDEO_BUSY_MESSAGE)
+        return
+    session.task = asyncio.current_task()
+
     # Check session timeout
-    current_time = asyncio.get_event_loop().time()
-    if current_time - session["last_activity"] > config.JOIN_SESSION_TIMEOUT:
+    current_time = time.monotonic()
+    if current_time - session.last_activity > config.JOIN_SESSION_TIMEOUT:
         logger.info(f"Join session expired for user {user_id}")
-        session["temp_mgr"].cleanup()
+        _fire_and_forget_cleanup(session.temp_mgr)
         context.user_data.pop("join_session", None)
         if effective_message:
             await effective_message.reply_text(
@@ -1456,8 +2277,16 @@ async def handle_join_done(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             )
         return
 
+    # Drop videos whose background validation failed
+    rejected = await _drop_invalid_join_videos(session, user_id)
+    if rejected and effective_message:
+        await effective_message.reply_text(
+            "Se descartaron videos inválidos:\n"
+            + "\n".join(f"Video {position}: {error_msg}" for position, error_msg in rejected)
+        )
+
     # Check minimum videos
-    video_count = len(session["videos"])
+    video_count = len(session.paths)
     if video_count < config.JOIN_MIN_VIDEOS:
         if effective_message:
             await effective_message.reply_text(
@@ -1466,11 +2295,9 @@ async def handle_join_done(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             )
         return
 
-    # Check disk space before joining
-    total_size_mb = 0
-    for video_path in session["videos"]:
-        total_size_mb += Path(video_path).stat().st_size / (1024 * 1024)
-    required_space = estimate_required_space(int(total_size_mb))
+    # Check disk space before joining (sizes were recorded as videos were added)
+    total_size_mb = sum(session.sizes) >> 20
+    required_space = estimate_required_space(total_size_mb)
     has_space, space_error = check_disk_space(required_space)
     if not has_space:
         logger.warning(f"Disk space check failed for user {user_id}: {space_error}")
@@ -1495,27 +2322,28 @@ async def handle_join_done(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     except Exception as e:
         logger.warning(f"Could not send processing message to user {user_id}: {e}")
 
-    temp_mgr = session["temp_mgr"]
+    temp_mgr = session.temp_mgr
 
     try:
         # Generate output path
-        output_filename = f"joined_{user_id}_{int(asyncio.get_event_loop().time())}.mp4"
+        output_filename = f"joined_{user_id}_{int(time.monotonic())}.mp4"
         output_path = temp_mgr.get_temp_path(output_filename)
 
-        # Create VideoJoiner and add all videos
-        logger.info(f"Starting video join for user {user_id} with {video_count} videos")
-        joiner = VideoJoiner(str(output_path))
-
-        for video_path in session["videos"]:
-            joiner.add_video(video_path)
+        # Add and join all videos in a single executor call
+        logger.info(
+            f"Starting video join for user {user_id} with {video_count} videos "
+            f"(~{sum(session.durations):.0f}s known duration)"
+        )
+        joiner = VideoJoiner(str(output_path), threads=config.FFMPEG_THREADS)
 
         # Join videos with timeout
         try:
-            loop = asyncio.get_event_loop()
-            success = await asyncio.wait_for(
-                loop.run_in_executor(None, joiner.join_videos),
-                timeout=config.JOIN_TIMEOUT  # Dedicated join timeout (120s default)
-            )
+            loop = asyncio.get_running_loop()
+            async with _media_job_slot(processing_message):
+                success = await asyncio.wait_for(
+                    loop.run_in_executor(MEDIA_EXECUTOR, joiner.join_from_list, list(session.paths)),
+                    timeout=config.JOIN_TIMEOUT  # Dedicated join timeout (120s default)
+                )
 
             if not success:
                 logger.error(f"Video joining failed for user {user_id}")
@@ -1529,49 +2357,32 @@ async def handle_join_done(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         logger.info(f"Sending joined video to user {user_id}")
         try:
             if effective_message:
-                with open(output_path, "rb") as video_file:
-                    await effective_message.reply_video(
-                        video=video_file,
-                        caption=f"Video unido ({video_count} partes)"
-                    )
+                await effective_message.reply_video(
+                    video=await _read_upload_file(output_path),
+                    caption=f"Video unido ({video_count} partes)"
+                )
                 logger.info(f"Joined video sent successfully to user {user_id}")
         except Exception as e:
             logger.error(f"Failed to send joined video to user {user_id}: {e}")
             raise
 
-        # Delete processing message on success
-        if processing_message:
-            try:
-                await processing_message.delete()
-            except Exception as e:
-                logger.warning(f"Could not delete processing message: {e}")
-
-        # Clean up session
-        temp_mgr.cleanup()
-        context.user_data.pop("join_session", None)
-
     except (VideoJoinError, ProcessingTimeoutError) as e:
         await handle_processing_error(update, e, user_id)
-        if processing_message:
-            try:
-                await processing_message.delete()
-            except Exception:
-                pass
-        # Clean up session on error
-        temp_mgr.cleanup()
-        context.user_data.pop("join_session", None)
 
     except Exception as e:
         logger.exception(f"Unexpected error joining videos for user {user_id}: {e}")
         await handle_processing_error(update, e, user_id)
-        if processing_message:
-            try:
-                await processing_message.delete()
-            except Exception:
-                pass
-        # Clean up session on error
-        temp_mgr.cleanup()
-        context.user_data.pop("join_session", None)
+
+    finally:
+        # The session ends here whatever happened above, including a /cancel
+        # that already removed it (and maybe started a new one)
+        _fire_and_forget_delete(processing_message)
+        # Break the session -> task -> frame -> session cycle
+        session.task = None
+        if context.user_data.get("join_session") is session:
+            context.user_data.pop("join_session", None)
+        del session
+        await temp_mgr.cleanup_async()
 
 
 async def handle_join_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -1592,19 +2403,24 @@ async def handle_join_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE)
     if not effective_message and update.callback_query:
         effective_message = update.callback_query.message
 
-    # Check if there's an active video join session
-    session = context.user_data.get("join_session")
+    # Resolve the active join session the same way /done does; audio
+    # sessions have their own handler
+    kind, session = _active_join_session(context.user_data)
+    if kind == "audio":
+        await handle_join_audio_cancel(update, context)
+        return
     if not session:
-        # No video session - check for audio join session
-        if context.user_data.get("join_audio_session"):
-            # Delegate to audio join handler
-            await handle_join_audio_cancel(update, context)
+        # A spammed /cancel costs one API call per second at most
+        now = time.monotonic()
+        last_reply = context.user_data.get("last_no_session_reply")
+        if last_reply is not None and now - last_reply < NO_SESSION_REPLY_COOLDOWN_SECONDS:
+            logger.debug(f"Skipping repeated no-session reply for user {user_id}")
             return
+        context.user_data["last_no_session_reply"] = now
         if effective_message:
-            await effective_message.reply_text(
-                "No hay una sesión de unión activa."
-            )
+            await _safe_reply(effective_message, JOIN_NO_SESSION_MESSAGE)
         return
+    context.user_data.pop("join_session", None)
 
     # Delete the callback query message (the one with buttons) if it exists
     if update.callback_query and update.callback_query.message:
@@ -1613,14 +2429,22 @@ async def handle_join_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE)
         except Exception as e:
             logger.debug(f"Could not delete callback message: {e}")
 
-    # Clean up temp files
-    video_count = len(session["videos"])
-    session["temp_mgr"].cleanup()
-    context.user_data.pop("join_session", None)
+    # Stop a /done join that is still queued or running. ffmpeg itself runs
+    # in an executor thread and finishes on its own; its output is discarded.
+    join_task = session.task
+    if join_task and not join_task.done():
+        logger.info(f"Cancelling in-flight video join for user {user_id}")
+        join_task.cancel()
+
+    # Clean up temp files in the background; the reply doesn't wait for disk
+    video_count = len(session.paths)
+    _fire_and_forget_cleanup(session.temp_mgr)
+    # Nothing below needs the session, and the reply may wait out a flood limit
+    del session, join_task
 
     if effective_message:
-        await effective_message.reply_text(
-            f"Sesión cancelada. {video_count} video(s) descartados."
+        await _safe_reply(
+            effective_message, f"Sesión cancelada. {video_count} video(s) descartados."
         )
 
 
@@ -1660,6 +2484,12 @@ async def handle_join_video_callback(update: Update, context: ContextTypes.DEFAU
 # Audio Join Handlers
 # =============================================================================
 
+def _join_audio_running(session: dict) -> bool:
+    """Return whether an audio join session is already being joined."""
+    task = session.get("task")
+    return task is not None and not task.done()
+
+
 async def handle_join_audio_start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /join_audio command to start an audio join session.
 
@@ -1692,8 +2522,10 @@ async def handle_join_audio_start(update: Update, context: ContextTypes.DEFAULT_
     # Initialize audio join session
     context.user_data["join_audio_session"] = {
         "audios": [],
+        "total_bytes": 0,
         "temp_mgr": TempManager(),
-        "last_activity": asyncio.get_event_loop().time(),
+        "last_activity": time.monotonic(),
+        "task": None,
     }
 
     await update.message.reply_text(
@@ -1710,7 +2542,8 @@ async def handle_join_audio_start(update: Update, context: ContextTypes.DEFAULT_
 async def handle_join_audio_file(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle audio file messages during an active audio join session.
 
-    Downloads each audio file and tracks it in the user's join session.
+    Queues each audio file in the user's join session; the downloads
+    happen together at /done.
 
     Args:
         update: Telegram update object
@@ -1725,12 +2558,19 @@ async def handle_join_audio_file(update: Update, context: ContextTypes.DEFAULT_T
         await handle_audio_file(update, context)
         return
 
+    # /done runs concurrently with this handler; audios queued while it is
+    # downloading and joining would never be fetched, and an idle-looking
+    # session must not expire under a running join
+    if _join_audio_running(session):
+        await update.message.reply_text(JOIN_AUDIO_BUSY_MESSAGE)
+        return
+
     # Check session timeout
-    current_time = asyncio.get_event_loop().time()
+    current_time = time.monotonic()
     if current_time - session["last_activity"] > config.JOIN_SESSION_TIMEOUT:
         logger.info(f"Join audio session expired for user {user_id}")
         # Clean up expired session
-        session["temp_mgr"].cleanup()
+        _fire_and_forget_cleanup(session["temp_mgr"])
         context.user_data.pop("join_audio_session", None)
         await update.message.reply_text(
             "La sesión expiró. Usa /join_audio para comenzar de nuevo."
@@ -1764,104 +2604,121 @@ async def handle_join_audio_file(update: Update, context: ContextTypes.DEFAULT_T
             await update.message.reply_text(error_msg)
             return
 
-    # Send processing message
-    processing_message = None
-    try:
-        processing_message = await update.message.reply_text(
-            f"Descargando audio {len(session['audios']) + 1}..."
+    # Fail fast if the session would no longer fit on disk once downloaded
+    total_bytes = session["total_bytes"] + (file_size or 0)
+    has_space, space_error = check_disk_space(estimate_required_space(total_bytes >> 20))
+    if not has_space:
+        logger.warning(f"Disk space check failed for user {user_id}: {space_error}")
+        await update.message.reply_text(space_error)
+        return
+
+    # Queue the audio; /done downloads every queued file in parallel
+    session["total_bytes"] = total_bytes
+    session["audios"].append(
+        {"file_id": file_id, "file_unique_id": file_unique_id, "size": file_size}
+    )
+    audio_count = len(session["audios"])
+    logger.info(f"Queued audio {audio_count} for join session, user {user_id}")
+
+    # Send confirmation with keyboard
+    if audio_count == 1:
+        await update.message.reply_text(
+            f"✓ Audio {audio_count} agregado.\n\n"
+            f"Actualmente tienes: *{audio_count} audio*\n"
+            f"Envía más audios o presiona el botón para unir:",
+            parse_mode="Markdown",
+            reply_markup=_get_join_audio_keyboard(audio_count)
+        )
+    elif audio_count < config.JOIN_MIN_AUDIO_FILES:
+        remaining = config.JOIN_MIN_AUDIO_FILES - audio_count
+        await update.message.reply_text(
+            f"✓ Audio {audio_count} agregado.\n\n"
+            f"Necesitas *{remaining}* audio(s) más para poder unir.\n"
+            f"Actualmente tienes: *{audio_count} audios*",
+            parse_mode="Markdown",
+            reply_markup=_get_join_audio_keyboard(audio_count)
+        )
+    else:
+        await update.message.reply_text(
+            f"✓ Audio {audio_count} agregado.\n\n"
+            f"Actualmente tienes: *{audio_count} audios*\n"
+            f"Máximo: {config.JOIN_MAX_AUDIO_FILES}\n\n"
+            f"Envía más audios o presiona el botón para unir:",
+            parse_mode="Markdown",
+            reply_markup=_get_join_audio_keyboard(audio_count)
         )
-    except Exception as e:
-        logger.warning(f"Could not send processing message to user {user_id}: {e}")
 
-    try:
-        temp_mgr = session["temp_mgr"]
 
-        # Generate safe filename
-        audio_index = len(session["audios"]) + 1
-        input_filename = f"join_audio_{user_id}_{audio_index:02d}_{file_unique_id}.mp3"
-        input_path = temp_mgr.get_temp_path(input_filename)
+async def _download_join_audios(bot, session: dict, user_id: int) -> list[tuple[int, str]]:
+    """Download and validate the queued join audios, several at a time.
 
-        # Download audio
-        logger.info(f"Downloading audio {audio_index} for join session, user {user_id}")
-        try:
-            file = await context.bot.get_file(file_id)
+    Each entry gets a "path" once it is downloaded and valid, so a later
+    /done does not fetch it again. The same file sent twice (same
+    file_unique_id) is downloaded once and joined from one path. Entries
+    that fail are removed.
+
+    Args:
+        bot: Bot used to resolve file IDs
+        session: Active audio join session
+        user_id: ID of the session owner, for file names and logging
+
+    Returns:
+        List of (1-based position, error message) for each dropped audio
+    """
+    temp_mgr = session["temp_mgr"]
+    semaphore = asyncio.Semaphore(config.JOIN_AUDIO_DOWNLOAD_CONCURRENCY)
+    loop = asyncio.get_running_loop()
+
+    # One download per distinct file, shared by every entry that sends it
+    downloads: dict[str, asyncio.Future] = {}
+    for source in session["audios"]:
+        if source.get("path") and source["file_unique_id"] not in downloads:
+            done = loop.create_future()
+            done.set_result((True, None, source["path"]))
+            downloads[source["file_unique_id"]] = done
+
+    async def download(position: int, source: dict) -> tuple[bool, str | None, str]:
+        input_path = str(temp_mgr.get_temp_path(
+            f"join_audio_{user_id}_{position:02d}_{source['file_unique_id']}.mp3"
+        ))
+        async with semaphore:
+            file = await bot.get_file(source["file_id"])
             await _download_with_retry(file, input_path)
-            logger.info(f"Audio downloaded to {input_path}")
-        except Exception as e:
-            logger.error(f"Failed to download audio for user {user_id}: {e}")
-            if processing_message:
-                try:
-                    await processing_message.delete()
-                except Exception:
-                    pass
-            await update.message.reply_text(
-                "No pude descargar el audio. Intenta con otro archivo."
-            )
-            return
+        temp_mgr.track_file(input_path)
+        is_valid, error_msg = await loop.run_in_executor(
+            MEDIA_EXECUTOR, validate_audio_file, input_path
+        )
+        return is_valid, error_msg, input_path
+
+    async def fetch(position: int, source: dict) -> tuple[bool, str | None]:
+        unique_id = source["file_unique_id"]
+        if unique_id not in downloads:
+            downloads[unique_id] = asyncio.ensure_future(download(position, source))
+        is_valid, error_msg, input_path = await downloads[unique_id]
+        if is_valid:
+            source["path"] = input_path
+        return is_valid, error_msg
+
+    results = await asyncio.gather(
+        *(fetch(position, source) for position, source in enumerate(session["audios"], 1)),
+        return_exceptions=True,
+    )
 
-        # Validate audio integrity after download
-        is_valid, error_msg = validate_audio_file(str(input_path))
+    rejected = []
+    for position, result in enumerate(results, 1):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to download join audio {position} for user {user_id}: {result}")
+            rejected.append((position, "No pude descargar el audio"))
+            continue
+        is_valid, error_msg = result
         if not is_valid:
-            logger.warning(f"Audio validation failed for user {user_id}: {error_msg}")
-            if processing_message:
-                try:
-                    await processing_message.delete()
-                except Exception:
-                    pass
-            await update.message.reply_text(error_msg)
-            return
-
-        # Track the audio
-        session["audios"].append(str(input_path))
-        temp_mgr.track_file(str(input_path))
-
-        audio_count = len(session["audios"])
-
-        # Delete processing message
-        if processing_message:
-            try:
-                await processing_message.delete()
-            except Exception:
-                pass
-
-        # Send confirmation with keyboard
-        if audio_count == 1:
-            await update.message.reply_text(
-                f"✓ Audio {audio_count} agregado.\n\n"
-                f"Actualmente tienes: *{audio_count} audio*\n"
-                f"Envía más audios o presiona el botón para unir:",
-                parse_mode="Markdown",
-                reply_markup=_get_join_audio_keyboard(audio_count)
-            )
-        elif audio_count < config.JOIN_MIN_AUDIO_FILES:
-            remaining = config.JOIN_MIN_AUDIO_FILES - audio_count
-            await update.message.reply_text(
-                f"✓ Audio {audio_count} agregado.\n\n"
-                f"Necesitas *{remaining}* audio(s) más para poder unir.\n"
-                f"Actualmente tienes: *{audio_count} audios*",
-                parse_mode="Markdown",
-                reply_markup=_get_join_audio_keyboard(audio_count)
-            )
-        else:
-            await update.message.reply_text(
-                f"✓ Audio {audio_count} agregado.\n\n"
-                f"Actualmente tienes: *{audio_count} audios*\n"
-                f"Máximo: {config.JOIN_MAX_AUDIO_FILES}\n\n"
-                f"Envía más audios o presiona el botón para unir:",
-                parse_mode="Markdown",
-                reply_markup=_get_join_audio_keyboard(audio_count)
-            )
+            logger.warning(f"Join audio {position} invalid for user {user_id}: {error_msg}")
+            rejected.append((position, error_msg))
 
-    except Exception as e:
-        logger.exception(f"Unexpected error handling join audio for user {user_id}: {e}")
-        if processing_message:
-            try:
-                await processing_message.delete()
-            except Exception:
-                pass
-        await update.message.reply_text(
-            "Ocurrió un error procesando el audio. Intenta de nuevo."
-        )
+    for position, _ in reversed(rejected):
+        session["total_bytes"] -= session["audios"][position - 1]["size"] or 0
+        del session["audios"][position - 1]
+    return rejected
 
 
 async def handle_join_audio_done(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -1893,10 +2750,10 @@ async def handle_join_audio_done(update: Update, context: ContextTypes.DEFAULT_T
         return
 
     # Check session timeout
-    current_time = asyncio.get_event_loop().time()
+    current_time = time.monotonic()
     if current_time - session["last_activity"] > config.JOIN_SESSION_TIMEOUT:
         logger.info(f"Join audio session expired for user {user_id}")
-        session["temp_mgr"].cleanup()
+        _fire_and_forget_cleanup(session["temp_mgr"])
         context.user_data.pop("join_audio_session", None)
         if effective_message:
             await effective_message.reply_text(
@@ -1914,11 +2771,9 @@ async def handle_join_audio_done(update: Update, context: ContextTypes.DEFAULT_T
             )
         return
 
-    # Check disk space before joining
-    total_size_mb = 0
-    for audio_path in session["audios"]:
-        total_size_mb += Path(audio_path).stat().st_size / (1024 * 1024)
-    required_space = estimate_required_space(int(total_size_mb))
+    # Re-check disk space before downloading; the running total was
+    # checked as each audio was added, but other jobs may have used it since
+    required_space = estimate_required_space(session["total_bytes"] >> 20)
     has_space, space_error = check_disk_space(required_space)
     if not has_space:
         logger.warning(f"Disk space check failed for user {user_id}: {space_error}")
@@ -1926,6 +2781,15 @@ async def handle_join_audio_done(update: Update, context: ContextTypes.DEFAULT_T
             await effective_message.reply_text(space_error)
         return
 
+    # Claim the session before the first await, as the video /done does, so
+    # a double-tapped /done does not download and join the audios twice
+    if _join_audio_running(session):
+        logger.info(f"Audio join already in progress for user {user_id}")
+        if effective_message:
+            await effective_message.reply_text(JOIN_AUDIO_BUSY_MESSAGE)
+        return
+    session["task"] = asyncio.current_task()
+
     # Delete the callback query message (the one with buttons) if it exists
     if update.callback_query and update.callback_query.message:
         try:
@@ -1943,83 +2807,82 @@ async def handle_join_audio_done(update: Update, context: ContextTypes.DEFAULT_T
     except Exception as e:
         logger.warning(f"Could not send processing message to user {user_id}: {e}")
 
-    temp_mgr = session["temp_mgr"]
-
-    try:
-        # Generate output path
-        output_filename = f"joined_audio_{user_id}_{int(asyncio.get_event_loop().time())}.mp3"
-        output_path = temp_mgr.get_temp_path(output_filename)
+    # The status message goes away however the job ends, including a
+    # /cancel during the download phase
+    async with _job_cleanup(processing_message, context.user_data):
+        # Download the queued audios and drop the ones that fail
+        rejected = await _download_join_audios(context.bot, session, user_id)
+        if rejected:
+            audio_count = len(session["audios"])
+            if effective_message:
+                await effective_message.reply_text(
+                    "Se descartaron audios inválidos:\n"
+                    + "\n".join(f"Audio {position}: {error_msg}" for position, error_msg in rejected)
+                )
+            if audio_count < config.JOIN_MIN_AUDIO_FILES:
+                # Keep the session so the user can add more audios
+                session["task"] = None
+                if effective_message:
+                    await effective_message.reply_text(
+                        f"Necesitas al menos {config.JOIN_MIN_AUDIO_FILES} audios para unir. "
+                        f"Actualmente tienes {audio_count}.",
+                        reply_markup=_get_join_audio_keyboard(audio_count)
+                    )
+                return
 
-        # Create AudioJoiner and add all audios
-        logger.info(f"Starting audio join for user {user_id} with {audio_count} audios")
-        joiner = AudioJoiner(str(output_path))
+        temp_mgr = session["temp_mgr"]
 
-        for audio_path in session["audios"]:
-            joiner.add_audio(audio_path)
+        async with _job_cleanup(None, context.user_data, "join_audio_session", temp_mgr=temp_mgr):
+            try:
+                # Generate output path
+                output_filename = f"joined_audio_{user_id}_{int(time.monotonic())}.mp3"
+                output_path = temp_mgr.get_temp_path(output_filename)
 
-        # Join audios with timeout
-        try:
-            loop = asyncio.get_event_loop()
-            success = await asyncio.wait_for(
-                loop.run_in_executor(None, joiner.join_audios),
-                timeout=config.JOIN_AUDIO_TIMEOUT
-            )
+                # Create AudioJoiner and add all audios
+                logger.info(f"Starting audio join for user {user_id} with {audio_count} audios")
+                joiner = AudioJoiner(str(output_path))
 
-            if not success:
-                logger.error(f"Audio joining failed for user {user_id}")
-                raise AudioJoinError("No pude unir los archivos de audio")
+                for source in session["audios"]:
+                    joiner.add_audio(source["path"])
 
-        except asyncio.TimeoutError as e:
-            logger.error(f"Audio joining timed out for user {user_id}")
-            raise ProcessingTimeoutError("La unión de audios tardó demasiado") from e
+                # Join audios with timeout
+                try:
+                    loop = asyncio.get_running_loop()
+                    async with _media_job_slot(processing_message):
+                        # Show how far ffmpeg is so the user doesn't resend /done
+                        progress = _threaded_progress(processing_message, f"Uniendo {audio_count} audios...")
+                        success = await asyncio.wait_for(
+                            loop.run_in_executor(MEDIA_EXECUTOR, joiner.join_audios, progress),
+                            timeout=config.JOIN_AUDIO_TIMEOUT
+                        )
 
-        # Send joined audio
-        logger.info(f"Sending joined audio to user {user_id}")
-        try:
-            if effective_message:
-                with open(output_path, "rb") as audio_file:
-                    await effective_message.reply_audio(
-                        audio=audio_file,
-                        caption=f"Audio unido ({audio_count} partes)"
-                    )
-                logger.info(f"Joined audio sent successfully to user {user_id}")
-        except Exception as e:
-            logger.error(f"Failed to send joined audio to user {user_id}: {e}")
-            raise
+                    if not success:
+                        logger.error(f"Audio joining failed for user {user_id}")
+                        raise AudioJoinError("No pude unir los archivos de audio")
 
-        # Delete processing message on success
-        if processing_message:
-            try:
-                await processing_message.delete()
-            except Exception as e:
-                logger.warning(f"Could not delete processing message: {e}")
+                except asyncio.TimeoutError as e:
+                    logger.error(f"Audio joining timed out for user {user_id}")
+                    raise ProcessingTimeoutError("La unión de audios tardó demasiado") from e
 
-        # Clean up session
-        temp_mgr.cleanup()
-        context.user_data.pop("join_audio_session", None)
+                # Send joined audio
+                logger.info(f"Sending joined audio to user {user_id}")
+                try:
+                    if effective_message:
+                        await effective_message.reply_audio(
+                            audio=await _read_upload_file(output_path),
+                            caption=f"Audio unido ({audio_count} partes)"
+                        )
+                        logger.info(f"Joined audio sent successfully to user {user_id}")
+                except Exception as e:
+                    logger.error(f"Failed to send joined audio to user {user_id}: {e}")
+                    raise
 
-    except (AudioJoinError, ProcessingTimeoutError) as e:
-        await handle_processing_error(update, e, user_id)
-        if processing_message:
-            try:
-                await processing_message.delete()
-            except Exception:
-                pass
-        # Clean up session on error
-        temp_mgr.cleanup()
-        context.user_data.pop("join_audio_session", None)
+            except (AudioJoinError, ProcessingTimeoutError) as e:
+                await handle_processing_error(update, e, user_id)
 
-    except Exception as e:
-        logger.exception(f"Unexpected error joining audios for user {user_id}: {e}")
-        await handle_processing_error(update, e, user_id)
-        if processing_message:
-            try:
-                await processing_message.delete()
-            except Exception:
-                pass
-        # Clean up session on error
-        temp_mgr.cleanup()
-        context.user_data.pop("join_audio_session", None)
+            except Exception as e:
+                logger.exception(f"Unexpected error joining audios for user {user_id}: {e}")
+                await handle_processing_error(update, e, user_id)
 
 
 async def handle_join_audio_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -2044,9 +2907,7 @@ async def handle_join_audio_cancel(update: Update, context: ContextTypes.DEFAULT
     if not session:
         # No active audio join session
         if effective_message:
-            await effective_message.reply_text(
-                "No hay una sesión de unión de audio activa."
-            )
+            await _safe_reply(effective_message, JOIN_AUDIO_NO_SESSION_MESSAGE)
         return
 
     # Delete the callback query message (the one with buttons) if it exists
@@ -2056,14 +2917,20 @@ async def handle_join_audio_cancel(update: Update, context: ContextTypes.DEFAULT
         except Exception as e:
             logger.debug(f"Could not delete callback message: {e}")
 
-    # Clean up temp files
+    # Stop a join that is downloading or queued for a media slot
+    join_task = session.get("task")
+    if join_task is not None and not join_task.done():
+        join_task.cancel()
+        logger.info(f"Cancelled in-flight audio join for user {user_id}")
+
+    # Clean up temp files in the background; the reply doesn't wait for disk
     audio_count = len(session["audios"])
-    session["temp_mgr"].cleanup()
+    _fire_and_forget_cleanup(session["temp_mgr"])
     context.user_data.pop("join_audio_session", None)
 
     if effective_message:
-        await effective_message.reply_text(
-            f"Sesión cancelada. {audio_count} audio(s) descartados."
+        await _safe_reply(
+            effective_message, f"Sesión cancelada. {audio_count} audio(s) descartados."
         )
 
 
@@ -2119,7 +2986,7 @@ async def _show_audio_menu_for_file(
 ) -> None:
     """Validate audio size and show the standard audio processing menu."""
     user_id = update.effective_user.id
-    correlation_id = str(uuid.uuid4())[:8]
+    correlation_id = token_hex(4)
     logger.info(f"[{correlation_id}] {source_label} received from user {user_id}")
 
     if file_size:
@@ -2209,7 +3076,7 @@ async def handle_merge_audio_received(update: Update, context: ContextTypes.DEFA
         context: Telegram context object
     """
     user_id = update.effective_user.id
-    correlation_id = context.user_data.get("merge_video_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("merge_video_correlation_id", token_hex(4))
     logger.info(f"[{correlation_id}] Audio received for merge from user {user_id}")
 
     # Get audio from message (native audio or document attachment)
@@ -2242,125 +3109,110 @@ async def handle_merge_audio_received(update: Update, context: ContextTypes.DEFA
         logger.warning(f"[{correlation_id}] Could not send processing message: {e}")
 
     # Process with TempManager
-    with TempManager() as temp_mgr:
-        try:
-            # Retrieve video file_id from context
-            video_file_id = context.user_data.get("merge_video_file_id")
-            if not video_file_id:
-                logger.error(f"[{correlation_id}] No video file_id in context")
-                raise DownloadError("No encontré el video original. Intenta de nuevo.")
-
-            # Generate safe filenames
-            video_filename = f"merge_video_{user_id}_{correlation_id}.mp4"
-            audio_filename = f"merge_audio_{user_id}_{correlation_id}.audio"
-            output_filename = f"merged_{user_id}_{correlation_id}.mp4"
-
-            video_path = temp_mgr.get_temp_path(video_filename)
-            audio_path = temp_mgr.get_temp_path(audio_filename)
-            output_path = temp_mgr.get_temp_path(output_filename)
-
-            # Download video
-            logger.info(f"[{correlation_id}] Downloading video for merge")
-            try:
-                file = await context.bot.get_file(video_file_id)
-                await _download_with_retry(file, video_path, correlation_id=correlation_id)
-                logger.info(f"[{correlation_id}] Video downloaded to {video_path}")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to download video: {e}")
-                raise DownloadError("No pude descargar el video") from e
-
-            # Download audio
-            logger.info(f"[{correlation_id}] Downloading audio for merge")
+    async with TempManager() as temp_mgr:
+        async with _job_cleanup(
+            processing_message, context.user_data,
+            "merge_video_file_id", "merge_video_correlation_id",
+        ):
             try:
-                file = await context.bot.get_file(audio_file_id)
-                await _download_with_retry(file, audio_path, correlation_id=correlation_id)
-                logger.info(f"[{correlation_id}] Audio downloaded to {audio_path}")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to download audio: {e}")
-                raise DownloadError("No pude descargar el audio") from e
+                # Retrieve video file_id from context
+                video_file_id = context.user_data.get("merge_video_file_id")
+                if not video_file_id:
+                    logger.error(f"[{correlation_id}] No video file_id in context")
+                    raise DownloadError("No encontré el video original. Intenta de nuevo.")
 
-            # Validate files
-            is_valid, error_msg = validate_video_file(str(video_path))
-            if not is_valid:
-                logger.warning(f"[{correlation_id}] Video validation failed: {error_msg}")
-                raise ValidationError(error_msg)
+                # Generate safe filenames
+                video_filename = f"merge_video_{user_id}_{correlation_id}.mp4"
+                audio_filename = f"merge_audio_{user_id}_{correlation_id}.audio"
+                output_filename = f"merged_{user_id}_{correlation_id}.mp4"
 
-            is_valid, error_msg = validate_audio_file(str(audio_path))
-            if not is_valid:
-                logger.warning(f"[{correlation_id}] Audio validation failed: {error_msg}")
-                raise ValidationError(error_msg)
+                video_path = temp_mgr.get_temp_path(video_filename)
+                audio_path = temp_mgr.get_temp_path(audio_filename)
+                output_path = temp_mgr.get_temp_path(output_filename)
 
-            # Check disk space
-            video_size_mb = Path(video_path).stat().st_size / (1024 * 1024)
-            audio_size_mb = Path(audio_path).stat().st_size / (1024 * 1024)
-            required_space = estimate_required_space(int(video_size_mb + audio_size_mb))
-            has_space, space_error = check_disk_space(required_space)
-            if not has_space:
-                logger.warning(f"[{correlation_id}] Disk space check failed: {space_error}")
-                raise ValidationError(space_error)
+                # Download video
+                logger.info(f"[{correlation_id}] Downloading video for merge")
+                try:
+                    file = await context.bot.get_file(video_file_id)
+                    await _download_with_retry(file, video_path, correlation_id=correlation_id)
+                    video_file_size = file.file_size
+                    logger.info(f"[{correlation_id}] Video downloaded to {video_path}")
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to download video: {e}")
+                    raise DownloadError("No pude descargar el video") from e
 
-            # Merge video and audio
-            logger.info(f"[{correlation_id}] Merging video and audio")
-            try:
-                loop = asyncio.get_event_loop()
-                merger = VideoAudioMerger(str(video_path), str(audio_path), str(output_path))
-                success = await asyncio.wait_for(
-                    loop.run_in_executor(None, merger.merge),
-                    timeout=config.PROCESSING_TIMEOUT
+                # Download audio
+                logger.info(f"[{correlation_id}] Downloading audio for merge")
+                try:
+                    file = await context.bot.get_file(audio_file_id)
+                    await _download_with_retry(file, audio_path, correlation_id=correlation_id)
+                    logger.info(f"[{correlation_id}] Audio downloaded to {audio_path}")
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to download audio: {e}")
+                    raise DownloadError("No pude descargar el audio") from e
+
+                # Validate both files at once in the media pool; ffprobe would
+                # otherwise block the event loop twice in a row
+                loop = asyncio.get_running_loop()
+                (video_valid, video_error), (audio_valid, audio_error) = await asyncio.gather(
+                    loop.run_in_executor(MEDIA_EXECUTOR, validate_video_file, str(video_path)),
+                    loop.run_in_executor(MEDIA_EXECUTOR, validate_audio_file, str(audio_path)),
                 )
+                if not video_valid:
+                    logger.warning(f"[{correlation_id}] Video validation failed: {video_error}")
+                    raise ValidationError(video_error)
+
+                if not audio_valid:
+                    logger.warning(f"[{correlation_id}] Audio validation failed: {audio_error}")
+                    raise ValidationError(audio_error)
+
+                # Check disk space; Telegram already reported both sizes, so
+                # only stat the files it left out
+                total_bytes = (
+                    (video_file_size or os.path.getsize(video_path))
+                    + (audio_file_size or os.path.getsize(audio_path))
+                )
+                required_space = estimate_required_space(total_bytes >> 20)
+                has_space, space_error = check_disk_space(required_space)
+                if not has_space:
+                    logger.warning(f"[{correlation_id}] Disk space check failed: {space_error}")
+                    raise ValidationError(space_error)
 
-                if not success:
-                    logger.error(f"[{correlation_id}] Video-audio merge failed")
-                    raise VideoMergeError("No pude unir el video con el audio")
+                # Merge video and audio
+                logger.info(f"[{correlation_id}] Merging video and audio")
+                try:
+                    loop = asyncio.get_running_loop()
+                    merger = VideoAudioMerger(str(video_path), str(audio_path), str(output_path))
+                    async with _media_job_slot(processing_message):
+                        success = await asyncio.wait_for(
+                            loop.run_in_executor(MEDIA_EXECUTOR, merger.merge),
+                            timeout=config.PROCESSING_TIMEOUT
+                        )
 
-            except asyncio.TimeoutError as e:
-                logger.error(f"[{correlation_id}] Merge timed out")
-                raise ProcessingTimeoutError("La unión tardó demasiado") from e
+                    if not success:
+                        logger.error(f"[{correlation_id}] Video-audio merge failed")
+                        raise VideoMergeError("No pude unir el video con el audio")
 
-            # Send merged video
-            logger.info(f"[{correlation_id}] Sending merged video")
-            try:
-                with open(output_path, "rb") as video_file:
-                    await update.message.reply_video(video=video_file)
-                logger.info(f"[{correlation_id}] Merged video sent successfully")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to send merged video: {e}")
-                raise
+                except asyncio.TimeoutError as e:
+                    logger.error(f"[{correlation_id}] Merge timed out")
+                    raise ProcessingTimeoutError("La unión tardó demasiado") from e
 
-            # Delete processing message
-            if processing_message:
+                # Send merged video
+                logger.info(f"[{correlation_id}] Sending merged video")
                 try:
-                    await processing_message.delete()
+                    await update.message.reply_video(video=await _read_upload_file(output_path))
+                    logger.info(f"[{correlation_id}] Merged video sent successfully")
                 except Exception as e:
-                    logger.warning(f"[{correlation_id}] Could not delete processing message: {e}")
-
-            # Clean up context
-            context.user_data.pop("merge_video_file_id", None)
-            context.user_data.pop("merge_video_correlation_id", None)
+                    logger.error(f"[{correlation_id}] Failed to send merged video: {e}")
+                    raise
 
-        except (DownloadError, VideoMergeError, ProcessingTimeoutError, ValidationError) as e:
-            logger.error(f"[{correlation_id}] Merge processing error: {e}")
-            await handle_processing_error(update, e, user_id)
-            if processing_message:
-                try:
-                    await processing_message.delete()
-                except Exception as e:
-                    logger.warning(f"[{correlation_id}] Could not delete processing message: {e}")
-            # Clean up context
-            context.user_data.pop("merge_video_file_id", None)
-            context.user_data.pop("merge_video_correlation_id", None)
+            except (DownloadError, VideoMergeError, ProcessingTimeoutError, ValidationError) as e:
+                logger.error(f"[{correlation_id}] Merge processing error: {e}")
+                await handle_processing_error(update, e, user_id)
 
-        except Exception as e:
-            logger.exception(f"[{correlation_id}] Unexpected error in merge: {e}")
-            await handle_processing_error(update, e, user_id)
-            if processing_message:
-                try:
-                    await processing_message.delete()
-                except Exception as e:
-                    logger.warning(f"[{correlation_id}] Could not delete processing message: {e}")
-            # Clean up context
-            context.user_data.pop("merge_video_file_id", None)
-            context.user_data.pop("merge_video_correlation_id", None)
+            except Exception as e:
+                logger.exception(f"[{correlation_id}] Unexpected error in merge: {e}")
+                await handle_processing_error(update, e, user_id)
 
 
 # Video Split Interactive Handlers
@@ -2376,7 +3228,7 @@ async def handle_video_split_start(update: Update, context: ContextTypes.DEFAULT
     """
     user_id = update.effective_user.id
     query = update.callback_query
-    correlation_id = str(uuid.uuid4())[:8]
+    correlation_id = token_hex(4)
 
     # Respond to callback immediately to avoid timeout
     await query.answer()
@@ -2415,9 +3267,16 @@ async def handle_video_split_start(update: Update, context: ContextTypes.DEFAULT
         file = await context.bot.get_file(file_id)
         await _download_with_retry(file, input_path, correlation_id=correlation_id)
 
-        # Get duration
-        splitter = VideoSplitter(str(input_path), str(temp_mgr.get_temp_path("output")))
-        duration = splitter.get_video_duration()
+        # Get duration; a video split before skips ffprobe entirely
+        splitter = VideoSplitter(
+            str(input_path),
+            str(temp_mgr.get_temp_path("output")),
+            duration=_get_cached_duration(file.file_unique_id, file.file_size),
+        )
+        duration = await asyncio.get_running_loop().run_in_executor(
+            MEDIA_EXECUTOR, splitter.get_video_duration
+        )
+        _cache_duration(file.file_unique_id, file.file_size, duration)
 
         # Store in session and keep temp_mgr reference
         context.user_data["split_video_session"]["duration"] = duration
@@ -2441,29 +3300,38 @@ async def handle_video_split_start(update: Update, context: ContextTypes.DEFAULT
             "Error al preparar el video. Intenta de nuevo."
         )
         context.user_data.pop("split_video_session", None)
-        temp_mgr.cleanup()
+        await temp_mgr.cleanup_async()
 
 
-async def handle_video_split_start_time(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Handle start time input for video split.
+def _parse_seconds(text: str | None) -> float | None:
+    """Parse a user-typed time in seconds.
 
     Args:
-        update: Telegram update object
-        context: Telegram context object
+        text: Raw message text
+
+    Returns:
+        The time as a float, or None if the text is not a finite number
     """
-    user_id = update.effective_user.id
-    session = context.user_data.get("split_video_session")
+    try:
+        value = float((text or "").strip())
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
 
-    if not session or session.get("type") != "video":
-        # Not a video split session, ignore
-        return
 
-    correlation_id = session.get("correlation_id", "unknown")
-    logger.info(f"[{correlation_id}] Start time input received from user {user_id}")
+async def _accept_split_start_time(update: Update, session: dict, media_name: str) -> None:
+    """Validate a typed split start time and ask for the end time.
 
-    try:
-        start_time = float(update.message.text.strip())
-    except (ValueError, AttributeError):
+    Invalid input gets an explanatory reply and leaves the session waiting
+    for another start time.
+
+    Args:
+        update: Telegram update object carrying the typed text
+        session: The active split session
+        media_name: "video" or "audio", used in the replies
+    """
+    start_time = _parse_seconds(update.message.text)
+    if start_time is None:
         await update.message.reply_text(
             "Por favor envía un número válido (ej: 30 o 30.5)"
         )
@@ -2478,7 +3346,7 @@ async def handle_video_split_start_time(update: Update, context: ContextTypes.DE
 
     if start_time >= duration:
         await update.message.reply_text(
-            f"El tiempo de inicio debe ser menor a la duración del video ({duration}s)."
+            f"El tiempo de inicio debe ser menor a la duración del {media_name} ({duration}s)."
         )
         return
 
@@ -2496,29 +3364,26 @@ async def handle_video_split_start_time(update: Update, context: ContextTypes.DE
     )
 
 
-async def handle_video_split_end_time(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Handle end time input for video split and process the cut.
+async def _confirm_split_range(
+    update: Update, session: dict, media_name: str
+) -> tuple[float, float, Any] | None:
+    """Validate a typed split end time and announce the cut.
 
     Args:
-        update: Telegram update object
-        context: Telegram context object
-    """
-    user_id = update.effective_user.id
-    session = context.user_data.get("split_video_session")
-
-    if not session or session.get("type") != "video":
-        return
+        update: Telegram update object carrying the typed text
+        session: The active split session, holding the start time
+        media_name: "video" or "audio", used in the replies
 
-    correlation_id = session.get("correlation_id", "unknown")
-    logger.info(f"[{correlation_id}] End time input received from user {user_id}")
-
-    try:
-        end_time = float(update.message.text.strip())
-    except (ValueError, AttributeError):
+    Returns:
+        Tuple of (start_time, end_time, processing_message), or None if the
+        input was rejected and the session keeps waiting for an end time
+    """
+    end_time = _parse_seconds(update.message.text)
+    if end_time is None:
         await update.message.reply_text(
             "Por favor envía un número válido (ej: 60 o 90.5)"
         )
-        return
+        return None
 
     start_time = session.get("start_time", 0)
     duration = session.get("duration", 0)
@@ -2527,43 +3392,95 @@ async def handle_video_split_end_time(update: Update, context: ContextTypes.DEFA
         await update.message.reply_text(
             f"El tiempo final debe ser mayor al tiempo de inicio ({start_time}s)."
         )
-        return
+        return None
 
     if end_time > duration:
         await update.message.reply_text(
-            f"El tiempo final no puede exceder la duración del video ({duration}s)."
+            f"El tiempo final no puede exceder la duración del {media_name} ({duration}s)."
         )
-        return
+        return None
 
     segment_duration = end_time - start_time
     if segment_duration < 1:
         await update.message.reply_text(
             "La duración mínima del segmento es 1 segundo."
         )
-        return
+        return None
 
     # Store end time and proceed to cut
     session["end_time"] = end_time
     session["state"] = SPLIT_CONFIRMING
 
-    # Send processing message
     processing_message = await update.message.reply_text(
         f"✂️ Extrayendo segmento de {start_time}s a {end_time}s...\n"
         f"Duración: {segment_duration:.1f}s"
     )
+    return start_time, end_time, processing_message
+
+
+async def handle_video_split_start_time(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle start time input for video split.
+
+    Args:
+        update: Telegram update object
+        context: Telegram context object
+    """
+    user_id = update.effective_user.id
+    session = context.user_data.get("split_video_session")
+
+    if not session or session.get("type") != "video":
+        # Not a video split session, ignore
+        return
+
+    correlation_id = session.get("correlation_id", "unknown")
+    logger.info(f"[{correlation_id}] Start time input received from user {user_id}")
+
+    await _accept_split_start_time(update, session, "video")
+
+
+async def handle_video_split_end_time(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle end time input for video split and process the cut.
+
+    Args:
+        update: Telegram update object
+        context: Telegram context object
+    """
+    user_id = update.effective_user.id
+    session = context.user_data.get("split_video_session")
+
+    if not session or session.get("type") != "video":
+        return
+
+    correlation_id = session.get("correlation_id", "unknown")
+    logger.info(f"[{correlation_id}] End time input received from user {user_id}")
+
+    cut = await _confirm_split_range(update, session, "video")
+    if cut is None:
+        return
+    start_time, end_time, processing_message = cut
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             input_path = session["input_path"]
+            # The splitter creates this directory only if it writes a file
             output_dir = temp_mgr.get_temp_path(f"split_output_{correlation_id}")
-            Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-            splitter = VideoSplitter(str(input_path), str(output_dir))
-            output_path = splitter.split_by_time_range(start_time, end_time)
+            # Reuse the duration probed at split start
+            splitter = VideoSplitter(
+                str(input_path), str(output_dir),
+                duration=session.get("duration"), threads=config.FFMPEG_THREADS,
+            )
+            # MP4 needs a seekable output for its index, so the cut goes to
+            # disk; it still runs off the event loop
+            loop = asyncio.get_running_loop()
+            async with _media_job_slot(processing_message):
+                output_path = await loop.run_in_executor(
+                    MEDIA_EXECUTOR, splitter.split_by_time_range, start_time, end_time
+                )
 
             # Send video segment
             await update.message.reply_video(
-                video=open(output_path, "rb"),
+                video=await _read_upload_file(output_path),
                 caption=f"Segmento extraído ({start_time}s - {end_time}s)"
             )
 
@@ -2591,7 +3508,7 @@ async def handle_audio_split_start(update: Update, context: ContextTypes.DEFAULT
     """
     user_id = update.effective_user.id
     query = update.callback_query
-    correlation_id = str(uuid.uuid4())[:8]
+    correlation_id = token_hex(4)
 
     # Respond to callback immediately to avoid timeout
     await query.answer()
@@ -2630,9 +3547,16 @@ async def handle_audio_split_start(update: Update, context: ContextTypes.DEFAULT
         file = await context.bot.get_file(file_id)
         await _download_with_retry(file, input_path, correlation_id=correlation_id)
 
-        # Get duration
-        splitter = AudioSplitter(str(input_path), str(temp_mgr.get_temp_path("output")))
-        duration = splitter.get_audio_duration()
+        # Get duration; an audio split before skips ffprobe entirely
+        splitter = AudioSplitter(
+            str(input_path),
+            str(temp_mgr.get_temp_path("output")),
+            duration=_get_cached_duration(file.file_unique_id, file.file_size),
+        )
+        duration = await asyncio.get_running_loop().run_in_executor(
+            MEDIA_EXECUTOR, splitter.get_audio_duration
+        )
+        _cache_duration(file.file_unique_id, file.file_size, duration)
 
         # Store in session and keep temp_mgr reference
         context.user_data["split_audio_session"]["duration"] = duration
@@ -2656,7 +3580,7 @@ async def handle_audio_split_start(update: Update, context: ContextTypes.DEFAULT
             "Error al preparar el audio. Intenta de nuevo."
         )
         context.user_data.pop("split_audio_session", None)
-        temp_mgr.cleanup()
+        await temp_mgr.cleanup_async()
 
 
 async def handle_audio_split_start_time(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -2675,39 +3599,7 @@ async def handle_audio_split_start_time(update: Update, context: ContextTypes.DE
     correlation_id = session.get("correlation_id", "unknown")
     logger.info(f"[{correlation_id}] Audio start time input received from user {user_id}")
 
-    try:
-        start_time = float(update.message.text.strip())
-    except (ValueError, AttributeError):
-        await update.message.reply_text(
-            "Por favor envía un número válido (ej: 30 o 30.5)"
-        )
-        return
-
-    duration = session.get("duration", 0)
-    if start_time < 0:
-        await update.message.reply_text(
-            "El tiempo de inicio no puede ser negativo."
-        )
-        return
-
-    if start_time >= duration:
-        await update.message.reply_text(
-            f"El tiempo de inicio debe ser menor a la duración del audio ({duration}s)."
-        )
-        return
-
-    # Store start time
-    session["start_time"] = start_time
-    session["state"] = SPLIT_WAITING_END_TIME
-
-    remaining = duration - start_time
-    await update.message.reply_text(
-        f"✅ Tiempo de inicio: *{start_time}s*\n\n"
-        f"Ahora envía el tiempo *final* en segundos.\n"
-        f"Debe ser mayor a {start_time}s y menor a {duration}s.\n\n"
-        f"Tiempo máximo disponible: *{remaining:.1f}s*",
-        parse_mode="Markdown"
-    )
+    await _accept_split_start_time(update, session, "audio")
 
 
 async def handle_audio_split_end_time(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -2726,58 +3618,33 @@ async def handle_audio_split_end_time(update: Update, context: ContextTypes.DEFA
     correlation_id = session.get("correlation_id", "unknown")
     logger.info(f"[{correlation_id}] Audio end time input received from user {user_id}")
 
-    try:
-        end_time = float(update.message.text.strip())
-    except (ValueError, AttributeError):
-        await update.message.reply_text(
-            "Por favor envía un número válido (ej: 60 o 90.5)"
-        )
-        return
-
-    start_time = session.get("start_time", 0)
-    duration = session.get("duration", 0)
-
-    if end_time <= start_time:
-        await update.message.reply_text(
-            f"El tiempo final debe ser mayor al tiempo de inicio ({start_time}s)."
-        )
-        return
-
-    if end_time > duration:
-        await update.message.reply_text(
-            f"El tiempo final no puede exceder la duración del audio ({duration}s)."
-        )
-        return
-
-    segment_duration = end_time - start_time
-    if segment_duration < 1:
-        await update.message.reply_text(
-            "La duración mínima del segmento es 1 segundo."
-        )
+    cut = await _confirm_split_range(update, session, "audio")
+    if cut is None:
         return
+    start_time, end_time, processing_message = cut
 
-    # Store end time and proceed to cut
-    session["end_time"] = end_time
-    session["state"] = SPLIT_CONFIRMING
-
-    # Send processing message
-    processing_message = await update.message.reply_text(
-        f"✂️ Extrayendo segmento de {start_time}s a {end_time}s...\n"
-        f"Duración: {segment_duration:.1f}s"
-    )
-
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             input_path = session["input_path"]
+            # The splitter creates this directory only if it writes a file
             output_dir = temp_mgr.get_temp_path(f"split_output_{correlation_id}")
-            Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-            splitter = AudioSplitter(str(input_path), str(output_dir))
-            output_path = splitter.split_by_time_range(start_time, end_time)
+            # Reuse the duration probed at split start
+            splitter = AudioSplitter(
+                str(input_path), str(output_dir),
+                duration=session.get("duration"), threads=config.FFMPEG_THREADS,
+            )
+            # Pipeable formats come back in memory; the rest as a file path
+            loop = asyncio.get_running_loop()
+            async with _media_job_slot(processing_message):
+                data, name = await loop.run_in_executor(
+                    MEDIA_EXECUTOR, splitter.extract_time_range, start_time, end_time
+                )
+            audio = InputFile(data, filename=name) if data is not None else await _read_upload_file(name)
 
             # Send audio segment
             await update.message.reply_audio(
-                audio=open(output_path, "rb"),
+                audio=audio,
                 caption=f"Segmento extraído ({start_time}s - {end_time}s)"
             )
 
@@ -2794,6 +3661,15 @@ async def handle_audio_split_end_time(update: Update, context: ContextTypes.DEFA
             context.user_data.pop("split_audio_session", None)
 
 
+# Text-input step for each interactive split session, keyed by (session key, state)
+SPLIT_TEXT_ROUTES = {
+    ("split_video_session", SPLIT_WAITING_START_TIME): handle_video_split_start_time,
+    ("split_video_session", SPLIT_WAITING_END_TIME): handle_video_split_end_time,
+    ("split_audio_session", SPLIT_WAITING_START_TIME): handle_audio_split_start_time,
+    ("split_audio_session", SPLIT_WAITING_END_TIME): handle_audio_split_end_time,
+}
+
+
 async def handle_split_text_input(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle text messages during active split or screenshot sessions.
 
@@ -2803,23 +3679,13 @@ async def handle_split_text_input(update: Update, context: ContextTypes.DEFAULT_
         update: Telegram update object
         context: Telegram context object
     """
-    # Check for video split session
-    if context.user_data.get("split_video_session"):
-        session = context.user_data["split_video_session"]
-        if session.get("state") == SPLIT_WAITING_START_TIME:
-            await handle_video_split_start_time(update, context)
-        elif session.get("state") == SPLIT_WAITING_END_TIME:
-            await handle_video_split_end_time(update, context)
-        return
-
-    # Check for audio split session
-    if context.user_data.get("split_audio_session"):
-        session = context.user_data["split_audio_session"]
-        if session.get("state") == SPLIT_WAITING_START_TIME:
-            await handle_audio_split_start_time(update, context)
-        elif session.get("state") == SPLIT_WAITING_END_TIME:
-            await handle_audio_split_end_time(update, context)
-        return
+    for session_key in ("split_video_session", "split_audio_session"):
+        session = context.user_data.get(session_key)
+        if session:
+            handler = SPLIT_TEXT_ROUTES.get((session_key, session.get("state")))
+            if handler:
+                await handler(update, context)
+            return
 
     # Check for screenshot session (automatic count or manual times)
     screenshot_state = context.user_data.get("screenshot_state")
@@ -2839,7 +3705,7 @@ async def handle_screenshot_text_input(update: Update, context: ContextTypes.DEF
         context: Telegram context object
     """
     user_id = update.effective_user.id
-    correlation_id = context.user_data.get("screenshot_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("screenshot_correlation_id", token_hex(4))
     screenshot_state = context.user_data.get("screenshot_state")
     mode = context.user_data.get("screenshot_mode")
 
@@ -2898,7 +3764,7 @@ async def handle_voice_message(update: Update, context: ContextTypes.DEFAULT_TYP
         context: Telegram context object
     """
     user_id = update.effective_user.id
-    correlation_id = str(uuid.uuid4())[:8]
+    correlation_id = token_hex(4)
     logger.info(f"[{correlation_id}] Voice message received from user {user_id} - running podcast pipeline")
 
     # Get voice from message
@@ -2921,14 +3787,15 @@ async def handle_voice_message(update: Update, context: ContextTypes.DEFAULT_TYP
     keyboard = [[InlineKeyboardButton("❌ Cancelar", callback_data=f"voice_cancel:{correlation_id}")]]
     reply_markup = InlineKeyboardMarkup(keyboard)
 
+    # Current step text, restored by the job slot if a step has to queue
+    step_text = (
+        "🎙️ Procesando nota de voz...\n\n"
+        "1️⃣ Convirtiendo a MP3...\n"
+        "⏳ Espera por favor"
+    )
     processing_message = None
     try:
-        processing_message = await update.message.reply_text(
-            "🎙️ Procesando nota de voz...\n\n"
-            "1️⃣ Convirtiendo a MP3...\n"
-            "⏳ Espera por favor",
-            reply_markup=reply_markup
-        )
+        processing_message = await update.message.reply_text(step_text, reply_markup=reply_markup)
     except Exception as e:
         logger.warning(f"[{correlation_id}] Could not send processing message to user {user_id}: {e}")
 
@@ -2936,7 +3803,7 @@ async def handle_voice_message(update: Update, context: ContextTypes.DEFAULT_TYP
     context.user_data["voice_pipeline_correlation_id"] = correlation_id
 
     # Use TempManager as context manager for automatic cleanup
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             # Generate safe filenames
             input_filename = f"voice_{user_id}_{voice.file_unique_id}.oga"
@@ -2958,29 +3825,24 @@ async def handle_voice_message(update: Update, context: ContextTypes.DEFAULT_TYP
                 logger.error(f"[{correlation_id}] Failed to download voice for user {user_id}: {e}")
                 raise DownloadError("No pude descargar la nota de voz") from e
 
-            # Validate audio integrity after download
-            is_valid, error_msg = validate_audio_file(str(input_path))
-            if not is_valid:
-                logger.warning(f"[{correlation_id}] Audio validation failed for user {user_id}: {error_msg}")
-                raise ValidationError(error_msg)
-
-            # Check disk space before processing
-            voice_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
-            required_space = estimate_required_space(int(voice_size_mb)) * 3  # 3x for pipeline
-            has_space, space_error = check_disk_space(required_space)
-            if not has_space:
-                logger.warning(f"[{correlation_id}] Disk space check failed for user {user_id}: {space_error}")
-                raise ValidationError(space_error)
+            # Validate integrity and disk space (3x for pipeline) after download
+            preflight = await asyncio.get_running_loop().run_in_executor(
+                MEDIA_EXECUTOR, preflight_audio, str(input_path), 3, file.file_size
+            )
+            if preflight.error:
+                logger.warning(f"[{correlation_id}] Audio preflight failed for user {user_id}: {preflight.error}")
+                raise ValidationError(preflight.error)
 
             # Step 1: Convert to MP3
             logger.info(f"[{correlation_id}] Converting voice to MP3 for user {user_id}")
             try:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 converter = VoiceToMp3Converter(str(input_path), str(mp3_path))
-                success = await asyncio.wait_for(
-                    loop.run_in_executor(None, converter.process),
-                    timeout=config.PROCESSING_TIMEOUT
-                )
+                async with _media_job_slot(processing_message, step_text, reply_markup):
+                    success = await asyncio.wait_for(
+                        loop.run_in_executor(MEDIA_EXECUTOR, converter.process),
+                        timeout=config.PROCESSING_TIMEOUT
+                    )
 
                 if not success:
                     logger.error(f"[{correlation_id}] Voice to MP3 conversion failed for user {user_id}")
@@ -2991,26 +3853,27 @@ async def handle_voice_message(update: Update, context: ContextTypes.DEFAULT_TYP
                 raise ProcessingTimeoutError("La conversión tardó demasiado") from e
 
             # Update progress message
+            step_text = (
+                "🎙️ Procesando nota de voz...\n\n"
+                "✅ Convertido a MP3\n"
+                "2️⃣ Normalizando a -16 LUFS (podcast)...\n"
+                "⏳ Espera por favor"
+            )
             try:
-                await processing_message.edit_text(
-                    "🎙️ Procesando nota de voz...\n\n"
-                    "✅ Convertido a MP3\n"
-                    "2️⃣ Normalizando a -16 LUFS (podcast)...\n"
-                    "⏳ Espera por favor",
-                    reply_markup=reply_markup
-                )
+                await processing_message.edit_text(step_text, reply_markup=reply_markup)
             except Exception as e:
                 logger.warning(f"[{correlation_id}] Could not update message: {e}")
 
             # Step 2: Normalize to -16 LUFS (podcast preset)
             logger.info(f"[{correlation_id}] Normalizing to -16 LUFS (podcast) for user {user_id}")
             try:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 effects = AudioEffects(str(mp3_path), str(normalized_path))
-                success = await asyncio.wait_for(
-                    loop.run_in_executor(None, effects.normalize, -16.0),
-                    timeout=config.PROCESSING_TIMEOUT
-                )
+                async with _media_job_slot(processing_message, step_text, reply_markup):
+                    success = await asyncio.wait_for(
+                        loop.run_in_executor(MEDIA_EXECUTOR, effects.normalize, -16.0),
+                        timeout=config.PROCESSING_TIMEOUT
+                    )
 
                 if not success:
                     logger.error(f"[{correlation_id}] Normalization failed for user {user_id}")
@@ -3021,27 +3884,28 @@ async def handle_voice_message(update: Update, context: ContextTypes.DEFAULT_TYP
                 raise ProcessingTimeoutError("La normalización tardó demasiado") from e
 
             # Update progress message
+            step_text = (
+                "🎙️ Procesando nota de voz...\n\n"
+                "✅ Convertido a MP3\n"
+                "✅ Normalizado a -16 LUFS\n"
+                "3️⃣ Aplicando bass boost (intensidad 4)...\n"
+                "⏳ Espera por favor"
+            )
             try:
-                await processing_message.edit_text(
-                    "🎙️ Procesando nota de voz...\n\n"
-                    "✅ Convertido a MP3\n"
-                    "✅ Normalizado a -16 LUFS\n"
-                    "3️⃣ Aplicando bass boost (intensidad 4)...\n"
-                    "⏳ Espera por favor",
-                    reply_markup=reply_markup
-                )
+                await processing_message.edit_text(step_text, reply_markup=reply_markup)
             except Exception as e:
                 logger.warning(f"[{correlation_id}] Could not update message: {e}")
 
             # Step 3: Apply bass boost (intensity 4)
             logger.info(f"[{correlation_id}] Applying bass boost (intensity 4) for user {user_id}")
             try:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 enhancer = AudioEnhancer(str(normalized_path), str(output_path))
-                success = await asyncio.wait_for(
-                    loop.run_in_executor(None, lambda: enhancer.bass_boost(4.0)),
-                    timeout=config.PROCESSING_TIMEOUT
-                )
+                async with _media_job_slot(processing_message, step_text, reply_markup):
+                    success = await asyncio.wait_for(
+                        loop.run_in_executor(MEDIA_EXECUTOR, lambda: enhancer.bass_boost(4.0)),
+                        timeout=config.PROCESSING_TIMEOUT
+                    )
 
                 if not success:
                     logger.error(f"[{correlation_id}] Bass boost failed for user {user_id}")
@@ -3067,13 +3931,11 @@ async def handle_voice_message(update: Update, context: ContextTypes.DEFAULT_TYP
             # Send as audio file with metadata
             logger.info(f"[{correlation_id}] Sending processed audio to user {user_id}")
             try:
-                with open(output_path, "rb") as audio_file:
-                    await update.message.reply_audio(
-                        audio=audio_file,
-                        title="Nota de voz procesada",
-                        performer="Podcast Pipeline",
-                        filename=f"voice_{user_id}_processed.mp3"
-                    )
+                await update.message.reply_audio(
+                    audio=await _read_upload_file(output_path, filename=f"voice_{user_id}_processed.mp3"),
+                    title="Nota de voz procesada",
+                    performer="Podcast Pipeline",
+                )
                 logger.info(f"[{correlation_id}] Processed audio sent successfully to user {user_id}")
             except Exception as e:
                 logger.error(f"[{correlation_id}] Failed to send processed audio to user {user_id}: {e}")
@@ -3120,6 +3982,39 @@ async def handle_voice_message(update: Update, context: ContextTypes.DEFAULT_TYP
         logger.debug(f"[{correlation_id}] Cleanup completed for user {user_id}")
 
 
+# Static selection keyboards for the audio commands (PTB markups are immutable)
+CONVERT_FORMAT_KEYBOARD = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("MP3", callback_data="format:mp3"),
+        InlineKeyboardButton("WAV", callback_data="format:wav"),
+        InlineKeyboardButton("OGG", callback_data="format:ogg"),
+    ],
+    [
+        InlineKeyboardButton("AAC", callback_data="format:aac"),
+        InlineKeyboardButton("FLAC", callback_data="format:flac"),
+    ],
+    [InlineKeyboardButton("❌ Cancelar", callback_data="cancel")],
+])
+
+
+def _intensity_keyboard(prefix: str) -> InlineKeyboardMarkup:
+    """Build a 1-10 intensity keyboard in a 5 + 5 layout with a cancel row."""
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton(str(i), callback_data=f"{prefix}:{i}") for i in range(1, 6)],
+        [InlineKeyboardButton(str(i), callback_data=f"{prefix}:{i}") for i in range(6, 11)],
+        [InlineKeyboardButton("❌ Cancelar", callback_data="cancel")],
+    ])
+
+
+BASS_INTENSITY_KEYBOARD = _intensity_keyboard("bass")
+TREBLE_INTENSITY_KEYBOARD = _intensity_keyboard("treble")
+
+# Every valid intensity callback ("bass:1" .. "treble:10") -> (enhance_type, intensity)
+INTENSITY_CALLBACKS = {
+    f"{enhance_type}:{i}": (enhance_type, i) for enhance_type in ("bass", "treble") for i in range(1, 11)
+}
+
+
 async def handle_convert_audio_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /convert_audio command to convert audio to different format.
 
@@ -3131,7 +4026,7 @@ async def handle_convert_audio_command(update: Update, context: ContextTypes.DEF
         context: Telegram context object
     """
     user_id = update.effective_user.id
-    correlation_id = str(uuid.uuid4())[:8]
+    correlation_id = token_hex(4)
     logger.info(f"[{correlation_id}] Convert audio command received from user {user_id}")
 
     # Get audio from message or reply
@@ -3154,25 +4049,12 @@ async def handle_convert_audio_command(update: Update, context: ContextTypes.DEF
     # Store file_id in context for later retrieval
     context.user_data["convert_audio_file_id"] = audio.file_id
     context.user_data["convert_audio_correlation_id"] = correlation_id
-
-    # Create inline keyboard with format options (3 + 2 layout)
-    keyboard = [
-        [
-            InlineKeyboardButton("MP3", callback_data="format:mp3"),
-            InlineKeyboardButton("WAV", callback_data="format:wav"),
-            InlineKeyboardButton("OGG", callback_data="format:ogg"),
-        ],
-        [
-            InlineKeyboardButton("AAC", callback_data="format:aac"),
-            InlineKeyboardButton("FLAC", callback_data="format:flac"),
-        ],
-        [InlineKeyboardButton("❌ Cancelar", callback_data="cancel")],
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    # Lets the format selection reject a no-op conversion before downloading
+    context.user_data["convert_audio_input_format"] = audio_format_from_mime_type(audio.mime_type)
 
     await update.message.reply_text(
         "Selecciona el formato de salida:",
-        reply_markup=reply_markup
+        reply_markup=CONVERT_FORMAT_KEYBOARD
     )
     logger.info(f"[{correlation_id}] Format selection keyboard sent to user {user_id}")
 
@@ -3202,7 +4084,7 @@ async def handle_format_selection(update: Update, context: ContextTypes.DEFAULT_
 
     # Retrieve file_id from context
     file_id = context.user_data.get("convert_audio_file_id")
-    correlation_id = context.user_data.get("convert_audio_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("convert_audio_correlation_id", token_hex(4))
 
     if not file_id:
         logger.error(f"[{correlation_id}] No file_id found in context for user {user_id}")
@@ -3211,6 +4093,15 @@ async def handle_format_selection(update: Update, context: ContextTypes.DEFAULT_
 
     logger.info(f"[{correlation_id}] Format {output_format} selected by user {user_id}")
 
+    if context.user_data.get("convert_audio_input_format") == output_format:
+        logger.info(f"[{correlation_id}] Audio already in {output_format}, skipping download")
+        for key in ("convert_audio_file_id", "convert_audio_correlation_id", "convert_audio_input_format"):
+            context.user_data.pop(key, None)
+        await query.edit_message_text(
+            f"El archivo ya está en formato {output_format.upper()}. No es necesario convertir."
+        )
+        return
+
     # Update message to show processing
     try:
         await query.edit_message_text(f"Convirtiendo a {output_format.upper()}...")
@@ -3218,119 +4109,112 @@ async def handle_format_selection(update: Update, context: ContextTypes.DEFAULT_
         logger.warning(f"[{correlation_id}] Could not update message: {e}")
 
     # Process with TempManager for automatic cleanup
-    with TempManager() as temp_mgr:
-        try:
-            # Generate safe filenames
-            input_filename = f"input_{user_id}_{correlation_id}.audio"
-            output_filename = f"converted_{user_id}_{correlation_id}.{output_format}"
-
-            input_path = temp_mgr.get_temp_path(input_filename)
-            output_path = temp_mgr.get_temp_path(output_filename)
-
-            # Download audio file
-            logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
+    async with TempManager() as temp_mgr:
+        async with _job_cleanup(
+            None, context.user_data, "convert_audio_file_id", "convert_audio_correlation_id",
+            "convert_audio_input_format",
+        ):
             try:
-                file = await context.bot.get_file(file_id)
-                await _download_with_retry(file, input_path, correlation_id=correlation_id)
-                logger.info(f"[{correlation_id}] Audio downloaded to {input_path}")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to download audio for user {user_id}: {e}")
-                raise DownloadError("No pude descargar el audio") from e
-
-            # Validate audio integrity after download
-            is_valid, error_msg = validate_audio_file(str(input_path))
-            if not is_valid:
-                logger.warning(f"[{correlation_id}] Audio validation failed for user {user_id}: {error_msg}")
-                raise ValidationError(error_msg)
-
-            # Detect input format
-            input_format = detect_audio_format(str(input_path))
-            if input_format:
-                logger.info(f"[{correlation_id}] Detected input format: {input_format}")
-                # Check if input format equals output format
-                if input_format == output_format:
-                    await query.edit_message_text(
-                        f"El archivo ya está en formato {output_format.upper()}. No es necesario convertir."
-                    )
-                    return
-            else:
-                logger.warning(f"[{correlation_id}] Could not detect input format for user {user_id}")
+                # Generate safe filenames
+                input_filename = f"input_{user_id}_{correlation_id}.audio"
+                output_filename = f"converted_{user_id}_{correlation_id}.{output_format}"
 
-            # Check disk space before processing
-            audio_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
-            required_space = estimate_required_space(int(audio_size_mb))
-            has_space, space_error = check_disk_space(required_space)
-            if not has_space:
-                logger.warning(f"[{correlation_id}] Disk space check failed for user {user_id}: {space_error}")
-                raise ValidationError(space_error)
+                input_path = temp_mgr.get_temp_path(input_filename)
+                output_path = temp_mgr.get_temp_path(output_filename)
 
-            # Convert audio with timeout
-            logger.info(f"[{correlation_id}] Converting audio to {output_format} for user {user_id}")
-            try:
-                loop = asyncio.get_event_loop()
-                converter = AudioFormatConverter(str(input_path), str(output_path))
-                success = await asyncio.wait_for(
-                    loop.run_in_executor(None, converter.convert, output_format),
-                    timeout=config.PROCESSING_TIMEOUT
+                # Download audio file
+                logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
+                try:
+                    file = await context.bot.get_file(file_id)
+                    await _download_with_retry(file, input_path, correlation_id=correlation_id)
+                    logger.info(f"[{correlation_id}] Audio downloaded to {input_path}")
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to download audio for user {user_id}: {e}")
+                    raise DownloadError("No pude descargar el audio") from e
+
+                # Validate integrity/disk space and detect the input format in parallel
+                loop = asyncio.get_running_loop()
+                preflight, input_format = await asyncio.gather(
+                    loop.run_in_executor(MEDIA_EXECUTOR, preflight_audio, str(input_path), 1, file.file_size),
+                    loop.run_in_executor(MEDIA_EXECUTOR, detect_audio_format_fast, str(input_path)),
                 )
+                if preflight.error:
+                    logger.warning(f"[{correlation_id}] Audio preflight failed for user {user_id}: {preflight.error}")
+                    raise ValidationError(preflight.error)
+
+                if input_format:
+                    logger.info(f"[{correlation_id}] Detected input format: {input_format}")
+                    # Check if input format equals output format
+                    if input_format == output_format:
+                        await query.edit_message_text(
+                            f"El archivo ya está en formato {output_format.upper()}. No es necesario convertir."
+                        )
+                        return
+                else:
+                    logger.warning(f"[{correlation_id}] Could not detect input format for user {user_id}")
 
-                if not success:
-                    logger.error(f"[{correlation_id}] Audio format conversion failed for user {user_id}")
-                    raise AudioFormatConversionError(f"No pude convertir el audio a {output_format.upper()}")
+                # Convert audio with timeout
+                logger.info(f"[{correlation_id}] Converting audio to {output_format} for user {user_id}")
+                try:
+                    loop = asyncio.get_running_loop()
+                    converter = AudioFormatConverter(str(input_path), str(output_path))
+                    async with _media_job_slot():
+                        success = await asyncio.wait_for(
+                            loop.run_in_executor(MEDIA_EXECUTOR, converter.convert, output_format),
+                            timeout=config.PROCESSING_TIMEOUT
+                        )
 
-            except asyncio.TimeoutError as e:
-                logger.error(f"[{correlation_id}] Audio conversion timed out for user {user_id}")
-                raise ProcessingTimeoutError("La conversión tardó demasiado") from e
+                    if not success:
+                        logger.error(f"[{correlation_id}] Audio format conversion failed for user {user_id}")
+                        raise AudioFormatConversionError(f"No pude convertir el audio a {output_format.upper()}")
 
-            # Send converted audio
-            logger.info(f"[{correlation_id}] Sending converted audio to user {user_id}")
-            try:
-                with open(output_path, "rb") as audio_file:
+                except asyncio.TimeoutError as e:
+                    logger.error(f"[{correlation_id}] Audio conversion timed out for user {user_id}")
+                    raise ProcessingTimeoutError("La conversión tardó demasiado") from e
+
+                # Send converted audio
+                logger.info(f"[{correlation_id}] Sending converted audio to user {user_id}")
+                try:
                     await context.bot.send_audio(
                         chat_id=update.effective_chat.id,
-                        audio=audio_file,
-                        filename=f"converted.{output_format}",
+                        audio=await _read_upload_file(output_path, filename=f"converted.{output_format}"),
                         title=f"Audio convertido a {output_format.upper()}"
                     )
-                logger.info(f"[{correlation_id}] Converted audio sent successfully to user {user_id}")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to send converted audio to user {user_id}: {e}")
-                raise
-
-            # Update message on success
-            try:
-                await query.edit_message_text(f"Audio convertido a {output_format.upper()} exitosamente.")
-            except Exception as e:
-                logger.warning(f"[{correlation_id}] Could not update final message: {e}")
+                    logger.info(f"[{correlation_id}] Converted audio sent successfully to user {user_id}")
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to send converted audio to user {user_id}: {e}")
+                    raise
 
-            # Clean up user_data
-            context.user_data.pop("convert_audio_file_id", None)
-            context.user_data.pop("convert_audio_correlation_id", None)
+                # Update message on success
+                try:
+                    await query.edit_message_text(f"Audio convertido a {output_format.upper()} exitosamente.")
+                except Exception as e:
+                    logger.warning(f"[{correlation_id}] Could not update final message: {e}")
 
-        except (DownloadError, ValidationError, AudioFormatConversionError, ProcessingTimeoutError) as e:
-            # Handle known processing errors
-            logger.error(f"[{correlation_id}] Processing error: {e}")
-            await handle_processing_error(update, e, user_id)
+            except (DownloadError, ValidationError, AudioFormatConversionError, ProcessingTimeoutError) as e:
+                # Handle known processing errors
+                logger.error(f"[{correlation_id}] Processing error: {e}")
+                await handle_processing_error(update, e, user_id)
 
-            # Update message on error
-            try:
-                await query.edit_message_text(f"Error: {str(e)}")
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+                # Update message on error
+                try:
+                    await query.edit_message_text(f"Error: {str(e)}")
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
 
-        except Exception as e:
-            # Handle unexpected errors
-            logger.exception(f"[{correlation_id}] Unexpected error converting audio for user {user_id}: {e}")
-            await handle_processing_error(update, e, user_id)
+            except Exception as e:
+                # Handle unexpected errors
+                logger.exception(f"[{correlation_id}] Unexpected error converting audio for user {user_id}: {e}")
+                await handle_processing_error(update, e, user_id)
 
-            # Update message on error
-            try:
-                await query.edit_message_text("Ocurrió un error inesperado. Por favor intenta de nuevo.")
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+                # Update message on error
+                try:
+                    await query.edit_message_text("Ocurrió un error inesperado. Por favor intenta de nuevo.")
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
 
-        # TempManager cleanup happens automatically on context exit
-        logger.debug(f"[{correlation_id}] Cleanup completed for user {user_id}")
+            # TempManager cleanup happens automatically on context exit
+            logger.debug(f"[{correlation_id}] Cleanup completed for user {user_id}")
 
 
 async def handle_bass_boost_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -3344,7 +4228,7 @@ async def handle_bass_boost_command(update: Update, context: ContextTypes.DEFAUL
         context: Telegram context object
     """
     user_id = update.effective_user.id
-    correlation_id = str(uuid.uuid4())[:8]
+    correlation_id = token_hex(4)
     logger.info(f"[{correlation_id}] Bass boost command received from user {user_id}")
 
     # Get audio from message or reply
@@ -3369,29 +4253,9 @@ async def handle_bass_boost_command(update: Update, context: ContextTypes.DEFAUL
     context.user_data["enhance_audio_correlation_id"] = correlation_id
     context.user_data["enhance_type"] = "bass"
 
-    # Create inline keyboard with intensity options (5 + 5 layout)
-    keyboard = [
-        [
-            InlineKeyboardButton("1", callback_data="bass:1"),
-            InlineKeyboardButton("2", callback_data="bass:2"),
-            InlineKeyboardButton("3", callback_data="bass:3"),
-            InlineKeyboardButton("4", callback_data="bass:4"),
-            InlineKeyboardButton("5", callback_data="bass:5"),
-        ],
-        [
-            InlineKeyboardButton("6", callback_data="bass:6"),
-            InlineKeyboardButton("7", callback_data="bass:7"),
-            InlineKeyboardButton("8", callback_data="bass:8"),
-            InlineKeyboardButton("9", callback_data="bass:9"),
-            InlineKeyboardButton("10", callback_data="bass:10"),
-        ],
-        [InlineKeyboardButton("❌ Cancelar", callback_data="cancel")],
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-
     await update.message.reply_text(
         "Selecciona la intensidad del bass boost (1-10):",
-        reply_markup=reply_markup
+        reply_markup=BASS_INTENSITY_KEYBOARD
     )
     logger.info(f"[{correlation_id}] Intensity selection keyboard sent to user {user_id}")
 
@@ -3407,7 +4271,7 @@ async def handle_treble_boost_command(update: Update, context: ContextTypes.DEFA
         context: Telegram context object
     """
     user_id = update.effective_user.id
-    correlation_id = str(uuid.uuid4())[:8]
+    correlation_id = token_hex(4)
     logger.info(f"[{correlation_id}] Treble boost command received from user {user_id}")
 
     # Get audio from message or reply
@@ -3432,29 +4296,9 @@ async def handle_treble_boost_command(update: Update, context: ContextTypes.DEFA
     context.user_data["enhance_audio_correlation_id"] = correlation_id
     context.user_data["enhance_type"] = "treble"
 
-    # Create inline keyboard with intensity options (5 + 5 layout)
-    keyboard = [
-        [
-            InlineKeyboardButton("1", callback_data="treble:1"),
-            InlineKeyboardButton("2", callback_data="treble:2"),
-            InlineKeyboardButton("3", callback_data="treble:3"),
-            InlineKeyboardButton("4", callback_data="treble:4"),
-            InlineKeyboardButton("5", callback_data="treble:5"),
-        ],
-        [
-            InlineKeyboardButton("6", callback_data="treble:6"),
-            InlineKeyboardButton("7", callback_data="treble:7"),
-            InlineKeyboardButton("8", callback_data="treble:8"),
-            InlineKeyboardButton("9", callback_data="treble:9"),
-            InlineKeyboardButton("10", callback_data="treble:10"),
-        ],
-        [InlineKeyboardButton("❌ Cancelar", callback_data="cancel")],
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-
     await update.message.reply_text(
         "Selecciona la intensidad del treble boost (1-10):",
-        reply_markup=reply_markup
+        reply_markup=TREBLE_INTENSITY_KEYBOARD
     )
     logger.info(f"[{correlation_id}] Intensity selection keyboard sent to user {user_id}")
 
@@ -3476,38 +4320,16 @@ async def handle_intensity_selection(update: Update, context: ContextTypes.DEFAU
 
     # Parse callback data (e.g., "bass:5" or "treble:8")
     callback_data = query.data
-    if not callback_data or ":" not in callback_data:
+    parsed = INTENSITY_CALLBACKS.get(callback_data)
+    if parsed is None:
         logger.warning(f"Invalid callback data received: {callback_data}")
         await query.edit_message_text("Error: selección inválida.")
         return
-
-    parts = callback_data.split(":")
-    if len(parts) != 2:
-        logger.warning(f"Invalid callback data format: {callback_data}")
-        await query.edit_message_text("Error: selección inválida.")
-        return
-
-    enhance_type = parts[0]
-    try:
-        intensity = int(parts[1])
-    except ValueError:
-        logger.warning(f"Invalid intensity value: {parts[1]}")
-        await query.edit_message_text("Error: intensidad inválida.")
-        return
-
-    if enhance_type not in ("bass", "treble"):
-        logger.warning(f"Invalid enhancement type: {enhance_type}")
-        await query.edit_message_text("Error: tipo de mejora inválido.")
-        return
-
-    if intensity < 1 or intensity > 10:
-        logger.warning(f"Invalid intensity range: {intensity}")
-        await query.edit_message_text("Error: intensidad debe estar entre 1 y 10.")
-        return
+    enhance_type, intensity = parsed
 
     # Retrieve file_id from context
     file_id = context.user_data.get("enhance_audio_file_id")
-    correlation_id = context.user_data.get("enhance_audio_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("enhance_audio_correlation_id", token_hex(4))
     stored_enhance_type = context.user_data.get("enhance_type")
 
     if not file_id:
@@ -3523,122 +4345,111 @@ async def handle_intensity_selection(update: Update, context: ContextTypes.DEFAU
     logger.info(f"[{correlation_id}] {effect_name.capitalize()} boost intensity {intensity} selected by user {user_id}")
 
     # Update message to show processing
+    status_text = f"Aplicando {effect_name} boost (intensidad {intensity})..."
     try:
-        await query.edit_message_text(f"Aplicando {effect_name} boost (intensidad {intensity})...")
+        await query.edit_message_text(status_text)
     except Exception as e:
         logger.warning(f"[{correlation_id}] Could not update message: {e}")
 
     # Process with TempManager for automatic cleanup
-    with TempManager() as temp_mgr:
-        try:
-            # Generate safe filenames
-            input_filename = f"input_{user_id}_{correlation_id}.audio"
-            output_filename = f"enhanced_{user_id}_{correlation_id}.mp3"
-
-            input_path = temp_mgr.get_temp_path(input_filename)
-            output_path = temp_mgr.get_temp_path(output_filename)
-
-            # Download audio file
-            logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
+    async with TempManager() as temp_mgr:
+        async with _job_cleanup(
+            None, context.user_data, "enhance_audio_file_id", "enhance_audio_correlation_id", "enhance_type"
+        ):
             try:
-                file = await context.bot.get_file(file_id)
-                await _download_with_retry(file, input_path, correlation_id=correlation_id)
-                logger.info(f"[{correlation_id}] Audio downloaded to {input_path}")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to download audio for user {user_id}: {e}")
-                raise DownloadError("No pude descargar el audio") from e
+                # Generate safe filenames
+                input_filename = f"input_{user_id}_{correlation_id}.audio"
+                # The job's temp dir is private, so the output can carry the
+                # name shown to the user and be uploaded by path
+                output_filename = f"enhanced_{effect_name}.mp3"
 
-            # Validate audio integrity after download
-            is_valid, error_msg = validate_audio_file(str(input_path))
-            if not is_valid:
-                logger.warning(f"[{correlation_id}] Audio validation failed for user {user_id}: {error_msg}")
-                raise ValidationError(error_msg)
+                input_path = temp_mgr.get_temp_path(input_filename)
+                output_path = temp_mgr.get_temp_path(output_filename)
 
-            # Check disk space before processing
-            audio_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
-            required_space = estimate_required_space(int(audio_size_mb))
-            has_space, space_error = check_disk_space(required_space)
-            if not has_space:
-                logger.warning(f"[{correlation_id}] Disk space check failed for user {user_id}: {space_error}")
-                raise ValidationError(space_error)
+                # Download audio file
+                logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
+                try:
+                    file = await context.bot.get_file(file_id)
+                    await _download_with_retry(file, input_path, correlation_id=correlation_id, cache=True)
+                    logger.info(f"[{correlation_id}] Audio downloaded to {input_path}")
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to download audio for user {user_id}: {e}")
+                    raise DownloadError("No pude descargar el audio") from e
 
-            # Apply enhancement with timeout
-            logger.info(f"[{correlation_id}] Applying {effect_name} boost (intensity {intensity}) for user {user_id}")
-            try:
-                loop = asyncio.get_event_loop()
-                enhancer = AudioEnhancer(str(input_path), str(output_path))
+                # Validate integrity and disk space after download
+                preflight = await asyncio.get_running_loop().run_in_executor(
+                    MEDIA_EXECUTOR, preflight_audio, str(input_path), 1, file.file_size
+                )
+                if preflight.error:
+                    logger.warning(f"[{correlation_id}] Audio preflight failed for user {user_id}: {preflight.error}")
+                    raise ValidationError(preflight.error)
 
-                if enhance_type == "bass":
-                    success = await asyncio.wait_for(
-                        loop.run_in_executor(None, enhancer.bass_boost, intensity),
-                        timeout=config.PROCESSING_TIMEOUT
-                    )
-                else:  # treble
-                    success = await asyncio.wait_for(
-                        loop.run_in_executor(None, enhancer.treble_boost, intensity),
-                        timeout=config.PROCESSING_TIMEOUT
-                    )
+                # Apply enhancement with timeout
+                logger.info(f"[{correlation_id}] Applying {effect_name} boost (intensity {intensity}) for user {user_id}")
+                try:
+                    loop = asyncio.get_running_loop()
+                    enhancer = AudioEnhancer(str(input_path), str(output_path))
 
-                if not success:
-                    logger.error(f"[{correlation_id}] Audio enhancement failed for user {user_id}")
-                    raise AudioEnhancementError(f"No pude aplicar el {effect_name} boost")
+                    boost = enhancer.bass_boost if enhance_type == "bass" else enhancer.treble_boost
+                    async with _media_job_slot(query.message, status_text):
+                        success = await asyncio.wait_for(
+                            loop.run_in_executor(MEDIA_EXECUTOR, boost, intensity),
+                            timeout=config.PROCESSING_TIMEOUT
+                        )
 
-            except asyncio.TimeoutError as e:
-                logger.error(f"[{correlation_id}] Audio enhancement timed out for user {user_id}")
-                raise ProcessingTimeoutError("El procesamiento tardó demasiado") from e
+                    if not success:
+                        logger.error(f"[{correlation_id}] Audio enhancement failed for user {user_id}")
+                        raise AudioEnhancementError(f"No pude aplicar el {effect_name} boost")
 
-            # Send enhanced audio
-            logger.info(f"[{correlation_id}] Sending enhanced audio to user {user_id}")
-            try:
-                with open(output_path, "rb") as audio_file:
+                except asyncio.TimeoutError as e:
+                    logger.error(f"[{correlation_id}] Audio enhancement timed out for user {user_id}")
+                    raise ProcessingTimeoutError("El procesamiento tardó demasiado") from e
+
+                # Send enhanced audio
+                logger.info(f"[{correlation_id}] Sending enhanced audio to user {user_id}")
+                try:
                     await context.bot.send_audio(
                         chat_id=update.effective_chat.id,
-                        audio=audio_file,
-                        filename=f"enhanced_{effect_name}.mp3",
+                        audio=await _read_upload_file(output_path),
                         title=f"Audio mejorado ({effect_name.capitalize()} Boost)"
                     )
-                logger.info(f"[{correlation_id}] Enhanced audio sent successfully to user {user_id}")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to send enhanced audio to user {user_id}: {e}")
-                raise
-
-            # Update message on success
-            try:
-                await query.edit_message_text(
-                    f"¡Listo! Audio mejorado con {effect_name} boost (intensidad {intensity}/10)."
-                )
-            except Exception as e:
-                logger.warning(f"[{correlation_id}] Could not update final message: {e}")
+                    logger.info(f"[{correlation_id}] Enhanced audio sent successfully to user {user_id}")
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to send enhanced audio to user {user_id}: {e}")
+                    raise
 
-            # Clean up user_data
-            context.user_data.pop("enhance_audio_file_id", None)
-            context.user_data.pop("enhance_audio_correlation_id", None)
-            context.user_data.pop("enhance_type", None)
+                # Update message on success
+                try:
+                    await query.edit_message_text(
+                        f"¡Listo! Audio mejorado con {effect_name} boost (intensidad {intensity}/10)."
+                    )
+                except Exception as e:
+                    logger.warning(f"[{correlation_id}] Could not update final message: {e}")
 
-        except (DownloadError, ValidationError, AudioEnhancementError, ProcessingTimeoutError) as e:
-            # Handle known processing errors
-            logger.error(f"[{correlation_id}] Processing error: {e}")
-            await handle_processing_error(update, e, user_id)
+            except (DownloadError, ValidationError, AudioEnhancementError, ProcessingTimeoutError) as e:
+                # Handle known processing errors
+                logger.error(f"[{correlation_id}] Processing error: {e}")
+                await handle_processing_error(update, e, user_id)
 
-            # Update message on error
-            try:
-                await query.edit_message_text(f"Error: {str(e)}")
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+                # Update message on error
+                try:
+                    await query.edit_message_text(f"Error: {str(e)}")
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
 
-        except Exception as e:
-            # Handle unexpected errors
-            logger.exception(f"[{correlation_id}] Unexpected error enhancing audio for user {user_id}: {e}")
-            await handle_processing_error(update, e, user_id)
+            except Exception as e:
+                # Handle unexpected errors
+                logger.exception(f"[{correlation_id}] Unexpected error enhancing audio for user {user_id}: {e}")
+                await handle_processing_error(update, e, user_id)
 
-            # Update message on error
-            try:
-                await query.edit_message_text("Ocurrió un error inesperado. Por favor intenta de nuevo.")
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+                # Update message on error
+                try:
+                    await query.edit_message_text("Ocurrió un error inesperado. Por favor intenta de nuevo.")
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
 
-        # TempManager cleanup happens automatically on context exit
-        logger.debug(f"[{correlation_id}] Cleanup completed for user {user_id}")
+            # TempManager cleanup happens automatically on context exit
+            logger.debug(f"[{correlation_id}] Cleanup completed for user {user_id}")
 
 
 # =============================================================================
@@ -3812,7 +4623,7 @@ async def handle_equalize_command(update: Update, context: ContextTypes.DEFAULT_
         context: Telegram context object
     """
     user_id = update.effective_user.id
-    correlation_id = str(uuid.uuid4())[:8]
+    correlation_id = token_hex(4)
     logger.info(f"[{correlation_id}] Equalize command received from user {user_id}")
 
     # Get audio from message or reply
@@ -3876,7 +4687,7 @@ async def handle_equalizer_adjustment(update: Update, context: ContextTypes.DEFA
     bass = context.user_data.get("eq_bass", 0)
     mid = context.user_data.get("eq_mid", 0)
     treble = context.user_data.get("eq_treble", 0)
-    correlation_id = context.user_data.get("eq_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("eq_correlation_id", token_hex(4))
 
     # Process callback
     if callback_data == "eq_apply":
@@ -3953,7 +4764,7 @@ async def _handle_equalizer_apply(
     """
     query = update.callback_query
     user_id = update.effective_user.id
-    correlation_id = context.user_data.get("eq_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("eq_correlation_id", token_hex(4))
 
     # Check if any adjustments were made
     if bass == 0 and mid == 0 and treble == 0:
@@ -3985,113 +4796,107 @@ async def _handle_equalizer_apply(
     logger.info(f"[{correlation_id}] Applying equalizer: bass={bass}, mid={mid}, treble={treble}")
 
     # Process with TempManager for automatic cleanup
-    with TempManager() as temp_mgr:
-        try:
-            # Generate safe filenames
-            input_filename = f"input_eq_{user_id}_{correlation_id}.audio"
-            output_filename = f"equalized_{user_id}_{correlation_id}.mp3"
+    async with TempManager() as temp_mgr:
+        async with _job_cleanup(
+            None, context.user_data, "eq_file_id", "eq_correlation_id", "eq_bass", "eq_mid", "eq_treble"
+        ):
+            try:
+                # Generate safe filenames
+                input_filename = f"input_eq_{user_id}_{correlation_id}.audio"
+                output_filename = f"equalized_{user_id}_{correlation_id}.mp3"
 
-            input_path = temp_mgr.get_temp_path(input_filename)
-            output_path = temp_mgr.get_temp_path(output_filename)
+                input_path = temp_mgr.get_temp_path(input_filename)
+                output_path = temp_mgr.get_temp_path(output_filename)
 
-            # Download audio file
-            logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
-            try:
-                file = await context.bot.get_file(file_id)
-                await _download_with_retry(file, input_path, correlation_id=correlation_id)
-                logger.info(f"[{correlation_id}] Audio downloaded to {input_path}")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to download audio for user {user_id}: {e}")
-                raise DownloadError("No pude descargar el audio") from e
+                # Download audio file
+                logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
+                try:
+                    file = await context.bot.get_file(file_id)
+                    await _download_with_retry(file, input_path, correlation_id=correlation_id)
+                    logger.info(f"[{correlation_id}] Audio downloaded to {input_path}")
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to download audio for user {user_id}: {e}")
+                    raise DownloadError("No pude descargar el audio") from e
 
-            # Validate audio integrity after download
-            is_valid, error_msg = validate_audio_file(str(input_path))
-            if not is_valid:
-                logger.warning(f"[{correlation_id}] Audio validation failed for user {user_id}: {error_msg}")
-                raise ValidationError(error_msg)
+                # Validate audio integrity after download
+                is_valid, error_msg = validate_audio_file(str(input_path))
+                if not is_valid:
+                    logger.warning(f"[{correlation_id}] Audio validation failed for user {user_id}: {error_msg}")
+                    raise ValidationError(error_msg)
 
-            # Check disk space before processing
-            audio_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
-            required_space = estimate_required_space(int(audio_size_mb))
-            has_space, space_error = check_disk_space(required_space)
-            if not has_space:
-                logger.warning(f"[{correlation_id}] Disk space check failed for user {user_id}: {space_error}")
-                raise ValidationError(space_error)
+                # Check disk space before processing
+                audio_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
+                required_space = estimate_required_space(int(audio_size_mb))
+                has_space, space_error = check_disk_space(required_space)
+                if not has_space:
+                    logger.warning(f"[{correlation_id}] Disk space check failed for user {user_id}: {space_error}")
+                    raise ValidationError(space_error)
 
-            # Apply equalization with timeout
-            logger.info(f"[{correlation_id}] Applying equalization for user {user_id}")
-            try:
-                loop = asyncio.get_event_loop()
-                enhancer = AudioEnhancer(str(input_path), str(output_path))
-                success = await asyncio.wait_for(
-                    loop.run_in_executor(None, enhancer.equalize, bass, mid, treble),
-                    timeout=config.PROCESSING_TIMEOUT
-                )
+                # Apply equalization with timeout
+                logger.info(f"[{correlation_id}] Applying equalization for user {user_id}")
+                try:
+                    loop = asyncio.get_running_loop()
+                    enhancer = AudioEnhancer(str(input_path), str(output_path))
+                    success = await asyncio.wait_for(
+                        loop.run_in_executor(MEDIA_EXECUTOR, enhancer.equalize, bass, mid, treble),
+                        timeout=config.PROCESSING_TIMEOUT
+                    )
 
-                if not success:
-                    logger.error(f"[{correlation_id}] Equalization failed for user {user_id}")
-                    raise AudioEnhancementError("No pude aplicar la ecualización")
+                    if not success:
+                        logger.error(f"[{correlation_id}] Equalization failed for user {user_id}")
+                        raise AudioEnhancementError("No pude aplicar la ecualización")
 
-            except asyncio.TimeoutError as e:
-                logger.error(f"[{correlation_id}] Equalization timed out for user {user_id}")
-                raise ProcessingTimeoutError("La ecualización tardó demasiado") from e
+                except asyncio.TimeoutError as e:
+                    logger.error(f"[{correlation_id}] Equalization timed out for user {user_id}")
+                    raise ProcessingTimeoutError("La ecualización tardó demasiado") from e
 
-            # Send equalized audio
-            logger.info(f"[{correlation_id}] Sending equalized audio to user {user_id}")
-            try:
-                with open(output_path, "rb") as audio_file:
+                # Send equalized audio
+                logger.info(f"[{correlation_id}] Sending equalized audio to user {user_id}")
+                try:
                     await context.bot.send_audio(
                         chat_id=update.effective_chat.id,
-                        audio=audio_file,
-                        filename=f"equalized.mp3",
+                        audio=await _read_upload_file(output_path, filename=f"equalized.mp3"),
                         title=f"Audio ecualizado"
                     )
-                logger.info(f"[{correlation_id}] Equalized audio sent successfully to user {user_id}")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to send equalized audio to user {user_id}: {e}")
-                raise
-
-            # Update message on success
-            try:
-                await query.edit_message_text(
-                    f"¡Listo! Ecualización aplicada:\n"
-                    f"🎵 Bass: {bass_display}\n"
-                    f"🎵 Mid: {mid_display}\n"
-                    f"🎵 Treble: {treble_display}"
-                )
-            except Exception as e:
-                logger.warning(f"[{correlation_id}] Could not update final message: {e}")
+                    logger.info(f"[{correlation_id}] Equalized audio sent successfully to user {user_id}")
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to send equalized audio to user {user_id}: {e}")
+                    raise
 
-            # Clean up user_data
-            context.user_data.pop("eq_file_id", None)
-            context.user_data.pop("eq_correlation_id", None)
-            context.user_data.pop("eq_bass", None)
-            context.user_data.pop("eq_mid", None)
-            context.user_data.pop("eq_treble", None)
+                # Update message on success
+                try:
+                    await query.edit_message_text(
+                        f"¡Listo! Ecualización aplicada:\n"
+                        f"🎵 Bass: {bass_display}\n"
+                        f"🎵 Mid: {mid_display}\n"
+                        f"🎵 Treble: {treble_display}"
+                    )
+                except Exception as e:
+                    logger.warning(f"[{correlation_id}] Could not update final message: {e}")
 
-        except (DownloadError, ValidationError, AudioEnhancementError, ProcessingTimeoutError) as e:
-            # Handle known processing errors
-            logger.error(f"[{correlation_id}] Processing error: {e}")
-            await handle_processing_error(update, e, user_id)
+            except (DownloadError, ValidationError, AudioEnhancementError, ProcessingTimeoutError) as e:
+                # Handle known processing errors
+                logger.error(f"[{correlation_id}] Processing error: {e}")
+                await handle_processing_error(update, e, user_id)
 
-            # Update message on error
-            try:
-                await query.edit_message_text(f"Error: {str(e)}")
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+                # Update message on error
+                try:
+                    await query.edit_message_text(f"Error: {str(e)}")
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
 
-        except Exception as e:
-            # Handle unexpected errors
-            logger.exception(f"[{correlation_id}] Unexpected error applying equalizer for user {user_id}: {e}")
-            await handle_processing_error(update, e, user_id)
+            except Exception as e:
+                # Handle unexpected errors
+                logger.exception(f"[{correlation_id}] Unexpected error applying equalizer for user {user_id}: {e}")
+                await handle_processing_error(update, e, user_id)
 
-            # Update message on error
-            try:
-                await query.edit_message_text("Ocurrió un error inesperado. Por favor intenta de nuevo.")
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+                # Update message on error
+                try:
+                    await query.edit_message_text("Ocurrió un error inesperado. Por favor intenta de nuevo.")
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
 
-        # TempManager cleanup happens automatically on context exit
+            # TempManager cleanup happens automatically on context exit
 
 
 async def handle_denoise_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -4105,7 +4910,7 @@ async def handle_denoise_command(update: Update, context: ContextTypes.DEFAULT_T
         context: Telegram context object
     """
     user_id = update.effective_user.id
-    correlation_id = str(uuid.uuid4())[:8]
+    correlation_id = token_hex(4)
     logger.info(f"[{correlation_id}] Denoise command received from user {user_id}")
 
     # Get audio from message or reply
@@ -4170,7 +4975,7 @@ async def handle_compress_command(update: Update, context: ContextTypes.DEFAULT_
         context: Telegram context object
     """
     user_id = update.effective_user.id
-    correlation_id = str(uuid.uuid4())[:8]
+    correlation_id = token_hex(4)
     logger.info(f"[{correlation_id}] Compress command received from user {user_id}")
 
     # Get audio from message or reply
@@ -4280,7 +5085,7 @@ async def handle_effect_selection(update: Update, context: ContextTypes.DEFAULT_
 
     # Retrieve file_id from context
     file_id = context.user_data.get("effect_audio_file_id")
-    correlation_id = context.user_data.get("effect_audio_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("effect_audio_correlation_id", token_hex(4))
     stored_effect_type = context.user_data.get("effect_type")
 
     if not file_id:
@@ -4310,110 +5115,106 @@ async def handle_effect_selection(update: Update, context: ContextTypes.DEFAULT_
         logger.warning(f"[{correlation_id}] Could not update message: {e}")
 
     # Process with TempManager for automatic cleanup
-    with TempManager() as temp_mgr:
-        try:
-            # Generate safe filenames
-            input_filename = f"input_{user_id}_{correlation_id}.audio"
-            output_filename = f"effect_{user_id}_{correlation_id}.mp3"
+    async with TempManager() as temp_mgr:
+        async with _job_cleanup(
+            None, context.user_data, "effect_audio_file_id", "effect_audio_correlation_id", "effect_type"
+        ):
+            try:
+                # Generate safe filenames
+                input_filename = f"input_{user_id}_{correlation_id}.audio"
+                output_filename = f"effect_{user_id}_{correlation_id}.mp3"
 
-            input_path = temp_mgr.get_temp_path(input_filename)
-            output_path = temp_mgr.get_temp_path(output_filename)
+                input_path = temp_mgr.get_temp_path(input_filename)
+                output_path = temp_mgr.get_temp_path(output_filename)
 
-            # Download audio file
-            logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
-            try:
-                file = await context.bot.get_file(file_id)
-                await _download_with_retry(file, input_path, correlation_id=correlation_id)
-                logger.info(f"[{correlation_id}] Audio downloaded to {input_path}")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to download audio for user {user_id}: {e}")
-                raise DownloadError("No pude descargar el audio") from e
+                # Download audio file
+                logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
+                try:
+                    file = await context.bot.get_file(file_id)
+                    await _download_with_retry(file, input_path, correlation_id=correlation_id)
+                    logger.info(f"[{correlation_id}] Audio downloaded to {input_path}")
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to download audio for user {user_id}: {e}")
+                    raise DownloadError("No pude descargar el audio") from e
 
-            # Validate audio integrity after download
-            is_valid, error_msg = validate_audio_file(str(input_path))
-            if not is_valid:
-                logger.warning(f"[{correlation_id}] Audio validation failed for user {user_id}: {error_msg}")
-                raise ValidationError(error_msg)
+                # Validate audio integrity after download
+                is_valid, error_msg = validate_audio_file(str(input_path))
+                if not is_valid:
+                    logger.warning(f"[{correlation_id}] Audio validation failed for user {user_id}: {error_msg}")
+                    raise ValidationError(error_msg)
 
-            # Check disk space before processing
-            audio_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
-            required_space = estimate_required_space(int(audio_size_mb))
-            has_space, space_error = check_disk_space(required_space)
-            if not has_space:
-                logger.warning(f"[{correlation_id}] Disk space check failed for user {user_id}: {space_error}")
-                raise ValidationError(space_error)
+                # Check disk space before processing
+                audio_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
+                required_space = estimate_required_space(int(audio_size_mb))
+                has_space, space_error = check_disk_space(required_space)
+                if not has_space:
+                    logger.warning(f"[{correlation_id}] Disk space check failed for user {user_id}: {space_error}")
+                    raise ValidationError(space_error)
 
-            # Apply effect with timeout
-            logger.info(f"[{correlation_id}] Applying {effect_name} for user {user_id}")
-            try:
-                loop = asyncio.get_event_loop()
-                effects = AudioEffects(str(input_path), str(output_path))
+                # Apply effect with timeout
+                logger.info(f"[{correlation_id}] Applying {effect_name} for user {user_id}")
+                try:
+                    loop = asyncio.get_running_loop()
+                    effects = AudioEffects(str(input_path), str(output_path))
 
-                if effect_type == "denoise":
-                    await asyncio.wait_for(
-                        loop.run_in_executor(None, effects.denoise, float(strength)),
-                        timeout=config.PROCESSING_TIMEOUT
-                    )
-                else:  # compress
-                    await asyncio.wait_for(
-                        loop.run_in_executor(None, effects.compress, ratio, -20.0),
-                        timeout=config.PROCESSING_TIMEOUT
-                    )
+                    if effect_type == "denoise":
+                        await asyncio.wait_for(
+                            loop.run_in_executor(MEDIA_EXECUTOR, effects.denoise, float(strength)),
+                            timeout=config.PROCESSING_TIMEOUT
+                        )
+                    else:  # compress
+                        await asyncio.wait_for(
+                            loop.run_in_executor(MEDIA_EXECUTOR, effects.compress, ratio, -20.0),
+                            timeout=config.PROCESSING_TIMEOUT
+                        )
 
-            except asyncio.TimeoutError as e:
-                logger.error(f"[{correlation_id}] Audio effect timed out for user {user_id}")
-                raise ProcessingTimeoutError("El procesamiento tardó demasiado") from e
+                except asyncio.TimeoutError as e:
+                    logger.error(f"[{correlation_id}] Audio effect timed out for user {user_id}")
+                    raise ProcessingTimeoutError("El procesamiento tardó demasiado") from e
 
-            # Send processed audio
-            logger.info(f"[{correlation_id}] Sending processed audio to user {user_id}")
-            try:
-                with open(output_path, "rb") as audio_file:
+                # Send processed audio
+                logger.info(f"[{correlation_id}] Sending processed audio to user {user_id}")
+                try:
                     await context.bot.send_audio(
                         chat_id=update.effective_chat.id,
-                        audio=audio_file,
-                        filename=f"{effect_type}_audio.mp3",
+                        audio=await _read_upload_file(output_path, filename=f"{effect_type}_audio.mp3"),
                         title=f"Audio con {effect_name.capitalize()}"
                     )
-                logger.info(f"[{correlation_id}] Processed audio sent successfully to user {user_id}")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to send processed audio to user {user_id}: {e}")
-                raise
-
-            # Update message on success
-            try:
-                await query.edit_message_text(success_text)
-            except Exception as e:
-                logger.warning(f"[{correlation_id}] Could not update final message: {e}")
+                    logger.info(f"[{correlation_id}] Processed audio sent successfully to user {user_id}")
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to send processed audio to user {user_id}: {e}")
+                    raise
 
-            # Clean up user_data
-            context.user_data.pop("effect_audio_file_id", None)
-            context.user_data.pop("effect_audio_correlation_id", None)
-            context.user_data.pop("effect_type", None)
+                # Update message on success
+                try:
+                    await query.edit_message_text(success_text)
+                except Exception as e:
+                    logger.warning(f"[{correlation_id}] Could not update final message: {e}")
 
-        except (DownloadError, ValidationError, AudioEffectsError, ProcessingTimeoutError) as e:
-            # Handle known processing errors
-            logger.error(f"[{correlation_id}] Processing error: {e}")
-            await handle_processing_error(update, e, user_id)
+            except (DownloadError, ValidationError, AudioEffectsError, ProcessingTimeoutError) as e:
+                # Handle known processing errors
+                logger.error(f"[{correlation_id}] Processing error: {e}")
+                await handle_processing_error(update, e, user_id)
 
-            # Update message on error
-            try:
-                await query.edit_message_text(f"Error: {str(e)}")
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+                # Update message on error
+                try:
+                    await query.edit_message_text(f"Error: {str(e)}")
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
 
-        except Exception as e:
-            # Handle unexpected errors
-            logger.exception(f"[{correlation_id}] Unexpected error applying effect for user {user_id}: {e}")
-            await handle_processing_error(update, e, user_id)
+            except Exception as e:
+                # Handle unexpected errors
+                logger.exception(f"[{correlation_id}] Unexpected error applying effect for user {user_id}: {e}")
+                await handle_processing_error(update, e, user_id)
 
-            # Update message on error
-            try:
-                await query.edit_message_text("Ocurrió un error inesperado. Por favor intenta de nuevo.")
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+                # Update message on error
+                try:
+                    await query.edit_message_text("Ocurrió un error inesperado. Por favor intenta de nuevo.")
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
 
-        # TempManager cleanup happens automatically on context exit
-        logger.debug(f"[{correlation_id}] Cleanup completed for user {user_id}")
+            # TempManager cleanup happens automatically on context exit
+            logger.debug(f"[{correlation_id}] Cleanup completed for user {user_id}")
 
 
 # =============================================================================
@@ -4432,7 +5233,7 @@ async def handle_normalize_command(update: Update, context: ContextTypes.DEFAULT
         context: Telegram context object
     """
     user_id = update.effective_user.id
-    correlation_id = str(uuid.uuid4())[:8]
+    correlation_id = token_hex(4)
     logger.info(f"[{correlation_id}] Normalize command received from user {user_id}")
 
     # Get audio from message or reply
@@ -4526,7 +5327,7 @@ async def handle_normalize_selection(update: Update, context: ContextTypes.DEFAU
 
     # Retrieve file_id from context
     file_id = context.user_data.get("effect_audio_file_id")
-    correlation_id = context.user_data.get("effect_audio_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("effect_audio_correlation_id", token_hex(4))
     stored_effect_type = context.user_data.get("effect_type")
 
     if not file_id:
@@ -4547,111 +5348,107 @@ async def handle_normalize_selection(update: Update, context: ContextTypes.DEFAU
         logger.warning(f"[{correlation_id}] Could not update message: {e}")
 
     # Process with TempManager for automatic cleanup
-    with TempManager() as temp_mgr:
-        try:
-            # Generate safe filenames
-            input_filename = f"input_{user_id}_{correlation_id}.audio"
-            output_filename = f"normalized_{user_id}_{correlation_id}.mp3"
-
-            input_path = temp_mgr.get_temp_path(input_filename)
-            output_path = temp_mgr.get_temp_path(output_filename)
-
-            # Download audio file
-            logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
+    async with TempManager() as temp_mgr:
+        async with _job_cleanup(
+            None, context.user_data, "effect_audio_file_id", "effect_audio_correlation_id", "effect_type"
+        ):
             try:
-                file = await context.bot.get_file(file_id)
-                await _download_with_retry(file, input_path, correlation_id=correlation_id)
-                logger.info(f"[{correlation_id}] Audio downloaded to {input_path}")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to download audio for user {user_id}: {e}")
-                raise DownloadError("No pude descargar el audio") from e
+                # Generate safe filenames
+                input_filename = f"input_{user_id}_{correlation_id}.audio"
+                output_filename = f"normalized_{user_id}_{correlation_id}.mp3"
+
+                input_path = temp_mgr.get_temp_path(input_filename)
+                output_path = temp_mgr.get_temp_path(output_filename)
 
-            # Validate audio integrity after download
-            is_valid, error_msg = validate_audio_file(str(input_path))
-            if not is_valid:
-                logger.warning(f"[{correlation_id}] Audio validation failed for user {user_id}: {error_msg}")
-                raise ValidationError(error_msg)
+                # Download audio file
+                logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
+                try:
+                    file = await context.bot.get_file(file_id)
+                    await _download_with_retry(file, input_path, correlation_id=correlation_id)
+                    logger.info(f"[{correlation_id}] Audio downloaded to {input_path}")
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to download audio for user {user_id}: {e}")
+                    raise DownloadError("No pude descargar el audio") from e
 
-            # Check disk space before processing
-            audio_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
-            required_space = estimate_required_space(int(audio_size_mb))
-            has_space, space_error = check_disk_space(required_space)
-            if not has_space:
-                logger.warning(f"[{correlation_id}] Disk space check failed for user {user_id}: {space_error}")
-                raise ValidationError(space_error)
+                # Validate audio integrity after download
+                is_valid, error_msg = validate_audio_file(str(input_path))
+                if not is_valid:
+                    logger.warning(f"[{correlation_id}] Audio validation failed for user {user_id}: {error_msg}")
+                    raise ValidationError(error_msg)
 
-            # Apply normalization with timeout
-            logger.info(f"[{correlation_id}] Applying normalization ({target_lufs} LUFS) for user {user_id}")
-            try:
-                loop = asyncio.get_event_loop()
-                effects = AudioEffects(str(input_path), str(output_path))
+                # Check disk space before processing
+                audio_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
+                required_space = estimate_required_space(int(audio_size_mb))
+                has_space, space_error = check_disk_space(required_space)
+                if not has_space:
+                    logger.warning(f"[{correlation_id}] Disk space check failed for user {user_id}: {space_error}")
+                    raise ValidationError(space_error)
 
-                success = await asyncio.wait_for(
-                    loop.run_in_executor(None, effects.normalize, target_lufs),
-                    timeout=config.PROCESSING_TIMEOUT
-                )
+                # Apply normalization with timeout
+                logger.info(f"[{correlation_id}] Applying normalization ({target_lufs} LUFS) for user {user_id}")
+                try:
+                    loop = asyncio.get_running_loop()
+                    effects = AudioEffects(str(input_path), str(output_path))
 
-                if not success:
-                    logger.error(f"[{correlation_id}] Normalization failed for user {user_id}")
-                    raise AudioEffectsError("No pude normalizar el audio")
+                    success = await asyncio.wait_for(
+                        loop.run_in_executor(MEDIA_EXECUTOR, effects.normalize, target_lufs),
+                        timeout=config.PROCESSING_TIMEOUT
+                    )
 
-            except asyncio.TimeoutError as e:
-                logger.error(f"[{correlation_id}] Normalization timed out for user {user_id}")
-                raise ProcessingTimeoutError("La normalización tardó demasiado") from e
+                    if not success:
+                        logger.error(f"[{correlation_id}] Normalization failed for user {user_id}")
+                        raise AudioEffectsError("No pude normalizar el audio")
 
-            # Send normalized audio
-            logger.info(f"[{correlation_id}] Sending normalized audio to user {user_id}")
-            try:
-                with open(output_path, "rb") as audio_file:
+                except asyncio.TimeoutError as e:
+                    logger.error(f"[{correlation_id}] Normalization timed out for user {user_id}")
+                    raise ProcessingTimeoutError("La normalización tardó demasiado") from e
+
+                # Send normalized audio
+                logger.info(f"[{correlation_id}] Sending normalized audio to user {user_id}")
+                try:
                     await context.bot.send_audio(
                         chat_id=update.effective_chat.id,
-                        audio=audio_file,
-                        filename=f"normalized.mp3",
+                        audio=await _read_upload_file(output_path, filename=f"normalized.mp3"),
                         title=f"Audio normalizado ({preset_name})"
                     )
-                logger.info(f"[{correlation_id}] Normalized audio sent successfully to user {user_id}")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to send normalized audio to user {user_id}: {e}")
-                raise
-
-            # Update message on success
-            try:
-                await query.edit_message_text(
-                    f"¡Listo! Audio normalizado a {preset_name} ({target_lufs} LUFS).\n\n"
-                    f"El volumen ahora está optimizado para {use_case}."
-                )
-            except Exception as e:
-                logger.warning(f"[{correlation_id}] Could not update final message: {e}")
+                    logger.info(f"[{correlation_id}] Normalized audio sent successfully to user {user_id}")
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to send normalized audio to user {user_id}: {e}")
+                    raise
 
-            # Clean up user_data
-            context.user_data.pop("effect_audio_file_id", None)
-            context.user_data.pop("effect_audio_correlation_id", None)
-            context.user_data.pop("effect_type", None)
+                # Update message on success
+                try:
+                    await query.edit_message_text(
+                        f"¡Listo! Audio normalizado a {preset_name} ({target_lufs} LUFS).\n\n"
+                        f"El volumen ahora está optimizado para {use_case}."
+                    )
+                except Exception as e:
+                    logger.warning(f"[{correlation_id}] Could not update final message: {e}")
 
-        except (DownloadError, ValidationError, AudioEffectsError, ProcessingTimeoutError) as e:
-            # Handle known processing errors
-            logger.error(f"[{correlation_id}] Processing error: {e}")
-            await handle_processing_error(update, e, user_id)
+            except (DownloadError, ValidationError, AudioEffectsError, ProcessingTimeoutError) as e:
+                # Handle known processing errors
+                logger.error(f"[{correlation_id}] Processing error: {e}")
+                await handle_processing_error(update, e, user_id)
 
-            # Update message on error
-            try:
-                await query.edit_message_text(f"Error: {str(e)}")
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+                # Update message on error
+                try:
+                    await query.edit_message_text(f"Error: {str(e)}")
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
 
-        except Exception as e:
-            # Handle unexpected errors
-            logger.exception(f"[{correlation_id}] Unexpected error normalizing audio for user {user_id}: {e}")
-            await handle_processing_error(update, e, user_id)
+            except Exception as e:
+                # Handle unexpected errors
+                logger.exception(f"[{correlation_id}] Unexpected error normalizing audio for user {user_id}: {e}")
+                await handle_processing_error(update, e, user_id)
 
-            # Update message on error
-            try:
-                await query.edit_message_text("Ocurrió un error inesperado. Por favor intenta de nuevo.")
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+                # Update message on error
+                try:
+                    await query.edit_message_text("Ocurrió un error inesperado. Por favor intenta de nuevo.")
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
 
-        # TempManager cleanup happens automatically on context exit
-        logger.debug(f"[{correlation_id}] Cleanup completed for user {user_id}")
+            # TempManager cleanup happens automatically on context exit
+            logger.debug(f"[{correlation_id}] Cleanup completed for user {user_id}")
 
 
 async def handle_audio_3d_selection(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -4684,7 +5481,7 @@ async def handle_audio_3d_selection(update: Update, context: ContextTypes.DEFAUL
         return
 
     file_id = context.user_data.get("effect_audio_file_id")
-    correlation_id = context.user_data.get("effect_audio_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("effect_audio_correlation_id", token_hex(4))
     stored_effect_type = context.user_data.get("effect_type")
 
     if not file_id:
@@ -4706,92 +5503,91 @@ async def handle_audio_3d_selection(update: Update, context: ContextTypes.DEFAUL
     except Exception as e:
         logger.warning(f"[{correlation_id}] Could not update message: {e}")
 
-    with TempManager() as temp_mgr:
-        try:
-            input_filename = f"input_{user_id}_{correlation_id}.audio"
-            output_filename = f"stereo3d_{user_id}_{correlation_id}.mp3"
-            input_path = temp_mgr.get_temp_path(input_filename)
-            output_path = temp_mgr.get_temp_path(output_filename)
-
-            logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
+    async with TempManager() as temp_mgr:
+        async with _job_cleanup(
+            None, context.user_data, "effect_audio_file_id", "effect_audio_correlation_id", "effect_type"
+        ):
             try:
-                file = await context.bot.get_file(file_id)
-                await _download_with_retry(file, input_path, correlation_id=correlation_id)
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to download audio: {e}")
-                raise DownloadError("No pude descargar el audio") from e
+                input_filename = f"input_{user_id}_{correlation_id}.audio"
+                output_filename = f"stereo3d_{user_id}_{correlation_id}.mp3"
+                input_path = temp_mgr.get_temp_path(input_filename)
+                output_path = temp_mgr.get_temp_path(output_filename)
 
-            is_valid, error_msg = validate_audio_file(str(input_path))
-            if not is_valid:
-                raise ValidationError(error_msg)
+                logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
+                try:
+                    file = await context.bot.get_file(file_id)
+                    await _download_with_retry(file, input_path, correlation_id=correlation_id)
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to download audio: {e}")
+                    raise DownloadError("No pude descargar el audio") from e
 
-            audio_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
-            required_space = estimate_required_space(int(audio_size_mb))
-            has_space, space_error = check_disk_space(required_space)
-            if not has_space:
-                raise ValidationError(space_error)
+                is_valid, error_msg = validate_audio_file(str(input_path))
+                if not is_valid:
+                    raise ValidationError(error_msg)
 
-            logger.info(f"[{correlation_id}] Applying stereo 3D ({intensity}) for user {user_id}")
-            try:
-                loop = asyncio.get_event_loop()
-                effects = AudioEffects(str(input_path), str(output_path))
-                await asyncio.wait_for(
-                    loop.run_in_executor(None, effects.stereo_3d, intensity),
-                    timeout=config.PROCESSING_TIMEOUT,
-                )
-            except asyncio.TimeoutError as e:
-                raise ProcessingTimeoutError("El efecto 3D tardó demasiado") from e
+                audio_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
+                required_space = estimate_required_space(int(audio_size_mb))
+                has_space, space_error = check_disk_space(required_space)
+                if not has_space:
+                    raise ValidationError(space_error)
 
-            doc_filename = f"stereo_3d_{intensity}_{correlation_id}.mp3"
-            document_sent = False
-            with open(output_path, "rb") as audio_file:
-                await context.bot.send_audio(
-                    chat_id=update.effective_chat.id,
-                    audio=audio_file,
-                    filename="stereo_3d.mp3",
-                    title=f"Audio con efecto 3D ({intensity_label})",
-                )
+                logger.info(f"[{correlation_id}] Applying stereo 3D ({intensity}) for user {user_id}")
                 try:
-                    audio_file.seek(0)
-                    await context.bot.send_document(
-                        chat_id=update.effective_chat.id,
-                        document=audio_file,
-                        filename=doc_filename,
-                        caption=(
-                            f"Archivo MP3 con efecto 3D ({intensity_label}) "
-                            "para editores de video"
-                        ),
-                    )
-                    document_sent = True
-                except Exception as doc_error:
-                    logger.warning(
-                        f"[{correlation_id}] Audio sent but document delivery failed: {doc_error}"
+                    loop = asyncio.get_running_loop()
+                    effects = AudioEffects(str(input_path), str(output_path))
+                    await asyncio.wait_for(
+                        loop.run_in_executor(MEDIA_EXECUTOR, effects.stereo_3d, intensity),
+                        timeout=config.PROCESSING_TIMEOUT,
                     )
+                except asyncio.TimeoutError as e:
+                    raise ProcessingTimeoutError("El efecto 3D tardó demasiado") from e
 
-            success_msg = f"¡Listo! Efecto 3D aplicado con intensidad {intensity_label}."
-            if not document_sent:
-                success_msg += (
-                    "\n\n(No pude enviar el archivo MP3 como documento; "
-                    "usa el audio de arriba.)"
-                )
-            await query.edit_message_text(success_msg)
+                doc_filename = f"stereo_3d_{intensity}_{correlation_id}.mp3"
+                document_sent = False
+                with open(output_path, "rb") as audio_file:
+                    await context.bot.send_audio(
+                        chat_id=update.effective_chat.id,
+                        audio=audio_file,
+                        filename="stereo_3d.mp3",
+                        title=f"Audio con efecto 3D ({intensity_label})",
+                    )
+                    try:
+                        audio_file.seek(0)
+                        await context.bot.send_document(
+                            chat_id=update.effective_chat.id,
+                            document=audio_file,
+                            filename=doc_filename,
+                            caption=(
+                                f"Archivo MP3 con efecto 3D ({intensity_label}) "
+                                "para editores de video"
+                            ),
+                        )
+                        document_sent = True
+                    except Exception as doc_error:
+                        logger.warning(
+                            f"[{correlation_id}] Audio sent but document delivery failed: {doc_error}"
+                        )
 
-            context.user_data.pop("effect_audio_file_id", None)
-            context.user_data.pop("effect_audio_correlation_id", None)
-            context.user_data.pop("effect_type", None)
+                success_msg = f"¡Listo! Efecto 3D aplicado con intensidad {intensity_label}."
+                if not document_sent:
+                    success_msg += (
+                        "\n\n(No pude enviar el archivo MP3 como documento; "
+                        "usa el audio de arriba.)"
+                    )
+                await query.edit_message_text(success_msg)
 
-        except (DownloadError, ValidationError, AudioEffectsError, ProcessingTimeoutError) as e:
-            logger.error(f"[{correlation_id}] Stereo 3D processing error: {e}")
-            try:
-                await query.edit_message_text(f"Error: {get_user_error_message(e)}")
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
-        except Exception as e:
-            logger.exception(f"[{correlation_id}] Unexpected error applying stereo 3D: {e}")
-            try:
-                await query.edit_message_text(DEFAULT_ERROR_MESSAGE)
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+            except (DownloadError, ValidationError, AudioEffectsError, ProcessingTimeoutError) as e:
+                logger.error(f"[{correlation_id}] Stereo 3D processing error: {e}")
+                try:
+                    await query.edit_message_text(f"Error: {get_user_error_message(e)}")
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+            except Exception as e:
+                logger.exception(f"[{correlation_id}] Unexpected error applying stereo 3D: {e}")
+                try:
+                    await query.edit_message_text(DEFAULT_ERROR_MESSAGE)
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
 
 
 # =============================================================================
@@ -4829,7 +5625,7 @@ async def handle_audio_pitch_selection(update: Update, context: ContextTypes.DEF
         return
 
     file_id = context.user_data.get("effect_audio_file_id")
-    correlation_id = context.user_data.get("effect_audio_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("effect_audio_correlation_id", token_hex(4))
     stored_effect_type = context.user_data.get("effect_type")
 
     if not file_id:
@@ -4851,92 +5647,91 @@ async def handle_audio_pitch_selection(update: Update, context: ContextTypes.DEF
     except Exception as e:
         logger.warning(f"[{correlation_id}] Could not update message: {e}")
 
-    with TempManager() as temp_mgr:
-        try:
-            input_filename = f"input_{user_id}_{correlation_id}.audio"
-            output_filename = f"pitch_{user_id}_{correlation_id}.mp3"
-            input_path = temp_mgr.get_temp_path(input_filename)
-            output_path = temp_mgr.get_temp_path(output_filename)
-
-            logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
+    async with TempManager() as temp_mgr:
+        async with _job_cleanup(
+            None, context.user_data, "effect_audio_file_id", "effect_audio_correlation_id", "effect_type"
+        ):
             try:
-                file = await context.bot.get_file(file_id)
-                await _download_with_retry(file, input_path, correlation_id=correlation_id)
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to download audio: {e}")
-                raise DownloadError("No pude descargar el audio") from e
+                input_filename = f"input_{user_id}_{correlation_id}.audio"
+                output_filename = f"pitch_{user_id}_{correlation_id}.mp3"
+                input_path = temp_mgr.get_temp_path(input_filename)
+                output_path = temp_mgr.get_temp_path(output_filename)
 
-            is_valid, error_msg = validate_audio_file(str(input_path))
-            if not is_valid:
-                raise ValidationError(error_msg)
+                logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
+                try:
+                    file = await context.bot.get_file(file_id)
+                    await _download_with_retry(file, input_path, correlation_id=correlation_id)
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to download audio: {e}")
+                    raise DownloadError("No pude descargar el audio") from e
 
-            audio_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
-            required_space = estimate_required_space(int(audio_size_mb))
-            has_space, space_error = check_disk_space(required_space)
-            if not has_space:
-                raise ValidationError(space_error)
+                is_valid, error_msg = validate_audio_file(str(input_path))
+                if not is_valid:
+                    raise ValidationError(error_msg)
 
-            logger.info(f"[{correlation_id}] Applying pitch shift ({intensity}) for user {user_id}")
-            try:
-                loop = asyncio.get_event_loop()
-                effects = AudioEffects(str(input_path), str(output_path))
-                await asyncio.wait_for(
-                    loop.run_in_executor(None, effects.pitch_shift, intensity),
-                    timeout=config.PROCESSING_TIMEOUT,
-                )
-            except asyncio.TimeoutError as e:
-                raise ProcessingTimeoutError("El cambio de tono tardó demasiado") from e
+                audio_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
+                required_space = estimate_required_space(int(audio_size_mb))
+                has_space, space_error = check_disk_space(required_space)
+                if not has_space:
+                    raise ValidationError(space_error)
 
-            doc_filename = f"pitch_shift_{intensity}_{correlation_id}.mp3"
-            document_sent = False
-            with open(output_path, "rb") as audio_file:
-                await context.bot.send_audio(
-                    chat_id=update.effective_chat.id,
-                    audio=audio_file,
-                    filename="pitch_shift.mp3",
-                    title=f"Audio con cambio de tono ({intensity_label})",
-                )
+                logger.info(f"[{correlation_id}] Applying pitch shift ({intensity}) for user {user_id}")
                 try:
-                    audio_file.seek(0)
-                    await context.bot.send_document(
-                        chat_id=update.effective_chat.id,
-                        document=audio_file,
-                        filename=doc_filename,
-                        caption=(
-                            f"Archivo MP3 con cambio de tono ({intensity_label}) "
-                            "para editores de video"
-                        ),
-                    )
-                    document_sent = True
-                except Exception as doc_error:
-                    logger.warning(
-                        f"[{correlation_id}] Audio sent but document delivery failed: {doc_error}"
+                    loop = asyncio.get_running_loop()
+                    effects = AudioEffects(str(input_path), str(output_path))
+                    await asyncio.wait_for(
+                        loop.run_in_executor(MEDIA_EXECUTOR, effects.pitch_shift, intensity),
+                        timeout=config.PROCESSING_TIMEOUT,
                     )
+                except asyncio.TimeoutError as e:
+                    raise ProcessingTimeoutError("El cambio de tono tardó demasiado") from e
 
-            success_msg = f"¡Listo! Cambio de tono aplicado con intensidad {intensity_label}."
-            if not document_sent:
-                success_msg += (
-                    "\n\n(No pude enviar el archivo MP3 como documento; "
-                    "usa el audio de arriba.)"
-                )
-            await query.edit_message_text(success_msg)
+                doc_filename = f"pitch_shift_{intensity}_{correlation_id}.mp3"
+                document_sent = False
+                with open(output_path, "rb") as audio_file:
+                    await context.bot.send_audio(
+                        chat_id=update.effective_chat.id,
+                        audio=audio_file,
+                        filename="pitch_shift.mp3",
+                        title=f"Audio con cambio de tono ({intensity_label})",
+                    )
+                    try:
+                        audio_file.seek(0)
+                        await context.bot.send_document(
+                            chat_id=update.effective_chat.id,
+                            document=audio_file,
+                            filename=doc_filename,
+                            caption=(
+                                f"Archivo MP3 con cambio de tono ({intensity_label}) "
+                                "para editores de video"
+                            ),
+                        )
+                        document_sent = True
+                    except Exception as doc_error:
+                        logger.warning(
+                            f"[{correlation_id}] Audio sent but document delivery failed: {doc_error}"
+                        )
 
-            context.user_data.pop("effect_audio_file_id", None)
-            context.user_data.pop("effect_audio_correlation_id", None)
-            context.user_data.pop("effect_type", None)
+                success_msg = f"¡Listo! Cambio de tono aplicado con intensidad {intensity_label}."
+                if not document_sent:
+                    success_msg += (
+                        "\n\n(No pude enviar el archivo MP3 como documento; "
+                        "usa el audio de arriba.)"
+                    )
+                await query.edit_message_text(success_msg)
 
-        except (DownloadError, ValidationError, AudioEffectsError, ProcessingTimeoutError) as e:
-            logger.error(f"[{correlation_id}] Pitch shift processing error: {e}")
-            try:
-                await query.edit_message_text(f"Error: {get_user_error_message(e)}")
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
-        except Exception as e:
-            logger.exception(f"[{correlation_id}] Unexpected error applying pitch shift: {e}")
-            try:
-                await query.edit_message_text(DEFAULT_ERROR_MESSAGE)
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+            except (DownloadError, ValidationError, AudioEffectsError, ProcessingTimeoutError) as e:
+                logger.error(f"[{correlation_id}] Pitch shift processing error: {e}")
+                try:
+                    await query.edit_message_text(f"Error: {get_user_error_message(e)}")
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+            except Exception as e:
+                logger.exception(f"[{correlation_id}] Unexpected error applying pitch shift: {e}")
+                try:
+                    await query.edit_message_text(DEFAULT_ERROR_MESSAGE)
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
 
 
 def _get_audio_menu_keyboard() -> InlineKeyboardMarkup:
@@ -5005,7 +5800,7 @@ async def handle_audio_menu_callback(update: Update, context: ContextTypes.DEFAU
 
     # Retrieve file_id from context
     file_id = context.user_data.get("audio_menu_file_id")
-    correlation_id = context.user_data.get("audio_menu_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("audio_menu_correlation_id", token_hex(4))
 
     if not file_id:
         logger.error(f"[{correlation_id}] No file_id found in context for user {user_id}")
@@ -5260,9 +6055,11 @@ async def handle_audio_menu_callback(update: Update, context: ContextTypes.DEFAU
         temp_mgr = TempManager()
         context.user_data["join_audio_session"] = {
             "audios": [],
+            "total_bytes": 0,
             "correlation_id": correlation_id,
-            "last_activity": time.time(),
+            "last_activity": time.monotonic(),
             "temp_mgr": temp_mgr,
+            "task": None,
         }
         await query.edit_message_text(
             "¡Perfecto! Ahora envíame los archivos de audio que quieres unir (uno por uno).\n\n"
@@ -5300,101 +6097,99 @@ async def _handle_audio_menu_voicenote(
         logger.warning(f"[{correlation_id}] Could not update message: {e}")
 
     # Process with TempManager for automatic cleanup
-    with TempManager() as temp_mgr:
-        try:
-            # Generate safe filenames
-            input_filename = f"input_{user_id}_{correlation_id}.audio"
-            output_filename = f"voice_{user_id}_{correlation_id}.ogg"
+    async with TempManager() as temp_mgr:
+        async with _job_cleanup(
+            None, context.user_data, "audio_menu_file_id", "audio_menu_correlation_id"
+        ):
+            try:
+                # Generate safe filenames
+                input_filename = f"input_{user_id}_{correlation_id}.audio"
+                output_filename = f"voice_{user_id}_{correlation_id}.ogg"
 
-            input_path = temp_mgr.get_temp_path(input_filename)
-            output_path = temp_mgr.get_temp_path(output_filename)
+                input_path = temp_mgr.get_temp_path(input_filename)
+                output_path = temp_mgr.get_temp_path(output_filename)
 
-            # Download audio file
-            logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
-            try:
-                file = await context.bot.get_file(file_id)
-                await _download_with_retry(file, input_path, correlation_id=correlation_id)
-                logger.info(f"[{correlation_id}] Audio downloaded to {input_path}")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to download audio for user {user_id}: {e}")
-                raise DownloadError("No pude descargar el audio") from e
+                # Download audio file
+                logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
+                try:
+                    file = await context.bot.get_file(file_id)
+                    await _download_with_retry(file, input_path, correlation_id=correlation_id)
+                    logger.info(f"[{correlation_id}] Audio downloaded to {input_path}")
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to download audio for user {user_id}: {e}")
+                    raise DownloadError("No pude descargar el audio") from e
 
-            # Validate audio integrity after download
-            is_valid, error_msg = validate_audio_file(str(input_path))
-            if not is_valid:
-                logger.warning(f"[{correlation_id}] Audio validation failed for user {user_id}: {error_msg}")
-                raise ValidationError(error_msg)
+                # Validate audio integrity after download
+                is_valid, error_msg = validate_audio_file(str(input_path))
+                if not is_valid:
+                    logger.warning(f"[{correlation_id}] Audio validation failed for user {user_id}: {error_msg}")
+                    raise ValidationError(error_msg)
 
-            # Check disk space before processing
-            audio_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
-            required_space = estimate_required_space(int(audio_size_mb))
-            has_space, space_error = check_disk_space(required_space)
-            if not has_space:
-                logger.warning(f"[{correlation_id}] Disk space check failed for user {user_id}: {space_error}")
-                raise ValidationError(space_error)
+                # Check disk space before processing
+                audio_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
+                required_space = estimate_required_space(int(audio_size_mb))
+                has_space, space_error = check_disk_space(required_space)
+                if not has_space:
+                    logger.warning(f"[{correlation_id}] Disk space check failed for user {user_id}: {space_error}")
+                    raise ValidationError(space_error)
 
-            # Convert to voice note with timeout
-            logger.info(f"[{correlation_id}] Converting audio to voice note for user {user_id}")
-            try:
-                loop = asyncio.get_event_loop()
-                converter = VoiceNoteConverter(str(input_path), str(output_path))
-                success = await asyncio.wait_for(
-                    loop.run_in_executor(None, converter.process),
-                    timeout=config.PROCESSING_TIMEOUT
-                )
+                # Convert to voice note with timeout
+                logger.info(f"[{correlation_id}] Converting audio to voice note for user {user_id}")
+                try:
+                    loop = asyncio.get_running_loop()
+                    converter = VoiceNoteConverter(str(input_path), str(output_path))
+                    success = await asyncio.wait_for(
+                        loop.run_in_executor(MEDIA_EXECUTOR, converter.process),
+                        timeout=config.PROCESSING_TIMEOUT
+                    )
 
-                if not success:
-                    logger.error(f"[{correlation_id}] Voice note conversion failed for user {user_id}")
-                    raise VoiceConversionError("No pude convertir el audio a nota de voz")
+                    if not success:
+                        logger.error(f"[{correlation_id}] Voice note conversion failed for user {user_id}")
+                        raise VoiceConversionError("No pude convertir el audio a nota de voz")
 
-            except asyncio.TimeoutError as e:
-                logger.error(f"[{correlation_id}] Voice note conversion timed out for user {user_id}")
-                raise ProcessingTimeoutError("El audio tardó demasiado en procesarse") from e
+                except asyncio.TimeoutError as e:
+                    logger.error(f"[{correlation_id}] Voice note conversion timed out for user {user_id}")
+                    raise ProcessingTimeoutError("El audio tardó demasiado en procesarse") from e
 
-            # Send as voice note
-            logger.info(f"[{correlation_id}] Sending voice note to user {user_id}")
-            try:
-                with open(output_path, "rb") as voice_file:
+                # Send as voice note
+                logger.info(f"[{correlation_id}] Sending voice note to user {user_id}")
+                try:
                     await context.bot.send_voice(
                         chat_id=update.effective_chat.id,
-                        voice=voice_file
+                        voice=await _read_upload_file(output_path)
                     )
-                logger.info(f"[{correlation_id}] Voice note sent successfully to user {user_id}")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to send voice note to user {user_id}: {e}")
-                raise
-
-            # Update message on success
-            try:
-                await query.edit_message_text("¡Listo! Audio convertido a nota de voz.")
-            except Exception as e:
-                logger.warning(f"[{correlation_id}] Could not update final message: {e}")
+                    logger.info(f"[{correlation_id}] Voice note sent successfully to user {user_id}")
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to send voice note to user {user_id}: {e}")
+                    raise
 
-            # Clean up user_data
-            context.user_data.pop("audio_menu_file_id", None)
-            context.user_data.pop("audio_menu_correlation_id", None)
+                # Update message on success
+                try:
+                    await query.edit_message_text("¡Listo! Audio convertido a nota de voz.")
+                except Exception as e:
+                    logger.warning(f"[{correlation_id}] Could not update final message: {e}")
 
-        except (DownloadError, ValidationError, VoiceConversionError, ProcessingTimeoutError) as e:
-            # Handle known processing errors
-            logger.error(f"[{correlation_id}] Processing error: {e}")
-            await handle_processing_error(update, e, user_id)
+            except (DownloadError, ValidationError, VoiceConversionError, ProcessingTimeoutError) as e:
+                # Handle known processing errors
+                logger.error(f"[{correlation_id}] Processing error: {e}")
+                await handle_processing_error(update, e, user_id)
 
-            # Update message on error
-            try:
-                await query.edit_message_text(f"Error: {str(e)}")
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+                # Update message on error
+                try:
+                    await query.edit_message_text(f"Error: {str(e)}")
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
 
-        except Exception as e:
-            # Handle unexpected errors
-            logger.exception(f"[{correlation_id}] Unexpected error converting audio for user {user_id}: {e}")
-            await handle_processing_error(update, e, user_id)
+            except Exception as e:
+                # Handle unexpected errors
+                logger.exception(f"[{correlation_id}] Unexpected error converting audio for user {user_id}: {e}")
+                await handle_processing_error(update, e, user_id)
 
-            # Update message on error
-            try:
-                await query.edit_message_text("Ocurrió un error inesperado. Por favor intenta de nuevo.")
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+                # Update message on error
+                try:
+                    await query.edit_message_text("Ocurrió un error inesperado. Por favor intenta de nuevo.")
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
 
 
 async def handle_audio_menu_format_selection(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -5423,7 +6218,7 @@ async def handle_audio_menu_format_selection(update: Update, context: ContextTyp
 
     # Retrieve file_id from context
     file_id = context.user_data.get("audio_menu_file_id")
-    correlation_id = context.user_data.get("audio_menu_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("audio_menu_correlation_id", token_hex(4))
 
     if not file_id:
         logger.error(f"[{correlation_id}] No file_id found in context for user {user_id}")
@@ -5439,117 +6234,108 @@ async def handle_audio_menu_format_selection(update: Update, context: ContextTyp
         logger.warning(f"[{correlation_id}] Could not update message: {e}")
 
     # Process with TempManager for automatic cleanup
-    with TempManager() as temp_mgr:
-        try:
-            # Generate safe filenames
-            input_filename = f"input_{user_id}_{correlation_id}.audio"
-            output_filename = f"converted_{user_id}_{correlation_id}.{output_format}"
-
-            input_path = temp_mgr.get_temp_path(input_filename)
-            output_path = temp_mgr.get_temp_path(output_filename)
-
-            # Download audio file
-            logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
+    async with TempManager() as temp_mgr:
+        async with _job_cleanup(
+            None, context.user_data, "audio_menu_file_id", "audio_menu_correlation_id", "audio_menu_action"
+        ):
             try:
-                file = await context.bot.get_file(file_id)
-                await _download_with_retry(file, input_path, correlation_id=correlation_id)
-                logger.info(f"[{correlation_id}] Audio downloaded to {input_path}")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to download audio for user {user_id}: {e}")
-                raise DownloadError("No pude descargar el audio") from e
-
-            # Validate audio integrity after download
-            is_valid, error_msg = validate_audio_file(str(input_path))
-            if not is_valid:
-                logger.warning(f"[{correlation_id}] Audio validation failed for user {user_id}: {error_msg}")
-                raise ValidationError(error_msg)
-
-            # Detect input format
-            input_format = detect_audio_format(str(input_path))
-            if input_format:
-                logger.info(f"[{correlation_id}] Detected input format: {input_format}")
-                # Check if input format equals output format
-                if input_format == output_format:
-                    await query.edit_message_text(
-                        f"El archivo ya está en formato {output_format.upper()}. No es necesario convertir."
-                    )
-                    return
-            else:
-                logger.warning(f"[{correlation_id}] Could not detect input format for user {user_id}")
+                # Generate safe filenames
+                input_filename = f"input_{user_id}_{correlation_id}.audio"
+                output_filename = f"converted_{user_id}_{correlation_id}.{output_format}"
 
-            # Check disk space before processing
-            audio_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
-            required_space = estimate_required_space(int(audio_size_mb))
-            has_space, space_error = check_disk_space(required_space)
-            if not has_space:
-                logger.warning(f"[{correlation_id}] Disk space check failed for user {user_id}: {space_error}")
-                raise ValidationError(space_error)
+                input_path = temp_mgr.get_temp_path(input_filename)
+                output_path = temp_mgr.get_temp_path(output_filename)
 
-            # Convert audio with timeout
-            logger.info(f"[{correlation_id}] Converting audio to {output_format} for user {user_id}")
-            try:
-                loop = asyncio.get_event_loop()
-                converter = AudioFormatConverter(str(input_path), str(output_path))
-                success = await asyncio.wait_for(
-                    loop.run_in_executor(None, converter.convert, output_format),
-                    timeout=config.PROCESSING_TIMEOUT
+                # Download audio file
+                logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
+                try:
+                    file = await context.bot.get_file(file_id)
+                    await _download_with_retry(file, input_path, correlation_id=correlation_id)
+                    logger.info(f"[{correlation_id}] Audio downloaded to {input_path}")
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to download audio for user {user_id}: {e}")
+                    raise DownloadError("No pude descargar el audio") from e
+
+                # Validate integrity/disk space and detect the input format in parallel
+                loop = asyncio.get_running_loop()
+                preflight, input_format = await asyncio.gather(
+                    loop.run_in_executor(MEDIA_EXECUTOR, preflight_audio, str(input_path), 1, file.file_size),
+                    loop.run_in_executor(MEDIA_EXECUTOR, detect_audio_format_fast, str(input_path)),
                 )
+                if preflight.error:
+                    logger.warning(f"[{correlation_id}] Audio preflight failed for user {user_id}: {preflight.error}")
+                    raise ValidationError(preflight.error)
+
+                if input_format:
+                    logger.info(f"[{correlation_id}] Detected input format: {input_format}")
+                    # Check if input format equals output format
+                    if input_format == output_format:
+                        await query.edit_message_text(
+                            f"El archivo ya está en formato {output_format.upper()}. No es necesario convertir."
+                        )
+                        return
+                else:
+                    logger.warning(f"[{correlation_id}] Could not detect input format for user {user_id}")
 
-                if not success:
-                    logger.error(f"[{correlation_id}] Audio format conversion failed for user {user_id}")
-                    raise AudioFormatConversionError(f"No pude convertir el audio a {output_format.upper()}")
+                # Convert audio with timeout
+                logger.info(f"[{correlation_id}] Converting audio to {output_format} for user {user_id}")
+                try:
+                    loop = asyncio.get_running_loop()
+                    converter = AudioFormatConverter(str(input_path), str(output_path))
+                    async with _media_job_slot():
+                        success = await asyncio.wait_for(
+                            loop.run_in_executor(MEDIA_EXECUTOR, converter.convert, output_format),
+                            timeout=config.PROCESSING_TIMEOUT
+                        )
 
-            except asyncio.TimeoutError as e:
-                logger.error(f"[{correlation_id}] Audio conversion timed out for user {user_id}")
-                raise ProcessingTimeoutError("La conversión tardó demasiado") from e
+                    if not success:
+                        logger.error(f"[{correlation_id}] Audio format conversion failed for user {user_id}")
+                        raise AudioFormatConversionError(f"No pude convertir el audio a {output_format.upper()}")
 
-            # Send converted audio
-            logger.info(f"[{correlation_id}] Sending converted audio to user {user_id}")
-            try:
-                with open(output_path, "rb") as audio_file:
+                except asyncio.TimeoutError as e:
+                    logger.error(f"[{correlation_id}] Audio conversion timed out for user {user_id}")
+                    raise ProcessingTimeoutError("La conversión tardó demasiado") from e
+
+                # Send converted audio
+                logger.info(f"[{correlation_id}] Sending converted audio to user {user_id}")
+                try:
                     await context.bot.send_audio(
                         chat_id=update.effective_chat.id,
-                        audio=audio_file,
-                        filename=f"converted.{output_format}",
+                        audio=await _read_upload_file(output_path, filename=f"converted.{output_format}"),
                         title=f"Audio convertido a {output_format.upper()}"
                     )
-                logger.info(f"[{correlation_id}] Converted audio sent successfully to user {user_id}")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to send converted audio to user {user_id}: {e}")
-                raise
-
-            # Update message on success
-            try:
-                await query.edit_message_text(f"Audio convertido a {output_format.upper()} exitosamente.")
-            except Exception as e:
-                logger.warning(f"[{correlation_id}] Could not update final message: {e}")
+                    logger.info(f"[{correlation_id}] Converted audio sent successfully to user {user_id}")
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to send converted audio to user {user_id}: {e}")
+                    raise
 
-            # Clean up user_data
-            context.user_data.pop("audio_menu_file_id", None)
-            context.user_data.pop("audio_menu_correlation_id", None)
-            context.user_data.pop("audio_menu_action", None)
+                # Update message on success
+                try:
+                    await query.edit_message_text(f"Audio convertido a {output_format.upper()} exitosamente.")
+                except Exception as e:
+                    logger.warning(f"[{correlation_id}] Could not update final message: {e}")
 
-        except (DownloadError, ValidationError, AudioFormatConversionError, ProcessingTimeoutError) as e:
-            # Handle known processing errors
-            logger.error(f"[{correlation_id}] Processing error: {e}")
-            await handle_processing_error(update, e, user_id)
+            except (DownloadError, ValidationError, AudioFormatConversionError, ProcessingTimeoutError) as e:
+                # Handle known processing errors
+                logger.error(f"[{correlation_id}] Processing error: {e}")
+                await handle_processing_error(update, e, user_id)
 
-            # Update message on error
-            try:
-                await query.edit_message_text(f"Error: {str(e)}")
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+                # Update message on error
+                try:
+                    await query.edit_message_text(f"Error: {str(e)}")
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
 
-        except Exception as e:
-            # Handle unexpected errors
-            logger.exception(f"[{correlation_id}] Unexpected error converting audio for user {user_id}: {e}")
-            await handle_processing_error(update, e, user_id)
+            except Exception as e:
+                # Handle unexpected errors
+                logger.exception(f"[{correlation_id}] Unexpected error converting audio for user {user_id}: {e}")
+                await handle_processing_error(update, e, user_id)
 
-            # Update message on error
-            try:
-                await query.edit_message_text("Ocurrió un error inesperado. Por favor intenta de nuevo.")
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+                # Update message on error
+                try:
+                    await query.edit_message_text("Ocurrió un error inesperado. Por favor intenta de nuevo.")
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
 
 
 # Effects Pipeline Handler
@@ -5640,7 +6426,7 @@ async def handle_effects_command(update: Update, context: ContextTypes.DEFAULT_T
         context: Telegram context object
     """
     user_id = update.effective_user.id
-    correlation_id = str(uuid.uuid4())[:8]
+    correlation_id = token_hex(4)
     logger.info(f"[{correlation_id}] Effects command received from user {user_id}")
 
     # Get audio from message or reply
@@ -5689,7 +6475,7 @@ async def handle_pipeline_builder(update: Update, context: ContextTypes.DEFAULT_
 
     user_id = update.effective_user.id
     callback_data = query.data
-    correlation_id = context.user_data.get("pipeline_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("pipeline_correlation_id", token_hex(4))
 
     # Get current pipeline state
     pipeline_effects = context.user_data.get("pipeline_effects", [])
@@ -5902,7 +6688,7 @@ async def _handle_pipeline_apply(
     """
     query = update.callback_query
     user_id = update.effective_user.id
-    correlation_id = context.user_data.get("pipeline_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("pipeline_correlation_id", token_hex(4))
 
     # Validate pipeline
     if not pipeline_effects:
@@ -5925,147 +6711,143 @@ async def _handle_pipeline_apply(
     logger.info(f"[{correlation_id}] Applying pipeline with {len(pipeline_effects)} effects for user {user_id}")
 
     # Process with TempManager for automatic cleanup
-    with TempManager() as temp_mgr:
-        try:
-            # Generate safe filenames
-            input_filename = f"input_pipeline_{user_id}_{correlation_id}.audio"
-            output_filename = f"pipeline_{user_id}_{correlation_id}.mp3"
-
-            input_path = temp_mgr.get_temp_path(input_filename)
-            output_path = temp_mgr.get_temp_path(output_filename)
-
-            # Download audio file
-            logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
+    async with TempManager() as temp_mgr:
+        async with _job_cleanup(
+            None, context.user_data, "pipeline_file_id", "pipeline_correlation_id", "pipeline_effects"
+        ):
             try:
-                file = await context.bot.get_file(file_id)
-                await _download_with_retry(file, input_path, correlation_id=correlation_id)
-                logger.info(f"[{correlation_id}] Audio downloaded to {input_path}")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to download audio for user {user_id}: {e}")
-                raise DownloadError("No pude descargar el audio") from e
+                # Generate safe filenames
+                input_filename = f"input_pipeline_{user_id}_{correlation_id}.audio"
+                output_filename = f"pipeline_{user_id}_{correlation_id}.mp3"
 
-            # Validate audio integrity after download
-            is_valid, error_msg = validate_audio_file(str(input_path))
-            if not is_valid:
-                logger.warning(f"[{correlation_id}] Audio validation failed for user {user_id}: {error_msg}")
-                raise ValidationError(error_msg)
+                input_path = temp_mgr.get_temp_path(input_filename)
+                output_path = temp_mgr.get_temp_path(output_filename)
 
-            # Check disk space before processing (estimate based on number of effects)
-            audio_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
-            required_space = estimate_required_space(int(audio_size_mb * (1 + len(pipeline_effects) * 0.5)))
-            has_space, space_error = check_disk_space(required_space)
-            if not has_space:
-                logger.warning(f"[{correlation_id}] Disk space check failed for user {user_id}: {space_error}")
-                raise ValidationError(space_error)
+                # Download audio file
+                logger.info(f"[{correlation_id}] Downloading audio from user {user_id}")
+                try:
+                    file = await context.bot.get_file(file_id)
+                    await _download_with_retry(file, input_path, correlation_id=correlation_id)
+                    logger.info(f"[{correlation_id}] Audio downloaded to {input_path}")
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to download audio for user {user_id}: {e}")
+                    raise DownloadError("No pude descargar el audio") from e
 
-            # Apply effects in chain using AudioEffects
-            logger.info(f"[{correlation_id}] Processing pipeline with {len(pipeline_effects)} effects for user {user_id}")
-            try:
-                loop = asyncio.get_event_loop()
-                effects = AudioEffects(str(input_path), str(output_path))
+                # Validate audio integrity after download
+                is_valid, error_msg = validate_audio_file(str(input_path))
+                if not is_valid:
+                    logger.warning(f"[{correlation_id}] Audio validation failed for user {user_id}: {error_msg}")
+                    raise ValidationError(error_msg)
 
-                # Build method chain based on pipeline_effects order
-                for effect in pipeline_effects:
-                    effect_type = effect.get("type")
-                    params = effect.get("params", {})
+                # Check disk space before processing (estimate based on number of effects)
+                audio_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
+                required_space = estimate_required_space(int(audio_size_mb * (1 + len(pipeline_effects) * 0.5)))
+                has_space, space_error = check_disk_space(required_space)
+                if not has_space:
+                    logger.warning(f"[{correlation_id}] Disk space check failed for user {user_id}: {space_error}")
+                    raise ValidationError(space_error)
 
-                    if effect_type == "denoise":
-                        strength = params.get("strength", 5)
-                        await asyncio.wait_for(
-                            loop.run_in_executor(None, effects.denoise, float(strength)),
-                            timeout=config.PROCESSING_TIMEOUT
-                        )
-                    elif effect_type == "compress":
-                        ratio = params.get("ratio", 4.0)
-                        await asyncio.wait_for(
-                            loop.run_in_executor(None, effects.compress, ratio, -20.0),
-                            timeout=config.PROCESSING_TIMEOUT
-                        )
-                    elif effect_type == "normalize":
-                        target_lufs = params.get("target_lufs", -14.0)
-                        await asyncio.wait_for(
-                            loop.run_in_executor(None, effects.normalize, target_lufs),
-                            timeout=config.PROCESSING_TIMEOUT
-                        )
+                # Apply effects in chain using AudioEffects
+                logger.info(f"[{correlation_id}] Processing pipeline with {len(pipeline_effects)} effects for user {user_id}")
+                try:
+                    loop = asyncio.get_running_loop()
+                    effects = AudioEffects(str(input_path), str(output_path))
+
+                    # Build method chain based on pipeline_effects order
+                    for effect in pipeline_effects:
+                        effect_type = effect.get("type")
+                        params = effect.get("params", {})
+
+                        if effect_type == "denoise":
+                            strength = params.get("strength", 5)
+                            await asyncio.wait_for(
+                                loop.run_in_executor(MEDIA_EXECUTOR, effects.denoise, float(strength)),
+                                timeout=config.PROCESSING_TIMEOUT
+                            )
+                        elif effect_type == "compress":
+                            ratio = params.get("ratio", 4.0)
+                            await asyncio.wait_for(
+                                loop.run_in_executor(MEDIA_EXECUTOR, effects.compress, ratio, -20.0),
+                                timeout=config.PROCESSING_TIMEOUT
+                            )
+                        elif effect_type == "normalize":
+                            target_lufs = params.get("target_lufs", -14.0)
+                            await asyncio.wait_for(
+                                loop.run_in_executor(MEDIA_EXECUTOR, effects.normalize, target_lufs),
+                                timeout=config.PROCESSING_TIMEOUT
+                            )
 
-                # Finalize the effect chain
-                final_output = await asyncio.wait_for(
-                    loop.run_in_executor(None, effects.finalize),
-                    timeout=config.PROCESSING_TIMEOUT
-                )
+                    # Finalize the effect chain
+                    final_output = await asyncio.wait_for(
+                        loop.run_in_executor(MEDIA_EXECUTOR, effects.finalize),
+                        timeout=config.PROCESSING_TIMEOUT
+                    )
 
-                if not final_output or not Path(final_output).exists():
-                    logger.error(f"[{correlation_id}] Pipeline processing failed for user {user_id}")
-                    raise AudioEffectsError("No pude procesar el pipeline de efectos")
+                    if not final_output or not Path(final_output).exists():
+                        logger.error(f"[{correlation_id}] Pipeline processing failed for user {user_id}")
+                        raise AudioEffectsError("No pude procesar el pipeline de efectos")
 
-            except asyncio.TimeoutError as e:
-                logger.error(f"[{correlation_id}] Pipeline processing timed out for user {user_id}")
-                raise ProcessingTimeoutError("El procesamiento del pipeline tardó demasiado") from e
+                except asyncio.TimeoutError as e:
+                    logger.error(f"[{correlation_id}] Pipeline processing timed out for user {user_id}")
+                    raise ProcessingTimeoutError("El procesamiento del pipeline tardó demasiado") from e
 
-            # Send processed audio
-            logger.info(f"[{correlation_id}] Sending pipeline result to user {user_id}")
-            try:
-                with open(output_path, "rb") as audio_file:
+                # Send processed audio
+                logger.info(f"[{correlation_id}] Sending pipeline result to user {user_id}")
+                try:
                     await context.bot.send_audio(
                         chat_id=update.effective_chat.id,
-                        audio=audio_file,
-                        filename=f"pipeline_audio.mp3",
+                        audio=await _read_upload_file(output_path, filename=f"pipeline_audio.mp3"),
                         title=f"Audio con pipeline ({len(pipeline_effects)} efectos)"
                     )
-                logger.info(f"[{correlation_id}] Pipeline result sent successfully to user {user_id}")
-            except Exception as e:
-                logger.error(f"[{correlation_id}] Failed to send pipeline result to user {user_id}: {e}")
-                raise
-
-            # Build effect list for success message
-            effect_list = []
-            for effect in pipeline_effects:
-                effect_type = effect.get("type", "unknown")
-                params = effect.get("params", {})
-                if effect_type == "denoise":
-                    effect_list.append(f"Denoise ({params.get('strength', 5)})")
-                elif effect_type == "compress":
-                    effect_list.append(f"Compress ({params.get('preset_name', 'media')})")
-                elif effect_type == "normalize":
-                    effect_list.append(f"Normalize ({params.get('preset_name', 'música')})")
+                    logger.info(f"[{correlation_id}] Pipeline result sent successfully to user {user_id}")
+                except Exception as e:
+                    logger.error(f"[{correlation_id}] Failed to send pipeline result to user {user_id}: {e}")
+                    raise
 
-            # Update message on success
-            try:
-                await query.edit_message_text(
-                    f"¡Listo! Pipeline aplicado ({len(pipeline_effects)} efectos):\n"
-                    + "\n".join(f"  {i+1}. {name}" for i, name in enumerate(effect_list))
-                )
-            except Exception as e:
-                logger.warning(f"[{correlation_id}] Could not update final message: {e}")
+                # Build effect list for success message
+                effect_list = []
+                for effect in pipeline_effects:
+                    effect_type = effect.get("type", "unknown")
+                    params = effect.get("params", {})
+                    if effect_type == "denoise":
+                        effect_list.append(f"Denoise ({params.get('strength', 5)})")
+                    elif effect_type == "compress":
+                        effect_list.append(f"Compress ({params.get('preset_name', 'media')})")
+                    elif effect_type == "normalize":
+                        effect_list.append(f"Normalize ({params.get('preset_name', 'música')})")
 
-            # Clean up user_data
-            context.user_data.pop("pipeline_file_id", None)
-            context.user_data.pop("pipeline_correlation_id", None)
-            context.user_data.pop("pipeline_effects", None)
+                # Update message on success
+                try:
+                    await query.edit_message_text(
+                        f"¡Listo! Pipeline aplicado ({len(pipeline_effects)} efectos):\n"
+                        + "\n".join(f"  {i+1}. {name}" for i, name in enumerate(effect_list))
+                    )
+                except Exception as e:
+                    logger.warning(f"[{correlation_id}] Could not update final message: {e}")
 
-        except (DownloadError, ValidationError, AudioEffectsError, ProcessingTimeoutError) as e:
-            # Handle known processing errors
-            logger.error(f"[{correlation_id}] Pipeline processing error: {e}")
-            await handle_processing_error(update, e, user_id)
+            except (DownloadError, ValidationError, AudioEffectsError, ProcessingTimeoutError) as e:
+                # Handle known processing errors
+                logger.error(f"[{correlation_id}] Pipeline processing error: {e}")
+                await handle_processing_error(update, e, user_id)
 
-            # Update message on error (keep state so user can retry)
-            try:
-                await query.edit_message_text(f"Error: {str(e)}\n\nPuedes intentar aplicar el pipeline de nuevo.")
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+                # Update message on error (keep state so user can retry)
+                try:
+                    await query.edit_message_text(f"Error: {str(e)}\n\nPuedes intentar aplicar el pipeline de nuevo.")
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
 
-        except Exception as e:
-            # Handle unexpected errors
-            logger.exception(f"[{correlation_id}] Unexpected error applying pipeline for user {user_id}: {e}")
-            await handle_processing_error(update, e, user_id)
+            except Exception as e:
+                # Handle unexpected errors
+                logger.exception(f"[{correlation_id}] Unexpected error applying pipeline for user {user_id}: {e}")
+                await handle_processing_error(update, e, user_id)
 
-            # Update message on error
-            try:
-                await query.edit_message_text("Ocurrió un error inesperado. Por favor intenta de nuevo.")
-            except Exception as edit_error:
-                logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
+                # Update message on error
+                try:
+                    await query.edit_message_text("Ocurrió un error inesperado. Por favor intenta de nuevo.")
+                except Exception as edit_error:
+                    logger.warning(f"[{correlation_id}] Could not update error message: {edit_error}")
 
-        # TempManager cleanup happens automatically on context exit
+            # TempManager cleanup happens automatically on context exit
 
 
 async def handle_video_menu_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -6086,7 +6868,7 @@ async def handle_video_menu_callback(update: Update, context: ContextTypes.DEFAU
 
     user_id = update.effective_user.id
     callback_data = query.data
-    correlation_id = context.user_data.get("video_menu_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("video_menu_correlation_id", token_hex(4))
 
     # Parse action from callback data (format: video_action:<action>)
     if not callback_data.startswith("video_action:"):
@@ -6107,7 +6889,7 @@ async def handle_video_menu_callback(update: Update, context: ContextTypes.DEFAU
         # Process video to video note
         await query.edit_message_text("Procesando video a nota de video...")
 
-        with TempManager() as temp_mgr:
+        async with TempManager() as temp_mgr:
             try:
                 # Generate safe filenames
                 input_filename = f"input_videonote_{user_id}_{correlation_id}.mp4"
@@ -6143,10 +6925,10 @@ async def handle_video_menu_callback(update: Update, context: ContextTypes.DEFAU
                 # Process video with timeout
                 logger.info(f"[{correlation_id}] Processing video to video note for user {user_id}")
                 try:
-                    loop = asyncio.get_event_loop()
+                    loop = asyncio.get_running_loop()
                     success = await asyncio.wait_for(
                         loop.run_in_executor(
-                            None,
+                            MEDIA_EXECUTOR,
                             VideoProcessor.process_video,
                             str(input_path),
                             str(output_path)
@@ -6165,8 +6947,7 @@ async def handle_video_menu_callback(update: Update, context: ContextTypes.DEFAU
                 # Send as video note
                 logger.info(f"[{correlation_id}] Sending video note to user {user_id}")
                 try:
-                    with open(output_path, "rb") as video_file:
-                        await query.message.reply_video_note(video_note=video_file)
+                    await query.message.reply_video_note(video_note=await _read_upload_file(output_path))
                     logger.info(f"[{correlation_id}] Video note sent successfully to user {user_id}")
                 except Exception as e:
                     logger.error(f"[{correlation_id}] Failed to send video note to user {user_id}: {e}")
@@ -6276,17 +7057,19 @@ async def handle_video_menu_callback(update: Update, context: ContextTypes.DEFAU
             is_valid, error_msg = validate_video_file(str(input_path))
             if not is_valid:
                 logger.warning(f"[{correlation_id}] Video validation failed: {error_msg}")
-                temp_mgr.cleanup()
+                await temp_mgr.cleanup_async()
                 await query.edit_message_text(f"Error: {error_msg}")
                 return
 
             # Initialize join session
-            context.user_data["join_session"] = {
-                "videos": [str(input_path)],
-                "temp_mgr": temp_mgr,
-                "last_activity": asyncio.get_event_loop().time(),
-                "correlation_id": correlation_id,
-            }
+            context.user_data["join_session"] = JoinSession(
+                temp_mgr=temp_mgr,
+                paths=[str(input_path)],
+                sizes=[os.path.getsize(input_path)],
+                durations=[0],
+                validations=[None],  # Validated before the session started
+                correlation_id=correlation_id,
+            )
 
             # Track the file
             temp_mgr.track_file(str(input_path))
@@ -6304,7 +7087,7 @@ async def handle_video_menu_callback(update: Update, context: ContextTypes.DEFAU
 
         except Exception as e:
             logger.error(f"[{correlation_id}] Failed to start join session: {e}")
-            temp_mgr.cleanup()
+            await temp_mgr.cleanup_async()
             await query.edit_message_text(
                 "Error al iniciar la sesión de unión. Por favor intenta de nuevo."
             )
@@ -6350,7 +7133,7 @@ async def handle_video_format_selection(update: Update, context: ContextTypes.DE
 
     user_id = update.effective_user.id
     callback_data = query.data
-    correlation_id = context.user_data.get("video_menu_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("video_menu_correlation_id", token_hex(4))
 
     # Retrieve file_id and action from context
     file_id = context.user_data.get("video_menu_file_id")
@@ -6377,7 +7160,7 @@ async def handle_video_format_selection(update: Update, context: ContextTypes.DE
 
     logger.info(f"[{correlation_id}] Format selected: {output_format} for action: {action} by user {user_id}")
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             # Generate safe filenames
             input_filename = f"input_{action}_{user_id}_{correlation_id}.mp4"
@@ -6416,10 +7199,10 @@ async def handle_video_format_selection(update: Update, context: ContextTypes.DE
 
                 logger.info(f"[{correlation_id}] Converting video to {output_format} for user {user_id}")
                 try:
-                    loop = asyncio.get_event_loop()
+                    loop = asyncio.get_running_loop()
                     converter = FormatConverter(str(input_path), str(output_path))
                     success = await asyncio.wait_for(
-                        loop.run_in_executor(None, converter.convert, output_format),
+                        loop.run_in_executor(MEDIA_EXECUTOR, converter.convert, output_format),
                         timeout=config.PROCESSING_TIMEOUT
                     )
 
@@ -6434,8 +7217,7 @@ async def handle_video_format_selection(update: Update, context: ContextTypes.DE
                 # Send converted video
                 logger.info(f"[{correlation_id}] Sending converted video to user {user_id}")
                 try:
-                    with open(output_path, "rb") as video_file:
-                        await query.message.reply_video(video=video_file)
+                    await query.message.reply_video(video=await _read_upload_file(output_path))
                     logger.info(f"[{correlation_id}] Converted video sent successfully to user {user_id}")
                 except Exception as e:
                     logger.error(f"[{correlation_id}] Failed to send converted video to user {user_id}: {e}")
@@ -6453,10 +7235,10 @@ async def handle_video_format_selection(update: Update, context: ContextTypes.DE
 
                 logger.info(f"[{correlation_id}] Extracting audio as {output_format} for user {user_id}")
                 try:
-                    loop = asyncio.get_event_loop()
+                    loop = asyncio.get_running_loop()
                     extractor = AudioExtractor(str(input_path), str(output_path))
                     success = await asyncio.wait_for(
-                        loop.run_in_executor(None, extractor.extract, output_format),
+                        loop.run_in_executor(MEDIA_EXECUTOR, extractor.extract, output_format),
                         timeout=config.PROCESSING_TIMEOUT
                     )
 
@@ -6471,8 +7253,7 @@ async def handle_video_format_selection(update: Update, context: ContextTypes.DE
                 # Send extracted audio
                 logger.info(f"[{correlation_id}] Sending extracted audio to user {user_id}")
                 try:
-                    with open(output_path, "rb") as audio_file:
-                        await query.message.reply_audio(audio=audio_file)
+                    await query.message.reply_audio(audio=await _read_upload_file(output_path))
                     logger.info(f"[{correlation_id}] Audio sent successfully to user {user_id}")
                 except Exception as e:
                     logger.error(f"[{correlation_id}] Failed to send audio to user {user_id}: {e}")
@@ -6525,7 +7306,7 @@ async def handle_screenshot_callback(update: Update, context: ContextTypes.DEFAU
 
     user_id = update.effective_user.id
     callback_data = query.data
-    correlation_id = context.user_data.get("screenshot_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("screenshot_correlation_id", token_hex(4))
 
     logger.info(f"[{correlation_id}] Screenshot callback: {callback_data} from user {user_id}")
 
@@ -6600,7 +7381,7 @@ async def _process_screenshots(update: Update, context: ContextTypes.DEFAULT_TYP
         count: Number of screenshots (for auto mode) or None for manual
     """
     query = update.callback_query
-    correlation_id = context.user_data.get("screenshot_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("screenshot_correlation_id", token_hex(4))
     user_id = update.effective_user.id
     file_id = context.user_data.get("screenshot_file_id")
 
@@ -6614,7 +7395,7 @@ async def _process_screenshots(update: Update, context: ContextTypes.DEFAULT_TYP
         except Exception:
             processing_msg = None
 
-    with TempManager(correlation_id) as temp_mgr:
+    async with TempManager(correlation_id) as temp_mgr:
         try:
             # Download video
             input_filename = f"screenshot_input_{correlation_id}.mp4"
@@ -6824,7 +7605,7 @@ async def handle_cancel_callback(update: Update, context: ContextTypes.DEFAULT_T
     await query.answer()
 
     user_id = update.effective_user.id
-    correlation_id = str(uuid.uuid4())[:8]
+    correlation_id = token_hex(4)
 
     # Clear video menu keys
     context.user_data.pop("video_menu_file_id", None)
@@ -7276,7 +8057,7 @@ async def handle_download_command(update: Update, context: ContextTypes.DEFAULT_
         context: Telegram context object
     """
     user_id = update.effective_user.id
-    correlation_id = str(uuid.uuid4())[:8]
+    correlation_id = token_hex(4)
 
     # Parse URL from command arguments
     args = context.args
@@ -7364,7 +8145,7 @@ async def handle_url_detection(update: Update, context: ContextTypes.DEFAULT_TYP
         # yt-dlp has a generic extractor that works with many sites
         logger.debug(f"URL type UNKNOWN, will attempt generic extraction: {url}")
 
-    correlation_id = str(uuid.uuid4())[:8]
+    correlation_id = token_hex(4)
     logger.info(f"[{correlation_id}] URL detected in message from user {user_id}: {url}")
 
     # Store URL and correlation_id in context
@@ -8293,7 +9074,7 @@ def _split_file_if_needed(file_path: str, output_dir: str, correlation_id: str)
     num_parts = min(10, max(1, num_parts))
 
     logger.info(f"[{correlation_id}] Splitting into {num_parts} parts")
-    splitter = VideoSplitter(file_path, output_dir)
+    splitter = VideoSplitter(file_path, output_dir, threads=config.FFMPEG_THREADS)
     return splitter.split_by_parts(num_parts)
 
 
@@ -8818,8 +9599,8 @@ async def _process_to_videonote(
 
     try:
         # Process video to video note format
-        success = await asyncio.get_event_loop().run_in_executor(
-            None,
+        success = await asyncio.get_running_loop().run_in_executor(
+            MEDIA_EXECUTOR,
             VideoProcessor.process_video,
             str(file_path),
             str(output_path)
@@ -8840,7 +9621,7 @@ async def _process_to_videonote(
         # Send original as fallback
         await _send_downloaded_file_with_menu(update, context, result, "video", correlation_id)
     finally:
-        temp_mgr.cleanup()
+        await temp_mgr.cleanup_async()
 
 
 async def _process_extract_audio(
@@ -8888,8 +9669,8 @@ async def _process_extract_audio(
     try:
         # Extract audio using AudioExtractor
         extractor = AudioExtractor(str(file_path), str(output_path))
-        success = await asyncio.get_event_loop().run_in_executor(
-            None,
+        success = await asyncio.get_running_loop().run_in_executor(
+            MEDIA_EXECUTOR,
             extractor.extract
         )
 
@@ -8914,7 +9695,7 @@ async def _process_extract_audio(
         # Send original as fallback
         await _send_downloaded_file_with_menu(update, context, result, "video", correlation_id)
     finally:
-        temp_mgr.cleanup()
+        await temp_mgr.cleanup_async()
 
 
 async def _process_to_voicenote(
@@ -8962,8 +9743,8 @@ async def _process_to_voicenote(
     try:
         # Convert to voice note format (OGG Opus)
         converter = VoiceNoteConverter(str(file_path), str(output_path))
-        success = await asyncio.get_event_loop().run_in_executor(
-            None,
+        success = await asyncio.get_running_loop().run_in_executor(
+            MEDIA_EXECUTOR,
             converter.convert
         )
 
@@ -8982,7 +9763,7 @@ async def _process_to_voicenote(
         # Send original as fallback
         await _send_downloaded_file_with_menu(update, context, result, "audio", correlation_id)
     finally:
-        temp_mgr.cleanup()
+        await temp_mgr.cleanup_async()
 
 
 async def handle_download_cancel_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -9568,16 +10349,16 @@ async def _handle_postdownload_videonote(
 
     await query.edit_message_text("Convirtiendo a nota de video...")
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             output_filename = f"videonote_{user_id}_{correlation_id}.mp4"
             output_path = temp_mgr.get_temp_path(output_filename)
 
             logger.info(f"[{correlation_id}] Processing downloaded video to video note for user {user_id}")
             try:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 success = await asyncio.wait_for(
-                    loop.run_in_executor(None, VideoProcessor.process_video, str(file_path), str(output_path)),
+                    loop.run_in_executor(MEDIA_EXECUTOR, VideoProcessor.process_video, str(file_path), str(output_path)),
                     timeout=config.PROCESSING_TIMEOUT
                 )
                 if not success:
@@ -9586,8 +10367,7 @@ async def _handle_postdownload_videonote(
                 raise ProcessingTimeoutError("El procesamiento tardó demasiado") from e
 
             logger.info(f"[{correlation_id}] Sending video note to user {user_id}")
-            with open(output_path, "rb") as video_file:
-                await query.message.reply_video_note(video_note=video_file)
+            await query.message.reply_video_note(video_note=await _read_upload_file(output_path))
 
             reply_markup = _get_postdownload_video_keyboard(correlation_id)
             await query.message.reply_text(
@@ -9622,12 +10402,14 @@ async def _handle_postdownload_join_video(
 
     # Initialize join session
     temp_mgr = TempManager()
-    context.user_data["join_session"] = {
-        "videos": [str(file_path)],
-        "temp_mgr": temp_mgr,
-        "last_activity": asyncio.get_event_loop().time(),
-        "correlation_id": correlation_id,
-    }
+    context.user_data["join_session"] = JoinSession(
+        temp_mgr=temp_mgr,
+        paths=[str(file_path)],
+        sizes=[os.path.getsize(file_path)],
+        durations=[0],
+        validations=[None],  # Validated before the session started
+        correlation_id=correlation_id,
+    )
 
     # Track the file with temp manager
     temp_mgr.track_file(str(file_path))
@@ -9797,17 +10579,17 @@ async def _handle_postdownload_voicenote(
 
     await query.edit_message_text("Convirtiendo a nota de voz...")
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             output_filename = f"voicenote_{user_id}_{correlation_id}.ogg"
             output_path = temp_mgr.get_temp_path(output_filename)
 
             logger.info(f"[{correlation_id}] Converting audio to voice note for user {user_id}")
             try:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 converter = VoiceNoteConverter(str(file_path), str(output_path))
                 success = await asyncio.wait_for(
-                    loop.run_in_executor(None, converter.process), timeout=config.PROCESSING_TIMEOUT
+                    loop.run_in_executor(MEDIA_EXECUTOR, converter.process), timeout=config.PROCESSING_TIMEOUT
                 )
                 if not success:
                     raise VoiceConversionError("No pude convertir a nota de voz")
@@ -9815,8 +10597,7 @@ async def _handle_postdownload_voicenote(
                 raise ProcessingTimeoutError("El procesamiento tardó demasiado") from e
 
             logger.info(f"[{correlation_id}] Sending voice note to user {user_id}")
-            with open(output_path, "rb") as voice_file:
-                await query.message.reply_voice(voice=voice_file)
+            await query.message.reply_voice(voice=await _read_upload_file(output_path))
 
             reply_markup = _get_postdownload_audio_keyboard(correlation_id)
             await query.message.reply_text(
@@ -9841,17 +10622,17 @@ async def _handle_postdownload_normalize(
 
     await query.edit_message_text("Normalizando audio...")
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             output_filename = f"normalized_{user_id}_{correlation_id}.mp3"
             output_path = temp_mgr.get_temp_path(output_filename)
 
             logger.info(f"[{correlation_id}] Normalizing audio for user {user_id}")
             try:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 effects = AudioEffects(str(file_path), str(output_path))
                 success = await asyncio.wait_for(
-                    loop.run_in_executor(None, effects.normalize), timeout=config.PROCESSING_TIMEOUT
+                    loop.run_in_executor(MEDIA_EXECUTOR, effects.normalize), timeout=config.PROCESSING_TIMEOUT
                 )
                 if not success:
                     raise AudioEffectsError("No pude normalizar el audio")
@@ -9859,10 +10640,10 @@ async def _handle_postdownload_normalize(
                 raise ProcessingTimeoutError("El procesamiento tardó demasiado") from e
 
             logger.info(f"[{correlation_id}] Sending normalized audio to user {user_id}")
-            with open(output_path, "rb") as audio_file:
-                await query.message.reply_audio(
-                    audio=audio_file, filename=f"normalized_{correlation_id}.mp3", title="Audio Normalizado"
-                )
+            await query.message.reply_audio(
+                audio=await _read_upload_file(output_path, filename=f"normalized_{correlation_id}.mp3"),
+                title="Audio Normalizado",
+            )
 
             reply_markup = _get_postdownload_audio_keyboard(correlation_id)
             await query.message.reply_text(
@@ -10038,17 +10819,17 @@ async def _handle_postdownload_audio_format_conversion(
 
     await query.edit_message_text(f"Convirtiendo a formato {target_format.upper()}...")
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             output_filename = f"converted_{user_id}_{correlation_id}.{target_format}"
             output_path = temp_mgr.get_temp_path(output_filename)
 
             logger.info(f"[{correlation_id}] Converting audio to {target_format} for user {user_id}")
             try:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 converter = AudioFormatConverter(str(file_path), str(output_path))
                 success = await asyncio.wait_for(
-                    loop.run_in_executor(None, converter.convert), timeout=config.PROCESSING_TIMEOUT
+                    loop.run_in_executor(MEDIA_EXECUTOR, converter.convert), timeout=config.PROCESSING_TIMEOUT
                 )
                 if not success:
                     raise AudioFormatConversionError(f"No pude convertir a {target_format}")
@@ -10056,12 +10837,10 @@ async def _handle_postdownload_audio_format_conversion(
                 raise ProcessingTimeoutError("El procesamiento tardó demasiado") from e
 
             logger.info(f"[{correlation_id}] Sending converted audio to user {user_id}")
-            with open(output_path, "rb") as audio_file:
-                await query.message.reply_audio(
-                    audio=audio_file,
-                    filename=f"converted_{correlation_id}.{target_format}",
-                    title=f"Audio Convertido ({target_format.upper()})"
-                )
+            await query.message.reply_audio(
+                audio=await _read_upload_file(output_path, filename=f"converted_{correlation_id}.{target_format}"),
+                title=f"Audio Convertido ({target_format.upper()})"
+            )
 
             reply_markup = _get_postdownload_audio_keyboard(correlation_id)
             await query.message.reply_text(
@@ -10086,17 +10865,17 @@ async def _handle_postdownload_video_format_conversion(
 
     await query.edit_message_text(f"Convirtiendo video a formato {target_format.upper()}...")
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             output_filename = f"converted_{user_id}_{correlation_id}.{target_format}"
             output_path = temp_mgr.get_temp_path(output_filename)
 
             logger.info(f"[{correlation_id}] Converting video to {target_format} for user {user_id}")
             try:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 converter = FormatConverter(str(file_path), str(output_path))
                 success = await asyncio.wait_for(
-                    loop.run_in_executor(None, converter.convert), timeout=config.PROCESSING_TIMEOUT
+                    loop.run_in_executor(MEDIA_EXECUTOR, converter.convert), timeout=config.PROCESSING_TIMEOUT
                 )
                 if not success:
                     raise FormatConversionError(f"No pude convertir a {target_format}")
@@ -10104,12 +10883,11 @@ async def _handle_postdownload_video_format_conversion(
                 raise ProcessingTimeoutError("El procesamiento tardó demasiado") from e
 
             logger.info(f"[{correlation_id}] Sending converted video to user {user_id}")
-            with open(output_path, "rb") as video_file:
-                await query.message.reply_video(
-                    video=video_file,
-                    caption=f"Video convertido a {target_format.upper()}",
-                    supports_streaming=True
-                )
+            await query.message.reply_video(
+                video=await _read_upload_file(output_path),
+                caption=f"Video convertido a {target_format.upper()}",
+                supports_streaming=True
+            )
 
             reply_markup = _get_postdownload_video_keyboard(correlation_id)
             await query.message.reply_text(
@@ -10134,17 +10912,17 @@ async def _handle_postdownload_extract_audio(
 
     await query.edit_message_text(f"Extrayendo audio en formato {audio_format.upper()}...")
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             output_filename = f"audio_{user_id}_{correlation_id}.{audio_format}"
             output_path = temp_mgr.get_temp_path(output_filename)
 
             logger.info(f"[{correlation_id}] Extracting audio as {audio_format} for user {user_id}")
             try:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 extractor = AudioExtractor(str(file_path), str(output_path))
                 success = await asyncio.wait_for(
-                    loop.run_in_executor(None, extractor.extract), timeout=config.PROCESSING_TIMEOUT
+                    loop.run_in_executor(MEDIA_EXECUTOR, extractor.extract), timeout=config.PROCESSING_TIMEOUT
                 )
                 if not success:
                     raise AudioExtractionError(f"No pude extraer el audio")
@@ -10152,12 +10930,10 @@ async def _handle_postdownload_extract_audio(
                 raise ProcessingTimeoutError("El procesamiento tardó demasiado") from e
 
             logger.info(f"[{correlation_id}] Sending extracted audio to user {user_id}")
-            with open(output_path, "rb") as audio_file:
-                await query.message.reply_audio(
-                    audio=audio_file,
-                    filename=f"extracted_{correlation_id}.{audio_format}",
-                    title=f"Audio Extraído ({audio_format.upper()})"
-                )
+            await query.message.reply_audio(
+                audio=await _read_upload_file(output_path, filename=f"extracted_{correlation_id}.{audio_format}"),
+                title=f"Audio Extraído ({audio_format.upper()})"
+            )
 
             reply_markup = _get_postdownload_video_keyboard(correlation_id)
             await query.message.reply_text(
@@ -10278,17 +11054,17 @@ async def _handle_postdownload_bass_boost(
 
     await query.edit_message_text(f"Aplicando Bass Boost (intensidad {intensity})...")
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             output_filename = f"bass_boosted_{user_id}_{correlation_id}.mp3"
             output_path = temp_mgr.get_temp_path(output_filename)
 
             logger.info(f"[{correlation_id}] Applying bass boost (intensity {intensity}) for user {user_id}")
             try:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 enhancer = AudioEnhancer(str(file_path), str(output_path))
                 success = await asyncio.wait_for(
-                    loop.run_in_executor(None, lambda: enhancer.bass_boost(intensity)),
+                    loop.run_in_executor(MEDIA_EXECUTOR, lambda: enhancer.bass_boost(intensity)),
                     timeout=config.PROCESSING_TIMEOUT
                 )
                 if not success:
@@ -10297,12 +11073,10 @@ async def _handle_postdownload_bass_boost(
                 raise ProcessingTimeoutError("El procesamiento tardó demasiado") from e
 
             logger.info(f"[{correlation_id}] Sending bass boosted audio to user {user_id}")
-            with open(output_path, "rb") as audio_file:
-                await query.message.reply_audio(
-                    audio=audio_file,
-                    filename=f"bass_boosted_{correlation_id}.mp3",
-                    title=f"Bass Boost (Intensidad {intensity})"
-                )
+            await query.message.reply_audio(
+                audio=await _read_upload_file(output_path, filename=f"bass_boosted_{correlation_id}.mp3"),
+                title=f"Bass Boost (Intensidad {intensity})"
+            )
 
             reply_markup = _get_postdownload_audio_keyboard(correlation_id)
             await query.message.reply_text(
@@ -10332,7 +11106,7 @@ async def _handle_postdownload_stereo_3d(
 
     await query.edit_message_text(f"Aplicando efecto 3D ({intensity_label})...")
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             output_filename = f"stereo3d_{user_id}_{correlation_id}.mp3"
             output_path = temp_mgr.get_temp_path(output_filename)
@@ -10341,10 +11115,10 @@ async def _handle_postdownload_stereo_3d(
                 f"[{correlation_id}] Applying stereo 3D ({intensity}) for user {user_id}"
             )
             try:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 effects = AudioEffects(str(file_path), str(output_path))
                 await asyncio.wait_for(
-                    loop.run_in_executor(None, effects.stereo_3d, intensity),
+                    loop.run_in_executor(MEDIA_EXECUTOR, effects.stereo_3d, intensity),
                     timeout=config.PROCESSING_TIMEOUT,
                 )
             except asyncio.TimeoutError as e:
@@ -10460,7 +11234,7 @@ async def _handle_postdownload_pitch_shift(
 
     await query.edit_message_text(f"Aplicando cambio de tono ({intensity_label})...")
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             output_filename = f"pitch_{user_id}_{correlation_id}.mp3"
             output_path = temp_mgr.get_temp_path(output_filename)
@@ -10469,10 +11243,10 @@ async def _handle_postdownload_pitch_shift(
                 f"[{correlation_id}] Applying pitch shift ({intensity}) for user {user_id}"
             )
             try:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 effects = AudioEffects(str(file_path), str(output_path))
                 await asyncio.wait_for(
-                    loop.run_in_executor(None, effects.pitch_shift, intensity),
+                    loop.run_in_executor(MEDIA_EXECUTOR, effects.pitch_shift, intensity),
                     timeout=config.PROCESSING_TIMEOUT,
                 )
             except asyncio.TimeoutError as e:
@@ -10531,17 +11305,17 @@ async def _handle_postdownload_treble_boost(
 
     await query.edit_message_text(f"Aplicando Treble Boost (intensidad {intensity})...")
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             output_filename = f"treble_boosted_{user_id}_{correlation_id}.mp3"
             output_path = temp_mgr.get_temp_path(output_filename)
 
             logger.info(f"[{correlation_id}] Applying treble boost (intensity {intensity}) for user {user_id}")
             try:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 enhancer = AudioEnhancer(str(file_path), str(output_path))
                 success = await asyncio.wait_for(
-                    loop.run_in_executor(None, lambda: enhancer.treble_boost(intensity)),
+                    loop.run_in_executor(MEDIA_EXECUTOR, lambda: enhancer.treble_boost(intensity)),
                     timeout=config.PROCESSING_TIMEOUT
                 )
                 if not success:
@@ -10550,12 +11324,10 @@ async def _handle_postdownload_treble_boost(
                 raise ProcessingTimeoutError("El procesamiento tardó demasiado") from e
 
             logger.info(f"[{correlation_id}] Sending treble boosted audio to user {user_id}")
-            with open(output_path, "rb") as audio_file:
-                await query.message.reply_audio(
-                    audio=audio_file,
-                    filename=f"treble_boosted_{correlation_id}.mp3",
-                    title=f"Treble Boost (Intensidad {intensity})"
-                )
+            await query.message.reply_audio(
+                audio=await _read_upload_file(output_path, filename=f"treble_boosted_{correlation_id}.mp3"),
+                title=f"Treble Boost (Intensidad {intensity})"
+            )
 
             reply_markup = _get_postdownload_audio_keyboard(correlation_id)
             await query.message.reply_text(
@@ -10626,17 +11398,17 @@ async def _handle_postdownload_denoise(
 
     await query.edit_message_text(f"Reduciendo ruido (intensidad {strength_es})...")
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             output_filename = f"denoised_{user_id}_{correlation_id}.mp3"
             output_path = temp_mgr.get_temp_path(output_filename)
 
             logger.info(f"[{correlation_id}] Applying denoise (strength {strength}) for user {user_id}")
             try:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 effects = AudioEffects(str(file_path), str(output_path))
                 success = await asyncio.wait_for(
-                    loop.run_in_executor(None, lambda: effects.denoise(strength)),
+                    loop.run_in_executor(MEDIA_EXECUTOR, lambda: effects.denoise(strength)),
                     timeout=config.PROCESSING_TIMEOUT
                 )
                 if not success:
@@ -10645,12 +11417,10 @@ async def _handle_postdownload_denoise(
                 raise ProcessingTimeoutError("El procesamiento tardó demasiado") from e
 
             logger.info(f"[{correlation_id}] Sending denoised audio to user {user_id}")
-            with open(output_path, "rb") as audio_file:
-                await query.message.reply_audio(
-                    audio=audio_file,
-                    filename=f"denoised_{correlation_id}.mp3",
-                    title=f"Audio Sin Ruido ({strength_es.capitalize()})"
-                )
+            await query.message.reply_audio(
+                audio=await _read_upload_file(output_path, filename=f"denoised_{correlation_id}.mp3"),
+                title=f"Audio Sin Ruido ({strength_es.capitalize()})"
+            )
 
             reply_markup = _get_postdownload_audio_keyboard(correlation_id)
             await query.message.reply_text(
@@ -10678,17 +11448,17 @@ async def _handle_postdownload_compress(
 
     await query.edit_message_text(f"Comprimiendo audio (intensidad {strength_es})...")
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             output_filename = f"compressed_{user_id}_{correlation_id}.mp3"
             output_path = temp_mgr.get_temp_path(output_filename)
 
             logger.info(f"[{correlation_id}] Applying compression (strength {strength}) for user {user_id}")
             try:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 effects = AudioEffects(str(file_path), str(output_path))
                 success = await asyncio.wait_for(
-                    loop.run_in_executor(None, lambda: effects.compress(strength)),
+                    loop.run_in_executor(MEDIA_EXECUTOR, lambda: effects.compress(strength)),
                     timeout=config.PROCESSING_TIMEOUT
                 )
                 if not success:
@@ -10697,12 +11467,10 @@ async def _handle_postdownload_compress(
                 raise ProcessingTimeoutError("El procesamiento tardó demasiado") from e
 
             logger.info(f"[{correlation_id}] Sending compressed audio to user {user_id}")
-            with open(output_path, "rb") as audio_file:
-                await query.message.reply_audio(
-                    audio=audio_file,
-                    filename=f"compressed_{correlation_id}.mp3",
-                    title=f"Audio Comprimido ({strength_es.capitalize()})"
-                )
+            await query.message.reply_audio(
+                audio=await _read_upload_file(output_path, filename=f"compressed_{correlation_id}.mp3"),
+                title=f"Audio Comprimido ({strength_es.capitalize()})"
+            )
 
             reply_markup = _get_postdownload_audio_keyboard(correlation_id)
             await query.message.reply_text(
@@ -10802,7 +11570,7 @@ async def _schedule_image_batch_menu(
     chat = message.chat
 
     if not media_group_id:
-        correlation_id = str(uuid.uuid4())[:8]
+        correlation_id = token_hex(4)
         await _send_image_menu_message(
             context.application,
             chat,
@@ -10822,7 +11590,7 @@ async def _schedule_image_batch_menu(
             "file_ids": [],
             "user_id": user_id,
             "chat": chat,
-            "correlation_id": str(uuid.uuid4())[:8],
+            "correlation_id": token_hex(4),
             "last_message_id": message.message_id,
             "debounce_task": None,
             "truncated": False,
@@ -11078,7 +11846,7 @@ async def _add_images_to_group_session(
         session["file_ids"].append(file_id)
         added_count += 1
 
-    session["last_activity"] = asyncio.get_event_loop().time()
+    session["last_activity"] = asyncio.get_running_loop().time()
 
     if added_count == 0 and truncated:
         await update.message.reply_text(
@@ -11109,7 +11877,7 @@ async def _schedule_image_group_batch(
         return
 
     session["pending_album_ids"].append(file_id)
-    session["last_activity"] = asyncio.get_event_loop().time()
+    session["last_activity"] = asyncio.get_running_loop().time()
 
     debounce_task = session.get("debounce_task")
     if debounce_task and not debounce_task.done():
@@ -11167,7 +11935,7 @@ async def _try_collect_caption_for_group_session(
         return False
 
     session["caption"] = _truncate_telegram_caption(text)
-    session["last_activity"] = asyncio.get_event_loop().time()
+    session["last_activity"] = asyncio.get_running_loop().time()
 
     image_count = len(session["file_ids"])
     status_text = (
@@ -11218,7 +11986,7 @@ async def handle_image_group_callback(
         await query.edit_message_text("No hay una sesión de agrupación activa.")
         return
 
-    correlation_id = session.get("correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = session.get("correlation_id", token_hex(4))
 
     if action == "cancel":
         context.user_data.pop("image_group_session", None)
@@ -11278,7 +12046,7 @@ async def handle_photo(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         context: Telegram context object
     """
     user_id = update.effective_user.id
-    correlation_id = str(uuid.uuid4())[:8]
+    correlation_id = token_hex(4)
     logger.info(f"[{correlation_id}] Photo received from user {user_id}")
 
     # Get the largest photo size
@@ -11309,7 +12077,7 @@ async def handle_image_document(update: Update, context: ContextTypes.DEFAULT_TY
         context: Telegram context object
     """
     user_id = update.effective_user.id
-    correlation_id = str(uuid.uuid4())[:8]
+    correlation_id = token_hex(4)
     logger.info(f"[{correlation_id}] Image document received from user {user_id}")
 
     document = update.message.document
@@ -11358,7 +12126,7 @@ async def handle_image_menu_callback(update: Update, context: ContextTypes.DEFAU
     # Retrieve file_id from context
     file_ids = context.user_data.get("image_menu_file_ids") or []
     file_id = context.user_data.get("image_menu_file_id")
-    correlation_id = context.user_data.get("image_menu_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("image_menu_correlation_id", token_hex(4))
 
     if not file_id:
         logger.error(f"[{correlation_id}] No file_id found in context for user {user_id}")
@@ -11534,7 +12302,7 @@ async def _handle_image_menu_info(
 
     await query.edit_message_text("Obteniendo información de la imagen...")
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             input_filename = f"image_info_{user_id}_{correlation_id}.img"
             input_path = temp_mgr.get_temp_path(input_filename)
@@ -11613,7 +12381,7 @@ async def handle_image_compress_callback(update: Update, context: ContextTypes.D
 
     # Retrieve file info
     file_id = context.user_data.get("image_menu_file_id")
-    correlation_id = context.user_data.get("image_menu_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("image_menu_correlation_id", token_hex(4))
 
     if not file_id:
         await query.edit_message_text("Error: no se encontró la imagen. Intenta de nuevo.")
@@ -11622,7 +12390,7 @@ async def handle_image_compress_callback(update: Update, context: ContextTypes.D
     logger.info(f"[{correlation_id}] Compressing image at quality {quality} for user {user_id}")
     await query.edit_message_text(f"Comprimiendo imagen (calidad {quality}%)...")
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             input_filename = f"image_compress_input_{user_id}_{correlation_id}.img"
             output_filename = f"compressed_{user_id}_{correlation_id}.jpg"
@@ -11635,10 +12403,10 @@ async def handle_image_compress_callback(update: Update, context: ContextTypes.D
             await _download_with_retry(file, input_path, correlation_id=correlation_id)
 
             # Compress
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             success, error = await asyncio.wait_for(
                 loop.run_in_executor(
-                    None,
+                    MEDIA_EXECUTOR,
                     lambda: ImageProcessor.compress(str(input_path), str(output_path), quality=quality)
                 ),
                 timeout=config.PROCESSING_TIMEOUT
@@ -11654,14 +12422,12 @@ async def handle_image_compress_callback(update: Update, context: ContextTypes.D
             reduction = (1 - compressed_size / original_size) * 100 if original_size > 0 else 0
 
             # Send compressed image
-            with open(output_path, "rb") as img_file:
-                await query.message.reply_document(
-                    document=img_file,
-                    filename=f"comprimida_{correlation_id}.jpg",
-                    caption=f"✅ Comprimida al {quality}%\n"
-                            f"📦 {_format_size(original_size)} → {_format_size(compressed_size)} "
-                            f"({reduction:.0f}% menos)"
-                )
+            await query.message.reply_document(
+                document=await _read_upload_file(output_path, filename=f"comprimida_{correlation_id}.jpg"),
+                caption=f"✅ Comprimida al {quality}%\n"
+                        f"📦 {_format_size(original_size)} → {_format_size(compressed_size)} "
+                        f"({reduction:.0f}% menos)"
+            )
 
             reply_markup = _get_image_post_menu_keyboard(correlation_id)
             await query.message.reply_text(
@@ -11713,7 +12479,7 @@ async def handle_image_convert_callback(update: Update, context: ContextTypes.DE
 
     # Retrieve file info
     file_id = context.user_data.get("image_menu_file_id")
-    correlation_id = context.user_data.get("image_menu_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("image_menu_correlation_id", token_hex(4))
 
     if not file_id:
         await query.edit_message_text("Error: no se encontró la imagen. Intenta de nuevo.")
@@ -11723,7 +12489,7 @@ async def handle_image_convert_callback(update: Update, context: ContextTypes.DE
     logger.info(f"[{correlation_id}] Converting image to {target_format} for user {user_id}")
     await query.edit_message_text(f"Convirtiendo a {target_format.upper()}...")
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             input_filename = f"image_convert_input_{user_id}_{correlation_id}.img"
             output_filename = f"convertida_{user_id}_{correlation_id}{fmt_info['ext']}"
@@ -11736,10 +12502,10 @@ async def handle_image_convert_callback(update: Update, context: ContextTypes.DE
             await _download_with_retry(file, input_path, correlation_id=correlation_id)
 
             # Convert format
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             success, error = await asyncio.wait_for(
                 loop.run_in_executor(
-                    None,
+                    MEDIA_EXECUTOR,
                     lambda: ImageProcessor.convert_format(str(input_path), str(output_path), target_format)
                 ),
                 timeout=config.PROCESSING_TIMEOUT
@@ -11757,12 +12523,10 @@ async def handle_image_convert_callback(update: Update, context: ContextTypes.DE
                 caption += f"\n📦 {_format_size(original_size)} → {_format_size(new_size)}"
 
             # Send converted image
-            with open(output_path, "rb") as img_file:
-                await query.message.reply_document(
-                    document=img_file,
-                    filename=f"convertida_{correlation_id}{fmt_info['ext']}",
-                    caption=caption
-                )
+            await query.message.reply_document(
+                document=await _read_upload_file(output_path, filename=f"convertida_{correlation_id}{fmt_info['ext']}"),
+                caption=caption
+            )
 
             reply_markup = _get_image_post_menu_keyboard(correlation_id)
             await query.message.reply_text(
@@ -11811,7 +12575,7 @@ async def handle_image_resize_callback(update: Update, context: ContextTypes.DEF
 
     # Retrieve file info
     file_id = context.user_data.get("image_menu_file_id")
-    correlation_id = context.user_data.get("image_menu_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("image_menu_correlation_id", token_hex(4))
 
     if not file_id:
         await query.edit_message_text("Error: no se encontró la imagen. Intenta de nuevo.")
@@ -11820,7 +12584,7 @@ async def handle_image_resize_callback(update: Update, context: ContextTypes.DEF
     logger.info(f"[{correlation_id}] Resizing image to {percentage}% for user {user_id}")
     await query.edit_message_text(f"Redimensionando imagen al {percentage}%...")
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             input_filename = f"image_resize_input_{user_id}_{correlation_id}.img"
             output_filename = f"redimensionada_{user_id}_{correlation_id}.jpg"
@@ -11836,10 +12600,10 @@ async def handle_image_resize_callback(update: Update, context: ContextTypes.DEF
             orig_info = ImageProcessor.get_image_info(str(input_path))
 
             # Resize
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             success, error = await asyncio.wait_for(
                 loop.run_in_executor(
-                    None,
+                    MEDIA_EXECUTOR,
                     lambda: ImageProcessor.resize(str(input_path), str(output_path), percentage=percentage)
                 ),
                 timeout=config.PROCESSING_TIMEOUT
@@ -11859,12 +12623,10 @@ async def handle_image_resize_callback(update: Update, context: ContextTypes.DEF
             )
 
             # Send resized image
-            with open(output_path, "rb") as img_file:
-                await query.message.reply_document(
-                    document=img_file,
-                    filename=f"redimensionada_{correlation_id}.jpg",
-                    caption=caption
-                )
+            await query.message.reply_document(
+                document=await _read_upload_file(output_path, filename=f"redimensionada_{correlation_id}.jpg"),
+                caption=caption
+            )
 
             reply_markup = _get_image_post_menu_keyboard(correlation_id)
             await query.message.reply_text(
@@ -11907,7 +12669,7 @@ async def handle_image_enhance_callback(update: Update, context: ContextTypes.DE
         single_id = context.user_data.get("image_menu_file_id")
         file_ids = [single_id] if single_id else []
 
-    correlation_id = context.user_data.get("image_menu_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("image_menu_correlation_id", token_hex(4))
 
     if not file_ids:
         await query.edit_message_text("Error: no se encontraron imágenes. Intenta de nuevo.")
@@ -11932,10 +12694,10 @@ async def handle_image_enhance_callback(update: Update, context: ContextTypes.DE
         f"Mejorando {count} imagen(es) con perfil {profile_label}..."
     )
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             enhanced_paths = []
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
 
             for idx, file_id in enumerate(file_ids, start=1):
                 if count > 1:
@@ -11963,7 +12725,7 @@ async def handle_image_enhance_callback(update: Update, context: ContextTypes.DE
 
                 success, error = await asyncio.wait_for(
                     loop.run_in_executor(
-                        None,
+                        MEDIA_EXECUTOR,
                         lambda inp=str(input_path), out=str(output_path), prof=profile: (
                             ImageProcessor.enhance(inp, out, prof)
                         ),
@@ -12046,7 +12808,7 @@ async def handle_image_noise_callback(update: Update, context: ContextTypes.DEFA
         single_id = context.user_data.get("image_menu_file_id")
         file_ids = [single_id] if single_id else []
 
-    correlation_id = context.user_data.get("image_menu_correlation_id", str(uuid.uuid4())[:8])
+    correlation_id = context.user_data.get("image_menu_correlation_id", token_hex(4))
 
     if not file_ids:
         await query.edit_message_text("Error: no se encontraron imágenes. Intenta de nuevo.")
@@ -12071,10 +12833,10 @@ async def handle_image_noise_callback(update: Update, context: ContextTypes.DEFA
         f"Naturalizando {count} imagen(es) ({strength_label})..."
     )
 
-    with TempManager() as temp_mgr:
+    async with TempManager() as temp_mgr:
         try:
             processed_paths = []
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
 
             for idx, file_id in enumerate(file_ids, start=1):
                 if count > 1:
@@ -12102,7 +12864,7 @@ async def handle_image_noise_callback(update: Update, context: ContextTypes.DEFA
 
                 success, error = await asyncio.wait_for(
                     loop.run_in_executor(
-                        None,
+                        MEDIA_EXECUTOR,
                         lambda inp=str(input_path), out=str(output_path), lvl=strength: (
                             ImageProcessor.add_noise(inp, out, lvl)
                         ),
@@ -2,6 +2,7 @@
 
 Provides functionality to merge multiple video files into a single continuous video.
 """
+import json
 import shutil
 import subprocess
 import logging
@@ -21,13 +22,15 @@ class VideoJoiner:
     or re-encodes to a common format when videos have incompatible codecs.
     """
 
-    def __init__(self, output_path: str):
+    def __init__(self, output_path: str, threads: int = 0):
         """Initialize video joiner.
 
         Args:
             output_path: Path for the joined output video
+            threads: ffmpeg -threads value per process (0 lets ffmpeg decide)
         """
         self.output_path = Path(output_path)
+        self.threads = threads
         self._input_videos: List[str] = []
 
     @staticmethod
@@ -48,6 +51,10 @@ class VideoJoiner:
         """
         return shutil.which("ffprobe") is not None
 
+    def _threads_args(self) -> List[str]:
+        """Return the ffmpeg thread-limit arguments, if a limit is set."""
+        return ["-threads", str(self.threads)] if self.threads > 0 else []
+
     def add_video(self, video_path: str) -> None:
         """Add a video to the join list.
 
@@ -81,56 +88,41 @@ class VideoJoiner:
             logger.error("ffprobe is not installed or not in PATH")
             raise VideoJoinError("ffprobe no está disponible")
 
-        # Get video codec
-        video_cmd = [
-            "ffprobe",
-            "-v", "error",
-            "-select_streams", "v:0",
-            "-show_entries", "stream=codec_name",
-            "-of", "csv=p=0",
-            video_path,
-        ]
-
-        # Get audio codec
-        audio_cmd = [
+        # Read both stream codecs and the container in one ffprobe run
+        cmd = [
             "ffprobe",
             "-v", "error",
-            "-select_streams", "a:0",
-            "-show_entries", "stream=codec_name",
-            "-of", "csv=p=0",
-            video_path,
-        ]
-
-        # Get container format
-        format_cmd = [
-            "ffprobe",
-            "-v", "error",
-            "-show_entries", "format=format_name",
-            "-of", "csv=p=0",
+            "-show_entries", "stream=codec_type,codec_name:format=format_name",
+            "-of", "json",
             video_path,
         ]
 
         try:
-            video_result = subprocess.run(
-                video_cmd, capture_output=True, text=True, check=True
-            )
-            video_codec = video_result.stdout.strip() or "unknown"
-
-            audio_result = subprocess.run(
-                audio_cmd, capture_output=True, text=True, check=False
-            )
-            audio_codec = audio_result.stdout.strip() or "none"
-
-            format_result = subprocess.run(
-                format_cmd, capture_output=True, text=True, check=True
+            result = subprocess.run(
+                cmd, capture_output=True, text=True, check=True
             )
-            container_format = format_result.stdout.strip() or "unknown"
-
-            return video_codec, audio_codec, container_format
-
+            info = json.loads(result.stdout or "{}")
         except subprocess.CalledProcessError as e:
             logger.error(f"ffprobe failed: {e.stderr}")
             raise VideoJoinError("No pude analizar el formato del video") from e
+        except json.JSONDecodeError as e:
+            logger.error(f"Could not parse ffprobe output for {video_path}: {e}")
+            raise VideoJoinError("No pude analizar el formato del video") from e
+
+        video_codec = "unknown"
+        audio_codec = "none"
+        seen_video = seen_audio = False
+        for stream in info.get("streams", []):
+            codec_type = stream.get("codec_type")
+            if codec_type == "video" and not seen_video:
+                video_codec = stream.get("codec_name") or "unknown"
+                seen_video = True
+            elif codec_type == "audio" and not seen_audio:
+                audio_codec = stream.get("codec_name") or "none"
+                seen_audio = True
+        container_format = info.get("format", {}).get("format_name") or "unknown"
+
+        return video_codec, audio_codec, container_format
 
     def _need_normalization(self) -> bool:
         """Check if videos need format normalization before concatenation.
@@ -208,6 +200,7 @@ class VideoJoiner:
                 "-b:a", "128k",  # Audio bitrate
                 "-movflags", "+faststart",  # Web optimization
                 "-pix_fmt", "yuv420p",  # Pixel format for compatibility
+                *self._threads_args(),  # Bound per-process CPU usage
                 str(output_path),
             ]
 
@@ -312,6 +305,7 @@ class VideoJoiner:
                 cmd.extend(["-c", "copy"])
 
             cmd.extend([
+                *self._threads_args(),  # Bound per-process CPU usage
                 "-movflags", "+faststart",  # Web optimization
                 str(self.output_path),
             ])
@@ -337,6 +331,25 @@ class VideoJoiner:
             logger.error(f"Unexpected error during video joining: {e}")
             raise VideoJoinError("Error inesperado al unir los videos") from e
 
+    def join_from_list(self, video_paths: List[str]) -> bool:
+        """Add all videos and join them in a single call.
+
+        Meant to be dispatched once to an executor so the per-file existence
+        checks in add_video don't run on the caller's thread.
+
+        Args:
+            video_paths: Paths of the videos to join, in order
+
+        Returns:
+            True if join succeeded
+
+        Raises:
+            VideoJoinError: If a video is missing or joining fails
+        """
+        for video_path in video_paths:
+            self.add_video(video_path)
+        return self.join_videos()
+
     def get_input_count(self) -> int:
         """Get the number of videos currently in the join list.
 
@@ -69,6 +69,8 @@ from bot.handlers import (
     handle_image_noise_callback,
     # YouTube menu handler
     handle_youtube_menu_callback,
+    start_session_sweeper,
+    close_download_session,
 )
 from bot.error_handler import error_handler
 from bot.temp_manager import active_temp_managers
@@ -109,6 +111,11 @@ def main() -> None:
     # Create the Application (cloud API or local Bot API server)
     application = create_application()
 
+    # Reclaim abandoned join sessions and their temp files
+    application.post_init = start_session_sweeper
+    # Close the keep-alive connections shared by file downloads
+    application.post_shutdown = close_download_session
+
     # Add handlers
     application.add_handler(CommandHandler("start", start))
 
@@ -218,13 +225,15 @@ def main() -> None:
     application.add_handler(CallbackQueryHandler(handle_youtube_menu_callback, pattern="^youtube:"))
 
     # Join session button handlers (for done/cancel buttons)
-    application.add_handler(CallbackQueryHandler(handle_join_video_callback, pattern="^join_video_action:"))
-    application.add_handler(CallbackQueryHandler(handle_join_audio_callback, pattern="^join_audio_action:"))
+    # Non-blocking like /done: "Unir" runs the whole join, and a /cancel must
+    # still reach a join that is running
+    application.add_handler(CallbackQueryHandler(handle_join_video_callback, pattern="^join_video_action:", block=False))
+    application.add_handler(CallbackQueryHandler(handle_join_audio_callback, pattern="^join_audio_action:", block=False))
 
     # /done and /cancel are shared between video join and audio join
     # The handlers check context.user_data to determine which session is active
     # Priority: video join session > audio join session
-    application.add_handler(CommandHandler("done", handle_join_done))
+    application.add_handler(CommandHandler("done", handle_join_done, block=False))
     application.add_handler(CommandHandler("cancel", handle_join_cancel))
 
     application.add_handler(MessageHandler(filters.VIDEO, handle_video))
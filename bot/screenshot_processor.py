@@ -198,7 +198,7 @@ class ScreenshotProcessor:
 
         try:
             # Run in executor to not block the event loop
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             await loop.run_in_executor(
                 None,
                 lambda: subprocess.run(cmd, capture_output=True, text=True, check=True)
@@ -4,10 +4,11 @@ Provides functionality to split videos by duration or number of parts.
 """
 import shutil
 import subprocess
+import tempfile
 import logging
 import os
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional
 
 from bot.error_handler import VideoSplitError
 
@@ -23,15 +24,25 @@ class VideoSplitter:
     - Time range: Extract segment from start_time to end_time
     """
 
-    def __init__(self, input_path: str, output_dir: str):
+    def __init__(
+        self,
+        input_path: str,
+        output_dir: str,
+        duration: Optional[float] = None,
+        threads: int = 0,
+    ):
         """Initialize video splitter.
 
         Args:
             input_path: Path to input video file
             output_dir: Directory for output segments
+            duration: Known video duration in seconds, skips the ffprobe call
+            threads: ffmpeg -threads value per process (0 lets ffmpeg decide)
         """
         self.input_path = Path(input_path)
         self.output_dir = Path(output_dir)
+        self.duration = duration
+        self.threads = threads
         self._basename = self.input_path.stem
         self._ext = self.input_path.suffix
 
@@ -53,15 +64,25 @@ class VideoSplitter:
         """
         return shutil.which("ffprobe") is not None
 
+    def _threads_args(self) -> List[str]:
+        """Return the ffmpeg thread-limit arguments, if a limit is set."""
+        return ["-threads", str(self.threads)] if self.threads > 0 else []
+
     def get_video_duration(self) -> float:
         """Get total video duration using ffprobe.
 
+        The result is kept on the instance, so repeated calls (and the split
+        methods that need the duration) only probe once.
+
         Returns:
             Duration in seconds
 
         Raises:
             VideoSplitError: If ffprobe is not available or fails
         """
+        if self.duration is not None:
+            return self.duration
+
         if not self._check_ffprobe():
             logger.error("ffprobe is not installed or not in PATH")
             raise VideoSplitError("ffprobe no está disponible")
@@ -88,6 +109,7 @@ class VideoSplitter:
             )
             duration = float(result.stdout.strip())
             logger.debug(f"Video duration: {duration} seconds")
+            self.duration = duration
             return duration
 
         except subprocess.CalledProcessError as e:
@@ -140,6 +162,7 @@ class VideoSplitter:
             "-segment_time", str(segment_duration),  # Segment duration
             "-f", "segment",  # Use segment muxer
             "-reset_timestamps", "1",  # Reset timestamps at each segment
+            *self._threads_args(),  # Bound per-process CPU usage
             str(output_pattern),  # Output pattern
         ]
 
@@ -168,6 +191,102 @@ class VideoSplitter:
             logger.error(f"Unexpected error during video splitting: {e}")
             raise VideoSplitError("Error inesperado al dividir el video") from e
 
+    def iter_split_by_duration(self, segment_duration: int) -> Iterator[str]:
+        """Split video by duration, yielding each segment as ffmpeg finishes it.
+
+        The segment muxer reports every completed file on stdout, so callers
+        can start uploading early segments while later ones are still being
+        written. Closing the iterator early stops ffmpeg.
+
+        Args:
+            segment_duration: Duration of each segment in seconds (must be >= 5)
+
+        Yields:
+            Path of each completed segment file, in order
+
+        Raises:
+            VideoSplitError: If splitting fails
+        """
+        if segment_duration < 5:
+            raise VideoSplitError("La duración mínima por segmento es 5 segundos")
+
+        if not self._check_ffmpeg():
+            logger.error("ffmpeg is not installed or not in PATH")
+            raise VideoSplitError("ffmpeg no está disponible")
+
+        if not self.input_path.exists():
+            logger.error(f"Input file not found: {self.input_path}")
+            raise VideoSplitError(f"Archivo no encontrado: {self.input_path}")
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        output_pattern = self.output_dir / f"{self._basename}_part%03d{self._ext}"
+
+        cmd = [
+            "ffmpeg",
+            "-y",  # Overwrite output if exists
+            "-i", str(self.input_path),  # Input file
+            "-c", "copy",  # Copy streams without re-encoding
+            "-map", "0",  # Map all streams from input
+            "-segment_time", str(segment_duration),  # Segment duration
+            "-f", "segment",  # Use segment muxer
+            "-reset_timestamps", "1",  # Reset timestamps at each segment
+            "-segment_list", "pipe:1",  # Announce each finished segment on stdout
+            "-segment_list_type", "flat",  # One bare filename per line
+            *self._threads_args(),  # Bound per-process CPU usage
+            str(output_pattern),  # Output pattern
+        ]
+
+        logger.debug(f"Running ffmpeg: {' '.join(cmd)}")
+        # stderr goes to a temp file so a chatty ffmpeg can't fill the pipe
+        # while we are blocked reading stdout
+        with tempfile.TemporaryFile(mode="w+") as stderr_file:
+            try:
+                process = subprocess.Popen(
+                    cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True
+                )
+            except OSError as e:
+                logger.error(f"Could not start ffmpeg: {e}")
+                raise VideoSplitError("Error inesperado al dividir el video") from e
+
+            count = 0
+            try:
+                for line in process.stdout:
+                    name = line.strip()
+                    if name:
+                        count += 1
+                        yield str(self.output_dir / name)
+                returncode = process.wait()
+            finally:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                process.stdout.close()
+
+            if returncode != 0:
+                stderr_file.seek(0)
+                logger.error(f"ffmpeg failed with code {returncode}")
+                logger.error(f"ffmpeg stderr: {stderr_file.read()}")
+                raise VideoSplitError("Error dividiendo el video por duración")
+
+        logger.info(f"Video split into {count} segments by duration")
+
+    def expected_segment_count(self, segment_duration: int) -> int:
+        """Probe the duration and compute how many segments a split would produce.
+
+        Args:
+            segment_duration: Duration of each segment in seconds
+
+        Returns:
+            Expected number of segments
+
+        Raises:
+            VideoSplitError: If the duration probe fails
+        """
+        duration = self.get_video_duration()
+        return int(duration // segment_duration) + (
+            1 if duration % segment_duration > 0 else 0
+        )
+
     def split_by_parts(self, num_parts: int) -> List[str]:
         """Split video into specified number of equal parts.
 
@@ -225,6 +344,7 @@ class VideoSplitter:
             "-segment_time", str(segment_duration),  # Calculated segment duration
             "-f", "segment",  # Use segment muxer
             "-reset_timestamps", "1",  # Reset timestamps at each segment
+            *self._threads_args(),  # Bound per-process CPU usage
             str(output_pattern),  # Output pattern
         ]
 
@@ -313,6 +433,7 @@ class VideoSplitter:
             "-b:a", "128k",  # Audio bitrate
             "-pix_fmt", "yuv420p",  # Pixel format for compatibility
             "-movflags", "+faststart",  # Web optimization
+            *self._threads_args(),  # Bound per-process CPU usage
             str(output_path),
         ]
 
@@ -1,4 +1,5 @@
 """Temporary file manager for video processing."""
+import asyncio
 import glob
 import os
 import shutil
@@ -47,7 +48,8 @@ class TempManager:
             self.temp_dir = tempfile.mkdtemp(prefix="videonote_")
             logger.debug(f"Created temp directory: {self.temp_dir}")
 
-        self._tracked_files: List[str] = []
+        # Insertion-ordered set: dedupe in O(1) however many files a session holds
+        self._tracked_files: dict[str, None] = {}
 
         # Register in active managers set
         active_temp_managers.add(self)
@@ -98,7 +100,7 @@ class TempManager:
             file_path: Path to the file to track
         """
         if file_path not in self._tracked_files:
-            self._tracked_files.append(file_path)
+            self._tracked_files[file_path] = None
             logger.debug(f"Tracking file: {file_path}")
 
     def get_tracked_files(self) -> List[str]:
@@ -107,7 +109,7 @@ class TempManager:
         Returns:
             List of tracked file paths
         """
-        return self._tracked_files.copy()
+        return list(self._tracked_files)
 
     def clear_tracked_files(self) -> None:
         """Clear the tracking list without deleting files.
@@ -138,14 +140,24 @@ class TempManager:
             except Exception:
                 pass
 
-        if os.path.exists(self.temp_dir):
-            try:
-                shutil.rmtree(self.temp_dir, ignore_errors=True)
-                logger.debug(f"Cleaned up temp directory: {self.temp_dir}")
-            except Exception as e:
-                logger.warning(f"Could not fully clean up temp directory {self.temp_dir}: {e}")
+        # rmtree walks the tree with os.scandir and unlinks relative to the
+        # directory fd; ignore_errors covers an already-removed directory, so
+        # no separate exists() stat is needed
+        try:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            logger.debug(f"Cleaned up temp directory: {self.temp_dir}")
+        except Exception as e:
+            logger.warning(f"Could not fully clean up temp directory {self.temp_dir}: {e}")
         self._tracked_files.clear()
 
+    async def cleanup_async(self) -> None:
+        """Run cleanup() in a worker thread so the event loop isn't blocked.
+
+        A single rmtree is used rather than concurrent per-file unlinks:
+        unlinks in one directory serialize on its inode lock anyway.
+        """
+        await asyncio.to_thread(self.cleanup)
+
     @classmethod
     def get_download_temp_dir(cls, correlation_id: str) -> str:
         """Create temp directory specifically for a download.
@@ -251,6 +263,15 @@ class TempManager:
         self.cleanup()
         return False  # Don't suppress exceptions
 
+    async def __aenter__(self):
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit async context manager - cleanup in a worker thread."""
+        await self.cleanup_async()
+        return False  # Don't suppress exceptions
+
 
 def cleanup_old_temp_directories(max_age_hours: int = 24) -> int:
     """Remove old temporary directories on startup.
@@ -3,11 +3,13 @@
 Provides validation functions to fail fast on invalid or problematic videos
 before processing. Validates file size, video integrity, and disk space.
 """
+import json
 import logging
 import os
 import shutil
 import subprocess
 import tempfile
+from dataclasses import dataclass
 from typing import Tuple, Optional
 
 logger = logging.getLogger(__name__)
@@ -279,43 +281,26 @@ def get_audio_duration(file_path: str) -> Tuple[Optional[float], Optional[str]]:
         return None, "Error al obtener la duración del audio"
 
 
-def validate_audio_file(file_path: str) -> Tuple[bool, Optional[str]]:
-    """Validate audio file integrity using ffprobe.
+def _probe_audio_integrity(file_path: str) -> Optional[str]:
+    """Check that a file has an audio stream with a positive duration.
 
-    Checks that the file exists, is not empty, and has valid audio streams
-    with a positive duration.
+    Stream type and container duration are read in a single ffprobe call.
 
     Args:
-        file_path: Path to the audio file to validate
+        file_path: Path to the audio file to probe
 
     Returns:
-        Tuple of (is_valid, error_message)
-        - is_valid: True if audio is valid, False otherwise
-        - error_message: None if valid, Spanish error message if invalid
+        None if the audio looks sound (or ffprobe is unavailable),
+        Spanish error message otherwise
     """
-    logger.debug(f"Validating audio file: {file_path}")
-
-    # Check file exists
-    if not os.path.exists(file_path):
-        logger.warning(f"Audio file does not exist: {file_path}")
-        return False, "El archivo de audio no existe"
-
-    # Check file is not empty
-    file_size = os.path.getsize(file_path)
-    if file_size == 0:
-        logger.warning(f"Audio file is empty: {file_path}")
-        return False, "El archivo de audio está vacío"
-
-    # Use ffprobe to validate audio integrity
     try:
-        # Check for audio stream existence
-        stream_result = subprocess.run(
+        result = subprocess.run(
             [
                 "ffprobe",
                 "-v", "error",
                 "-select_streams", "a:0",
-                "-show_entries", "stream=codec_type",
-                "-of", "default=noprint_wrappers=1:nokey=1",
+                "-show_entries", "stream=codec_type:format=duration",
+                "-of", "json",
                 file_path
             ],
             capture_output=True,
@@ -323,56 +308,125 @@ def validate_audio_file(file_path: str) -> Tuple[bool, Optional[str]]:
             timeout=30
         )
 
-        if stream_result.returncode != 0 or 'audio' not in stream_result.stdout.lower():
-            logger.warning(f"No audio stream found in {file_path}")
-            return False, "El archivo de audio parece estar corrupto"
-
-        # Get duration to verify file integrity
-        duration_result = subprocess.run(
-            [
-                "ffprobe",
-                "-v", "error",
-                "-select_streams", "a:0",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                file_path
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        if result.returncode != 0:
+            logger.warning(f"ffprobe failed for {file_path}: {result.stderr}")
+            return "El archivo de audio parece estar corrupto"
 
-        if duration_result.returncode != 0:
-            logger.warning(f"ffprobe failed for {file_path}: {duration_result.stderr}")
-            return False, "El archivo de audio parece estar corrupto"
+        info = json.loads(result.stdout or "{}")
+        streams = info.get("streams") or []
+        if not any(stream.get("codec_type") == "audio" for stream in streams):
+            logger.warning(f"No audio stream found in {file_path}")
+            return "El archivo de audio parece estar corrupto"
 
-        duration_str = duration_result.stdout.strip()
+        duration_str = (info.get("format") or {}).get("duration")
         if not duration_str:
             logger.warning(f"No duration info for {file_path}")
-            return False, "El archivo de audio parece estar corrupto"
+            return "El archivo de audio parece estar corrupto"
 
         try:
             duration = float(duration_str)
             if duration <= 0:
                 logger.warning(f"Invalid audio duration for {file_path}: {duration}")
-                return False, "El archivo de audio parece estar corrupto"
+                return "El archivo de audio parece estar corrupto"
         except ValueError:
             logger.warning(f"Invalid duration format for {file_path}: {duration_str}")
-            return False, "El archivo de audio parece estar corrupto"
+            return "El archivo de audio parece estar corrupto"
 
         logger.debug(f"Audio validation passed for {file_path} (duration: {duration:.2f}s)")
-        return True, None
+        return None
 
     except FileNotFoundError:
         # ffprobe not available - log warning but don't fail
         logger.warning("ffprobe not found, skipping audio integrity validation")
-        return True, None
+        return None
     except subprocess.TimeoutExpired:
         logger.warning(f"ffprobe timed out for {file_path}")
-        return False, "El archivo de audio parece estar corrupto"
+        return "El archivo de audio parece estar corrupto"
     except Exception as e:
         logger.warning(f"Error validating audio {file_path}: {e}")
-        return False, "El archivo de audio parece estar corrupto"
+        return "El archivo de audio parece estar corrupto"
+
+
+def validate_audio_file(file_path: str) -> Tuple[bool, Optional[str]]:
+    """Validate audio file integrity using ffprobe.
+
+    Checks that the file exists, is not empty, and has valid audio streams
+    with a positive duration.
+
+    Args:
+        file_path: Path to the audio file to validate
+
+    Returns:
+        Tuple of (is_valid, error_message)
+        - is_valid: True if audio is valid, False otherwise
+        - error_message: None if valid, Spanish error message if invalid
+    """
+    logger.debug(f"Validating audio file: {file_path}")
+
+    # Check file exists
+    if not os.path.exists(file_path):
+        logger.warning(f"Audio file does not exist: {file_path}")
+        return False, "El archivo de audio no existe"
+
+    # Check file is not empty
+    file_size = os.path.getsize(file_path)
+    if file_size == 0:
+        logger.warning(f"Audio file is empty: {file_path}")
+        return False, "El archivo de audio está vacío"
+
+    error_msg = _probe_audio_integrity(file_path)
+    return error_msg is None, error_msg
+
+
+@dataclass(frozen=True)
+class AudioPreflight:
+    """Result of the post-download checks for an audio file.
+
+    Attributes:
+        size_bytes: Size of the downloaded file (0 if it does not exist)
+        error: None if the file can be processed, Spanish error message otherwise
+    """
+
+    size_bytes: int
+    error: Optional[str] = None
+
+
+def preflight_audio(
+    file_path: str, space_multiplier: int = 1, size_bytes: Optional[int] = None
+) -> AudioPreflight:
+    """Run the post-download checks for an audio file in one pass.
+
+    Probes the file's integrity with a single ffprobe call and checks free
+    disk space for processing it. The file is only stat'ed when the caller
+    does not already know its size.
+
+    Args:
+        file_path: Path to the downloaded audio file
+        space_multiplier: Number of intermediate outputs the caller will write
+        size_bytes: Exact size reported by the download, if known
+
+    Returns:
+        AudioPreflight with the file size and the first failed check, if any
+    """
+    if size_bytes is None:
+        try:
+            size_bytes = os.stat(file_path).st_size
+        except FileNotFoundError:
+            logger.warning(f"Audio file does not exist: {file_path}")
+            return AudioPreflight(0, "El archivo de audio no existe")
+
+    if size_bytes == 0:
+        logger.warning(f"Audio file is empty: {file_path}")
+        return AudioPreflight(0, "El archivo de audio está vacío")
+
+    error_msg = _probe_audio_integrity(file_path)
+    if error_msg:
+        return AudioPreflight(size_bytes, error_msg)
+
+    size_mb = size_bytes / (1024 * 1024)
+    required_space = estimate_required_space(int(size_mb)) * space_multiplier
+    _, space_error = check_disk_space(required_space)
+    return AudioPreflight(size_bytes, space_error)
 
 
 def validate_audio_duration(file_path: str, max_minutes: int) -> Tuple[bool, Optional[str]]:
@@ -416,6 +470,8 @@ __all__ = [
     "validate_video_file",
     "validate_audio_file",
     "validate_audio_duration",
+    "AudioPreflight",
+    "preflight_audio",
     "get_audio_duration",
     "check_disk_space",
     "estimate_required_space",
@@ -134,8 +134,8 @@ class TestMergeJoinWithDocument:
             "bot.handlers.asyncio.get_event_loop"
         ) as loop_mock:
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             def resolve_path(name):
                 if name.startswith("merge_video"):
                     return str(video_path)
@@ -161,46 +161,71 @@ class TestMergeJoinWithDocument:
                 await handle_merge_audio_received(update, mock_context)
 
         mock_context.bot.get_file.assert_any_await("merge-doc-id")
+        update.message.reply_video.assert_awaited_once()
+        assert update.message.reply_video.await_args.kwargs["video"].filename == "merged.mp4"
 
     @pytest.mark.asyncio
-    async def test_join_downloads_document_file_id(self, mock_update, mock_context):
+    async def test_join_queues_document_file_id(self, mock_update, mock_context):
         mock_update.message = SimpleNamespace(
             audio=None,
             document=_document(file_id="join-doc-id"),
             reply_text=AsyncMock(),
         )
 
-        temp_mgr = MagicMock()
-        temp_mgr.get_temp_path.return_value = "/tmp/join_audio.mp3"
-        temp_mgr.track_file = MagicMock()
-
         session = {
             "audios": [],
-            "temp_mgr": temp_mgr,
+            "total_bytes": 0,
+            "temp_mgr": MagicMock(),
             "last_activity": 0,
         }
         mock_context.user_data["join_audio_session"] = session
 
-        mock_context.bot.get_file = AsyncMock(return_value=MagicMock())
+        with patch("bot.handlers.config") as cfg, patch(
+            "bot.handlers.time.monotonic", return_value=100
+        ):
+            cfg.JOIN_SESSION_TIMEOUT = 3600
+            cfg.JOIN_MAX_AUDIO_FILES = 20
+            cfg.JOIN_MIN_AUDIO_FILES = 2
+            cfg.max_incoming_audio_file_size_mb = 20
+
+            await handle_join_audio_file(mock_update, mock_context)
+
+        # Downloads are deferred to /done
+        mock_context.bot.get_file.assert_not_awaited()
+        assert session["audios"] == [
+            {"file_id": "join-doc-id", "file_unique_id": "uniq-doc", "size": 1024}
+        ]
+        assert session["total_bytes"] == 1024
+
+    @pytest.mark.asyncio
+    async def test_join_refuses_audio_that_would_not_fit_on_disk(self, mock_update, mock_context):
+        mock_update.message = SimpleNamespace(
+            audio=None,
+            document=_document(file_id="join-doc-id"),
+            reply_text=AsyncMock(),
+        )
+        session = {
+            "audios": [],
+            "total_bytes": 0,
+            "temp_mgr": MagicMock(),
+            "last_activity": 0,
+        }
+        mock_context.user_data["join_audio_session"] = session
 
         with patch("bot.handlers.config") as cfg, patch(
-            "bot.handlers.asyncio.get_event_loop"
-        ) as loop_mock, patch(
-            "bot.handlers._download_with_retry", new_callable=AsyncMock
+            "bot.handlers.time.monotonic", return_value=100
         ), patch(
-            "bot.handlers.validate_audio_file", return_value=(True, None)
+            "bot.handlers.check_disk_space", return_value=(False, "Espacio insuficiente en disco")
         ):
             cfg.JOIN_SESSION_TIMEOUT = 3600
             cfg.JOIN_MAX_AUDIO_FILES = 20
-            cfg.MAX_AUDIO_FILE_SIZE_MB = 20
-            loop = MagicMock()
-            loop.time.return_value = 100
-            loop_mock.return_value = loop
+            cfg.max_incoming_audio_file_size_mb = 20
 
             await handle_join_audio_file(mock_update, mock_context)
 
-        mock_context.bot.get_file.assert_awaited_once_with("join-doc-id")
-        assert len(session["audios"]) == 1
+        mock_update.message.reply_text.assert_awaited_once_with("Espacio insuficiente en disco")
+        assert session["audios"] == []
+        assert session["total_bytes"] == 0
 
     @pytest.mark.asyncio
     async def test_join_rejects_non_audio_document(self, mock_update, mock_context):
@@ -224,13 +249,10 @@ class TestMergeJoinWithDocument:
         mock_context.user_data["join_audio_session"] = session
 
         with patch("bot.handlers.config") as cfg, patch(
-            "bot.handlers.asyncio.get_event_loop"
-        ) as loop_mock:
+            "bot.handlers.time.monotonic", return_value=100
+        ):
             cfg.JOIN_SESSION_TIMEOUT = 3600
             cfg.JOIN_MAX_AUDIO_FILES = 20
-            loop = MagicMock()
-            loop.time.return_value = 100
-            loop_mock.return_value = loop
 
             await handle_join_audio_file(mock_update, mock_context)
 
@@ -0,0 +1,66 @@
+"""Unit tests for audio format detection and the no-op conversion check."""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from bot.audio_format_converter import audio_format_from_mime_type, detect_audio_format_fast
+from bot.handlers import handle_format_selection
+
+
+class TestDetectAudioFormatFast:
+    @pytest.mark.parametrize("head, expected", [
+        (b"ID3\x04\x00\x00\x00\x00\x00\x00", "mp3"),
+        (b"\xff\xfb\x90\x64\x00\x00", "mp3"),
+        (b"\xff\xf1\x50\x80\x02\x1f", "aac"),
+        (b"OggS\x00\x02\x00\x00", "ogg"),
+        (b"RIFF\x24\x08\x00\x00WAVEfmt ", "wav"),
+        (b"fLaC\x00\x00\x00\x22", "flac"),
+    ])
+    def test_known_headers_skip_ffprobe(self, tmp_path, head, expected):
+        path = tmp_path / "input.bin"
+        path.write_bytes(head + b"\x00" * 32)
+
+        with patch("bot.audio_format_converter.subprocess.run") as run_mock:
+            assert detect_audio_format_fast(str(path)) == expected
+        run_mock.assert_not_called()
+
+    def test_unknown_header_falls_back_to_ffprobe(self, tmp_path):
+        path = tmp_path / "input.m4a"
+        path.write_bytes(b"\x00\x00\x00\x20ftypM4A " + b"\x00" * 32)
+
+        with patch("bot.audio_format_converter.detect_audio_format", return_value=None) as probe:
+            assert detect_audio_format_fast(str(path)) is None
+        probe.assert_called_once_with(str(path))
+
+    def test_missing_file_returns_none(self, tmp_path):
+        assert detect_audio_format_fast(str(tmp_path / "missing.mp3")) is None
+
+
+class TestAudioFormatFromMimeType:
+    def test_known_and_unknown_types(self):
+        assert audio_format_from_mime_type("audio/mpeg") == "mp3"
+        assert audio_format_from_mime_type("Audio/X-WAV") == "wav"
+        assert audio_format_from_mime_type("audio/mp4") is None
+        assert audio_format_from_mime_type(None) is None
+
+
+class TestSameFormatShortCircuit:
+    @pytest.mark.asyncio
+    async def test_same_format_skips_download(self):
+        query = SimpleNamespace(data="format:mp3", answer=AsyncMock(), edit_message_text=AsyncMock())
+        update = SimpleNamespace(effective_user=SimpleNamespace(id=42), callback_query=query)
+        context = SimpleNamespace(
+            user_data={
+                "convert_audio_file_id": "file-id",
+                "convert_audio_correlation_id": "corr",
+                "convert_audio_input_format": "mp3",
+            },
+            bot=SimpleNamespace(get_file=AsyncMock()),
+        )
+
+        await handle_format_selection(update, context)
+
+        context.bot.get_file.assert_not_awaited()
+        assert context.user_data == {}
+        assert "ya está en formato MP3" in query.edit_message_text.await_args.args[0]
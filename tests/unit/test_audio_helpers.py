@@ -77,4 +77,19 @@ class TestGetMessageAudioSource:
 
     def test_returns_none_for_unrelated_document(self):
         message = _message(document=_document("notes.txt", mime_type="text/plain"))
-        assert _get_message_audio_source(message) == (None, None, None)
\ No newline at end of file
+        assert _get_message_audio_source(message) == (None, None, None)
+
+class TestIntensityCallbacks:
+    def test_table_covers_exactly_the_keyboard_buttons(self):
+        from bot.handlers import BASS_INTENSITY_KEYBOARD, INTENSITY_CALLBACKS, TREBLE_INTENSITY_KEYBOARD
+
+        buttons = {
+            button.callback_data
+            for keyboard in (BASS_INTENSITY_KEYBOARD, TREBLE_INTENSITY_KEYBOARD)
+            for row in keyboard.inline_keyboard[:2]
+            for button in row
+        }
+
+        assert set(INTENSITY_CALLBACKS) == buttons
+        assert INTENSITY_CALLBACKS["treble:10"] == ("treble", 10)
+        assert "bass:11" not in INTENSITY_CALLBACKS
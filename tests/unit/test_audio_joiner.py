@@ -0,0 +1,110 @@
+"""Unit tests for AudioJoiner probing and command construction."""
+import io
+import json
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bot.audio_joiner import AudioJoiner
+from bot.error_handler import AudioJoinError
+
+
+def _joiner(tmp_path, *names):
+    joiner = AudioJoiner(str(tmp_path / "out" / "joined.mp3"))
+    for name in names:
+        path = tmp_path / name
+        path.write_bytes(b"x")
+        joiner.add_audio(str(path))
+    return joiner
+
+
+class TestJoinAudios:
+    def test_mismatched_codecs_join_in_one_reencode_pass(self, tmp_path):
+        joiner = _joiner(tmp_path, "a.mp3", "b.ogg")
+        done = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+
+        with patch.object(AudioJoiner, "_check_ffmpeg", return_value=True), \
+                patch.object(AudioJoiner, "_need_normalization", return_value=True), \
+                patch("bot.audio_joiner.subprocess.run", return_value=done) as run_mock:
+            assert joiner.join_audios() is True
+
+        run_mock.assert_called_once()
+        cmd = run_mock.call_args.args[0]
+        assert cmd.count("-i") == 2
+        assert "[0:a:0][1:a:0]concat=n=2:v=0:a=1[out]" in cmd
+        assert not (tmp_path / "out" / "join_audio_temp").exists()
+
+    def test_compatible_codecs_use_stream_copy(self, tmp_path):
+        joiner = _joiner(tmp_path, "a.mp3", "b.mp3")
+        done = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+
+        with patch.object(AudioJoiner, "_check_ffmpeg", return_value=True), \
+                patch.object(AudioJoiner, "_need_normalization", return_value=False), \
+                patch("bot.audio_joiner.subprocess.run", return_value=done) as run_mock:
+            assert joiner.join_audios() is True
+
+        cmd = run_mock.call_args.args[0]
+        assert cmd[cmd.index("-c") + 1] == "copy"
+        concat_list = (tmp_path / "out" / "join_audio_temp" / "concat_list.txt").read_text()
+        assert concat_list.count("file '") == 2
+
+
+def _probe(codec, sample_rate, channels, format_name="mp3"):
+    payload = {
+        "streams": [{"codec_name": codec, "sample_rate": sample_rate, "channels": channels}],
+        "format": {"format_name": format_name},
+    }
+    return subprocess.CompletedProcess(args=[], returncode=0, stdout=json.dumps(payload), stderr="")
+
+
+class TestNeedNormalization:
+    def test_single_ffprobe_call_per_file(self, tmp_path):
+        joiner = _joiner(tmp_path, "a.mp3", "b.mp3")
+        with patch.object(AudioJoiner, "_check_ffprobe", return_value=True), \
+                patch("bot.audio_joiner.subprocess.run", return_value=_probe("mp3", "44100", 2)) as run_mock:
+            assert joiner._need_normalization() is False
+
+        assert run_mock.call_count == 2
+
+    def test_sample_rate_mismatch_needs_reencode(self, tmp_path):
+        joiner = _joiner(tmp_path, "a.mp3", "b.mp3")
+        probes = [_probe("mp3", "44100", 2), _probe("mp3", "22050", 1)]
+        with patch.object(AudioJoiner, "_check_ffprobe", return_value=True), \
+                patch("bot.audio_joiner.subprocess.run", side_effect=probes):
+            assert joiner._need_normalization() is True
+
+
+class TestJoinProgress:
+    def _popen(self, stdout: str, returncode: int):
+        process = MagicMock()
+        process.stdout = io.StringIO(stdout)
+        process.wait.return_value = returncode
+        process.poll.return_value = returncode
+        return process
+
+    def test_reports_fraction_of_total_duration(self, tmp_path):
+        joiner = _joiner(tmp_path, "a.mp3", "b.ogg")
+        joiner._durations = {path: 10.0 for path in joiner._input_audios}
+        process = self._popen("out_time_us=5000000\nprogress=continue\nout_time_us=20000000\n", 0)
+        reported = []
+
+        with patch.object(AudioJoiner, "_check_ffmpeg", return_value=True), \
+                patch.object(AudioJoiner, "_need_normalization", return_value=True) as check_mock, \
+                patch("bot.audio_joiner.subprocess.Popen", return_value=process) as popen_mock:
+            assert joiner.join_audios(reported.append) is True
+
+        assert reported == [0.25, 1.0]
+        check_mock.assert_called_once_with(probe_all=True)
+        cmd = popen_mock.call_args.args[0]
+        assert cmd[cmd.index("-progress") + 1] == "pipe:1"
+        assert cmd[-1] == str(joiner.output_path)
+
+    def test_ffmpeg_failure_raises(self, tmp_path):
+        joiner = _joiner(tmp_path, "a.mp3", "b.ogg")
+
+        with patch.object(AudioJoiner, "_check_ffmpeg", return_value=True), \
+                patch.object(AudioJoiner, "_need_normalization", return_value=True), \
+                patch("bot.audio_joiner.subprocess.Popen", return_value=self._popen("", 1)):
+            with pytest.raises(AudioJoinError):
+                joiner.join_audios(lambda fraction: None)
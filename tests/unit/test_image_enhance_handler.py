@@ -62,8 +62,8 @@ class TestHandleImageEnhanceCallback:
             return_value=(True, None),
         ):
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.side_effect = lambda name: f"/tmp/{name}"
             temp_mgr_cls.return_value = temp_mgr
 
@@ -88,8 +88,8 @@ class TestHandleImageEnhanceCallback:
             "bot.handlers.asyncio.wait_for", wait_for_mock
         ), patch("builtins.open", MagicMock()):
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.side_effect = lambda name: f"/tmp/{name}"
             temp_mgr_cls.return_value = temp_mgr
 
@@ -112,8 +112,8 @@ class TestHandleImageEnhanceCallback:
             return_value="La mejora tardó demasiado. Intenta con menos imágenes o más pequeñas.",
         ):
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.side_effect = lambda name: f"/tmp/{name}"
             temp_mgr_cls.return_value = temp_mgr
 
@@ -144,8 +144,8 @@ class TestHandleImageEnhanceCallback:
             side_effect=lambda exc: exc.message,
         ):
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.side_effect = lambda name: f"/tmp/{name}"
             temp_mgr_cls.return_value = temp_mgr
 
@@ -177,8 +177,8 @@ class TestHandleImageEnhanceCallback:
             return_value=(True, None),
         ), patch("builtins.open", mock_open(read_data=b"jpg")):
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.side_effect = lambda name: f"/tmp/{name}"
             temp_mgr_cls.return_value = temp_mgr
 
@@ -199,8 +199,8 @@ class TestHandleImageEnhanceCallback:
             "bot.handlers.asyncio.wait_for", side_effect=asyncio.TimeoutError()
         ):
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.side_effect = lambda name: f"/tmp/{name}"
             temp_mgr_cls.return_value = temp_mgr
 
@@ -235,8 +235,8 @@ class TestHandleImageEnhanceCallback:
             side_effect=lambda exc: exc.message,
         ):
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.side_effect = lambda name: f"/tmp/{name}"
             temp_mgr_cls.return_value = temp_mgr
 
@@ -0,0 +1,399 @@
+"""Unit tests for video join session bookkeeping."""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from telegram.error import NetworkError
+
+from bot.handlers import (
+    JOIN_VIDEO_BUSY_MESSAGE,
+    JoinSession,
+    _active_join_session,
+    _background_tasks,
+    _download_join_audios,
+    _drop_invalid_join_videos,
+    _fire_and_forget_cleanup,
+    handle_join_audio_cancel,
+    handle_join_audio_done,
+    handle_join_audio_file,
+    handle_join_cancel,
+    handle_join_done,
+    handle_join_video,
+    sweep_expired_sessions,
+)
+
+
+def _done(result):
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(result)
+    return future
+
+
+class TestDropInvalidJoinVideos:
+    @pytest.mark.asyncio
+    async def test_invalid_videos_are_removed_from_all_lists(self):
+        session = JoinSession(
+            temp_mgr=MagicMock(),
+            paths=["a.mp4", "b.mp4", "c.mp4"],
+            sizes=[1, 2, 3],
+            durations=[10, 20, 30],
+            validations=[None, _done((False, "El archivo de video está vacío")), _done((True, None))],
+        )
+
+        rejected = await _drop_invalid_join_videos(session, 42)
+
+        assert rejected == [(2, "El archivo de video está vacío")]
+        assert session.paths == ["a.mp4", "c.mp4"]
+        assert session.sizes == [1, 3]
+        assert session.durations == [10, 30]
+        assert session.validations == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_validation_errors_count_as_rejections(self):
+        failed = asyncio.get_running_loop().create_future()
+        failed.set_exception(RuntimeError("ffprobe crashed"))
+        session = JoinSession(
+            temp_mgr=MagicMock(), paths=["a.mp4"], sizes=[1], durations=[0], validations=[failed]
+        )
+
+        rejected = await _drop_invalid_join_videos(session, 42)
+
+        assert rejected == [(1, "No pude validar el video")]
+        assert session.paths == []
+
+
+class TestSweepExpiredSessions:
+    @pytest.mark.asyncio
+    async def test_only_idle_sessions_are_removed(self):
+        stale = JoinSession(temp_mgr=MagicMock(cleanup_async=AsyncMock()), last_activity=100.0)
+        fresh = {"temp_mgr": MagicMock(cleanup_async=AsyncMock()), "last_activity": 950.0}
+        user_data = {
+            1: {"join_session": stale, "other": "kept"},
+            2: {"join_audio_session": fresh},
+        }
+
+        with patch("bot.handlers.config", SimpleNamespace(JOIN_SESSION_TIMEOUT=300)):
+            removed = await sweep_expired_sessions(user_data, now=1000.0)
+
+        assert removed == 1
+        stale.temp_mgr.cleanup_async.assert_awaited_once()
+        fresh["temp_mgr"].cleanup_async.assert_not_awaited()
+        assert user_data[1] == {"other": "kept"}
+        assert "join_audio_session" in user_data[2]
+
+    @pytest.mark.asyncio
+    async def test_sessions_with_a_running_join_are_kept(self):
+        running = asyncio.get_running_loop().create_future()
+        video = JoinSession(temp_mgr=MagicMock(cleanup_async=AsyncMock()), last_activity=100.0, task=running)
+        audio = {"temp_mgr": MagicMock(cleanup_async=AsyncMock()), "last_activity": 100.0, "task": running}
+        user_data = {1: {"join_session": video}, 2: {"join_audio_session": audio}}
+
+        with patch("bot.handlers.config", SimpleNamespace(JOIN_SESSION_TIMEOUT=300)):
+            removed = await sweep_expired_sessions(user_data, now=1000.0)
+
+        assert removed == 0
+        video.temp_mgr.cleanup_async.assert_not_awaited()
+        audio["temp_mgr"].cleanup_async.assert_not_awaited()
+        running.cancel()
+
+
+class TestFireAndForgetCleanup:
+    @pytest.mark.asyncio
+    async def test_cleanup_runs_in_background(self):
+        temp_mgr = MagicMock()
+        temp_mgr.cleanup_async = AsyncMock()
+
+        _fire_and_forget_cleanup(temp_mgr)
+        temp_mgr.cleanup_async.assert_not_awaited()
+        await asyncio.gather(*_background_tasks)
+
+        temp_mgr.cleanup_async.assert_awaited_once()
+
+
+class TestActiveJoinSession:
+    def test_video_session_takes_priority(self):
+        video, audio = JoinSession(temp_mgr=MagicMock()), {"audios": []}
+        user_data = {"join_session": video, "join_audio_session": audio}
+
+        assert _active_join_session(user_data) == ("video", video)
+
+    def test_audio_session_and_none(self):
+        audio = {"audios": []}
+
+        assert _active_join_session({"join_audio_session": audio}) == ("audio", audio)
+        assert _active_join_session({}) == (None, None)
+
+
+class TestCancelInFlightJoin:
+    @pytest.mark.asyncio
+    async def test_cancel_stops_running_join_task(self):
+        join_task = asyncio.create_task(asyncio.sleep(60))
+        temp_mgr = MagicMock()
+        temp_mgr.cleanup_async = AsyncMock()
+        session = JoinSession(temp_mgr=temp_mgr, paths=["a.mp4", "b.mp4"], task=join_task)
+        message = SimpleNamespace(reply_text=AsyncMock())
+        update = SimpleNamespace(
+            effective_user=SimpleNamespace(id=42),
+            message=message,
+            callback_query=None,
+        )
+        context = SimpleNamespace(user_data={"join_session": session})
+
+        await handle_join_cancel(update, context)
+        await asyncio.gather(*_background_tasks)
+
+        with pytest.raises(asyncio.CancelledError):
+            await join_task
+        assert "join_session" not in context.user_data
+        temp_mgr.cleanup_async.assert_awaited_once()
+        message.reply_text.assert_awaited_once()
+
+
+class TestJoinSession:
+    def test_is_slotted(self):
+        session = JoinSession(temp_mgr=MagicMock())
+
+        assert not hasattr(session, "__dict__")
+        with pytest.raises(AttributeError):
+            session.videos = []
+
+
+class TestCancelDispatch:
+    @pytest.mark.asyncio
+    async def test_audio_session_is_delegated(self):
+        update = SimpleNamespace(
+            effective_user=SimpleNamespace(id=42),
+            message=SimpleNamespace(reply_text=AsyncMock()),
+            callback_query=None,
+        )
+        context = SimpleNamespace(user_data={"join_audio_session": {"audios": []}})
+
+        with patch("bot.handlers.handle_join_audio_cancel", new=AsyncMock()) as audio_cancel:
+            await handle_join_cancel(update, context)
+
+        audio_cancel.assert_awaited_once_with(update, context)
+        update.message.reply_text.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_repeated_no_session_cancel_replies_once(self):
+        update = SimpleNamespace(
+            effective_user=SimpleNamespace(id=42),
+            message=SimpleNamespace(reply_text=AsyncMock()),
+            callback_query=None,
+        )
+        context = SimpleNamespace(user_data={})
+
+        await handle_join_cancel(update, context)
+        await handle_join_cancel(update, context)
+
+        update.message.reply_text.assert_awaited_once()
+
+
+class TestDoubleDone:
+    @pytest.mark.asyncio
+    async def test_second_done_does_not_start_another_join(self):
+        running = asyncio.create_task(asyncio.sleep(60))
+        session = JoinSession(temp_mgr=MagicMock(), paths=["a.mp4", "b.mp4"], task=running)
+        update = SimpleNamespace(
+            effective_user=SimpleNamespace(id=42),
+            message=SimpleNamespace(reply_text=AsyncMock()),
+            callback_query=None,
+        )
+        context = SimpleNamespace(user_data={"join_session": session})
+
+        with patch("bot.handlers._drop_invalid_join_videos", new=AsyncMock()) as drop:
+            await handle_join_done(update, context)
+
+        drop.assert_not_awaited()
+        assert session.task is running
+        assert context.user_data["join_session"] is session
+        update.message.reply_text.assert_awaited_once_with(JOIN_VIDEO_BUSY_MESSAGE)
+        running.cancel()
+
+    @pytest.mark.asyncio
+    async def test_video_sent_during_join_is_not_queued(self):
+        running = asyncio.create_task(asyncio.sleep(60))
+        session = JoinSession(temp_mgr=MagicMock(), paths=["a.mp4", "b.mp4"], task=running)
+        update = SimpleNamespace(
+            effective_user=SimpleNamespace(id=42),
+            message=SimpleNamespace(reply_text=AsyncMock()),
+        )
+        context = SimpleNamespace(user_data={"join_session": session})
+
+        with patch("bot.handlers._download_with_retry", new=AsyncMock()) as download:
+            await handle_join_video(update, context)
+
+        download.assert_not_awaited()
+        assert session.paths == ["a.mp4", "b.mp4"]
+        update.message.reply_text.assert_awaited_once_with(JOIN_VIDEO_BUSY_MESSAGE)
+        running.cancel()
+
+
+class TestDownloadJoinAudios:
+    @pytest.mark.asyncio
+    async def test_downloads_in_parallel_and_drops_failures(self, tmp_path):
+        in_flight = peak = 0
+
+        async def download(file, path):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if file.file_id == "bad":
+                raise RuntimeError("network down")
+
+        temp_mgr = MagicMock()
+        temp_mgr.get_temp_path.side_effect = lambda name: tmp_path / name
+        session = {
+            "audios": [
+                {"file_id": file_id, "file_unique_id": file_id, "size": 1}
+                for file_id in ("a", "bad", "c", "d")
+            ],
+            "total_bytes": 4,
+            "temp_mgr": temp_mgr,
+        }
+        bot = SimpleNamespace(get_file=AsyncMock(side_effect=lambda file_id: SimpleNamespace(file_id=file_id)))
+
+        with patch("bot.handlers._download_with_retry", new=download), \
+                patch("bot.handlers.validate_audio_file", return_value=(True, None)), \
+                patch("bot.handlers.config", SimpleNamespace(JOIN_AUDIO_DOWNLOAD_CONCURRENCY=3)):
+            rejected = await _download_join_audios(bot, session, 42)
+
+        assert peak == 3
+        assert rejected == [(2, "No pude descargar el audio")]
+        assert [source["file_id"] for source in session["audios"]] == ["a", "c", "d"]
+        assert session["total_bytes"] == 3
+        assert session["audios"][0]["path"] == str(tmp_path / "join_audio_42_01_a.mp3")
+
+    @pytest.mark.asyncio
+    async def test_already_downloaded_audios_are_skipped(self):
+        session = {
+            "audios": [{"file_id": "a", "file_unique_id": "a", "size": 1, "path": "/tmp/a.mp3"}],
+            "temp_mgr": MagicMock(),
+        }
+        bot = SimpleNamespace(get_file=AsyncMock())
+
+        with patch("bot.handlers.config", SimpleNamespace(JOIN_AUDIO_DOWNLOAD_CONCURRENCY=3)):
+            rejected = await _download_join_audios(bot, session, 42)
+
+        assert rejected == []
+        bot.get_file.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_same_file_sent_twice_is_downloaded_once(self, tmp_path):
+        temp_mgr = MagicMock()
+        temp_mgr.get_temp_path.side_effect = lambda name: tmp_path / name
+        session = {
+            "audios": [
+                {"file_id": "id-1", "file_unique_id": "same", "size": 1},
+                {"file_id": "id-2", "file_unique_id": "same", "size": 1},
+            ],
+            "temp_mgr": temp_mgr,
+        }
+        bot = SimpleNamespace(get_file=AsyncMock(return_value=MagicMock()))
+
+        with patch("bot.handlers._download_with_retry", new=AsyncMock()) as download_mock, \
+                patch("bot.handlers.validate_audio_file", return_value=(True, None)), \
+                patch("bot.handlers.config", SimpleNamespace(JOIN_AUDIO_DOWNLOAD_CONCURRENCY=3)):
+            rejected = await _download_join_audios(bot, session, 42)
+
+        assert rejected == []
+        download_mock.assert_awaited_once()
+        assert session["audios"][0]["path"] == session["audios"][1]["path"]
+
+
+class TestAudioJoinClaim:
+    def _session(self, task):
+        return {
+            "audios": [{"file_id": "a", "size": 1}, {"file_id": "b", "size": 1}],
+            "total_bytes": 2,
+            "temp_mgr": MagicMock(cleanup_async=AsyncMock()),
+            "last_activity": 100.0,
+            "task": task,
+        }
+
+    def _update(self):
+        return SimpleNamespace(
+            effective_user=SimpleNamespace(id=42),
+            message=SimpleNamespace(reply_text=AsyncMock(), audio=None, document=None),
+            callback_query=None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_second_done_does_not_start_another_join(self):
+        running = asyncio.create_task(asyncio.sleep(60))
+        session = self._session(running)
+        update = self._update()
+        context = SimpleNamespace(user_data={"join_audio_session": session}, bot=MagicMock())
+
+        with patch("bot.handlers._download_join_audios", new=AsyncMock()) as download, \
+                patch("bot.handlers.time.monotonic", return_value=100.0), \
+                patch("bot.handlers.check_disk_space", return_value=(True, None)):
+            await handle_join_audio_done(update, context)
+
+        download.assert_not_awaited()
+        assert session["task"] is running
+        update.message.reply_text.assert_awaited_once_with("Ya estoy uniendo tus audios, espera un momento.")
+        running.cancel()
+
+    @pytest.mark.asyncio
+    async def test_status_message_is_removed_when_download_is_cancelled(self):
+        session = self._session(None)
+        update = self._update()
+        status = MagicMock()
+        update.message.reply_text = AsyncMock(return_value=status)
+        context = SimpleNamespace(user_data={"join_audio_session": session}, bot=MagicMock())
+
+        with patch("bot.handlers._download_join_audios", new=AsyncMock(side_effect=asyncio.CancelledError)), \
+                patch("bot.handlers._safe_delete", new=AsyncMock()) as delete, \
+                patch("bot.handlers.time.monotonic", return_value=100.0), \
+                patch("bot.handlers.check_disk_space", return_value=(True, None)):
+            with pytest.raises(asyncio.CancelledError):
+                await handle_join_audio_done(update, context)
+            await asyncio.gather(*_background_tasks)
+
+        delete.assert_awaited_once_with(status)
+
+    @pytest.mark.asyncio
+    async def test_audio_sent_during_join_is_not_queued(self):
+        running = asyncio.create_task(asyncio.sleep(60))
+        session = self._session(running)
+        update = self._update()
+        context = SimpleNamespace(user_data={"join_audio_session": session})
+
+        with patch("bot.handlers.time.monotonic", return_value=100.0):
+            await handle_join_audio_file(update, context)
+
+        assert len(session["audios"]) == 2
+        update.message.reply_text.assert_awaited_once()
+        running.cancel()
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_running_audio_join(self):
+        running = asyncio.create_task(asyncio.sleep(60))
+        session = self._session(running)
+        update = self._update()
+        context = SimpleNamespace(user_data={"join_audio_session": session})
+
+        await handle_join_audio_cancel(update, context)
+
+        with pytest.raises(asyncio.CancelledError):
+            await running
+        assert "join_audio_session" not in context.user_data
+        await asyncio.gather(*_background_tasks)
+        session["temp_mgr"].cleanup_async.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cancel_reply_retries_transient_network_error(self):
+        session = self._session(None)
+        update = self._update()
+        update.message.reply_text = AsyncMock(side_effect=[NetworkError("reset"), None])
+        context = SimpleNamespace(user_data={"join_audio_session": session})
+
+        with patch("bot.handlers.asyncio.sleep", new=AsyncMock()):
+            await handle_join_audio_cancel(update, context)
+        await asyncio.gather(*_background_tasks)
+
+        assert update.message.reply_text.await_count == 2
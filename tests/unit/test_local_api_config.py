@@ -28,6 +28,10 @@ class TestLocalApiConfig:
                 TELEGRAM_LOCAL_MODE=True,
             )
 
+    def test_shared_fs_requires_local_mode(self):
+        with pytest.raises(ValueError, match="TELEGRAM_LOCAL_SHARED_FS"):
+            BotConfig(BOT_TOKEN="test-token", TELEGRAM_LOCAL_SHARED_FS=True)
+
     def test_local_mode_accepts_valid_base_url(self):
         config = BotConfig(
             BOT_TOKEN="test-token",
@@ -0,0 +1,225 @@
+"""Unit tests for parallel range downloads of Telegram files."""
+import asyncio
+from dataclasses import replace
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiohttp import web
+from telegram.error import RetryAfter
+from aiohttp.test_utils import TestServer
+
+from bot import handlers
+from bot.handlers import _download_in_ranges, _download_with_retry, handle_intensity_selection
+from bot.validators import AudioPreflight
+
+PAYLOAD = bytes(range(256)) * 200  # 51200 bytes
+
+
+async def _serve(honor_range: bool) -> TestServer:
+    async def _handler(request):
+        range_header = request.headers.get("Range")
+        if honor_range and range_header:
+            start, end = (int(x) for x in range_header.split("=")[1].split("-"))
+            return web.Response(status=206, body=PAYLOAD[start:end + 1])
+        return web.Response(body=PAYLOAD)
+
+    app = web.Application()
+    app.router.add_get("/file", _handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+class TestDownloadInRanges:
+    @pytest.mark.asyncio
+    async def test_reassembles_chunks_in_order(self, tmp_path):
+        server = await _serve(honor_range=True)
+        destination = tmp_path / "out.bin"
+        try:
+            with patch.object(handlers, "PARALLEL_DOWNLOAD_CHUNK_BYTES", 4096):
+                ok = await _download_in_ranges(
+                    str(server.make_url("/file")), str(destination), len(PAYLOAD)
+                )
+        finally:
+            await handlers.close_download_session()
+            await server.close()
+
+        assert ok is True
+        assert destination.read_bytes() == PAYLOAD
+
+    @pytest.mark.asyncio
+    async def test_returns_false_when_range_ignored(self, tmp_path):
+        server = await _serve(honor_range=False)
+        try:
+            with patch.object(handlers, "PARALLEL_DOWNLOAD_CHUNK_BYTES", 4096):
+                ok = await _download_in_ranges(
+                    str(server.make_url("/file")), str(tmp_path / "out.bin"), len(PAYLOAD)
+                )
+        finally:
+            await handlers.close_download_session()
+            await server.close()
+
+        assert ok is False
+
+
+class TestSharedDownloadSession:
+    @pytest.mark.asyncio
+    async def test_session_is_reused_until_closed(self):
+        first = handlers._get_download_session()
+        assert handlers._get_download_session() is first
+
+        await handlers.close_download_session()
+
+        assert first.closed
+        second = handlers._get_download_session()
+        assert second is not first
+        await handlers.close_download_session()
+
+
+class TestDownloadWithRetryFallback:
+    @pytest.mark.asyncio
+    async def test_falls_back_to_single_stream(self, tmp_path):
+        file = SimpleNamespace(
+            file_path="https://api.telegram.org/file/botTOKEN/videos/file_1.mp4",
+            file_size=handlers.PARALLEL_DOWNLOAD_MIN_BYTES,
+            download_to_drive=AsyncMock(),
+        )
+        with patch.object(handlers, "_download_in_ranges", AsyncMock(return_value=False)):
+            ok = await _download_with_retry(file, str(tmp_path / "out.mp4"))
+
+        assert ok is True
+        file.download_to_drive.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_small_files_skip_range_download(self, tmp_path):
+        file = SimpleNamespace(
+            file_path="https://api.telegram.org/file/botTOKEN/videos/file_1.mp4",
+            file_size=1024,
+            download_to_drive=AsyncMock(),
+        )
+        with patch.object(handlers, "_download_in_ranges", AsyncMock()) as ranges_mock:
+            await _download_with_retry(file, str(tmp_path / "out.mp4"))
+
+        ranges_mock.assert_not_awaited()
+        file.download_to_drive.assert_awaited_once()
+
+
+class TestDownloadConcurrencyLimit:
+    @pytest.mark.asyncio
+    async def test_downloads_share_global_slots(self, tmp_path):
+        in_flight = peak = 0
+
+        async def _slow_download(path):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        files = [
+            SimpleNamespace(file_path=None, file_size=1024, download_to_drive=_slow_download)
+            for _ in range(5)
+        ]
+        with patch.object(handlers, "DOWNLOAD_SEMAPHORE", asyncio.Semaphore(2)):
+            await asyncio.gather(*(
+                _download_with_retry(file, str(tmp_path / f"{i}.mp4")) for i, file in enumerate(files)
+            ))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_flood_wait_is_slept_out_and_retried(self, tmp_path):
+        file = SimpleNamespace(
+            file_path=None, file_size=1024, download_to_drive=AsyncMock(side_effect=[RetryAfter(timedelta(seconds=7)), None])
+        )
+        with patch("bot.handlers.asyncio.sleep", AsyncMock()) as sleep_mock:
+            ok = await _download_with_retry(file, str(tmp_path / "out.mp4"))
+
+        assert ok is True
+        sleep_mock.assert_awaited_once_with(7.0)
+
+
+class TestDownloadCache:
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self, tmp_path):
+        with patch.object(handlers, "_download_cache", handlers.OrderedDict()), \
+                patch.object(handlers, "_download_cache_dir", str(tmp_path / "cache")):
+            (tmp_path / "cache").mkdir()
+            yield
+
+    @staticmethod
+    def _file(file_unique_id="uniq1"):
+        async def _download(path):
+            with open(path, "wb") as f:
+                f.write(b"audio")
+
+        return SimpleNamespace(
+            file_path=None, file_size=5, file_unique_id=file_unique_id,
+            download_to_drive=AsyncMock(side_effect=_download),
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeat_download_reuses_cached_file(self, tmp_path):
+        file = self._file()
+        await _download_with_retry(file, str(tmp_path / "a.audio"), cache=True)
+        (tmp_path / "a.audio").unlink()  # job temp dir cleaned up
+        ok = await _download_with_retry(file, str(tmp_path / "b.audio"), cache=True)
+
+        assert ok is True
+        assert (tmp_path / "b.audio").read_bytes() == b"audio"
+        file.download_to_drive.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_downloaded_again(self, tmp_path):
+        file = self._file()
+        clock = SimpleNamespace(monotonic=lambda: 100.0)
+        with patch.object(handlers, "config", replace(handlers.config, DOWNLOAD_CACHE_TTL=1)), \
+                patch("bot.handlers.time", clock):
+            await _download_with_retry(file, str(tmp_path / "a.audio"), cache=True)
+            clock.monotonic = lambda: 102.0
+            await _download_with_retry(file, str(tmp_path / "b.audio"), cache=True)
+
+        assert file.download_to_drive.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unlinkable_download_is_not_cached(self, tmp_path):
+        file = self._file()
+        with patch("bot.handlers.os.link", side_effect=OSError(18, "Invalid cross-device link")):
+            ok = await _download_with_retry(file, str(tmp_path / "a.audio"), cache=True)
+
+        assert ok is True
+        assert not handlers._download_cache
+
+    @pytest.mark.asyncio
+    async def test_uncached_calls_always_download(self, tmp_path):
+        file = self._file()
+        await _download_with_retry(file, str(tmp_path / "a.audio"), cache=True)
+        await _download_with_retry(file, str(tmp_path / "b.audio"))
+
+        assert file.download_to_drive.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_second_boost_on_same_file_skips_download(self):
+        file = self._file()
+        context = MagicMock()
+        context.bot.get_file = AsyncMock(return_value=file)
+        context.bot.send_audio = AsyncMock()
+        update = MagicMock()
+        update.effective_user = SimpleNamespace(id=7)
+        update.effective_chat = SimpleNamespace(id=99)
+        update.callback_query.answer = AsyncMock()
+        update.callback_query.edit_message_text = AsyncMock()
+
+        with patch("bot.handlers.preflight_audio", return_value=AudioPreflight(5)), \
+                patch("bot.handlers.AudioEnhancer") as enhancer_cls, \
+                patch("bot.handlers._read_upload_file", AsyncMock(return_value=b"mp3")):
+            enhancer_cls.return_value.bass_boost.return_value = True
+            for data in ("bass:5", "bass:7"):
+                context.user_data = {"enhance_audio_file_id": "audio-file", "enhance_type": "bass"}
+                update.callback_query.data = data
+                await handle_intensity_selection(update, context)
+
+        assert context.bot.send_audio.await_count == 2
+        file.download_to_drive.assert_awaited_once()
@@ -54,14 +54,14 @@ class TestHandleAudioPitchSelectionDualSend:
         ), patch("bot.handlers.estimate_required_space", return_value=10), patch(
             "bot.handlers.Path"
         ) as path_cls, patch("bot.handlers.AudioEffects") as effects_cls, patch(
-            "bot.handlers.asyncio.get_event_loop"
+            "bot.handlers.asyncio.get_running_loop"
         ) as loop_mock, patch("builtins.open", mock_open(read_data=b"mp3")):
             path_instance = MagicMock()
             path_instance.stat.return_value = MagicMock(st_size=1024)
             path_cls.return_value = path_instance
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.side_effect = lambda name: f"/tmp/{name}"
             temp_mgr_cls.return_value = temp_mgr
 
@@ -90,15 +90,15 @@ class TestHandleAudioPitchSelectionDualSend:
         ), patch("bot.handlers.estimate_required_space", return_value=10), patch(
             "bot.handlers.Path"
         ) as path_cls, patch("bot.handlers.AudioEffects"), patch(
-            "bot.handlers.asyncio.get_event_loop"
+            "bot.handlers.asyncio.get_running_loop"
         ) as loop_mock, patch("builtins.open", mock_open(read_data=b"mp3")):
             path_instance = MagicMock()
             path_instance.stat.return_value = MagicMock(st_size=1024)
             path_cls.return_value = path_instance
 
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.side_effect = lambda name: f"/tmp/{name}"
             temp_mgr_cls.return_value = temp_mgr
 
@@ -125,15 +125,15 @@ class TestHandleAudioPitchSelectionDualSend:
         ), patch("bot.handlers.estimate_required_space", return_value=10), patch(
             "bot.handlers.Path"
         ) as path_cls, patch("bot.handlers.AudioEffects"), patch(
-            "bot.handlers.asyncio.get_event_loop"
+            "bot.handlers.asyncio.get_running_loop"
         ) as loop_mock:
             path_instance = MagicMock()
             path_instance.stat.return_value = MagicMock(st_size=1024)
             path_cls.return_value = path_instance
 
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.side_effect = lambda name: f"/tmp/{name}"
             temp_mgr_cls.return_value = temp_mgr
 
@@ -161,15 +161,15 @@ class TestHandleAudioPitchSelectionDualSend:
         ), patch("bot.handlers.estimate_required_space", return_value=10), patch(
             "bot.handlers.Path"
         ) as path_cls, patch("bot.handlers.AudioEffects"), patch(
-            "bot.handlers.asyncio.get_event_loop"
+            "bot.handlers.asyncio.get_running_loop"
         ) as loop_mock:
             path_instance = MagicMock()
             path_instance.stat.return_value = MagicMock(st_size=1024)
             path_cls.return_value = path_instance
 
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.side_effect = lambda name: f"/tmp/{name}"
             temp_mgr_cls.return_value = temp_mgr
 
@@ -192,14 +192,14 @@ class TestPostdownloadPitchShiftDualSend:
         with patch("bot.handlers.TempManager") as temp_mgr_cls, patch(
             "bot.handlers.Path"
         ) as path_cls, patch("bot.handlers.AudioEffects"), patch(
-            "bot.handlers.asyncio.get_event_loop"
+            "bot.handlers.asyncio.get_running_loop"
         ) as loop_mock, patch("builtins.open", mock_open(read_data=b"mp3")):
             path_instance = MagicMock()
             path_instance.stat.return_value = MagicMock(st_size=1024)
             path_cls.return_value = path_instance
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.return_value = "/tmp/out.mp3"
             temp_mgr_cls.return_value = temp_mgr
 
@@ -222,14 +222,14 @@ class TestPostdownloadPitchShiftDualSend:
         with patch("bot.handlers.TempManager") as temp_mgr_cls, patch(
             "bot.handlers.Path"
         ) as path_cls, patch("bot.handlers.AudioEffects"), patch(
-            "bot.handlers.asyncio.get_event_loop"
+            "bot.handlers.asyncio.get_running_loop"
         ) as loop_mock:
             path_instance = MagicMock()
             path_instance.stat.return_value = MagicMock(st_size=1024)
             path_cls.return_value = path_instance
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.return_value = "/tmp/out.mp3"
             temp_mgr_cls.return_value = temp_mgr
 
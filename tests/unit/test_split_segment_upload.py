@@ -0,0 +1,461 @@
+"""Unit tests for concurrent split segment uploads."""
+import asyncio
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from telegram.error import BadRequest, NetworkError, RetryAfter, TimedOut
+
+from bot.handlers import (
+    _fire_and_forget_delete,
+    _iter_segments_in_executor,
+    _job_cleanup,
+    _media_job_slot,
+    _read_upload_file,
+    _replace_status,
+    _safe_reply,
+    _send_split_segments,
+    _threaded_progress,
+)
+from bot.split_processor import VideoSplitter
+
+
+def _update():
+    update = MagicMock()
+    update.effective_user = SimpleNamespace(id=42)
+    update.message = MagicMock()
+    update.message.reply_video = AsyncMock()
+    update.message.reply_audio = AsyncMock()
+    update.message.reply_text = AsyncMock()
+    return update
+
+
+def _segments(tmp_path, count: int) -> list[str]:
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"part_{i}.mp4"
+        path.write_bytes(b"data")
+        paths.append(str(path))
+    return paths
+
+
+class TestSendSplitSegments:
+    @pytest.mark.asyncio
+    async def test_sends_every_segment_with_part_caption(self, tmp_path):
+        update = _update()
+        segments = _segments(tmp_path, 4)
+
+        await _send_split_segments(update, segments, "video", None, 42)
+
+        captions = sorted(
+            call.kwargs["caption"] for call in update.message.reply_video.await_args_list
+        )
+        assert captions == [f"Parte {i} de 4" for i in range(1, 5)]
+        update.message.reply_audio.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded_by_config(self, tmp_path):
+        update = _update()
+        segments = _segments(tmp_path, 6)
+        in_flight = 0
+        peak = 0
+
+        async def _slow_reply(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        update.message.reply_audio.side_effect = _slow_reply
+
+        with patch("bot.handlers.config", SimpleNamespace(UPLOAD_CONCURRENCY=2, TELEGRAM_LOCAL_SHARED_FS=False)):
+            await _send_split_segments(update, segments, "audio", None, 42)
+
+        assert update.message.reply_audio.await_count == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_next_segment_is_read_while_previous_uploads(self, tmp_path):
+        update = _update()
+        segments = _segments(tmp_path, 2)
+        events = []
+
+        async def _read(path):
+            events.append(f"read {path[-5]}")
+            return path
+
+        async def _slow_reply(**kwargs):
+            await asyncio.sleep(0.01)
+            events.append(f"upload end {kwargs['video'][-5]}")
+
+        update.message.reply_video.side_effect = _slow_reply
+
+        with patch("bot.handlers.config", SimpleNamespace(UPLOAD_CONCURRENCY=1)), \
+                patch("bot.handlers._read_upload_file", side_effect=_read):
+            await _send_split_segments(update, segments, "video", None, 42)
+
+        # Part 1 is read ahead before part 0's upload has released the slot
+        assert events.index("read 1") < events.index("upload end 0")
+
+    @pytest.mark.asyncio
+    async def test_read_ahead_is_one_segment(self, tmp_path):
+        update = _update()
+        segments = _segments(tmp_path, 6)
+        held = peak = 0
+
+        async def _read(path):
+            nonlocal held, peak
+            held += 1
+            peak = max(peak, held)
+            return path
+
+        async def _slow_reply(**kwargs):
+            nonlocal held
+            await asyncio.sleep(0.01)
+            held -= 1
+
+        update.message.reply_video.side_effect = _slow_reply
+
+        with patch("bot.handlers.config", SimpleNamespace(UPLOAD_CONCURRENCY=2)), \
+                patch("bot.handlers._read_upload_file", side_effect=_read):
+            await _send_split_segments(update, segments, "video", None, 42)
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_retries_once_after_flood_wait(self, tmp_path):
+        update = _update()
+        segments = _segments(tmp_path, 1)
+        update.message.reply_video.side_effect = [RetryAfter(0), None]
+
+        with patch("bot.handlers.asyncio.sleep", AsyncMock()) as sleep_mock:
+            await _send_split_segments(update, segments, "video", None, 42)
+
+        assert update.message.reply_video.await_count == 2
+        sleep_mock.assert_awaited_once()
+        update.message.reply_text.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_part_is_reported_without_aborting(self, tmp_path):
+        update = _update()
+        segments = _segments(tmp_path, 2)
+
+        async def _fail_first_part(**kwargs):
+            # Reads finish in any order, so fail by part rather than call order
+            if kwargs["caption"] == "Parte 1 de 2":
+                raise RuntimeError("boom")
+
+        update.message.reply_video.side_effect = _fail_first_part
+
+        with patch("bot.handlers.config", SimpleNamespace(UPLOAD_CONCURRENCY=1, TELEGRAM_LOCAL_SHARED_FS=False)):
+            await _send_split_segments(update, segments, "video", None, 42)
+
+        assert update.message.reply_video.await_count == 2
+        update.message.reply_text.assert_awaited_once_with("Error enviando la parte 1 de 2.")
+
+    @pytest.mark.asyncio
+    async def test_streamed_segments_use_given_total(self, tmp_path):
+        update = _update()
+        paths = _segments(tmp_path, 3)
+
+        async def _stream():
+            for path in paths:
+                yield path
+
+        sent = await _send_split_segments(update, _stream(), "video", None, 42, 3)
+
+        assert sent == 3
+        captions = sorted(
+            call.kwargs["caption"] for call in update.message.reply_video.await_args_list
+        )
+        assert captions == [f"Parte {i} de 3" for i in range(1, 4)]
+
+    @pytest.mark.asyncio
+    async def test_captions_are_corrected_when_stream_yields_fewer_parts(self, tmp_path):
+        update = _update()
+        paths = _segments(tmp_path, 2)
+        messages = {path: MagicMock(edit_caption=AsyncMock()) for path in paths}
+        update.message.reply_video.side_effect = lambda **kwargs: messages[kwargs["video"]]
+
+        async def _stream():
+            for path in paths:
+                yield path
+
+        with patch("bot.handlers._read_upload_file", AsyncMock(side_effect=lambda path: path)):
+            sent = await _send_split_segments(update, _stream(), "video", None, 42, 3)
+
+        assert sent == 2
+        messages[paths[0]].edit_caption.assert_awaited_once_with(caption="Parte 1 de 2")
+        messages[paths[1]].edit_caption.assert_awaited_once_with(caption="Parte 2 de 2")
+
+
+class TestIterSegmentsInExecutor:
+    @pytest.mark.asyncio
+    async def test_yields_items_from_blocking_iterator(self):
+        collected = [path async for path in _iter_segments_in_executor(iter(["a", "b"]))]
+        assert collected == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_worker_errors_propagate(self):
+        def _failing():
+            yield "a"
+            raise RuntimeError("ffmpeg died")
+
+        with pytest.raises(RuntimeError):
+            async for _ in _iter_segments_in_executor(_failing()):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_timeout_stops_ffmpeg(self, tmp_path):
+        source = tmp_path / "in.mp4"
+        source.write_bytes(b"x")
+        splitter = VideoSplitter(str(source), str(tmp_path / "out"))
+
+        class _SlowStdout:
+            def __iter__(self):
+                for i in range(100):
+                    time.sleep(0.05)
+                    yield f"in_part{i:03d}.mp4\n"
+
+            def close(self):
+                pass
+
+        process = MagicMock(stdout=_SlowStdout())
+        process.poll.return_value = None
+
+        with patch.object(splitter, "_check_ffmpeg", return_value=True), \
+                patch("bot.split_processor.subprocess.Popen", return_value=process), \
+                patch("bot.handlers.config", SimpleNamespace(PROCESSING_TIMEOUT=0.01)):
+            with pytest.raises(asyncio.TimeoutError):
+                async for _ in _iter_segments_in_executor(splitter.iter_split_by_duration(30)):
+                    pass
+
+        process.kill.assert_called_once()
+
+
+class TestReadUploadFile:
+    @pytest.mark.asyncio
+    async def test_returns_input_file_with_original_name(self, tmp_path):
+        path = tmp_path / "segment_003.mp4"
+        path.write_bytes(b"video-bytes")
+
+        input_file = await _read_upload_file(str(path))
+
+        assert input_file.input_file_content == b"video-bytes"
+        assert input_file.filename == "segment_003.mp4"
+
+    @pytest.mark.asyncio
+    async def test_custom_filename_is_kept_even_with_shared_local_api(self, tmp_path):
+        path = tmp_path / "out_123.mp3"
+        path.write_bytes(b"audio-bytes")
+
+        with patch("bot.handlers.config", SimpleNamespace(TELEGRAM_LOCAL_SHARED_FS=True)):
+            input_file = await _read_upload_file(str(path), filename="converted.mp3")
+
+        assert input_file.filename == "converted.mp3"
+        assert input_file.input_file_content == b"audio-bytes"
+
+    @pytest.mark.asyncio
+    async def test_shared_local_api_gets_path_instead_of_bytes(self, tmp_path):
+        path = tmp_path / "segment_003.mp4"
+        path.write_bytes(b"video-bytes")
+        local = SimpleNamespace(TELEGRAM_LOCAL_SHARED_FS=True)
+
+        with patch("bot.handlers.config", local), patch("bot.handlers.aiofiles.open") as open_mock:
+            upload = await _read_upload_file(str(path))
+
+        assert upload == path.resolve()
+        open_mock.assert_not_called()
+
+
+class TestProgressThrottling:
+    @pytest.mark.asyncio
+    async def test_progress_edits_are_coalesced(self, tmp_path):
+        update = _update()
+        segments = _segments(tmp_path, 5)
+        processing_message = MagicMock()
+        processing_message.edit_text = AsyncMock()
+
+        await _send_split_segments(update, segments, "video", processing_message, 42)
+
+        # All parts finish well within one throttle interval
+        assert processing_message.edit_text.await_count == 1
+
+
+class TestMediaJobSlot:
+    @pytest.mark.asyncio
+    async def test_queued_job_notifies_and_restores_status(self):
+        status = MagicMock()
+        status.text = "Dividiendo video..."
+        status.edit_text = AsyncMock()
+
+        with patch("bot.handlers.MEDIA_JOB_SEMAPHORE", asyncio.Semaphore(1)) as sem:
+            await sem.acquire()
+            waiter = asyncio.create_task(_enter_slot(status))
+            await asyncio.sleep(0)
+            assert not waiter.done()
+            sem.release()
+            await waiter
+
+        texts = [call.args[0] for call in status.edit_text.await_args_list]
+        assert texts[0].startswith("⏳ En cola")
+        assert texts[-1] == "Dividiendo video..."
+
+    @pytest.mark.asyncio
+    async def test_queued_job_keeps_keyboard_and_restores_given_text(self):
+        status = MagicMock()
+        status.text = "1️⃣ Convirtiendo a MP3..."
+        status.edit_text = AsyncMock()
+        markup = object()
+
+        with patch("bot.handlers.MEDIA_JOB_SEMAPHORE", asyncio.Semaphore(1)) as sem:
+            await sem.acquire()
+            waiter = asyncio.create_task(_enter_slot(status, "2️⃣ Normalizando...", markup))
+            await asyncio.sleep(0)
+            sem.release()
+            await waiter
+
+        calls = status.edit_text.await_args_list
+        assert all(call.kwargs["reply_markup"] is markup for call in calls)
+        assert calls[-1].args[0] == "2️⃣ Normalizando..."
+
+    @pytest.mark.asyncio
+    async def test_free_slot_does_not_touch_status(self):
+        status = MagicMock()
+        status.edit_text = AsyncMock()
+
+        with patch("bot.handlers.MEDIA_JOB_SEMAPHORE", asyncio.Semaphore(1)):
+            await _enter_slot(status)
+
+        status.edit_text.assert_not_awaited()
+
+
+async def _enter_slot(status, restore_text=None, reply_markup=None):
+    async with _media_job_slot(status, restore_text, reply_markup):
+        pass
+
+
+class TestFireAndForgetDelete:
+    @pytest.mark.asyncio
+    async def test_delete_runs_in_background_and_swallows_errors(self):
+        message = MagicMock()
+        message.delete = AsyncMock(side_effect=RuntimeError("gone"))
+
+        _fire_and_forget_delete(message)
+        message.delete.assert_not_awaited()
+        await asyncio.sleep(0)
+
+        message.delete.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_already_deleted_message_is_not_a_warning(self, caplog):
+        message = MagicMock()
+        message.delete = AsyncMock(side_effect=BadRequest("Message to delete not found"))
+
+        _fire_and_forget_delete(message)
+        await asyncio.sleep(0)
+
+        assert not [r for r in caplog.records if r.levelname == "WARNING"]
+
+    def test_none_is_ignored(self):
+        _fire_and_forget_delete(None)
+
+
+class TestSafeReply:
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors_with_backoff(self):
+        message = MagicMock()
+        message.reply_text = AsyncMock(side_effect=[TimedOut(), NetworkError("502"), "sent"])
+
+        with patch("bot.handlers.asyncio.sleep", AsyncMock()) as sleep_mock:
+            result = await _safe_reply(message, "hola")
+
+        assert result == "sent"
+        assert [call.args[0] for call in sleep_mock.await_args_list] == [1.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_attempts(self):
+        message = MagicMock()
+        message.reply_text = AsyncMock(side_effect=RetryAfter(timedelta(seconds=5)))
+
+        with patch("bot.handlers.asyncio.sleep", AsyncMock()) as sleep_mock:
+            result = await _safe_reply(message, "hola", attempts=2)
+
+        assert result is None
+        assert message.reply_text.await_count == 2
+        sleep_mock.assert_awaited_once_with(5.0)
+
+    @pytest.mark.asyncio
+    async def test_bad_request_is_not_retried(self):
+        message = MagicMock()
+        message.reply_text = AsyncMock(side_effect=BadRequest("bad"))
+
+        with pytest.raises(BadRequest):
+            await _safe_reply(message, "hola")
+        assert message.reply_text.await_count == 1
+
+
+class TestReplaceStatus:
+    @pytest.mark.asyncio
+    async def test_status_is_edited_in_place(self):
+        status = SimpleNamespace(edit_text=AsyncMock(return_value="edited"))
+        message = SimpleNamespace(reply_text=AsyncMock())
+
+        result = await _replace_status(status, message, "listo", parse_mode="Markdown")
+
+        assert result == "edited"
+        status.edit_text.assert_awaited_once_with("listo", parse_mode="Markdown")
+        message.reply_text.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_reply_when_edit_fails(self):
+        status = SimpleNamespace(edit_text=AsyncMock(side_effect=BadRequest("Message to edit not found")))
+        message = SimpleNamespace(reply_text=AsyncMock())
+
+        await _replace_status(status, message, "listo")
+
+        message.reply_text.assert_awaited_once_with("listo")
+
+
+class TestJobCleanup:
+    @pytest.mark.asyncio
+    async def test_cleanup_runs_when_job_is_cancelled(self):
+        status = SimpleNamespace(delete=AsyncMock())
+        temp_mgr = SimpleNamespace(cleanup_async=AsyncMock())
+        user_data = {"join_audio_session": {}, "other": 1}
+        started = asyncio.Event()
+
+        async def _job():
+            async with _job_cleanup(status, user_data, "join_audio_session", temp_mgr=temp_mgr):
+                started.set()
+                await asyncio.sleep(60)
+
+        task = asyncio.create_task(_job())
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+        assert user_data == {"other": 1}
+        temp_mgr.cleanup_async.assert_awaited_once()
+        status.delete.assert_awaited_once()
+
+
+class TestThreadedProgress:
+    @pytest.mark.asyncio
+    async def test_worker_thread_progress_edits_status(self):
+        status = SimpleNamespace(edit_text=AsyncMock())
+        report = _threaded_progress(status, "Uniendo 3 audios...")
+
+        await asyncio.get_running_loop().run_in_executor(None, report, 0.5)
+        await asyncio.sleep(0.01)
+
+        status.edit_text.assert_awaited_once_with("Uniendo 3 audios... 50%")
+
+    @pytest.mark.asyncio
+    async def test_no_status_message_means_no_callback(self):
+        assert _threaded_progress(None, "Uniendo...") is None
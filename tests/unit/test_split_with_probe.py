@@ -0,0 +1,219 @@
+"""Unit tests for the duration-probe and split helpers."""
+import io
+import subprocess
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from bot.audio_splitter import AudioSplitter
+from bot.error_handler import VideoSplitError
+from bot.split_processor import VideoSplitter
+
+
+class TestExpectedSegmentCount:
+    def test_rounds_partial_segment_up(self, tmp_path):
+        splitter = VideoSplitter(str(tmp_path / "in.mp4"), str(tmp_path / "out"), duration=125.0)
+        assert splitter.expected_segment_count(10) == 13
+
+    def test_exact_multiple_has_no_extra_segment(self, tmp_path):
+        splitter = AudioSplitter(str(tmp_path / "in.mp3"), str(tmp_path / "out"), duration=300.0)
+        assert splitter.expected_segment_count(15) == 20
+
+    @pytest.mark.asyncio
+    async def test_known_duration_skips_executor(self, tmp_path):
+        from bot.handlers import _expected_segment_count
+
+        splitter = VideoSplitter(str(tmp_path / "in.mp4"), str(tmp_path / "out"), duration=60.0)
+        with patch("bot.handlers.asyncio.get_running_loop") as loop_mock:
+            assert await _expected_segment_count(splitter, 30) == 2
+        loop_mock.assert_not_called()
+
+
+class TestIterSplitByDuration:
+    def _popen(self, stdout: str, returncode: int):
+        process = MagicMock()
+        process.stdout = io.StringIO(stdout)
+        process.wait.return_value = returncode
+        process.poll.return_value = returncode
+        return process
+
+    def test_yields_segments_as_reported_by_ffmpeg(self, tmp_path):
+        source = tmp_path / "in.mp4"
+        source.write_bytes(b"x")
+        splitter = VideoSplitter(str(source), str(tmp_path / "out"))
+        process = self._popen("in_part000.mp4\nin_part001.mp4\n", 0)
+
+        with patch.object(splitter, "_check_ffmpeg", return_value=True), \
+                patch("bot.split_processor.subprocess.Popen", return_value=process) as popen_mock:
+            segments = list(splitter.iter_split_by_duration(30))
+
+        assert segments == [
+            str(tmp_path / "out" / "in_part000.mp4"),
+            str(tmp_path / "out" / "in_part001.mp4"),
+        ]
+        assert "pipe:1" in popen_mock.call_args.args[0]
+
+    def test_nonzero_exit_raises(self, tmp_path):
+        source = tmp_path / "in.mp4"
+        source.write_bytes(b"x")
+        splitter = VideoSplitter(str(source), str(tmp_path / "out"))
+        process = self._popen("", 1)
+
+        with patch.object(splitter, "_check_ffmpeg", return_value=True), \
+                patch("bot.split_processor.subprocess.Popen", return_value=process):
+            with pytest.raises(VideoSplitError):
+                list(splitter.iter_split_by_duration(30))
+
+
+class TestDurationReuse:
+    def test_known_duration_skips_ffprobe(self, tmp_path):
+        splitter = VideoSplitter(str(tmp_path / "in.mp4"), str(tmp_path / "out"), duration=42.0)
+        with patch("bot.split_processor.subprocess.run") as run_mock:
+            assert splitter.get_video_duration() == 42.0
+        run_mock.assert_not_called()
+
+    def test_duration_cache_evicts_least_recently_used(self):
+        from bot import handlers
+
+        with patch.object(handlers, "MEDIA_DURATION_CACHE_SIZE", 2), \
+                patch.object(handlers, "_media_duration_cache", handlers.OrderedDict()):
+            handlers._cache_duration("a", 1, 10.0)
+            handlers._cache_duration("b", 1, 20.0)
+            assert handlers._get_cached_duration("a", 1) == 10.0
+            handlers._cache_duration("c", 1, 30.0)
+
+            assert handlers._get_cached_duration("b", 1) is None
+            assert handlers._get_cached_duration("a", 1) == 10.0
+            assert handlers._get_cached_duration("c", 1) == 30.0
+
+
+class TestExtractTimeRange:
+    def test_segment_is_piped_from_ffmpeg(self, tmp_path):
+        splitter = AudioSplitter(str(tmp_path / "in.mp3"), str(tmp_path / "out"), duration=120.0)
+        (tmp_path / "in.mp3").write_bytes(b"x")
+        done = subprocess.CompletedProcess(args=[], returncode=0, stdout=b"cut", stderr=b"")
+
+        with patch.object(splitter, "_check_ffmpeg", return_value=True), \
+                patch("bot.audio_splitter.subprocess.run", return_value=done) as run_mock:
+            data, filename = splitter.extract_time_range(10, 200)
+
+        assert data == b"cut"
+        assert filename == "in_10s_to_120s.mp3"
+        cmd = run_mock.call_args.args[0]
+        assert cmd[-3:] == ["-f", "mp3", "pipe:1"]
+        assert not (tmp_path / "out").exists()
+
+    def test_unpipeable_format_is_returned_by_path(self, tmp_path):
+        splitter = AudioSplitter(str(tmp_path / "in.m4a"), str(tmp_path / "out"))
+        segment = str(tmp_path / "out" / "in_0s_to_5s.m4a")
+
+        with patch.object(splitter, "split_by_time_range", return_value=segment):
+            assert splitter.extract_time_range(0, 5) == (None, segment)
+
+
+class TestInteractiveSplitDuration:
+    @pytest.mark.asyncio
+    async def test_repeated_audio_split_skips_ffprobe(self, tmp_path):
+        from bot import handlers
+
+        query = SimpleNamespace(answer=AsyncMock(), edit_message_text=AsyncMock())
+        update = SimpleNamespace(effective_user=SimpleNamespace(id=42), callback_query=query)
+        file = SimpleNamespace(file_unique_id="uniq", file_size=1024)
+        context = SimpleNamespace(
+            user_data={"audio_menu_file_id": "file-id"},
+            bot=SimpleNamespace(get_file=AsyncMock(return_value=file)),
+        )
+
+        with patch.object(handlers, "_media_duration_cache", handlers.OrderedDict()), \
+                patch("bot.handlers._download_with_retry", new=AsyncMock()), \
+                patch("bot.audio_splitter.subprocess.run") as run_mock:
+            handlers._cache_duration("uniq", 1024, 95.0)
+            await handlers.handle_audio_split_start(update, context)
+
+        run_mock.assert_not_called()
+        session = context.user_data["split_audio_session"]
+        assert session["duration"] == 95.0
+        session["temp_mgr"].cleanup()
+
+
+class TestThreadsArgs:
+    def test_threads_flag_added_when_limited(self, tmp_path):
+        splitter = VideoSplitter(str(tmp_path / "in.mp4"), str(tmp_path / "out"), threads=2)
+        assert splitter._threads_args() == ["-threads", "2"]
+
+    def test_threads_flag_omitted_by_default(self, tmp_path):
+        splitter = AudioSplitter(str(tmp_path / "in.mp3"), str(tmp_path / "out"))
+        assert splitter._threads_args() == []
+
+
+class TestSplitTextRouting:
+    @pytest.mark.asyncio
+    async def test_text_goes_to_step_of_active_session(self):
+        from bot import handlers
+
+        end_time = AsyncMock()
+        update = SimpleNamespace()
+        context = SimpleNamespace(
+            user_data={"split_audio_session": {"state": handlers.SPLIT_WAITING_END_TIME}}
+        )
+
+        with patch.dict(handlers.SPLIT_TEXT_ROUTES,
+                        {("split_audio_session", handlers.SPLIT_WAITING_END_TIME): end_time}):
+            await handlers.handle_split_text_input(update, context)
+
+        end_time.assert_awaited_once_with(update, context)
+
+    @pytest.mark.asyncio
+    async def test_confirming_session_ignores_text(self):
+        from bot import handlers
+
+        context = SimpleNamespace(
+            user_data={"split_video_session": {"state": handlers.SPLIT_CONFIRMING}, "screenshot_state": "waiting_count"}
+        )
+
+        with patch("bot.handlers.handle_screenshot_text_input", new=AsyncMock()) as screenshot:
+            await handlers.handle_split_text_input(SimpleNamespace(), context)
+
+        screenshot.assert_not_awaited()
+
+
+class TestParseSeconds:
+    def test_accepts_plain_numbers(self):
+        from bot.handlers import _parse_seconds
+
+        assert _parse_seconds(" 30.5 ") == 30.5
+        assert _parse_seconds("90") == 90.0
+
+    def test_rejects_garbage_and_non_finite_values(self):
+        from bot.handlers import _parse_seconds
+
+        for text in ("abc", "", None, "nan", "inf", "-Infinity"):
+            assert _parse_seconds(text) is None
+
+
+class TestSplitRangeValidation:
+    def _update(self, text):
+        return SimpleNamespace(message=SimpleNamespace(text=text, reply_text=AsyncMock(return_value="status")))
+
+    @pytest.mark.asyncio
+    async def test_end_time_past_duration_keeps_waiting(self):
+        from bot import handlers
+
+        update = self._update("130")
+        session = {"start_time": 10.0, "duration": 120.0, "state": handlers.SPLIT_WAITING_END_TIME}
+
+        assert await handlers._confirm_split_range(update, session, "audio") is None
+        assert session["state"] == handlers.SPLIT_WAITING_END_TIME
+        assert "del audio (120.0s)" in update.message.reply_text.await_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_valid_range_is_stored_and_announced(self):
+        from bot import handlers
+
+        update = self._update("40")
+        session = {"start_time": 10.0, "duration": 120.0, "state": handlers.SPLIT_WAITING_END_TIME}
+
+        assert await handlers._confirm_split_range(update, session, "video") == (10.0, 40.0, "status")
+        assert session["end_time"] == 40.0
+        assert session["state"] == handlers.SPLIT_CONFIRMING
@@ -54,14 +54,14 @@ class TestHandleAudio3dSelectionDualSend:
         ), patch("bot.handlers.estimate_required_space", return_value=10), patch(
             "bot.handlers.Path"
         ) as path_cls, patch("bot.handlers.AudioEffects") as effects_cls, patch(
-            "bot.handlers.asyncio.get_event_loop"
+            "bot.handlers.asyncio.get_running_loop"
         ) as loop_mock, patch("builtins.open", mock_open(read_data=b"mp3")):
             path_instance = MagicMock()
             path_instance.stat.return_value = MagicMock(st_size=1024)
             path_cls.return_value = path_instance
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.side_effect = lambda name: f"/tmp/{name}"
             temp_mgr_cls.return_value = temp_mgr
 
@@ -90,15 +90,15 @@ class TestHandleAudio3dSelectionDualSend:
         ), patch("bot.handlers.estimate_required_space", return_value=10), patch(
             "bot.handlers.Path"
         ) as path_cls, patch("bot.handlers.AudioEffects"), patch(
-            "bot.handlers.asyncio.get_event_loop"
+            "bot.handlers.asyncio.get_running_loop"
         ) as loop_mock, patch("builtins.open", mock_open(read_data=b"mp3")):
             path_instance = MagicMock()
             path_instance.stat.return_value = MagicMock(st_size=1024)
             path_cls.return_value = path_instance
 
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.side_effect = lambda name: f"/tmp/{name}"
             temp_mgr_cls.return_value = temp_mgr
 
@@ -125,15 +125,15 @@ class TestHandleAudio3dSelectionDualSend:
         ), patch("bot.handlers.estimate_required_space", return_value=10), patch(
             "bot.handlers.Path"
         ) as path_cls, patch("bot.handlers.AudioEffects"), patch(
-            "bot.handlers.asyncio.get_event_loop"
+            "bot.handlers.asyncio.get_running_loop"
         ) as loop_mock:
             path_instance = MagicMock()
             path_instance.stat.return_value = MagicMock(st_size=1024)
             path_cls.return_value = path_instance
 
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.side_effect = lambda name: f"/tmp/{name}"
             temp_mgr_cls.return_value = temp_mgr
 
@@ -147,6 +147,8 @@ class TestHandleAudio3dSelectionDualSend:
 
         error_text = update.callback_query.edit_message_text.await_args_list[-1][0][0]
         assert "ffmpeg stderr junk" in error_text
+        assert "effect_audio_file_id" not in mock_context.user_data
+        assert "effect_type" not in mock_context.user_data
 
     @pytest.mark.asyncio
     async def test_uses_default_error_message_for_generic_audio_effects_error(
@@ -161,15 +163,15 @@ class TestHandleAudio3dSelectionDualSend:
         ), patch("bot.handlers.estimate_required_space", return_value=10), patch(
             "bot.handlers.Path"
         ) as path_cls, patch("bot.handlers.AudioEffects"), patch(
-            "bot.handlers.asyncio.get_event_loop"
+            "bot.handlers.asyncio.get_running_loop"
         ) as loop_mock:
             path_instance = MagicMock()
             path_instance.stat.return_value = MagicMock(st_size=1024)
             path_cls.return_value = path_instance
 
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.side_effect = lambda name: f"/tmp/{name}"
             temp_mgr_cls.return_value = temp_mgr
 
@@ -192,14 +194,14 @@ class TestPostdownloadStereo3dDualSend:
         with patch("bot.handlers.TempManager") as temp_mgr_cls, patch(
             "bot.handlers.Path"
         ) as path_cls, patch("bot.handlers.AudioEffects"), patch(
-            "bot.handlers.asyncio.get_event_loop"
+            "bot.handlers.asyncio.get_running_loop"
         ) as loop_mock, patch("builtins.open", mock_open(read_data=b"mp3")):
             path_instance = MagicMock()
             path_instance.stat.return_value = MagicMock(st_size=1024)
             path_cls.return_value = path_instance
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.return_value = "/tmp/out.mp3"
             temp_mgr_cls.return_value = temp_mgr
 
@@ -222,14 +224,14 @@ class TestPostdownloadStereo3dDualSend:
         with patch("bot.handlers.TempManager") as temp_mgr_cls, patch(
             "bot.handlers.Path"
         ) as path_cls, patch("bot.handlers.AudioEffects"), patch(
-            "bot.handlers.asyncio.get_event_loop"
+            "bot.handlers.asyncio.get_running_loop"
         ) as loop_mock:
             path_instance = MagicMock()
             path_instance.stat.return_value = MagicMock(st_size=1024)
             path_cls.return_value = path_instance
             temp_mgr = MagicMock()
-            temp_mgr.__enter__ = MagicMock(return_value=temp_mgr)
-            temp_mgr.__exit__ = MagicMock(return_value=False)
+            temp_mgr.__aenter__ = AsyncMock(return_value=temp_mgr)
+            temp_mgr.__aexit__ = AsyncMock(return_value=False)
             temp_mgr.get_temp_path.return_value = "/tmp/out.mp3"
             temp_mgr_cls.return_value = temp_mgr
 
@@ -0,0 +1,65 @@
+"""Unit tests for TempManager session directories."""
+import os
+
+import pytest
+
+from bot.temp_manager import TempManager, active_temp_managers
+
+
+class TestCleanup:
+    def test_single_rmtree_removes_whole_session_tree(self):
+        temp_mgr = TempManager()
+        video_path = temp_mgr.get_temp_path("join_1_video01.mp4")
+        with open(video_path, "wb") as f:
+            f.write(b"data")
+        nested = os.path.join(temp_mgr.get_subdir("join_temp"), "concat_list.txt")
+        with open(nested, "w") as f:
+            f.write("file 'a.mp4'\n")
+        temp_mgr.track_file(video_path)
+
+        temp_mgr.cleanup()
+
+        assert not os.path.exists(temp_mgr.temp_dir)
+        assert temp_mgr.get_tracked_files() == []
+        assert temp_mgr not in active_temp_managers
+
+    def test_cleanup_is_idempotent(self):
+        temp_mgr = TempManager()
+        temp_mgr.cleanup()
+        temp_mgr.cleanup()
+
+        assert not os.path.exists(temp_mgr.temp_dir)
+
+    @pytest.mark.asyncio
+    async def test_cleanup_async_removes_directory(self):
+        temp_mgr = TempManager()
+        with open(temp_mgr.get_temp_path("a.mp4"), "wb") as f:
+            f.write(b"data")
+
+        await temp_mgr.cleanup_async()
+
+        assert not os.path.exists(temp_mgr.temp_dir)
+
+    @pytest.mark.asyncio
+    async def test_async_context_cleans_up_on_exit(self):
+        async with TempManager() as temp_mgr:
+            with open(temp_mgr.get_temp_path("a.mp4"), "wb") as f:
+                f.write(b"data")
+
+        assert not os.path.exists(temp_mgr.temp_dir)
+        assert temp_mgr not in active_temp_managers
+
+
+class TestTrackFile:
+    def test_duplicates_are_tracked_once_in_order(self):
+        temp_mgr = TempManager()
+        try:
+            for name in ("b.mp4", "a.mp4", "b.mp4"):
+                temp_mgr.track_file(temp_mgr.get_temp_path(name))
+
+            assert temp_mgr.get_tracked_files() == [
+                temp_mgr.get_temp_path("b.mp4"),
+                temp_mgr.get_temp_path("a.mp4"),
+            ]
+        finally:
+            temp_mgr.cleanup()
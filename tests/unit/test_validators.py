@@ -0,0 +1,75 @@
+"""Unit tests for audio validation and preflight checks."""
+import json
+import subprocess
+from unittest.mock import patch
+
+from bot.validators import preflight_audio, validate_audio_file
+
+
+def _probe(streams, duration):
+    payload = {"streams": streams, "format": {"duration": duration}}
+    return subprocess.CompletedProcess(args=[], returncode=0, stdout=json.dumps(payload), stderr="")
+
+
+class TestValidateAudioFile:
+    def test_stream_and_duration_come_from_one_probe(self, tmp_path):
+        path = tmp_path / "in.mp3"
+        path.write_bytes(b"x")
+
+        with patch("bot.validators.subprocess.run", return_value=_probe([{"codec_type": "audio"}], "12.5")) as run_mock:
+            assert validate_audio_file(str(path)) == (True, None)
+        run_mock.assert_called_once()
+
+    def test_missing_audio_stream_is_corrupt(self, tmp_path):
+        path = tmp_path / "in.mp3"
+        path.write_bytes(b"x")
+
+        with patch("bot.validators.subprocess.run", return_value=_probe([], "12.5")):
+            assert validate_audio_file(str(path)) == (False, "El archivo de audio parece estar corrupto")
+
+
+class TestPreflightAudio:
+    def test_valid_file_reports_size(self, tmp_path):
+        path = tmp_path / "in.mp3"
+        path.write_bytes(b"x" * 10)
+
+        with patch("bot.validators.subprocess.run", return_value=_probe([{"codec_type": "audio"}], "3.0")), \
+                patch("bot.validators.check_disk_space", return_value=(True, None)) as space_mock:
+            result = preflight_audio(str(path), space_multiplier=3)
+
+        assert result.size_bytes == 10
+        assert result.error is None
+        space_mock.assert_called_once_with(300)
+
+    def test_empty_file_skips_probe(self, tmp_path):
+        path = tmp_path / "in.mp3"
+        path.write_bytes(b"")
+
+        with patch("bot.validators.subprocess.run") as run_mock:
+            result = preflight_audio(str(path))
+
+        assert result.error == "El archivo de audio está vacío"
+        run_mock.assert_not_called()
+
+    def test_disk_space_error_is_reported(self, tmp_path):
+        path = tmp_path / "in.mp3"
+        path.write_bytes(b"x")
+
+        with patch("bot.validators.subprocess.run", return_value=_probe([{"codec_type": "audio"}], "3.0")), \
+                patch("bot.validators.check_disk_space", return_value=(False, "Espacio insuficiente en disco")):
+            assert preflight_audio(str(path)).error == "Espacio insuficiente en disco"
+
+    def test_missing_file(self, tmp_path):
+        assert preflight_audio(str(tmp_path / "missing.mp3")).error == "El archivo de audio no existe"
+
+    def test_known_size_skips_stat(self, tmp_path):
+        path = tmp_path / "in.mp3"
+        path.write_bytes(b"x")
+
+        with patch("bot.validators.os.stat") as stat_mock, \
+                patch("bot.validators.subprocess.run", return_value=_probe([{"codec_type": "audio"}], "3.0")), \
+                patch("bot.validators.check_disk_space", return_value=(True, None)):
+            result = preflight_audio(str(path), size_bytes=2048)
+
+        assert result.size_bytes == 2048
+        stat_mock.assert_not_called()
@@ -0,0 +1,50 @@
+"""Unit tests for VideoJoiner probing and list-based joining."""
+import json
+import subprocess
+from unittest.mock import patch
+
+from bot.join_processor import VideoJoiner
+
+
+def _probe_result(streams, format_name="mov,mp4,m4a,3gp,3g2,mj2"):
+    payload = {"streams": streams, "format": {"format_name": format_name}}
+    return subprocess.CompletedProcess(args=[], returncode=0, stdout=json.dumps(payload), stderr="")
+
+
+class TestGetVideoInfo:
+    def test_single_ffprobe_call_reads_codecs_and_container(self, tmp_path):
+        joiner = VideoJoiner(str(tmp_path / "out.mp4"))
+        streams = [
+            {"codec_type": "video", "codec_name": "h264"},
+            {"codec_type": "audio", "codec_name": "aac"},
+            {"codec_type": "audio", "codec_name": "mp3"},
+        ]
+        with patch.object(VideoJoiner, "_check_ffprobe", return_value=True), \
+                patch("bot.join_processor.subprocess.run", return_value=_probe_result(streams)) as run_mock:
+            info = joiner._get_video_info("clip.mp4")
+
+        assert info == ("h264", "aac", "mov,mp4,m4a,3gp,3g2,mj2")
+        run_mock.assert_called_once()
+
+    def test_missing_audio_stream_reports_none(self, tmp_path):
+        joiner = VideoJoiner(str(tmp_path / "out.mp4"))
+        streams = [{"codec_type": "video", "codec_name": "vp9"}]
+        with patch.object(VideoJoiner, "_check_ffprobe", return_value=True), \
+                patch("bot.join_processor.subprocess.run", return_value=_probe_result(streams)):
+            assert joiner._get_video_info("clip.webm")[1] == "none"
+
+
+class TestJoinFromList:
+    def test_adds_videos_in_order_then_joins(self, tmp_path):
+        paths = []
+        for name in ("a.mp4", "b.mp4"):
+            path = tmp_path / name
+            path.write_bytes(b"x")
+            paths.append(str(path))
+        joiner = VideoJoiner(str(tmp_path / "out.mp4"))
+
+        with patch.object(joiner, "join_videos", return_value=True) as join_mock:
+            assert joiner.join_from_list(paths) is True
+
+        assert joiner.get_input_count() == 2
+        join_mock.assert_called_once_with()